@@ -31,7 +31,7 @@ setup(
     entry_points={
         "console_scripts": ["swap=swap.cli.__main__:main"]
     },
-    python_requires=">=3.6,<4",
+    python_requires=">=3.7,<4",
     install_requires=requirements,
     extras_require={
         "tests": [
@@ -42,12 +42,14 @@ setup(
             "sphinx>=4.3.1,<5",
             "sphinx-rtd-theme>=1.0.0,<2",
             "sphinx-click>=3.0.2,<4"
+        ],
+        "aio": [
+            "aiohttp>=3.7.4,<4"
         ]
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "License :: OSI Approved :: GNU Affero General Public License v3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -1,12 +1,65 @@
 #!/usr/bin/env python3
 
+from typing import (
+    Optional, Dict, List, Tuple
+)
+
+import importlib
 import textwrap
 import click
 import sys
 
 
+class LazyGroup(click.Group):
+    """
+    Click group with lazily imported subcommands.
+
+    :param lazy_commands: Subcommand names with their ``module:attribute`` import paths, defaults to ``None``.
+    :type lazy_commands: dict
+    :param lazy_help: Subcommand names with their short help, listed by ``--help``, defaults to ``None``.
+    :type lazy_help: dict
+
+    .. note::
+        A subcommand module (and the provider stack behind it) is imported only
+        when that subcommand is resolved, so one command never pays for the others.
+        ``--help`` lists subcommands with their static short help, without resolving them.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None,
+                 lazy_help: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, str] = dict(lazy_commands or {})
+        self.lazy_help: Dict[str, str] = dict(lazy_help or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        commands: List[str] = [
+            cmd_name for cmd_name in self.list_commands(ctx)
+            if cmd_name not in self.commands or not self.commands[cmd_name].hidden
+        ]
+        if not commands:
+            return
+        limit: int = formatter.width - 6 - max(len(cmd_name) for cmd_name in commands)
+        rows: List[Tuple[str, str]] = [
+            (cmd_name, self.commands[cmd_name].get_short_help_str(limit)
+                if cmd_name in self.commands else self.lazy_help.get(cmd_name, ""))
+            for cmd_name in commands
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
 __all__ = [
     "textwrap",
     "click",
-    "sys"
+    "sys",
+    "LazyGroup"
 ]
@@ -2,23 +2,39 @@
 # coding=utf-8
 
 from .. import __version__
-from ..cli import click
-
-from ..cli.providers.bitcoin import bitcoin
-from ..cli.providers.bytom import bytom
-from ..cli.providers.ethereum import ethereum
-from ..cli.providers.vapor import vapor
-from ..cli.providers.xinfin import xinfin
+from ..cli import (
+    click, LazyGroup
+)
 
 CONTEXT_SETTINGS = dict(
     help_option_names=["-h", "--help"],
 )
-
-
-class AliasedGroup(click.Group):
+# Commands with their import paths, a provider package is imported only when its command is invoked
+COMMANDS = {
+    "bitcoin": "swap.cli.providers.bitcoin:bitcoin",
+    "bytom": "swap.cli.providers.bytom:bytom",
+    "ethereum": "swap.cli.providers.ethereum:ethereum",
+    "vapor": "swap.cli.providers.vapor:vapor",
+    "xinfin": "swap.cli.providers.xinfin:xinfin",
+    "batch": "swap.cli.batch:batch",
+    "serve": "swap.cli.batch:serve"
+}
+# Commands with their short help, listed without importing them
+COMMANDS_HELP = {
+    "bitcoin": "Select Bitcoin provider.",
+    "bytom": "Select Bytom provider.",
+    "ethereum": "Select Ethereum provider.",
+    "vapor": "Select Vapor provider.",
+    "xinfin": "Select XinFin provider.",
+    "batch": "Select newline-delimited JSON batch runner.",
+    "serve": "Select newline-delimited JSON Unix socket server."
+}
+
+
+class AliasedGroup(LazyGroup):
 
     def get_command(self, ctx, cmd_name):
-        rv = click.Group.get_command(self, ctx, cmd_name)
+        rv = LazyGroup.get_command(self, ctx, cmd_name)
         if rv is not None:
             return rv
         matches = [x for x in self.list_commands(ctx)
@@ -26,7 +42,7 @@ class AliasedGroup(click.Group):
         if not matches:
             return None
         elif len(matches) == 1:
-            return click.Group.get_command(self, ctx, matches[0])
+            return LazyGroup.get_command(self, ctx, matches[0])
         ctx.fail('Too many matches: %s' % ', '.join(sorted(matches)))
 
 
@@ -37,21 +53,10 @@ def print_version(ctx, param, value):
     ctx.exit()
 
 
-@click.group(cls=AliasedGroup,
+@click.group(cls=AliasedGroup, lazy_commands=COMMANDS, lazy_help=COMMANDS_HELP,
              options_metavar="[OPTIONS]", context_settings=CONTEXT_SETTINGS)
 @click.option("-v", "--version", is_flag=True, callback=print_version,
               expose_value=False, help="Show Swap version and exit.")
 def main():
     pass
 
-
-# Add Bitcoin provider
-main.add_command(bitcoin)
-# Add Bytom provider
-main.add_command(bytom)
-# Add Ethereum provider
-main.add_command(ethereum)
-# Add Vapor provider
-main.add_command(vapor)
-# Add XinFin provider
-main.add_command(xinfin)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from contextlib import (
+    redirect_stdout, redirect_stderr
+)
+from typing import (
+    Any, Optional, TextIO
+)
+
+import socketserver
+import signal
+import socket
+import stat
+import threading
+import tempfile
+import json
+import io
+import os
+
+from ..cli import (
+    click, sys
+)
+
+# Commands run in this process redirect the process wide stdout and stderr, one at a time
+_lock: threading.Lock = threading.Lock()
+
+
+def _command_name(command: click.Command, args: list) -> Optional[str]:
+    # Root options are flags only, the first other argument is the subcommand name or its alias
+    names: list = [arg for arg in args if not arg.startswith("-")][:1]
+    if not names or not isinstance(command, click.Group):
+        return None
+    with command.make_context("swap", [], resilient_parsing=True) as ctx:
+        try:
+            _, subcommand, _ = command.resolve_command(ctx, names)
+        except click.UsageError:
+            # Ambiguous alias, the command run reports it
+            return None
+    return subcommand.name if subcommand else None
+
+
+def execute(command: click.Command, line: str) -> dict:
+    """
+    Execute one newline-delimited JSON command in this process.
+
+    :param command: Root swap command.
+    :type command: click.Command
+    :param line: JSON command line, like ``{"id": 1, "args": ["bytom", "decode", "-tr", "..."]}``.
+    :type line: str
+
+    :returns: dict -- Command result, JSON output is loaded and error message is None on success.
+    """
+
+    result: dict = dict(id=None, result=None, error=None)
+    try:
+        request: Any = json.loads(line)
+        if not isinstance(request, dict) or not isinstance(request.get("args"), list) \
+                or not all(isinstance(arg, str) for arg in request["args"]):
+            raise ValueError("Invalid command, use {\"id\": ..., \"args\": [\"<provider>\", \"<command>\", ...]}.")
+        result["id"] = request.get("id")
+        command_name: Optional[str] = _command_name(command=command, args=request["args"])
+        if command_name in ["batch", "serve"]:
+            raise ValueError(f"Command '{command_name}' can't be run in batch mode.")
+    except ValueError as exception:
+        result["error"] = str(exception)
+        return result
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with _lock, redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            command.main(args=request["args"], prog_name="swap", standalone_mode=False)
+        except click.ClickException as exception:
+            click.echo(f"Error: {exception.format_message()}", err=True)
+        except (SystemExit, click.exceptions.Exit, click.Abort):
+            pass
+        except Exception as exception:
+            click.echo(f"Error: {exception}", err=True)
+
+    # Commands report errors on stderr, like they do on the shell
+    error: str = stderr.getvalue().strip()
+    if error:
+        result["error"] = error[len("Error: "):] if error.startswith("Error: ") else error
+        return result
+    output: str = stdout.getvalue().strip()
+    try:
+        result["result"] = json.loads(output)
+    except ValueError:
+        result["result"] = output
+    return result
+
+
+@click.command("batch", options_metavar="[OPTIONS]",
+               short_help="Select newline-delimited JSON batch runner.")
+@click.option("-f", "--file", "file", type=click.File("r"), default="-",
+              help="Set newline-delimited JSON commands file.  [default: stdin]")
+@click.pass_context
+def batch(ctx: click.Context, file: TextIO):
+    command: click.Command = ctx.find_root().command
+    for line in file:
+        if line.strip():
+            click.echo(json.dumps(execute(command=command, line=line)))
+
+
+@click.command("serve", options_metavar="[OPTIONS]",
+               short_help="Select newline-delimited JSON Unix socket server.")
+@click.option("-s", "--socket", "socket_path", type=str,
+              default=os.path.join(tempfile.gettempdir(), "swap.sock"),
+              help="Set Unix socket path.", show_default=True)
+@click.pass_context
+def serve(ctx: click.Context, socket_path: str):
+    command: click.Command = ctx.find_root().command
+
+    class Handler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            for line in self.rfile:
+                if line.strip():
+                    try:
+                        result: dict = execute(command=command, line=line.decode())
+                    except UnicodeDecodeError:
+                        # One bad line is answered like any invalid command, the connection stays open
+                        result: dict = dict(id=None, result=None, error="Invalid command, it is not UTF-8 encoded.")
+                    self.wfile.write(json.dumps(result).encode() + b"\n")
+                    self.wfile.flush()
+
+    if os.path.exists(socket_path):
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            raise click.UsageError(f"Socket path '{socket_path}' already exists and it is not a Unix socket.")
+        probe: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            # Nothing listens, left behind by a killed server
+            os.remove(socket_path)
+        else:
+            raise click.UsageError(f"Socket path '{socket_path}' is already served by another server.")
+        finally:
+            probe.close()
+    server: Optional[socketserver.ThreadingUnixStreamServer] = None
+    try:
+        # Imported providers, clients and caches stay warm between requests
+        server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+        server.daemon_threads, server.block_on_close = True, False
+        if threading.current_thread() is threading.main_thread():
+            # Terminated servers still remove their socket file
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+        click.echo(f"Serving on {socket_path}", err=True)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.server_close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
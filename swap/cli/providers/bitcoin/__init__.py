@@ -1,29 +1,35 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-# IMPORT ALL PACKAGES
-from ....cli import click
+from typing import Dict
 
-from .htlc import htlc
-from .fund import fund
-from .withdraw import withdraw
-from .refund import refund
-from .decode import decode
-from .signature import sign
-from .submit import submit
+from ....cli import (
+    click, LazyGroup
+)
 
+# Bitcoin commands with their import paths, imported only when invoked
+COMMANDS: Dict[str, str] = {
+    "htlc": "swap.cli.providers.bitcoin.htlc:htlc",
+    "fund": "swap.cli.providers.bitcoin.fund:fund",
+    "withdraw": "swap.cli.providers.bitcoin.withdraw:withdraw",
+    "refund": "swap.cli.providers.bitcoin.refund:refund",
+    "decode": "swap.cli.providers.bitcoin.decode:decode",
+    "sign": "swap.cli.providers.bitcoin.signature:sign",
+    "submit": "swap.cli.providers.bitcoin.submit:submit"
+}
+# Bitcoin commands with their short help, listed without importing them
+COMMANDS_HELP: Dict[str, str] = {
+    "htlc": "Select Bitcoin Hash Time Lock Contract (HTLC) builder.",
+    "fund": "Select Bitcoin Fund transaction builder.",
+    "withdraw": "Select Bitcoin Withdraw transaction builder.",
+    "refund": "Select Bitcoin Refund transaction builder.",
+    "decode": "Select Bitcoin Transaction raw decoder.",
+    "sign": "Select Bitcoin Transaction raw signer.",
+    "submit": "Select Bitcoin Transaction raw submitter."
+}
 
-@click.group("bitcoin", options_metavar="[OPTIONS]",
-             short_help="Select Bitcoin provider.")
+
+@click.group("bitcoin", cls=LazyGroup, lazy_commands=COMMANDS, lazy_help=COMMANDS_HELP,
+             options_metavar="[OPTIONS]", short_help="Select Bitcoin provider.")
 def bitcoin():
     pass
-
-
-# Adding bitcoin commands
-bitcoin.add_command(htlc)
-bitcoin.add_command(fund)
-bitcoin.add_command(withdraw)
-bitcoin.add_command(refund)
-bitcoin.add_command(decode)
-bitcoin.add_command(sign)
-bitcoin.add_command(submit)
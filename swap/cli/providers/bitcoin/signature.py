@@ -1,9 +1,6 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-from base64 import b64decode
-
-import json
 import sys
 
 from ....cli import click
@@ -16,7 +13,9 @@ from ....providers.bitcoin.signature import (
 from ....providers.bitcoin.utils import is_transaction_raw
 from ....providers.config import bitcoin as config
 from ....exceptions import TransactionRawError
-from ....utils import clean_transaction_raw
+from ....utils import (
+    parse_transaction_raw, TransactionRaw
+)
 
 
 @click.command("sign", options_metavar="[OPTIONS]",
@@ -43,12 +42,9 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
          secret_key: str, endtime: int, account: int, change: bool, address: int, path: str, version: int):
 
     try:
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
-
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
         
         if loaded_transaction_raw["type"] == "bitcoin_fund_unsigned":
             # Fund HTLC solver
@@ -62,7 +58,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"], version=version
             )
             fund_signature.sign(
-                transaction_raw=transaction_raw, solver=fund_solver
+                transaction_raw=loaded_transaction_raw, solver=fund_solver
             )
             click.echo(fund_signature.transaction_raw())
 
@@ -89,7 +85,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"], version=version
             )
             withdraw_signature.sign(
-                transaction_raw=transaction_raw, solver=withdraw_solver
+                transaction_raw=loaded_transaction_raw, solver=withdraw_solver
             )
             click.echo(withdraw_signature.transaction_raw())
 
@@ -116,7 +112,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"], version=version
             )
             refund_signature.sign(
-                transaction_raw=transaction_raw, solver=refund_solver
+                transaction_raw=loaded_transaction_raw, solver=refund_solver
             )
             click.echo(refund_signature.transaction_raw())
         else:
@@ -1,28 +1,35 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-from ....cli import click
+from typing import Dict
 
-from .htlc import htlc
-from .fund import fund
-from .withdraw import withdraw
-from .refund import refund
-from .decode import decode
-from .signature import sign
-from .submit import submit
+from ....cli import (
+    click, LazyGroup
+)
 
+# Bytom commands with their import paths, imported only when invoked
+COMMANDS: Dict[str, str] = {
+    "htlc": "swap.cli.providers.bytom.htlc:htlc",
+    "fund": "swap.cli.providers.bytom.fund:fund",
+    "withdraw": "swap.cli.providers.bytom.withdraw:withdraw",
+    "refund": "swap.cli.providers.bytom.refund:refund",
+    "decode": "swap.cli.providers.bytom.decode:decode",
+    "sign": "swap.cli.providers.bytom.signature:sign",
+    "submit": "swap.cli.providers.bytom.submit:submit"
+}
+# Bytom commands with their short help, listed without importing them
+COMMANDS_HELP: Dict[str, str] = {
+    "htlc": "Select Bytom Hash Time Lock Contract (HTLC) builder.",
+    "fund": "Select Bytom Fund transaction builder.",
+    "withdraw": "Select Bytom Withdraw transaction builder.",
+    "refund": "Select Bytom Refund transaction builder.",
+    "decode": "Select Bytom Transaction raw decoder.",
+    "sign": "Select Bytom Transaction raw signer.",
+    "submit": "Select Bytom Transaction raw submitter."
+}
 
-@click.group("bytom", options_metavar="[OPTIONS]",
-             short_help="Select Bytom provider.")
+
+@click.group("bytom", cls=LazyGroup, lazy_commands=COMMANDS, lazy_help=COMMANDS_HELP,
+             options_metavar="[OPTIONS]", short_help="Select Bytom provider.")
 def bytom():
     pass
-
-
-# Adding bytom commands
-bytom.add_command(htlc)
-bytom.add_command(fund)
-bytom.add_command(withdraw)
-bytom.add_command(refund)
-bytom.add_command(decode)
-bytom.add_command(sign)
-bytom.add_command(submit)
@@ -1,9 +1,6 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-from base64 import b64decode
-
-import json
 import sys
 
 from ....cli import click
@@ -15,7 +12,9 @@ from ....providers.bytom.signature import (
 )
 from ....providers.bytom.utils import is_transaction_raw
 from ....exceptions import TransactionRawError
-from ....utils import clean_transaction_raw
+from ....utils import (
+    parse_transaction_raw, TransactionRaw
+)
 
 
 @click.command("sign", options_metavar="[OPTIONS]",
@@ -40,13 +39,10 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
          secret_key: str, account: int, change: bool, address: int, path: str, indexes: list):
 
     try:
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] == "bytom_fund_unsigned":
             # Fund HTLC solver
             fund_solver = FundSolver(
@@ -59,7 +55,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"]
             )
             fund_signature.sign(
-                transaction_raw=transaction_raw, solver=fund_solver
+                transaction_raw=loaded_transaction_raw, solver=fund_solver
             )
             click.echo(fund_signature.transaction_raw())
 
@@ -86,7 +82,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"]
             )
             withdraw_signature.sign(
-                transaction_raw=transaction_raw, solver=withdraw_solver
+                transaction_raw=loaded_transaction_raw, solver=withdraw_solver
             )
             click.echo(withdraw_signature.transaction_raw())
     
@@ -108,7 +104,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"]
             )
             refund_signature.sign(
-                transaction_raw=transaction_raw, solver=refund_solver
+                transaction_raw=loaded_transaction_raw, solver=refund_solver
             )
             click.echo(refund_signature.transaction_raw())
         else:
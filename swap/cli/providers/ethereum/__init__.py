@@ -1,29 +1,35 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-# IMPORT ALL PACKAGES
-from ....cli import click
+from typing import Dict
 
-from .htlc import htlc
-from .fund import fund
-from .withdraw import withdraw
-from .refund import refund
-from .decode import decode
-from .signature import sign
-from .submit import submit
+from ....cli import (
+    click, LazyGroup
+)
 
+# Ethereum commands with their import paths, imported only when invoked
+COMMANDS: Dict[str, str] = {
+    "htlc": "swap.cli.providers.ethereum.htlc:htlc",
+    "fund": "swap.cli.providers.ethereum.fund:fund",
+    "withdraw": "swap.cli.providers.ethereum.withdraw:withdraw",
+    "refund": "swap.cli.providers.ethereum.refund:refund",
+    "decode": "swap.cli.providers.ethereum.decode:decode",
+    "sign": "swap.cli.providers.ethereum.signature:sign",
+    "submit": "swap.cli.providers.ethereum.submit:submit"
+}
+# Ethereum commands with their short help, listed without importing them
+COMMANDS_HELP: Dict[str, str] = {
+    "htlc": "Select Ethereum Hash Time Lock Contract (HTLC) builder.",
+    "fund": "Select Ethereum Fund transaction builder.",
+    "withdraw": "Select Ethereum Withdraw transaction builder.",
+    "refund": "Select Ethereum Refund transaction builder.",
+    "decode": "Select Ethereum Transaction raw decoder.",
+    "sign": "Select Ethereum Transaction raw signer.",
+    "submit": "Select Ethereum Transaction raw submitter."
+}
 
-@click.group("ethereum", options_metavar="[OPTIONS]",
-             short_help="Select Ethereum provider.")
+
+@click.group("ethereum", cls=LazyGroup, lazy_commands=COMMANDS, lazy_help=COMMANDS_HELP,
+             options_metavar="[OPTIONS]", short_help="Select Ethereum provider.")
 def ethereum():
     pass
-
-
-# Adding ethereum commands
-ethereum.add_command(htlc)
-ethereum.add_command(fund)
-ethereum.add_command(withdraw)
-ethereum.add_command(refund)
-ethereum.add_command(decode)
-ethereum.add_command(sign)
-ethereum.add_command(submit)
@@ -1,29 +1,35 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-# IMPORT ALL PACKAGES
-from ....cli import click
+from typing import Dict
 
-from .htlc import htlc
-from .fund import fund
-from .withdraw import withdraw
-from .refund import refund
-from .decode import decode
-from .signature import sign
-from .submit import submit
+from ....cli import (
+    click, LazyGroup
+)
 
+# Vapor commands with their import paths, imported only when invoked
+COMMANDS: Dict[str, str] = {
+    "htlc": "swap.cli.providers.vapor.htlc:htlc",
+    "fund": "swap.cli.providers.vapor.fund:fund",
+    "withdraw": "swap.cli.providers.vapor.withdraw:withdraw",
+    "refund": "swap.cli.providers.vapor.refund:refund",
+    "decode": "swap.cli.providers.vapor.decode:decode",
+    "sign": "swap.cli.providers.vapor.signature:sign",
+    "submit": "swap.cli.providers.vapor.submit:submit"
+}
+# Vapor commands with their short help, listed without importing them
+COMMANDS_HELP: Dict[str, str] = {
+    "htlc": "Select Vapor Hash Time Lock Contract (HTLC) builder.",
+    "fund": "Select Vapor Fund transaction builder.",
+    "withdraw": "Select Vapor Withdraw transaction builder.",
+    "refund": "Select Vapor Refund transaction builder.",
+    "decode": "Select Vapor Transaction raw decoder.",
+    "sign": "Select Vapor Transaction raw signer.",
+    "submit": "Select Vapor Transaction raw submitter."
+}
 
-@click.group("vapor", options_metavar="[OPTIONS]",
-             short_help="Select Vapor provider.")
+
+@click.group("vapor", cls=LazyGroup, lazy_commands=COMMANDS, lazy_help=COMMANDS_HELP,
+             options_metavar="[OPTIONS]", short_help="Select Vapor provider.")
 def vapor():
     pass
-
-
-# Adding vapor commands
-vapor.add_command(htlc)
-vapor.add_command(fund)
-vapor.add_command(withdraw)
-vapor.add_command(refund)
-vapor.add_command(decode)
-vapor.add_command(sign)
-vapor.add_command(submit)
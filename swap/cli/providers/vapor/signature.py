@@ -1,9 +1,6 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-from base64 import b64decode
-
-import json
 import sys
 
 from ....cli import click
@@ -15,7 +12,9 @@ from ....providers.vapor.signature import (
 )
 from ....providers.vapor.utils import is_transaction_raw
 from ....exceptions import TransactionRawError
-from ....utils import clean_transaction_raw
+from ....utils import (
+    parse_transaction_raw, TransactionRaw
+)
 
 
 @click.command("sign", options_metavar="[OPTIONS]",
@@ -39,13 +38,10 @@ from ....utils import clean_transaction_raw
 def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
          secret_key: str, account: int, change: bool, address: int, path: str, indexes: list):
     try:
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] == "vapor_fund_unsigned":
             # Fund HTLC solver
             fund_solver = FundSolver(
@@ -58,7 +54,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"]
             )
             fund_signature.sign(
-                transaction_raw=transaction_raw, solver=fund_solver
+                transaction_raw=loaded_transaction_raw, solver=fund_solver
             )
             click.echo(fund_signature.transaction_raw())
 
@@ -85,7 +81,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"]
             )
             withdraw_signature.sign(
-                transaction_raw=transaction_raw, solver=withdraw_solver
+                transaction_raw=loaded_transaction_raw, solver=withdraw_solver
             )
             click.echo(withdraw_signature.transaction_raw())
 
@@ -107,7 +103,7 @@ def sign(xprivate_key: str, transaction_raw: str, bytecode: str,
                 network=loaded_transaction_raw["network"]
             )
             refund_signature.sign(
-                transaction_raw=transaction_raw, solver=refund_solver
+                transaction_raw=loaded_transaction_raw, solver=refund_solver
             )
             click.echo(refund_signature.transaction_raw())
         else:
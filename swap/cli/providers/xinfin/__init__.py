@@ -1,29 +1,35 @@
 #!/usr/bin/env python
 # coding=utf-8
 
-# IMPORT ALL PACKAGES
-from ....cli import click
+from typing import Dict
 
-from .htlc import htlc
-from .fund import fund
-from .withdraw import withdraw
-from .refund import refund
-from .decode import decode
-from .signature import sign
-from .submit import submit
+from ....cli import (
+    click, LazyGroup
+)
 
+# XinFin commands with their import paths, imported only when invoked
+COMMANDS: Dict[str, str] = {
+    "htlc": "swap.cli.providers.xinfin.htlc:htlc",
+    "fund": "swap.cli.providers.xinfin.fund:fund",
+    "withdraw": "swap.cli.providers.xinfin.withdraw:withdraw",
+    "refund": "swap.cli.providers.xinfin.refund:refund",
+    "decode": "swap.cli.providers.xinfin.decode:decode",
+    "sign": "swap.cli.providers.xinfin.signature:sign",
+    "submit": "swap.cli.providers.xinfin.submit:submit"
+}
+# XinFin commands with their short help, listed without importing them
+COMMANDS_HELP: Dict[str, str] = {
+    "htlc": "Select XinFin Hash Time Lock Contract (HTLC) builder.",
+    "fund": "Select XinFin Fund transaction builder.",
+    "withdraw": "Select XinFin Withdraw transaction builder.",
+    "refund": "Select XinFin Refund transaction builder.",
+    "decode": "Select XinFin Transaction raw decoder.",
+    "sign": "Select XinFin Transaction raw signer.",
+    "submit": "Select XinFin Transaction raw submitter."
+}
 
-@click.group("xinfin", options_metavar="[OPTIONS]",
-             short_help="Select XinFin provider.")
+
+@click.group("xinfin", cls=LazyGroup, lazy_commands=COMMANDS, lazy_help=COMMANDS_HELP,
+             options_metavar="[OPTIONS]", short_help="Select XinFin provider.")
 def xinfin():
     pass
-
-
-# Adding xinfin commands
-xinfin.add_command(htlc)
-xinfin.add_command(fund)
-xinfin.add_command(withdraw)
-xinfin.add_command(refund)
-xinfin.add_command(decode)
-xinfin.add_command(sign)
-xinfin.add_command(submit)
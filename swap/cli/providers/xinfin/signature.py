@@ -2,9 +2,7 @@
 # coding=utf-8
 
 from typing import Optional
-from base64 import b64decode
 
-import json
 import sys
 
 from ....cli import click
@@ -16,7 +14,9 @@ from ....providers.xinfin.signature import (
 )
 from ....providers.xinfin.utils import is_transaction_raw
 from ....exceptions import TransactionRawError
-from ....utils import clean_transaction_raw
+from ....utils import (
+    parse_transaction_raw, TransactionRaw
+)
 
 
 @click.command("sign", options_metavar="[OPTIONS]",
@@ -34,12 +34,9 @@ from ....utils import clean_transaction_raw
 def sign(xprivate_key: str, transaction_raw: str, account: int, change: bool, address: int, path: Optional[str]):
 
     try:
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
-
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
         
         if loaded_transaction_raw["type"] == "xinfin_fund_unsigned":
             # Fund HTLC solver
@@ -53,7 +50,7 @@ def sign(xprivate_key: str, transaction_raw: str, account: int, change: bool, ad
                 network=loaded_transaction_raw["network"], xrc20=loaded_transaction_raw["xrc20"]
             )
             fund_signature.sign(
-                transaction_raw=transaction_raw, solver=fund_solver
+                transaction_raw=loaded_transaction_raw, solver=fund_solver
             )
             click.echo(fund_signature.transaction_raw())
 
@@ -70,7 +67,7 @@ def sign(xprivate_key: str, transaction_raw: str, account: int, change: bool, ad
                 network=loaded_transaction_raw["network"], xrc20=loaded_transaction_raw["xrc20"]
             )
             withdraw_signature.sign(
-                transaction_raw=transaction_raw, solver=withdraw_solver
+                transaction_raw=loaded_transaction_raw, solver=withdraw_solver
             )
             click.echo(withdraw_signature.transaction_raw())
 
@@ -87,7 +84,7 @@ def sign(xprivate_key: str, transaction_raw: str, account: int, change: bool, ad
                 network=loaded_transaction_raw["network"], xrc20=loaded_transaction_raw["xrc20"]
             )
             refund_signature.sign(
-                transaction_raw=transaction_raw, solver=refund_solver
+                transaction_raw=loaded_transaction_raw, solver=refund_solver
             )
             click.echo(refund_signature.transaction_raw())
         else:
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+from typing import (
+    Any, Callable, Optional
+)
+
+import asyncio
+import aiohttp
+import weakref
+import json
+
+from ..exceptions import APIError
+from .config import (
+    aio as config, session as session_config
+)
+from .session import CircuitBreaker
+
+# Same retryable methods as urllib3 Retry of the requests session
+IDEMPOTENT_METHODS: frozenset = frozenset(["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"])
+
+
+class Response:
+    """
+    Asynchronous HTTP response, read in full.
+
+    :param status_code: HTTP status code.
+    :type status_code: int
+    :param content: Response body.
+    :type content: bytes
+
+    :returns: Response -- Response instance.
+    """
+
+    def __init__(self, status_code: int, content: bytes):
+
+        self.status_code: int = status_code
+        self.content: bytes = content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncSession:
+    """
+    Pooled non-blocking HTTP session with retries and circuit breaker.
+
+    :param limit: Maximum open connections, defaults to ``100``.
+    :type limit: int
+    :param limit_per_host: Maximum open connections per host, defaults to ``10``.
+    :type limit_per_host: int
+    :param retries: Retries on connection errors and retryable status codes, defaults to ``3``.
+    :type retries: int
+    :param backoff_factor: Exponential backoff factor (seconds), defaults to ``0.5``.
+    :type backoff_factor: float
+    :param circuit_breaker: Circuit breaker, defaults to a new one.
+    :type circuit_breaker: CircuitBreaker
+
+    :returns: AsyncSession -- Asynchronous session instance.
+
+    .. note::
+        ``Retry-After`` header of ``429`` and ``503`` responses is honored before the next retry,
+        ``POST`` requests are retried only on connection errors.
+
+    >>> from swap.providers.aio import AsyncSession
+    >>> async_session: AsyncSession = AsyncSession(limit=500)
+    >>> (await async_session.get(url="https://api.blockcypher.com/v1/btc/test3", timeout=60)).status_code
+    200
+    """
+
+    def __init__(self, limit: int = config["limit"], limit_per_host: int = config["limit_per_host"],
+                 retries: int = session_config["retries"], backoff_factor: float = session_config["backoff_factor"],
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker()
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._retries: int = retries
+        self._backoff_factor: float = backoff_factor
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _client(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host
+            ))
+        return self._session
+
+    def _backoff(self, retry: int, retry_after: Optional[str] = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self._backoff_factor * (2 ** (retry - 1))
+
+    async def request(self, method: str, url: str, params: Optional[dict] = None, data: Optional[str] = None,
+                      headers: Optional[dict] = None, timeout: Optional[int] = None) -> Response:
+        endpoint: str = urlparse(url).netloc
+        if not self.circuit_breaker.allow(endpoint=endpoint):
+            raise APIError(f"Too many failed requests to '{endpoint}' endpoint, circuit is open.")
+        retry: int = 0
+        while True:
+            try:
+                async with self._client().request(
+                    method, url, params=params, data=data, headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    status_code: int = response.status
+                    content: bytes = await response.read()
+                    retry_after: Optional[str] = response.headers.get("Retry-After")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                # POST (like raw transaction submit) is retried only when the connection was never made
+                if retry >= self._retries or (
+                    method not in IDEMPOTENT_METHODS and not isinstance(error, aiohttp.ClientConnectorError)
+                ):
+                    self.circuit_breaker.failure(endpoint=endpoint)
+                    raise
+                retry += 1
+                await asyncio.sleep(self._backoff(retry=retry))
+                continue
+            if status_code in session_config["status_forcelist"] and retry < self._retries and \
+                    method in IDEMPOTENT_METHODS:
+                retry += 1
+                await asyncio.sleep(self._backoff(
+                    retry=retry, retry_after=(retry_after if status_code in [429, 503] else None)
+                ))
+                continue
+            if status_code in session_config["status_forcelist"]:
+                self.circuit_breaker.failure(endpoint=endpoint)
+            else:
+                self.circuit_breaker.success(endpoint=endpoint)
+            return Response(status_code=status_code, content=content)
+
+    async def get(self, url: str, **kwargs) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# One shared session per event loop, aiohttp sessions can't be shared between loops
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSession]" = weakref.WeakKeyDictionary()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_session() -> AsyncSession:
+    """
+    Get the shared asynchronous session of the running event loop.
+
+    :returns: AsyncSession -- Asynchronous session instance.
+
+    >>> from swap.providers.aio import get_session
+    >>> get_session()
+    <swap.providers.aio.AsyncSession object at 0x0409DAF0>
+    """
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    if loop not in _sessions:
+        _sessions[loop] = AsyncSession()
+    return _sessions[loop]
+
+
+async def close_session() -> None:
+    """
+    Close the shared asynchronous session of the running event loop.
+
+    >>> from swap.providers.aio import close_session
+    >>> await close_session()
+    """
+
+    async_session: Optional[AsyncSession] = _sessions.pop(asyncio.get_event_loop(), None)
+    if async_session is not None:
+        await async_session.close()
+
+
+async def run_sync(function: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking function on the shared bounded builder thread pool.
+
+    :param function: Blocking function.
+    :type function: callable
+
+    :returns: any -- Function result.
+
+    >>> from swap.providers.aio import run_sync
+    >>> from swap.providers.ethereum.rpc import get_erc20_decimals
+    >>> await run_sync(get_erc20_decimals, token_address="0xDaB6844e863bdfEE6AaFf888D2D34Bf1B7c37861", network="testnet")
+    18
+    """
+
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=config["workers"], thread_name_prefix="swap-aio")
+    return await asyncio.get_event_loop().run_in_executor(_executor, partial(function, *args, **kwargs))
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+from typing import (
+    Any, Dict, Optional, Tuple
+)
+
+import threading
+import tempfile
+import hashlib
+import json
+import os
+
+from .config import artifacts as config
+
+_lock: threading.Lock = threading.Lock()
+# Loaded JSON artifact files and compiled solc outputs, by file path and source hash
+_artifacts: Dict[str, dict] = {}
+_compiled: Dict[str, dict] = {}
+# Contract objects by web3 instance, ABI and address, least recently used ones are evicted
+_contracts: "OrderedDict[Tuple[int, int, Optional[str]], Tuple[Any, list, Any]]" = OrderedDict()
+
+
+def _contracts_directory(package: str) -> str:
+    # Provider packages sit next to this module, resolved without importing them
+    return os.path.join(os.path.dirname(__file__), package.rsplit(".", 1)[-1], "contracts")
+
+
+def load_artifact(package: str, json_source_name: str, sol_source_with_class_name: str) -> dict:
+    """
+    Load compiled contract artifact, every file is read once per process.
+
+    :param package: Provider package name (like ``swap.providers.ethereum``).
+    :type package: str
+    :param json_source_name: JSON source name in the package contracts directory.
+    :type json_source_name: str
+    :param sol_source_with_class_name: Solidity source with class name.
+    :type sol_source_with_class_name: str
+
+    :returns: dict -- Contract artifact (abi, bin, bin-runtime and opcodes).
+
+    .. note::
+        Returned artifacts are shared between callers, they must not be modified.
+
+    >>> from swap.providers.artifacts import load_artifact
+    >>> load_artifact(package="swap.providers.ethereum", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC")["opcodes"]
+    "PUSH1 0x80 PUSH1 0x40 MSTORE CALLVALUE DUP1 ISZERO PUSH2 0x10 JUMPI PUSH1 0x0 DUP1 REVERT JUMPDEST POP ..."
+    """
+
+    path: str = os.path.join(_contracts_directory(package=package), json_source_name)
+    with _lock:
+        if path not in _artifacts:
+            with open(path, "r") as json_file:
+                _artifacts[path] = json.loads(json_file.read())
+        return _artifacts[path][sol_source_with_class_name]
+
+
+def source_hash(package: str, solc_version: str) -> str:
+    """
+    Get contracts source hash, changes with any solidity source or the solc version.
+
+    :param package: Provider package name (like ``swap.providers.ethereum``).
+    :type package: str
+    :param solc_version: Solidity compiler version.
+    :type solc_version: str
+
+    :returns: str -- Contracts source sha-256 hash.
+
+    >>> from swap.providers.artifacts import source_hash
+    >>> source_hash(package="swap.providers.ethereum", solc_version="0.8.6")
+    "8eeb970b47630795fe64bb310146579fbd1771c7a9bcffbd66cfe952391798b7"
+    """
+
+    directory: str = _contracts_directory(package=package)
+    sources = hashlib.sha256(solc_version.encode())
+    # Imported libraries are hashed too, they are compiled into the contracts
+    for root, directories, files in os.walk(directory):
+        directories.sort()
+        for file in sorted(files):
+            if file.endswith(".sol"):
+                with open(os.path.join(root, file), "rb") as sol_file:
+                    sources.update(os.path.relpath(os.path.join(root, file), directory).encode())
+                    sources.update(sol_file.read())
+    return sources.hexdigest()
+
+
+def compile_artifact(package: str, sol_source_name: str, sol_source_with_class_name: str,
+                     solc_version: str, path: Optional[str] = config["path"]) -> dict:
+    """
+    Compile contract artifact with solc, outputs are kept on disk by contracts source hash.
+
+    :param package: Provider package name (like ``swap.providers.ethereum``).
+    :type package: str
+    :param sol_source_name: Solidity source name in the package contracts directory.
+    :type sol_source_name: str
+    :param sol_source_with_class_name: Solidity source with class name.
+    :type sol_source_with_class_name: str
+    :param solc_version: Solidity compiler version.
+    :type solc_version: str
+    :param path: Compiled outputs directory, defaults to ``None`` (temporary directory).
+    :type path: str
+
+    :returns: dict -- Contract artifact (abi, bin, bin-runtime and opcodes).
+
+    >>> from swap.providers.artifacts import compile_artifact
+    >>> compile_artifact(package="swap.providers.ethereum", sol_source_name="htlc.sol", sol_source_with_class_name="htlc.sol:HTLC", solc_version="0.8.6")["opcodes"]
+    "PUSH1 0x80 PUSH1 0x40 MSTORE CALLVALUE DUP1 ISZERO PUSH2 0x10 JUMPI PUSH1 0x0 DUP1 REVERT JUMPDEST POP ..."
+    """
+
+    key: str = f"{source_hash(package=package, solc_version=solc_version)}-{sol_source_name}"
+    path: str = os.path.join(path or os.path.join(tempfile.gettempdir(), "swap-solc"), f"{key}.json")
+    with _lock:
+        if key not in _compiled and os.path.isfile(path):
+            with open(path, "r") as json_file:
+                _compiled[key] = json.loads(json_file.read())
+        if key not in _compiled:
+            directory: str = _contracts_directory(package=package)
+            solcx = __import__("solcx")
+            semantic_version = __import__("semantic_version")
+            compiled_files: dict = solcx.compile_files(
+                source_files=[os.path.join(directory, sol_source_name)],
+                output_values=["abi", "bin", "bin-runtime", "opcodes"],
+                solc_version=semantic_version.Version(solc_version)
+            )
+            # Keys are stored relative to the contracts directory, site-packages paths differ between hosts
+            _compiled[key] = {
+                os.path.relpath(name, directory): compiled_file for name, compiled_file in compiled_files.items()
+            }
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.{os.getpid()}", "w") as json_file:
+                json_file.write(json.dumps(_compiled[key]))
+            os.replace(f"{path}.{os.getpid()}", path)
+        return _compiled[key][sol_source_with_class_name]
+
+
+def get_contract(web3: Any, abi: list, address: Optional[str] = None) -> Any:
+    """
+    Get web3 contract, built once per web3 instance, ABI and address.
+
+    :param web3: Web3 instance.
+    :type web3: web3.Web3
+    :param abi: Contract ABI, from a loaded artifact.
+    :type abi: list
+    :param address: Contract checksum address, defaults to ``None``.
+    :type address: str
+
+    :returns: Contract -- Web3 contract instance.
+
+    >>> from swap.providers.artifacts import load_artifact, get_contract
+    >>> from swap.providers.ethereum.rpc import get_web3
+    >>> abi: list = load_artifact(package="swap.providers.ethereum", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC")["abi"]
+    >>> get_contract(web3=get_web3(network="testnet"), abi=abi, address="0xeaEaC81da5E386E8Ca4De1e64d40a10E468A5b40")
+    <web3._utils.datatypes.Contract object at 0x0409DAF0>
+    """
+
+    key: Tuple[int, int, Optional[str]] = (id(web3), id(abi), address)
+    with _lock:
+        cached: Optional[Tuple[Any, list, Any]] = _contracts.get(key)
+        # Identity check, ids of collected web3 instances or ABIs can be reused
+        if cached is None or cached[0] is not web3 or cached[1] is not abi:
+            _contracts[key] = cached = (web3, abi, web3.eth.contract(address=address, abi=abi))
+            if len(_contracts) > config["maxsize"]:
+                _contracts.popitem(last=False)
+        _contracts.move_to_end(key)
+        return cached[2]
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, AsyncIterator
+)
+
+import json
+
+from ...exceptions import (
+    AddressError, APIError, NetworkError
+)
+from ..aio import (
+    get_session, run_sync
+)
+from ..cache import (
+    cached, finalized
+)
+from ..config import bitcoin as config
+from .rpc import decode_raw as _decode_raw_offline
+from .utils import (
+    is_network, is_address
+)
+from . import transaction
+
+
+@cached(policy="balance")
+async def get_balance(address: str, network: str = config["network"],
+                      headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
+    """
+    Get Bitcoin balance.
+
+    :param address: Bitcoin address.
+    :type address: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: int -- Bitcoin balance (Satoshi amount).
+
+    >>> from swap.providers.bitcoin.aio import get_balance
+    >>> await get_balance(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", network="testnet")
+    1394238
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
+
+    url = f"{config[network]['blockcypher']['url']}/addrs/{address}/balance"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    return response_json["balance"]
+
+
+async def get_utxos(address: str, network: str = config["network"], include_script: bool = True,
+                    limit: Optional[int] = 15, headers: dict = config["headers"],
+                    timeout: int = config["timeout"]) -> list:
+    """
+    Get Bitcoin unspent transaction outputs (UTXO's).
+
+    :param address: Bitcoin address.
+    :type address: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param include_script: Bitcoin include script, defaults to ``True``.
+    :type include_script: bool
+    :param limit: Bitcoin utxo's limit, defaults to ``15`` (``None`` to follow every page).
+    :type limit: int
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :returns: list -- Bitcoin unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.bitcoin.aio import get_utxos
+    >>> await get_utxos(address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", network="testnet")
+    [{'tx_hash': '98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999', 'block_height': 1890810, 'tx_input_n': -1, 'tx_output_n': 1, 'value': 67966, 'ref_balance': 146610, 'spent': False, 'confirmations': 5278, 'confirmed': '2020-11-09T08:53:01Z', 'double_spend': False, 'script': '76a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac'}]
+    """
+
+    if limit is None:
+        return [utxo async for utxo in iter_utxos(
+            address=address, network=network, include_script=include_script, headers=headers, timeout=timeout
+        )]
+    async for page in iter_utxos(
+        address=address, network=network, include_script=include_script,
+        limit=limit, headers=headers, timeout=timeout, pages=True
+    ):
+        return page
+    return []
+
+
+def iter_utxos(address: str, network: str = config["network"], include_script: bool = True,
+               limit: int = config["utxo_limit"], headers: dict = config["headers"],
+               timeout: int = config["timeout"], pages: bool = False) -> AsyncIterator:
+    """
+    Iterate Bitcoin unspent transaction outputs (UTXO's), next page is fetched only when needed.
+
+    :param address: Bitcoin address.
+    :type address: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param include_script: Bitcoin include script, defaults to ``True``.
+    :type include_script: bool
+    :param limit: Bitcoin utxo's page size, defaults to ``200``.
+    :type limit: int
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :param pages: Yield whole pages instead of single UTXO's, defaults to ``False``.
+    :type pages: bool
+    :returns: async generator -- Bitcoin unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.bitcoin.aio import iter_utxos
+    >>> [utxo async for utxo in iter_utxos(address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", network="testnet")]
+    [{'tx_hash': '98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999', 'block_height': 1890810, 'tx_input_n': -1, 'tx_output_n': 1, 'value': 67966, 'ref_balance': 146610, 'spent': False, 'confirmations': 5278, 'confirmed': '2020-11-09T08:53:01Z', 'double_spend': False, 'script': '76a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac'}]
+    """
+
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    parameter = dict(
+        limit=limit, unspentOnly="true",
+        includeScript=("true" if include_script else "false"),
+        token=config[network]["blockcypher"]["token"]
+    )
+    url = f"{config[network]['blockcypher']['url']}/addrs/{address}"
+    return _iter_utxos(url=url, parameter=parameter, headers=headers, timeout=timeout, pages=pages)
+
+
+async def _iter_utxos(url: str, parameter: dict, headers: dict, timeout: int, pages: bool) -> AsyncIterator:
+    seen: set = set()
+    while True:
+        response = await get_session().get(
+            url=url, params=parameter, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        txrefs: list = response_json["txrefs"] if "txrefs" in response_json else []
+        # BlockCypher pages by block height, skip outputs repeated across the page edge
+        page: list = [
+            txref for txref in txrefs if (txref["tx_hash"], txref["tx_output_n"]) not in seen
+        ]
+        seen.update((txref["tx_hash"], txref["tx_output_n"]) for txref in page)
+        if not page:
+            # Nothing new, the lowest block has more outputs than the page limit
+            break
+        if pages:
+            yield page
+        else:
+            for txref in page:
+                yield txref
+        if not response_json.get("hasMore"):
+            break
+        # Before is exclusive, request the lowest block again for its outputs past the page edge,
+        # unless this page was already that block only
+        block_height: int = min(txref["block_height"] for txref in txrefs)
+        parameter["before"] = block_height if parameter.get("before") == (block_height + 1) else (block_height + 1)
+
+
+@cached(policy="transaction", permanent=finalized, cacheable=lambda transaction: "error" not in transaction)
+async def get_transaction(transaction_hash: str, network: str = config["network"],
+                          headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
+    """
+    Get Bitcoin transaction detail.
+
+    :param transaction_hash: Bitcoin transaction hash/id.
+    :type transaction_hash: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Bitcoin transaction detail.
+
+    >>> from swap.providers.bitcoin.aio import get_transaction
+    >>> await get_transaction(transaction_hash="4e91bca76db112d3a356c17366df93e364a4922993414225f65390220730d0c1", network="testnet")
+    {'block_hash': '000000000000006fb2aec57209181feb54750319e47263c48eca24369bdbee86', 'block_height': 1890810, 'block_index': 37, 'hash': '98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999', ...}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockcypher']['url']}/txs/{transaction_hash}"
+    parameter = dict(token=config[network]["blockcypher"]["token"])
+    response = await get_session().get(
+        url=url, params=parameter, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    return response_json
+
+
+async def get_fee_rate(network: str = config["network"], priority: str = config["fee_priority"],
+                       headers: dict = config["headers"], timeout: int = config["timeout"]) -> float:
+    """
+    Get Bitcoin network fee rate.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param priority: Fee priority, defaults to ``medium``.
+    :type priority: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: float -- Bitcoin fee rate (Satoshi per virtual byte).
+
+    >>> from swap.providers.bitcoin.aio import get_fee_rate
+    >>> await get_fee_rate(network="testnet")
+    12.345
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    if priority not in ["high", "medium", "low"]:
+        raise ValueError("Invalid Bitcoin fee priority, choose only 'high', 'medium' or 'low' priorities.")
+
+    response = await get_session().get(
+        url=config[network]["blockcypher"]["url"], params=dict(
+            token=config[network]["blockcypher"]["token"]
+        ), headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    if f"{priority}_fee_per_kb" not in response_json:
+        raise APIError(response_json.get("error", "Invalid Bitcoin fee rate response."))
+    # BlockCypher fee is Satoshi per kilobyte
+    return response_json[f"{priority}_fee_per_kb"] / 1000
+
+
+async def decode_raw(raw: str, network: str = config["network"], offline: bool = True,
+                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
+    """
+    Decode original Bitcoin raw.
+
+    :param raw: Bitcoin transaction raw.
+    :type raw: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param offline: Offline decode, defaults to ``True``.
+    :type offline: bool
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Bitcoin decoded transaction raw.
+
+    >>> from swap.providers.bitcoin.aio import decode_raw
+    >>> await decode_raw(raw="02000000011823f39a8c5f6f27845dd13a65e03fe2ef5108d235e7a36edb6eb267b0459c5a010000006a47304402207018b7fd1ba6624fe9bb0f16cd65fa243d202e32fdff452699f56465b61ab648022009f0dc1a0a63109246c45e120fc0d34b40e789dfc4d05e64f269602c7d67d9210121027f0dc0894bd690635412af782d05e4f79d3d40bf568978c650f3f1ca1a96cf36ffffffff02102700000000000017a9149418feed4647e156d6663db3e0cef7c050d038678734330100000000001976a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac00000000", network="testnet")
+    {'hex': '02000000011823f39a8c5f6f27845dd13a65e03fe2ef5108d235e7a36edb6eb267b0459c5a010000006a47304402207018b7fd1ba6624fe9bb0f16cd65fa243d202e32fdff452699f56465b61ab648022009f0dc1a0a63109246c45e120fc0d34b40e789dfc4d05e64f269602c7d67d9210121027f0dc0894bd690635412af782d05e4f79d3d40bf568978c650f3f1ca1a96cf36ffffffff02102700000000000017a9149418feed4647e156d6663db3e0cef7c050d038678734330100000000001976a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac00000000', 'txid': '6e5c80f600f45acda3c3101128bb3075bf2cf7af4bab0d99c9d856ebfb4b0953', ...}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    if offline:
+        return _decode_raw_offline(raw=raw, network=network, offline=True)
+    return await _decode_raw(raw=raw, network=network, headers=headers, timeout=timeout)
+
+
+@cached(policy="decoded", cacheable=lambda decoded: "error" not in decoded)
+async def _decode_raw(raw: str, network: str, headers: dict, timeout: int) -> dict:
+    url = f"{config[network]['blockcypher']['url']}/txs/decode"
+    parameter = dict(token=config[network]["blockcypher"]["token"])
+    data = dict(tx=raw)
+    response = await get_session().post(
+        url=url, data=json.dumps(data), params=parameter, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    return response_json
+
+
+async def submit_raw(raw: str, network: str = config["network"], endpoint: str = "sochain",
+                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> str:
+    """
+    Submit original Bitcoin raw into blockchain.
+
+    :param raw: Bitcoin transaction raw.
+    :type raw: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param endpoint: Bitcoin transaction submiter endpoint api name, defaults to ``sochain``.
+    :type endpoint: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Bitcoin submitted transaction id/hash.
+
+    >>> from swap.providers.bitcoin.aio import submit_raw
+    >>> await submit_raw(raw="02000000011823f39a8c5f6f27845dd13a65e03fe2ef5108d235e7a36edb6eb267b0459c5a010000006a47304402207018b7fd1ba6624fe9bb0f16cd65fa243d202e32fdff452699f56465b61ab648022009f0dc1a0a63109246c45e120fc0d34b40e789dfc4d05e64f269602c7d67d9210121027f0dc0894bd690635412af782d05e4f79d3d40bf568978c650f3f1ca1a96cf36ffffffff02102700000000000017a9149418feed4647e156d6663db3e0cef7c050d038678734330100000000001976a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac00000000", network="testnet")
+    "167faa4043ff622e7860ee5228d1ad6d763c5a6cfce79dbc3b9b5fc7bded6394"
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    if endpoint == "smartbit":
+        url = f"{config[network]['smartbit']}/pushtx"
+        data = dict(hex=raw)
+        response = await get_session().post(
+            url=url, data=json.dumps(data), headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        if "success" in response_json and not response_json["success"]:
+            raise APIError(response_json["error"]["message"], response_json["error"]["code"])
+        elif "success" in response_json and response_json["success"]:
+            return response_json["txid"]
+        else:
+            raise APIError("Unknown Bitcoin submit payment error.")
+    elif endpoint == "sochain":
+        url = str(config[network]['sochain']).format(links="send_tx")
+        data = dict(tx_hex=raw)
+        response = await get_session().post(
+            url=url, data=json.dumps(data), headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        if "status" in response_json and response_json["status"] == "success":
+            return response_json["data"]["txid"]
+        elif "status" in response_json and response_json["status"] == "fail":
+            raise APIError(response_json["data"]["tx_hex"])
+        else:
+            raise APIError("Unknown Bitcoin submit payment error.")
+    else:
+        raise TypeError("Invalid Bitcoin endpoint api name, please choose only smartbit or sochain only.")
+
+
+class NormalTransaction(transaction.NormalTransaction):
+    """
+    Bitcoin asynchronous normal transaction.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
+
+    :returns: NormalTransaction -- Bitcoin asynchronous normal transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "NormalTransaction":
+        """
+        Build Bitcoin normal transaction, takes the same arguments as
+        :meth:`swap.providers.bitcoin.transaction.NormalTransaction.build_transaction`.
+
+        >>> from swap.providers.bitcoin.aio import NormalTransaction
+        >>> normal_transaction: NormalTransaction = NormalTransaction(network="testnet")
+        >>> await normal_transaction.build_transaction(address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", recipients={"2N6kHwQy6Ph5EdKNgzGrcW2WhGHKGfmP5ae": 10000000}, locktime=0)
+        <swap.providers.bitcoin.aio.NormalTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class FundTransaction(transaction.FundTransaction):
+    """
+    Bitcoin asynchronous fund transaction.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
+
+    :returns: FundTransaction -- Bitcoin asynchronous fund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "FundTransaction":
+        """
+        Build Bitcoin fund transaction, takes the same arguments as
+        :meth:`swap.providers.bitcoin.transaction.FundTransaction.build_transaction`.
+
+        >>> from swap.providers.bitcoin.htlc import HTLC
+        >>> from swap.providers.bitcoin.aio import FundTransaction
+        >>> from swap.utils import sha256
+        >>> htlc: HTLC = HTLC(network="testnet")
+        >>> htlc.build_htlc(secret_hash=sha256("Hello Meheret!"), recipient_address="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", sender_address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", endtime=1624687630)
+        >>> fund_transaction: FundTransaction = FundTransaction(network="testnet")
+        >>> await fund_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", htlc=htlc, amount=0.001, unit="BTC")
+        <swap.providers.bitcoin.aio.FundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class WithdrawTransaction(transaction.WithdrawTransaction):
+    """
+    Bitcoin asynchronous withdraw transaction.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
+
+    :returns: WithdrawTransaction -- Bitcoin asynchronous withdraw transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "WithdrawTransaction":
+        """
+        Build Bitcoin withdraw transaction, takes the same arguments as
+        :meth:`swap.providers.bitcoin.transaction.WithdrawTransaction.build_transaction`.
+
+        >>> from swap.providers.bitcoin.aio import WithdrawTransaction
+        >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction("testnet")
+        >>> await withdraw_transaction.build_transaction(address="mgS3WMHp9nvdUPeDJxr5iCF2P5HuFZSR3V", transaction_hash="a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31")
+        <swap.providers.bitcoin.aio.WithdrawTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class RefundTransaction(transaction.RefundTransaction):
+    """
+    Bitcoin asynchronous refund transaction.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param version: Bitcoin transaction version, defaults to ``2``.
+    :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
+
+    :returns: RefundTransaction -- Bitcoin asynchronous refund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "RefundTransaction":
+        """
+        Build Bitcoin refund transaction, takes the same arguments as
+        :meth:`swap.providers.bitcoin.transaction.RefundTransaction.build_transaction`.
+
+        >>> from swap.providers.bitcoin.aio import RefundTransaction
+        >>> refund_transaction: RefundTransaction = RefundTransaction("testnet")
+        >>> await refund_transaction.build_transaction(address="n1wgm6kkzMcNfAtJmes8YhpvtDzdNhDY5a", transaction_hash="a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31")
+        <swap.providers.bitcoin.aio.RefundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+from btcpy.structs.transaction import MutableTransaction
+from typing import (
+    Optional, Callable, Dict, List, Tuple
+)
+
+import threading
+import math
+import time
+
+from ..config import bitcoin as config
+from .utils import TRANSACTION_OVERHEAD_SIZE
+from .rpc import get_fee_rate
+
+# Signed script sig sizes (bytes)
+SIGNATURE_PUSH_SIZE: int = 74  # push, DER signature (max 72) and sighash type
+PUBLIC_KEY_PUSH_SIZE: int = 34  # push and compressed public key
+HTLC_SCRIPT_SIZE: int = 96  # swap/providers/bitcoin/contracts/htlc.script with 5 bytes end time
+HTLC_SECRET_SIZE: int = 32
+
+
+def _push_size(size: int) -> int:
+    # Data push opcode (OP_PUSHBYTES, OP_PUSHDATA1, OP_PUSHDATA2) plus data
+    return size + (1 if size < 76 else 2 if size < 256 else 3)
+
+
+def _var_int_size(size: int) -> int:
+    return 1 if size < 253 else 3 if size <= 0xffff else 5
+
+
+def script_sig_size(script_type: str = "p2pkh", secret_size: int = HTLC_SECRET_SIZE,
+                    redeem_script_size: int = HTLC_SCRIPT_SIZE) -> int:
+    """
+    Get Bitcoin signed script sig size.
+
+    :param script_type: Spent script type, defaults to ``p2pkh``.
+    :type script_type: str
+    :param secret_size: HTLC secret key size (bytes), defaults to ``32``.
+    :type secret_size: int
+    :param redeem_script_size: HTLC redeem script size (bytes), defaults to ``96``.
+    :type redeem_script_size: int
+
+    :returns: int -- Script sig size (bytes).
+
+    .. note::
+        Bitcoin has only three spent script types, ``p2pkh``, ``withdraw`` (HTLC hash lock branch)
+        and ``refund`` (HTLC time lock branch).
+
+    >>> from swap.providers.bitcoin.fee import script_sig_size
+    >>> script_sig_size(script_type="withdraw", secret_size=14)
+    222
+    """
+
+    if script_type == "p2pkh":
+        return SIGNATURE_PUSH_SIZE + PUBLIC_KEY_PUSH_SIZE
+    elif script_type == "withdraw":
+        # <signature> <public key> <secret> OP_TRUE <redeem script>
+        return SIGNATURE_PUSH_SIZE + PUBLIC_KEY_PUSH_SIZE + _push_size(secret_size) + 1 + \
+            _push_size(redeem_script_size)
+    elif script_type == "refund":
+        # <signature> <public key> OP_FALSE <redeem script>
+        return SIGNATURE_PUSH_SIZE + PUBLIC_KEY_PUSH_SIZE + 1 + _push_size(redeem_script_size)
+    raise ValueError(f"Invalid Bitcoin '{script_type}' script type, "
+                     f"choose only 'p2pkh', 'withdraw' or 'refund' script types.")
+
+
+def estimate_size(transaction: MutableTransaction, script_types: Optional[List[str]] = None,
+                  secret_size: int = HTLC_SECRET_SIZE) -> int:
+    """
+    Estimate Bitcoin signed transaction virtual size.
+
+    :param transaction: Bitcoin unsigned transaction.
+    :type transaction: btcpy.structs.transaction.MutableTransaction
+    :param script_types: Spent script type of each input, defaults to ``p2pkh`` for all.
+    :type script_types: list
+    :param secret_size: HTLC secret key size (bytes), defaults to ``32``.
+    :type secret_size: int
+
+    :returns: int -- Bitcoin transaction virtual size (bytes).
+
+    >>> from swap.providers.bitcoin.fee import estimate_size
+    >>> estimate_size(transaction=unsigned_transaction)
+    227
+    """
+
+    # Unsigned transaction has empty script sigs, add the signed ones on top
+    size: int = len(transaction.hexlify()) // 2
+    script_types = script_types or (["p2pkh"] * len(transaction.ins))
+    for _input, script_type in zip(transaction.ins, script_types):
+        _script_sig_size: int = script_sig_size(script_type=script_type, secret_size=secret_size)
+        size += _script_sig_size + _var_int_size(_script_sig_size) - 1
+    # Legacy transactions have no witness, virtual size equals size
+    return max(size, TRANSACTION_OVERHEAD_SIZE)
+
+
+def estimate_fee(transaction: MutableTransaction, fee_rate: float, script_types: Optional[List[str]] = None,
+                 secret_size: int = HTLC_SECRET_SIZE) -> int:
+    """
+    Estimate Bitcoin transaction fee.
+
+    :param transaction: Bitcoin unsigned transaction.
+    :type transaction: btcpy.structs.transaction.MutableTransaction
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte).
+    :type fee_rate: float
+    :param script_types: Spent script type of each input, defaults to ``p2pkh`` for all.
+    :type script_types: list
+    :param secret_size: HTLC secret key size (bytes), defaults to ``32``.
+    :type secret_size: int
+
+    :returns: int -- Bitcoin fee (Satoshi amount).
+
+    >>> from swap.providers.bitcoin.fee import estimate_fee
+    >>> estimate_fee(transaction=unsigned_transaction, fee_rate=2.5)
+    568
+    """
+
+    return math.ceil(fee_rate * estimate_size(
+        transaction=transaction, script_types=script_types, secret_size=secret_size
+    ))
+
+
+class FeeEstimator:
+    """
+    Bitcoin fee rate estimator.
+
+    :param source: Fee rate source, called with network and returns Satoshi per virtual byte, defaults to ``get_fee_rate``.
+    :type source: callable
+    :param ttl: Seconds to keep a fee rate, defaults to ``60``.
+    :type ttl: int
+    :param min_fee_rate: Minimum fee rate (Satoshi per virtual byte), defaults to ``1``.
+    :type min_fee_rate: float
+
+    :returns: FeeEstimator -- Bitcoin fee rate estimator instance.
+
+    .. note::
+        When the source fails, the last known fee rate of the network is used even if it is expired.
+
+    >>> from swap.providers.bitcoin.fee import FeeEstimator
+    >>> fee_estimator: FeeEstimator = FeeEstimator(ttl=120)
+    >>> fee_estimator.fee_rate(network="testnet")
+    12.345
+    """
+
+    def __init__(self, source: Optional[Callable[[str], float]] = None, ttl: int = config["fee_rate_ttl"],
+                 min_fee_rate: float = config["min_fee_rate"]):
+
+        self._source: Callable[[str], float] = source or (lambda network: get_fee_rate(network=network))
+        self._ttl: int = ttl
+        self._min_fee_rate: float = min_fee_rate
+        self._fee_rates: Dict[str, Tuple[float, float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def fee_rate(self, network: str = config["network"]) -> float:
+        """
+        Get Bitcoin fee rate.
+
+        :param network: Bitcoin network, defaults to ``mainnet``.
+        :type network: str
+
+        :returns: float -- Bitcoin fee rate (Satoshi per virtual byte).
+
+        >>> from swap.providers.bitcoin.fee import FeeEstimator
+        >>> fee_estimator: FeeEstimator = FeeEstimator()
+        >>> fee_estimator.fee_rate(network="testnet")
+        12.345
+        """
+
+        with self._lock:
+            cached: Optional[Tuple[float, float]] = self._fee_rates.get(network)
+            if cached and (time.monotonic() - cached[1]) < self._ttl:
+                return cached[0]
+            try:
+                fee_rate: float = max(float(self._source(network)), self._min_fee_rate)
+            except Exception:
+                if cached:
+                    return cached[0]
+                raise
+            self._fee_rates[network] = (fee_rate, time.monotonic())
+            return fee_rate
+
+    def clear(self) -> "FeeEstimator":
+        """
+        Forget cached fee rates.
+
+        :returns: FeeEstimator -- Bitcoin fee rate estimator instance.
+
+        >>> from swap.providers.bitcoin.fee import FeeEstimator
+        >>> fee_estimator: FeeEstimator = FeeEstimator()
+        >>> fee_estimator.clear()
+        <swap.providers.bitcoin.fee.FeeEstimator object at 0x0409DAF0>
+        """
+
+        with self._lock:
+            self._fee_rates.clear()
+            return self
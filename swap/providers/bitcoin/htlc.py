@@ -18,6 +18,7 @@ from ...exceptions import (
     AddressError, NetworkError, UnitError
 )
 from ..config import bitcoin as config
+from .network import in_network_context
 from .rpc import (
     get_balance, get_utxos
 )
@@ -53,6 +54,7 @@ class HTLC:
     def script(self) -> Union[ScriptBuilder]:
         return self._script
 
+    @in_network_context
     def build_htlc(self, secret_hash: str, recipient_address: str, sender_address: str, endtime: int) -> "HTLC":
         """
         Build Bitcoin Hash Time Lock Contract (HTLC).
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import (
+    Any, Callable, Iterator, Optional, Tuple
+)
+
+import btcpy.setup
+import btcpy.structs.crypto
+import btcpy.structs.hd
+import btcpy.structs.address
+import btcpy.lib.codecs
+
+from ...exceptions import NetworkError
+
+# Current Bitcoin network and strictness, local to each thread (and asyncio task)
+_context: ContextVar[Optional[Tuple[str, bool]]] = ContextVar("bitcoin_network", default=None)
+# Original btcpy globals readers, used outside of any network context
+_is_mainnet: Callable[[], bool] = btcpy.setup.is_mainnet
+_net_name: Callable[[], str] = btcpy.setup.net_name
+_is_strict: Callable[[], bool] = btcpy.setup.is_strict
+
+
+def is_mainnet() -> bool:
+    context: Optional[Tuple[str, bool]] = _context.get()
+    return _is_mainnet() if context is None else context[0] == "mainnet"
+
+
+def net_name() -> str:
+    context: Optional[Tuple[str, bool]] = _context.get()
+    return _net_name() if context is None else context[0]
+
+
+def is_strict() -> bool:
+    context: Optional[Tuple[str, bool]] = _context.get()
+    return _is_strict() if context is None else context[1]
+
+
+# btcpy modules read the network through these functions, imported by name, they are replaced once
+for _module in [btcpy.setup, btcpy.structs.crypto, btcpy.structs.hd, btcpy.structs.address, btcpy.lib.codecs]:
+    for _name, _function in [("is_mainnet", is_mainnet), ("net_name", net_name), ("is_strict", is_strict)]:
+        if hasattr(_module, _name):
+            setattr(_module, _name, _function)
+
+
+@contextmanager
+def network_context(network: str, strict: bool = True) -> Iterator[str]:
+    """
+    Bitcoin network context, btcpy uses this network inside the block without mutating its globals.
+
+    :param network: Bitcoin network.
+    :type network: str
+    :param strict: btcpy strict mode, defaults to ``True``.
+    :type strict: bool
+
+    :returns: str -- Bitcoin network.
+
+    .. note::
+        Contexts are local to each thread and asyncio task, mainnet and testnet
+        transactions can be built and signed concurrently in one process.
+
+    >>> from btcpy.structs.address import Address
+    >>> from swap.providers.bitcoin.network import network_context
+    >>> with network_context(network="testnet"):
+    ...     Address.from_string("mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC").hash.hex()
+    "33ecab3d67f0e2bde43e52f41ec1ecbdc73f11f8"
+    """
+
+    if network not in ["mainnet", "testnet"]:
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    token = _context.set((network, strict))
+    try:
+        yield network
+    finally:
+        _context.reset(token)
+
+
+def in_network_context(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Run instance method inside its instance Bitcoin network context.
+
+    :param method: Method of instance with ``_network`` attribute.
+    :type method: callable
+
+    :returns: callable -- Wrapped method.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs) -> Any:
+        with network_context(network=self._network):
+            return method(self, *args, **kwargs)
+    return wrapper
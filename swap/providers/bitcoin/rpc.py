@@ -1,21 +1,27 @@
 #!/usr/bin/env python3
 
 from btcpy.structs.transaction import MutableTransaction
-from btcpy.setup import setup as stp
-from typing import Optional
+from typing import (
+    Optional, Iterator
+)
 
-import requests
 import json
 
 from ...exceptions import (
     AddressError, APIError, NetworkError
 )
 from ..config import bitcoin as config
+from ..session import session
+from ..cache import (
+    cached, finalized
+)
+from .network import network_context
 from .utils import (
     is_network, is_address
 )
 
 
+@cached(policy="balance")
 def get_balance(address: str, network: str = config["network"],
                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
     """
@@ -44,7 +50,7 @@ def get_balance(address: str, network: str = config["network"],
         raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
     
     url = f"{config[network]['blockcypher']['url']}/addrs/{address}/balance"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -52,7 +58,7 @@ def get_balance(address: str, network: str = config["network"],
 
 
 def get_utxos(address: str, network: str = config["network"], include_script: bool = True,
-              limit: int = 15, headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
+              limit: Optional[int] = 15, headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
     """
     Get Bitcoin unspent transaction outputs (UTXO's).
 
@@ -62,7 +68,7 @@ def get_utxos(address: str, network: str = config["network"], include_script: bo
     :type network: str
     :param include_script: Bitcoin include script, defaults to ``True``.
     :type include_script: bool
-    :param limit: Bitcoin utxo's limit, defaults to ``15``.
+    :param limit: Bitcoin utxo's limit, defaults to ``15`` (``None`` to follow every page).
     :type limit: int
     :param headers: Request headers, default to ``common-headers``.
     :type headers: dict
@@ -75,25 +81,87 @@ def get_utxos(address: str, network: str = config["network"], include_script: bo
     [{'tx_hash': '98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999', 'block_height': 1890810, 'tx_input_n': -1, 'tx_output_n': 1, 'value': 67966, 'ref_balance': 146610, 'spent': False, 'confirmations': 5278, 'confirmed': '2020-11-09T08:53:01Z', 'double_spend': False, 'script': '76a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac'}]
     """
 
+    if limit is None:
+        return list(iter_utxos(
+            address=address, network=network, include_script=include_script, headers=headers, timeout=timeout
+        ))
+    return next(iter_utxos(
+        address=address, network=network, include_script=include_script,
+        limit=limit, headers=headers, timeout=timeout, pages=True
+    ), [])
+
+
+def iter_utxos(address: str, network: str = config["network"], include_script: bool = True,
+               limit: int = config["utxo_limit"], headers: dict = config["headers"],
+               timeout: int = config["timeout"], pages: bool = False) -> Iterator:
+    """
+    Iterate Bitcoin unspent transaction outputs (UTXO's), next page is fetched only when needed.
+
+    :param address: Bitcoin address.
+    :type address: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param include_script: Bitcoin include script, defaults to ``True``.
+    :type include_script: bool
+    :param limit: Bitcoin utxo's page size, defaults to ``200``.
+    :type limit: int
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :param pages: Yield whole pages instead of single UTXO's, defaults to ``False``.
+    :type pages: bool
+    :returns: generator -- Bitcoin unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.bitcoin.rpc import iter_utxos
+    >>> next(iter_utxos(address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", network="testnet"))
+    {'tx_hash': '98c6a3d4e136d32d0848126e08325c94da2e8217593e92236471b11b42ee7999', 'block_height': 1890810, 'tx_input_n': -1, 'tx_output_n': 1, 'value': 67966, 'ref_balance': 146610, 'spent': False, 'confirmations': 5278, 'confirmed': '2020-11-09T08:53:01Z', 'double_spend': False, 'script': '76a91433ecab3d67f0e2bde43e52f41ec1ecbdc73f11f888ac'}
+    """
+
     if not is_address(address=address, network=network):
         raise AddressError(f"Invalid Bitcoin '{address}' {network} address.")
     if not is_network(network=network):
         raise NetworkError(f"Invalid Bitcoin '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
-    
+
     parameter = dict(
-        limit=limit, unspentOnly="true", 
+        limit=limit, unspentOnly="true",
         includeScript=("true" if include_script else "false"),
         token=config[network]["blockcypher"]["token"]
     )
     url = f"{config[network]['blockcypher']['url']}/addrs/{address}"
-    response = requests.get(
-        url=url, params=parameter, headers=headers, timeout=timeout
-    )
-    response_json = response.json()
-    return response_json["txrefs"] if "txrefs" in response_json else []
+    return _iter_utxos(url=url, parameter=parameter, headers=headers, timeout=timeout, pages=pages)
+
+
+def _iter_utxos(url: str, parameter: dict, headers: dict, timeout: int, pages: bool) -> Iterator:
+    seen: set = set()
+    while True:
+        response = session.get(
+            url=url, params=parameter, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        txrefs: list = response_json["txrefs"] if "txrefs" in response_json else []
+        # BlockCypher pages by block height, skip outputs repeated across the page edge
+        page: list = [
+            txref for txref in txrefs if (txref["tx_hash"], txref["tx_output_n"]) not in seen
+        ]
+        seen.update((txref["tx_hash"], txref["tx_output_n"]) for txref in page)
+        if not page:
+            # Nothing new, the lowest block has more outputs than the page limit
+            break
+        if pages:
+            yield page
+        else:
+            yield from page
+        if not response_json.get("hasMore"):
+            break
+        # Before is exclusive, request the lowest block again for its outputs past the page edge,
+        # unless this page was already that block only
+        block_height: int = min(txref["block_height"] for txref in txrefs)
+        parameter["before"] = block_height if parameter.get("before") == (block_height + 1) else (block_height + 1)
 
 
+@cached(policy="transaction", permanent=finalized, cacheable=lambda transaction: "error" not in transaction)
 def get_transaction(transaction_hash: str, network: str = config["network"],
                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
     """
@@ -121,13 +189,52 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
 
     url = f"{config[network]['blockcypher']['url']}/txs/{transaction_hash}"
     parameter = dict(token=config[network]["blockcypher"]["token"])
-    response = requests.get(
+    response = session.get(
         url=url, params=parameter, headers=headers, timeout=timeout
     )
     response_json = response.json()
     return response_json
 
 
+def get_fee_rate(network: str = config["network"], priority: str = config["fee_priority"],
+                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> float:
+    """
+    Get Bitcoin network fee rate.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param priority: Fee priority, defaults to ``medium``.
+    :type priority: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: float -- Bitcoin fee rate (Satoshi per virtual byte).
+
+    >>> from swap.providers.bitcoin.rpc import get_fee_rate
+    >>> get_fee_rate(network="testnet")
+    12.345
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+    if priority not in ["high", "medium", "low"]:
+        raise ValueError("Invalid Bitcoin fee priority, choose only 'high', 'medium' or 'low' priorities.")
+
+    response = session.get(
+        url=config[network]["blockcypher"]["url"], params=dict(
+            token=config[network]["blockcypher"]["token"]
+        ), headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    if f"{priority}_fee_per_kb" not in response_json:
+        raise APIError(response_json.get("error", "Invalid Bitcoin fee rate response."))
+    # BlockCypher fee is Satoshi per kilobyte
+    return response_json[f"{priority}_fee_per_kb"] / 1000
+
+
 def find_p2sh_utxo(transaction: dict) -> Optional[dict]:
     """
     Find Bitcoin pay to script hash UTXO info's.
@@ -179,14 +286,18 @@ def decode_raw(raw: str, network: str = config["network"], offline: bool = True,
                            "choose only 'mainnet' or 'testnet' networks.")
 
     if offline:
-        stp(network, strict=True, force=True)
-        tx = MutableTransaction.unhexlify(raw)
-        return tx.to_json()
+        with network_context(network=network):
+            return MutableTransaction.unhexlify(raw).to_json()
+
+    return _decode_raw(raw=raw, network=network, headers=headers, timeout=timeout)
+
 
+@cached(policy="decoded", cacheable=lambda decoded: "error" not in decoded)
+def _decode_raw(raw: str, network: str, headers: dict, timeout: int) -> dict:
     url = f"{config[network]['blockcypher']['url']}/txs/decode"
     parameter = dict(token=config[network]["blockcypher"]["token"])
     data = dict(tx=raw)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), params=parameter, headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -223,7 +334,7 @@ def submit_raw(raw: str, network: str = config["network"], endpoint: str = "soch
     if endpoint == "smartbit":
         url = f"{config[network]['smartbit']}/pushtx"
         data = dict(hex=raw)
-        response = requests.post(
+        response = session.post(
             url=url, data=json.dumps(data), headers=headers, timeout=timeout
         )
         response_json = response.json()
@@ -236,7 +347,7 @@ def submit_raw(raw: str, network: str = config["network"], endpoint: str = "soch
     elif endpoint == "sochain":
         url = str(config[network]['sochain']).format(links="send_tx")
         data = dict(tx_hex=raw)
-        response = requests.post(
+        response = session.post(
             url=url, data=json.dumps(data), headers=headers, timeout=timeout
         )
         response_json = response.json()
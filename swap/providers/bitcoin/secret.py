@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+from binascii import unhexlify
+from typing import (
+    Optional, Dict, List
+)
+
+import hashlib
+
+from ...exceptions import (
+    APIError, NetworkError
+)
+from ...utils import sha256
+from ..config import bitcoin as config
+from ..session import session
+from .rpc import get_transaction
+from .utils import is_network
+from .watcher import _script_pushes
+
+
+def _script_secret(script: str) -> Optional[str]:
+    try:
+        pushes: List[bytes] = _script_pushes(script)
+    except (ValueError, IndexError):
+        return None
+    # Withdraw scriptSig pushes the secret, the OP_1 branch selector and the redeem script last
+    if len(pushes) < 3 or pushes[-2] != b"\x01":
+        return None
+    try:
+        secret: str = pushes[-3].decode()
+    except UnicodeDecodeError:
+        return None
+    # HTLC redeem script locks the double sha256 of the secret (OP_HASH256)
+    if hashlib.sha256(unhexlify(sha256(secret))).digest() not in pushes[-1]:
+        return None
+    return secret
+
+
+def extract_secret(transaction_hash: str, network: str = config["network"],
+                   headers: dict = config["headers"], timeout: int = config["timeout"]) -> Optional[str]:
+    """
+    Extract secret key (preimage) from Bitcoin HTLC withdraw transaction.
+
+    :param transaction_hash: Bitcoin withdraw transaction hash/id.
+    :type transaction_hash: str
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: str -- Secret key, None if the transaction is not an HTLC withdraw.
+
+    >>> from swap.providers.bitcoin.secret import extract_secret
+    >>> extract_secret(transaction_hash="f85cd877d7d9e7a9aab7b1cde336cbcd423545355a9aa2d424422dff96d953a9", network="testnet")
+    "Hello Meheret!"
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    transaction: dict = get_transaction(
+        transaction_hash=transaction_hash, network=network, headers=headers, timeout=timeout
+    )
+    if "error" in transaction:
+        raise APIError(transaction["error"])
+    for transaction_input in transaction["inputs"]:
+        secret: Optional[str] = _script_secret(transaction_input.get("script") or "")
+        if secret is not None:
+            return secret
+    return None
+
+
+def scan_secrets(secret_hashes: List[str], start_block: int, end_block: int, network: str = config["network"],
+                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> Dict[str, str]:
+    """
+    Scan Bitcoin block range once for HTLC withdraw secrets.
+
+    :param secret_hashes: Watched secret sha-256 hashes.
+    :type secret_hashes: list
+    :param start_block: First block height to scan.
+    :type start_block: int
+    :param end_block: Last block height to scan (included).
+    :type end_block: int
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Found secret keys by secret hash, stops early once every hash is found.
+
+    >>> from swap.providers.bitcoin.secret import scan_secrets
+    >>> scan_secrets(secret_hashes=["3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb"], start_block=1938000, end_block=1938010, network="testnet")
+    {'3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb': 'Hello Meheret!'}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    watched: set = {secret_hash.lower() for secret_hash in secret_hashes}
+    secrets: Dict[str, str] = {}
+    for block_height in range(start_block, end_block + 1):
+        if len(secrets) == len(watched):
+            break
+        # One request returns every transaction (with input scripts) of the block
+        url = f"{config[network]['blockchain']}/block-height/{block_height}"
+        response = session.get(
+            url=url, params=dict(format="json"), headers=headers, timeout=timeout
+        )
+        if response.status_code != 200:
+            raise APIError(f"Can't get this '{block_height}' Bitcoin block.", response.status_code)
+        for block in response.json()["blocks"]:
+            for transaction in block["tx"]:
+                for transaction_input in transaction["inputs"]:
+                    secret: Optional[str] = _script_secret(transaction_input.get("script") or "")
+                    if secret is not None and sha256(secret) in watched:
+                        secrets[sha256(secret)] = secret
+    return secrets
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, List, Tuple, Iterable, Callable
+)
+
+from ..config import bitcoin as config
+from .utils import fee_calculator
+
+# Coin selection strategies
+STRATEGIES: List[str] = [
+    "first-fit", "branch-and-bound", "largest-first", "smallest-first", "knapsack"
+]
+
+
+def _fees(transaction_output: int, fee_rate: Optional[float] = None) -> Tuple[int, int, int]:
+    # Split the linear fee_calculator into base, per input and change output costs
+    input_fee: int = fee_calculator(2, transaction_output, fee_rate) - fee_calculator(1, transaction_output, fee_rate)
+    base_fee: int = fee_calculator(1, transaction_output, fee_rate) - input_fee
+    change_fee: int = fee_calculator(1, transaction_output + 1, fee_rate) - fee_calculator(1, transaction_output, fee_rate)
+    return base_fee, input_fee, change_fee
+
+
+def first_fit(utxos: list, amount: int, transaction_output: int = 2,
+              fee_rate: Optional[float] = None) -> Optional[List[int]]:
+    """
+    Select UTXO's in the given order until amount and fee are covered.
+
+    :param utxos: Bitcoin UTXO's.
+    :type utxos: list
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+
+    :returns: list -- Selected UTXO indexes, ``None`` when UTXO's are not enough.
+
+    >>> from swap.providers.bitcoin.selection import first_fit
+    >>> first_fit(utxos=[{"value": 5000}, {"value": 20000}, {"value": 8000}], amount=10000)
+    [0, 1]
+    """
+
+    total: int = 0
+    for index, utxo in enumerate(utxos):
+        total += utxo["value"]
+        if total > (amount + fee_calculator((index + 1), transaction_output, fee_rate)):
+            return list(range(index + 1))
+    return None
+
+
+def largest_first(utxos: list, amount: int, transaction_output: int = 2,
+                  fee_rate: Optional[float] = None) -> Optional[List[int]]:
+    """
+    Select the largest UTXO's first, minimizes the number of inputs.
+
+    :param utxos: Bitcoin UTXO's.
+    :type utxos: list
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+
+    :returns: list -- Selected UTXO indexes, ``None`` when UTXO's are not enough.
+
+    >>> from swap.providers.bitcoin.selection import largest_first
+    >>> largest_first(utxos=[{"value": 5000}, {"value": 20000}, {"value": 8000}], amount=10000)
+    [1]
+    """
+
+    return _accumulate(utxos=utxos, amount=amount, transaction_output=transaction_output, fee_rate=fee_rate, reverse=True)
+
+
+def smallest_first(utxos: list, amount: int, transaction_output: int = 2,
+                   fee_rate: Optional[float] = None) -> Optional[List[int]]:
+    """
+    Select the smallest UTXO's first, consolidates dust into the spend.
+
+    :param utxos: Bitcoin UTXO's.
+    :type utxos: list
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+
+    :returns: list -- Selected UTXO indexes, ``None`` when UTXO's are not enough.
+
+    >>> from swap.providers.bitcoin.selection import smallest_first
+    >>> smallest_first(utxos=[{"value": 5000}, {"value": 20000}, {"value": 8000}], amount=10000)
+    [0, 2]
+    """
+
+    return _accumulate(utxos=utxos, amount=amount, transaction_output=transaction_output, fee_rate=fee_rate, reverse=False)
+
+
+def _accumulate(utxos: list, amount: int, transaction_output: int, fee_rate: Optional[float],
+                reverse: bool) -> Optional[List[int]]:
+    base_fee, input_fee, _ = _fees(transaction_output=transaction_output, fee_rate=fee_rate)
+    target: int = amount + base_fee
+    total, selected = 0, []
+    for index in sorted(range(len(utxos)), key=lambda i: utxos[i]["value"], reverse=reverse):
+        effective_value: int = utxos[index]["value"] - input_fee
+        if effective_value <= 0:
+            continue
+        selected.append(index)
+        total += effective_value
+        if total >= target:
+            return sorted(selected)
+    return None
+
+
+def branch_and_bound(utxos: list, amount: int, transaction_output: int = 2,
+                     fee_rate: Optional[float] = None, max_tries: int = 100_000) -> Optional[List[int]]:
+    """
+    Search for an UTXO set which pays amount and fee without a change output.
+
+    :param utxos: Bitcoin UTXO's.
+    :type utxos: list
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+    :param max_tries: Maximum search steps, defaults to ``100000``.
+    :type max_tries: int
+
+    :returns: list -- Selected UTXO indexes, ``None`` when there is no change-less match.
+
+    .. note::
+        The change output cost is the cost of one more output beyond ``transaction_output``,
+        the leftover of a match is never more than it, so it is paid to the miners
+        instead of creating a dust change output.
+
+    >>> from swap.providers.bitcoin.selection import branch_and_bound
+    >>> branch_and_bound(utxos=[{"value": 5000}, {"value": 20000}, {"value": 6100}], amount=10000, transaction_output=1)
+    [0, 2]
+    """
+
+    base_fee, input_fee, change_fee = _fees(transaction_output=transaction_output, fee_rate=fee_rate)
+    target: int = amount + base_fee
+    order: List[int] = sorted(
+        [index for index, utxo in enumerate(utxos) if utxo["value"] > input_fee],
+        key=lambda i: utxos[i]["value"], reverse=True
+    )
+    values: List[int] = [utxos[index]["value"] - input_fee for index in order]
+
+    selected: List[bool] = []
+    current, remaining = 0, sum(values)
+    best, best_excess = None, None
+    for _ in range(max_tries):
+        if current + remaining < target or current > target + change_fee:
+            backtrack: bool = True
+        elif current >= target:
+            excess: int = current - target
+            if best_excess is None or excess < best_excess:
+                best, best_excess = [order[i] for i, include in enumerate(selected) if include], excess
+                if excess == 0:
+                    break
+            backtrack: bool = True
+        else:
+            backtrack: bool = False
+
+        if backtrack:
+            # Walk back to the last included UTXO and exclude it
+            while selected and not selected[-1]:
+                selected.pop()
+                remaining += values[len(selected)]
+            if not selected:
+                break
+            selected[-1] = False
+            current -= values[len(selected) - 1]
+        else:
+            remaining -= values[len(selected)]
+            current += values[len(selected)]
+            selected.append(True)
+
+    return sorted(best) if best is not None else None
+
+
+def knapsack(utxos: list, amount: int, transaction_output: int = 2,
+             fee_rate: Optional[float] = None) -> Optional[List[int]]:
+    """
+    Select the UTXO set with the smallest leftover found by a greedy knapsack pass.
+
+    :param utxos: Bitcoin UTXO's.
+    :type utxos: list
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+
+    :returns: list -- Selected UTXO indexes, ``None`` when UTXO's are not enough.
+
+    >>> from swap.providers.bitcoin.selection import knapsack
+    >>> knapsack(utxos=[{"value": 5000}, {"value": 20000}, {"value": 8000}], amount=10000)
+    [0, 2]
+    """
+
+    base_fee, input_fee, change_fee = _fees(transaction_output=transaction_output, fee_rate=fee_rate)
+    target: int = amount + base_fee
+    smaller: List[Tuple[int, int]] = []
+    larger: Optional[Tuple[int, int]] = None
+    for index, utxo in enumerate(utxos):
+        effective_value: int = utxo["value"] - input_fee
+        if effective_value <= 0:
+            continue
+        if effective_value == target:
+            return [index]
+        elif effective_value < target + change_fee:
+            smaller.append((effective_value, index))
+        elif larger is None or effective_value < larger[0]:
+            larger = (effective_value, index)
+
+    total: int = sum(effective_value for effective_value, _ in smaller)
+    if total < target:
+        return [larger[1]] if larger else None
+
+    # Take the biggest smaller UTXO's, then drop the ones which are not needed
+    smaller.sort(reverse=True)
+    selected, total = [], 0
+    for effective_value, index in smaller:
+        selected.append((effective_value, index))
+        total += effective_value
+        if total >= target:
+            break
+    for effective_value, index in sorted(selected):
+        if total - effective_value >= target:
+            selected.remove((effective_value, index))
+            total -= effective_value
+
+    if larger and (larger[0] - target) <= (total - target):
+        return [larger[1]]
+    return sorted(index for _, index in selected)
+
+
+def select_utxos(utxos: list, amount: int, transaction_output: int = 2,
+                 strategy: str = config["coin_selection"], fee_rate: Optional[float] = None) -> Tuple[List[int], int]:
+    """
+    Select Bitcoin UTXO's to spend.
+
+    :param utxos: Bitcoin UTXO's.
+    :type utxos: list
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param strategy: Coin selection strategy, defaults to ``first-fit``.
+    :type strategy: str
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+
+    :returns: tuple -- Selected UTXO indexes and maximum spendable amount.
+
+    .. note::
+        Bitcoin has only five coin selection strategies, ``first-fit``, ``branch-and-bound``,
+        ``largest-first``, ``smallest-first`` and ``knapsack``. ``branch-and-bound``
+        falls back to ``knapsack`` when there is no change-less match.
+
+    >>> from swap.providers.bitcoin.selection import select_utxos
+    >>> select_utxos(utxos=[{"value": 5000}, {"value": 20000}, {"value": 8000}], amount=10000, strategy="largest-first")
+    ([1], 33000)
+    """
+
+    indexes: Optional[List[int]] = _strategy(strategy)(utxos, amount, transaction_output, fee_rate)
+    max_amount: int = sum(utxo["value"] for utxo in utxos)
+    # Not enough UTXO's, spend everything and let the builder report the balance
+    return (indexes if indexes is not None else list(range(len(utxos)))), max_amount
+
+
+def collect_utxos(pages: Iterable[list], amount: int, transaction_output: int = 2,
+                  strategy: str = config["coin_selection"], fee_rate: Optional[float] = None) -> Tuple[list, List[int], int]:
+    """
+    Pull Bitcoin UTXO's page by page until the selected ones cover amount and fee.
+
+    :param pages: Bitcoin UTXO's pages, like ``iter_utxos(..., pages=True)``.
+    :type pages: iterable
+    :param amount: Bitcoin amount (Satoshi amount).
+    :type amount: int
+    :param transaction_output: transaction output numbers, defaults to ``2``.
+    :type transaction_output: int
+    :param strategy: Coin selection strategy, defaults to ``first-fit``.
+    :type strategy: str
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (legacy fixed fee).
+    :type fee_rate: float
+
+    :returns: tuple -- Fetched UTXO's, selected UTXO indexes and maximum spendable amount.
+
+    >>> from swap.providers.bitcoin.selection import collect_utxos
+    >>> collect_utxos(pages=iter([[{"value": 5000}], [{"value": 20000}], [{"value": 8000}]]), amount=10000)
+    ([{'value': 5000}, {'value': 20000}], [0, 1], 25000)
+    """
+
+    select, utxos, indexes = _strategy(strategy), [], None
+    for page in pages:
+        utxos.extend(page)
+        indexes = select(utxos, amount, transaction_output, fee_rate)
+        if indexes is not None:
+            break
+
+    max_amount: int = sum(utxo["value"] for utxo in utxos)
+    return utxos, (indexes if indexes is not None else list(range(len(utxos)))), max_amount
+
+
+def _strategy(strategy: str) -> Callable[[list, int, int, Optional[float]], Optional[List[int]]]:
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Invalid Bitcoin '{strategy}' coin selection strategy, "
+                         f"choose only {', '.join(map(repr, STRATEGIES))} strategies.")
+
+    if strategy == "branch-and-bound":
+        return lambda utxos, amount, transaction_output, fee_rate: (
+            branch_and_bound(utxos, amount, transaction_output, fee_rate) or
+            knapsack(utxos, amount, transaction_output, fee_rate)
+        )
+    return dict(zip(STRATEGIES, [
+        first_fit, branch_and_bound, largest_first, smallest_first, knapsack
+    ]))[strategy]
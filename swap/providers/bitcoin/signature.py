@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode, b64decode
 from btcpy.structs.script import (
     Script, P2shScript
 )
@@ -8,18 +7,22 @@ from btcpy.structs.transaction import (
     MutableTransaction, TxOut
 )
 from btcpy.structs.sig import P2shSolver
-from btcpy.setup import setup
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import (
-    Optional, Union
+    Optional, Union, Iterator, List, Tuple
 )
 
-import json
+import copy
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    clean_transaction_raw, dumps_transaction_raw, parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
     TransactionRawError, NetworkError, UnitError
 )
 from ..config import bitcoin as config
+from .network import in_network_context
 from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
@@ -27,6 +30,37 @@ from .utils import (
     is_transaction_raw, is_network, amount_unit_converter
 )
 
+# Worker process signature class, network, version and warm solver
+_worker: Optional[Tuple[type, str, int, Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]]] = None
+
+
+def _warm_solver(solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver], network: str) \
+        -> Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]:
+    solver = copy.copy(solver)
+    # Solver keys are derived once, then reused by every transaction
+    solver.solve = lru_cache(maxsize=None)(solver.solve)
+    if hasattr(solver, "witness"):
+        solver.witness = lru_cache(maxsize=None)(solver.witness)
+    solver.solve(network=network)
+    return solver
+
+
+def _initialize_worker(signature: type, network: str, version: int,
+                       solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> None:
+    global _worker
+    _worker = (signature, network, version, _warm_solver(solver=solver, network=network))
+
+
+def _sign(signature: type, network: str, version: int,
+          solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver], transaction_raw: str) -> str:
+    return signature(network=network, version=version).sign(
+        transaction_raw=transaction_raw, solver=solver
+    ).transaction_raw()
+
+
+def _sign_worker(transaction_raw: str) -> str:
+    return _sign(*_worker, transaction_raw=transaction_raw)
+
 
 class Signature:
     """
@@ -57,8 +91,6 @@ class Signature:
         self._signed_raw: Optional[str] = None
         self._fee: int = 0
 
-        setup(network, strict=True, force=True)
-
     def fee(self, unit: str = config["unit"]) -> Union[int, float]:
         """
         Get Bitcoin transaction fee.
@@ -106,6 +138,7 @@ class Signature:
             raise ValueError("Transaction is none, sign unsigned transaction raw first.")
         return self._transaction.txid
 
+    @in_network_context
     def json(self) -> dict:
         """
         Get Bitcoin signature transaction json format.
@@ -167,7 +200,8 @@ class Signature:
             raise ValueError("Type is none, sign unsigned transaction raw first.")
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
+    @in_network_context
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
             -> Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign unsigned transaction raw.
@@ -188,39 +222,77 @@ class Signature:
         <swap.providers.bitcoin.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "bitcoin_normal_unsigned":
             return NormalSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bitcoin_fund_unsigned":
             return FundSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bitcoin_withdraw_unsigned":
             return WithdrawSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "bitcoin_refund_unsigned":
             return RefundSignature(
                 network=self._network, version=self._version
             ).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
+    def sign_many(self, transaction_raws: List[str],
+                  solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver],
+                  processes: Optional[int] = None) -> Iterator[str]:
+        """
+        Sign many unsigned transaction raws, in a process pool.
+
+        :param transaction_raws: Bitcoin unsigned transaction raws.
+        :type transaction_raws: list
+        :param solver: Bitcoin solver of every transaction raw.
+        :type solver: bitcoin.solver.NormalSolver, bitcoin.solver.FundSolver, bitcoin.solver.WithdrawSolver, bitcoin.solver.RefundSolver
+        :param processes: Worker processes, defaults to ``None`` (CPU count), ``1`` signs in this process.
+        :type processes: int
+
+        :returns: iterator -- Bitcoin signed transaction raws, in the same order, yielded as they are signed.
+
+        .. note::
+            Each worker derives the solver keys once at start, then signs its transactions with them.
+
+        >>> from swap.providers.bitcoin.signature import WithdrawSignature
+        >>> from swap.providers.bitcoin.solver import WithdrawSolver
+        >>> unsigned_withdraw_transaction_raw: str = "eyJmZWUiOiA1NzYsICJyYXciOiAiMDIwMDAwMDAwMTMxZmI3NmEwYzM4ZDU3MzgxYjMxMTBlNGY1ZWU5YjUyODFkY2YyZmJlMmZlMjU2OTI2NmI3NTEwMTFkMjExYTIwMDAwMDAwMDAwZmZmZmZmZmYwMTYwODQwMTAwMDAwMDAwMDAxOTc2YTkxNDBhMGE2NTkwZTZiYTRiNDgxMThkMjFiODY4MTI2MTUyMTllY2U3NmI4OGFjMDAwMDAwMDAiLCAib3V0cHV0cyI6IHsidmFsdWUiOiAxMDAwMDAsICJ0eF9vdXRwdXRfbiI6IDAsICJzY3JpcHQiOiAiYTkxNGM4Yzc3YTliNDNlZTJiZGYxYTA3YzQ4Njk5ODMzZDc2NjhiZjI2NGM4NyJ9LCAibmV0d29yayI6ICJ0ZXN0bmV0IiwgInR5cGUiOiAiYml0Y29pbl93aXRoZHJhd191bnNpZ25lZCJ9"
+        >>> bytecode: str = "63aa20821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e01588876a9140a0a6590e6ba4b48118d21b86812615219ece76b88ac67040ec4d660b17576a914e00ff2a640b7ce2d336860739169487a57f84b1588ac68"
+        >>> withdraw_solver: WithdrawSolver = WithdrawSolver(xprivate_key="tprv8ZgxMBicQKsPf949JcuVFLXPJ5m4VKe33gVX3FYVZYVHr2dChU8K66aEQcPdHpUgACq5GQu81Z4e3QN1vxCrV4pxcUcXHoRTamXBRaPdJhW", secret_key="Hello Meheret!", bytecode=bytecode)
+        >>> withdraw_signature: WithdrawSignature = WithdrawSignature(network="testnet")
+        >>> len(list(withdraw_signature.sign_many(transaction_raws=[unsigned_withdraw_transaction_raw] * 100, solver=withdraw_solver)))
+        100
+        """
+
+        if processes is not None and processes <= 1 or len(transaction_raws) <= 1:
+            solver = _warm_solver(solver=solver, network=self._network)
+            for transaction_raw in transaction_raws:
+                yield _sign(type(self), self._network, self._version, solver, transaction_raw=transaction_raw)
+            return
+
+        with ProcessPoolExecutor(max_workers=processes, initializer=_initialize_worker, initargs=(
+            type(self), self._network, self._version, solver
+        )) as executor:
+            # Results are yielded in order, each one as soon as it and the previous ones are signed
+            yield from executor.map(_sign_worker, transaction_raws)
+
     def transaction_raw(self) -> str:
         """
         Get Bitcoin transaction raw.
@@ -257,7 +329,8 @@ class NormalSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    @in_network_context
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: NormalSolver) -> "NormalSignature":
         """
         Sign unsigned normal transaction raw.
 
@@ -277,13 +350,11 @@ class NormalSignature(Signature):
         <swap.providers.bitcoin.signature.NormalSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_normal_unsigned":
             raise TypeError(f"Invalid Bitcoin normal unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using normal signature.")
@@ -317,12 +388,12 @@ class NormalSignature(Signature):
 
         # Encode normal transaction raw
         self._type = "bitcoin_normal_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -341,7 +412,8 @@ class FundSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    @in_network_context
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: FundSolver) -> "FundSignature":
         """
         Sign unsigned fund transaction raw.
 
@@ -361,13 +433,11 @@ class FundSignature(Signature):
         <swap.providers.bitcoin.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_fund_unsigned":
             raise TypeError(f"Invalid Bitcoin fund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using fund signature.")
@@ -401,12 +471,12 @@ class FundSignature(Signature):
 
         # Encode fund transaction raw
         self._type = "bitcoin_fund_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -425,7 +495,8 @@ class WithdrawSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    @in_network_context
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign unsigned withdraw transaction raw.
 
@@ -446,13 +517,11 @@ class WithdrawSignature(Signature):
         <swap.providers.bitcoin.signature.WithdrawSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_withdraw_unsigned":
             raise TypeError(f"Invalid Bitcoin withdraw unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using withdraw signature.")
@@ -485,12 +554,12 @@ class WithdrawSignature(Signature):
 
         # Encode withdraw transaction raw
         self._type = "bitcoin_withdraw_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type,
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -509,7 +578,8 @@ class RefundSignature(Signature):
     def __init__(self, network: str = config["network"], version: int = config["version"]):
         super().__init__(network=network, version=version)
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    @in_network_context
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: RefundSolver) -> "RefundSignature":
         """
         Sign unsigned refund transaction raw.
 
@@ -529,13 +599,11 @@ class RefundSignature(Signature):
         <swap.providers.bitcoin.signature.RefundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bitcoin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "bitcoin_refund_unsigned":
             raise TypeError(f"Invalid Bitcoin refund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using refund signature.")
@@ -568,10 +636,10 @@ class RefundSignature(Signature):
 
         # Encode refund transaction raw
         self._type = "bitcoin_refund_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             raw=self._transaction.hexlify(),
             fee=self._fee,
             network=self._network,
             type=self._type,
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
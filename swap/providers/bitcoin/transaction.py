@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode
 from btcpy.structs.script import (
     ScriptSig, P2shScript
 )
@@ -8,28 +7,30 @@ from btcpy.structs.transaction import (
     Locktime, MutableTransaction, TxOut, Sequence, TxIn
 )
 from btcpy.structs.sig import P2shSolver
-from btcpy.setup import setup
 from typing import (
     Optional, Union
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import dumps_transaction_raw
 from ...exceptions import (
     BalanceError, AddressError, NetworkError, UnitError
 )
 from ..config import bitcoin as config
 from .htlc import HTLC
+from .network import in_network_context
 from .utils import (
-    fee_calculator, is_address, is_network, _get_previous_transaction_indexes,
-    _build_inputs, _build_outputs, get_address_hash, amount_unit_converter
+    fee_calculator, is_address, is_network, _build_inputs, _build_outputs,
+    get_address_hash, amount_unit_converter
+)
+from .selection import collect_utxos
+from .fee import (
+    FeeEstimator, estimate_fee
 )
 from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 from .rpc import (
-    get_transaction, get_utxos, find_p2sh_utxo
+    get_transaction, iter_utxos, find_p2sh_utxo
 )
 
 
@@ -41,6 +42,8 @@ class Transaction:
     :type network: str
     :param version: Bitcoin transaction version, defaults to ``2``.
     :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
 
     :returns: Transaction -- Bitcoin transaction instance.
 
@@ -48,7 +51,8 @@ class Transaction:
         Bitcoin has only two networks, ``mainnet`` and ``testnet``.
     """
 
-    def __init__(self, network: str = config["network"], version: int = config["version"]):
+    def __init__(self, network: str = config["network"], version: int = config["version"],
+                 fee_estimator: Optional[FeeEstimator] = None):
 
         if not is_network(network=network):
             raise NetworkError(f"Invalid Bitcoin '{network}' network",
@@ -63,8 +67,73 @@ class Transaction:
         self._datas: dict = {}
         self._amount: int = 0
         self._fee: int = 0
+        self._fee_estimator: Optional[FeeEstimator] = fee_estimator
+
+    def _fee_rate(self, fee_rate: Optional[float] = None) -> Optional[float]:
+        if fee_rate is not None or self._fee_estimator is None:
+            return fee_rate
+        return self._fee_estimator.fee_rate(network=self._network)
+
+    def _change(self, inputs: list, outputs: list, amount: int, fee_rate: Optional[float], locktime: int,
+                transaction_output: int, coin_selection: str) -> list:
+        if fee_rate is None:
+            # Legacy fixed fee, without fee rate and fee estimator
+            self._fee = fee_calculator(len(inputs), transaction_output)
+            if amount < self._amount:
+                raise BalanceError(
+                    "Insufficient spend UTXO's", "you don't have enough amount."
+                )
+            elif amount < (self._amount + self._fee):
+                raise BalanceError(
+                    f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
+                    f"you can spend maximum '{amount - self._fee}' Satoshi amount."
+                )
+
+            return_amount: int = int(amount - (self._amount + self._fee))
+            # Branch and bound leftover is cheaper to pay as fee than to send back as change
+            if coin_selection == "branch-and-bound" and \
+                    return_amount <= (fee_calculator(len(inputs), len(outputs) + 1) - fee_calculator(len(inputs), len(outputs))):
+                self._fee, return_amount = (self._fee + return_amount), 0
+            if return_amount == 0:
+                return outputs
+            return outputs + [TxOut(
+                value=return_amount, n=len(outputs), script_pubkey=get_address_hash(
+                    address=self._address, script=True
+                )
+            )]
+
+        # Calculate the fee from the signed transaction size, without and with change output
+        change_output: TxOut = TxOut(
+            value=0, n=len(outputs), script_pubkey=get_address_hash(
+                address=self._address, script=True
+            )
+        )
+        self._fee = estimate_fee(MutableTransaction(
+            version=self._version, ins=inputs, outs=outputs, locktime=Locktime(locktime)
+        ), fee_rate=fee_rate)
+        change_fee: int = estimate_fee(MutableTransaction(
+            version=self._version, ins=inputs, outs=(outputs + [change_output]), locktime=Locktime(locktime)
+        ), fee_rate=fee_rate)
+
+        if amount < self._amount:
+            raise BalanceError(
+                "Insufficient spend UTXO's", "you don't have enough amount."
+            )
+        elif amount < (self._amount + self._fee):
+            raise BalanceError(
+                f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
+                f"you can spend maximum '{amount - self._fee}' Satoshi amount."
+            )
 
-        setup(network, strict=True, force=True)
+        return_amount: int = int(amount - (self._amount + change_fee))
+        if return_amount < config["dust"]:
+            # Change below dust limit is cheaper to pay as fee
+            self._fee = int(amount - self._amount)
+            return outputs
+        self._fee = change_fee
+        return outputs + [TxOut(
+            value=return_amount, n=len(outputs), script_pubkey=change_output.script_pubkey
+        )]
 
     def fee(self, unit: str = config["unit"]) -> Union[int, float]:
         """
@@ -108,6 +177,7 @@ class Transaction:
             raise ValueError("Transaction is none, build transaction first.")
         return self._transaction.txid
 
+    @in_network_context
     def json(self) -> dict:
         """
         Get Bitcoin transaction json format.
@@ -174,6 +244,8 @@ class NormalTransaction(Transaction):
     :type network: str
     :param version: Bitcoin transaction version, defaults to ``2``.
     :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
 
     :returns: NormalTransaction -- Bitcoin normal transaction instance.
 
@@ -181,15 +253,19 @@ class NormalTransaction(Transaction):
         Do not forget to build transaction after initialize normal transaction.
     """
 
-    def __init__(self, network: str = config["network"], version: int = config["version"]):
-        super().__init__(network=network, version=version)
+    def __init__(self, network: str = config["network"], version: int = config["version"],
+                 fee_estimator: Optional[FeeEstimator] = None):
+        super().__init__(network=network, version=version, fee_estimator=fee_estimator)
 
         self._utxos: Optional[list] = None
         self._previous_transaction_indexes: Optional[list] = None
         self._interest: Optional[int] = None
 
+    @in_network_context
     def build_transaction(self, address: str, recipients: dict, unit: str = config["unit"],
-                          locktime: int = config["locktime"]) -> "NormalTransaction":
+                          locktime: int = config["locktime"],
+                          coin_selection: str = config["coin_selection"],
+                          fee_rate: Optional[float] = None) -> "NormalTransaction":
         """
         Build Bitcoin normal transaction.
 
@@ -201,6 +277,10 @@ class NormalTransaction(Transaction):
         :type unit: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
+        :param coin_selection: Bitcoin coin selection strategy, defaults to ``first-fit``.
+        :type coin_selection: str
+        :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (fee estimator rate or legacy fixed fee).
+        :type fee_rate: float
 
         :returns: NormalTransaction -- Bitcoin normal transaction instance.
 
@@ -224,10 +304,6 @@ class NormalTransaction(Transaction):
                 )
             )
         )
-        # Get Sender UTXO's
-        self._utxos = get_utxos(
-            address=self._address, network=self._network
-        )
         # Outputs action
         for _address, _amount in recipients.items():
             if not is_address(_address, self._network):
@@ -238,35 +314,21 @@ class NormalTransaction(Transaction):
                     address=_address, script=True
                 )
             ))
-        # Get previous transaction indexes
-        self._previous_transaction_indexes, max_amount = _get_previous_transaction_indexes(
-            utxos=self._utxos, amount=self._amount, transaction_output=len(outputs)
+        fee_rate = self._fee_rate(fee_rate=fee_rate)
+        # Get Sender UTXO's page by page and previous transaction indexes
+        self._utxos, self._previous_transaction_indexes, max_amount = collect_utxos(
+            pages=iter_utxos(address=self._address, network=self._network, pages=True),
+            amount=self._amount, transaction_output=len(outputs), strategy=coin_selection, fee_rate=fee_rate
         )
         # Build transaction inputs
         inputs, amount = _build_inputs(
             utxos=self._utxos, previous_transaction_indexes=self._previous_transaction_indexes
         )
-        # Calculate the fee
-        self._fee = fee_calculator(len(inputs), len(outputs))
-
-        if amount < self._amount:
-            raise BalanceError(
-                "Insufficient spend UTXO's", "you don't have enough amount."
-            )
-        elif amount < (self._amount + self._fee):
-            raise BalanceError(
-                f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
-                f"you can spend maximum '{amount - self._fee}' Satoshi amount."
-            )
-
-        return_amount: int = int(amount - (self._amount + self._fee))
-        if return_amount != 0:
-            outputs.append(TxOut(
-                value=return_amount, n=len(outputs),
-                script_pubkey=get_address_hash(
-                    address=self._address, script=True
-                )
-            ))
+        # Calculate the fee and change output
+        outputs = self._change(
+            inputs=inputs, outputs=outputs, amount=amount, fee_rate=fee_rate, locktime=locktime,
+            transaction_output=len(outputs), coin_selection=coin_selection
+        )
 
         # Build mutable transaction
         self._transaction = MutableTransaction(
@@ -276,6 +338,7 @@ class NormalTransaction(Transaction):
         self._type = "bitcoin_normal_unsigned"
         return self
 
+    @in_network_context
     def sign(self, solver: NormalSolver) -> "NormalTransaction":
         """
         Sign Bitcoin normal transaction.
@@ -314,10 +377,14 @@ class NormalTransaction(Transaction):
         self._type = "bitcoin_normal_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    @in_network_context
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Bitcoin normal transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Bitcoin normal transaction raw.
 
         >>> from swap.providers.bitcoin.transaction import NormalTransaction
@@ -333,13 +400,13 @@ class NormalTransaction(Transaction):
 
         # Encode normal transaction raw
         if self._type == "bitcoin_normal_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=_build_outputs(
@@ -349,7 +416,7 @@ class NormalTransaction(Transaction):
             ),
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class FundTransaction(Transaction):
@@ -360,6 +427,8 @@ class FundTransaction(Transaction):
     :type network: str
     :param version: Bitcoin transaction version, defaults to ``2``.
     :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
 
     :returns: FundTransaction -- Bitcoin fund transaction instance.
 
@@ -367,16 +436,20 @@ class FundTransaction(Transaction):
         Do not forget to build transaction after initialize fund transaction.
     """
 
-    def __init__(self, network: str = config["network"], version: int = config["version"]):
-        super().__init__(network=network, version=version)
+    def __init__(self, network: str = config["network"], version: int = config["version"],
+                 fee_estimator: Optional[FeeEstimator] = None):
+        super().__init__(network=network, version=version, fee_estimator=fee_estimator)
 
         self._htlc: Optional[HTLC] = None
         self._utxos: Optional[list] = None
         self._previous_transaction_indexes: Optional[list] = None
         self._interest: Optional[int] = None
 
+    @in_network_context
     def build_transaction(self, address: str, htlc: HTLC, amount: Optional[Union[int, float]],
-                          unit: str = config["unit"], locktime: int = config["locktime"]) -> "FundTransaction":
+                          unit: str = config["unit"], locktime: int = config["locktime"],
+                          coin_selection: str = config["coin_selection"],
+                          fee_rate: Optional[float] = None) -> "FundTransaction":
         """
         Build Bitcoin fund transaction.
 
@@ -390,6 +463,10 @@ class FundTransaction(Transaction):
         :type unit: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
+        :param coin_selection: Bitcoin coin selection strategy, defaults to ``first-fit``.
+        :type coin_selection: str
+        :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (fee estimator rate or legacy fixed fee).
+        :type fee_rate: float
 
         :returns: FundTransaction -- Bitcoin fund transaction instance.
 
@@ -423,10 +500,6 @@ class FundTransaction(Transaction):
             )
         )
 
-        # Get Sender UTXO's
-        self._utxos = get_utxos(
-            address=self._address, network=self._network
-        )
         # Outputs action
         outputs.append(TxOut(
             value=self._amount, n=0,
@@ -434,35 +507,21 @@ class FundTransaction(Transaction):
                 address=self._htlc.contract_address(), script=True
             )
         ))
-        # Get previous transaction indexes
-        self._previous_transaction_indexes, max_amount = _get_previous_transaction_indexes(
-            utxos=self._utxos, amount=self._amount, transaction_output=2
+        fee_rate = self._fee_rate(fee_rate=fee_rate)
+        # Get Sender UTXO's page by page and previous transaction indexes
+        self._utxos, self._previous_transaction_indexes, max_amount = collect_utxos(
+            pages=iter_utxos(address=self._address, network=self._network, pages=True),
+            amount=self._amount, transaction_output=2, strategy=coin_selection, fee_rate=fee_rate
         )
         # Build transaction inputs
         inputs, amount = _build_inputs(
             utxos=self._utxos, previous_transaction_indexes=self._previous_transaction_indexes
         )
-        # Calculate the fee
-        self._fee = fee_calculator(len(inputs), 2)
-
-        if amount < self._amount:
-            raise BalanceError(
-                "Insufficient spend UTXO's", "you don't have enough amount."
-            )
-        elif amount < (self._amount + self._fee):
-            raise BalanceError(
-                f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
-                f"you can spend maximum '{amount - self._fee}' Satoshi amount."
-            )
-
-        return_amount: int = int(amount - (self._amount + self._fee))
-        if return_amount != 0:
-            outputs.append(TxOut(
-                value=return_amount, n=len(outputs),
-                script_pubkey=get_address_hash(
-                    address=self._address, script=True
-                )
-            ))
+        # Calculate the fee and change output
+        outputs = self._change(
+            inputs=inputs, outputs=outputs, amount=amount, fee_rate=fee_rate, locktime=locktime,
+            transaction_output=2, coin_selection=coin_selection
+        )
 
         # Build mutable transaction
         self._transaction = MutableTransaction(
@@ -472,6 +531,7 @@ class FundTransaction(Transaction):
         self._type = "bitcoin_fund_unsigned"
         return self
 
+    @in_network_context
     def sign(self, solver: FundSolver) -> "FundTransaction":
         """
         Sign Bitcoin fund transaction.
@@ -513,10 +573,14 @@ class FundTransaction(Transaction):
         self._type = "bitcoin_fund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    @in_network_context
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Bitcoin fund transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Bitcoin fund transaction raw.
 
         >>> from swap.providers.bitcoin.htlc import HTLC
@@ -536,13 +600,13 @@ class FundTransaction(Transaction):
 
         # Encode fund transaction raw
         if self._type == "bitcoin_fund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=_build_outputs(
@@ -552,7 +616,7 @@ class FundTransaction(Transaction):
             ),
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class WithdrawTransaction(Transaction):
@@ -563,6 +627,8 @@ class WithdrawTransaction(Transaction):
     :type network: str
     :param version: Bitcoin transaction version, defaults to ``2``.
     :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
 
     :returns: WithdrawTransaction -- Bitcoin withdraw transaction instance.
 
@@ -570,16 +636,18 @@ class WithdrawTransaction(Transaction):
         Do not forget to build transaction after initialize withdraw transaction.
     """
 
-    def __init__(self, network: str = config["network"], version: int = config["version"]):
-        super().__init__(network=network, version=version)
+    def __init__(self, network: str = config["network"], version: int = config["version"],
+                 fee_estimator: Optional[FeeEstimator] = None):
+        super().__init__(network=network, version=version, fee_estimator=fee_estimator)
 
         self._transaction_hash: Optional[str] = None
         self._transaction_detail: Optional[dict] = None
         self._htlc_utxo: Optional[dict] = None
         self._interest: Optional[int] = None
 
+    @in_network_context
     def build_transaction(self, address: str, transaction_hash: str,
-                          locktime: int = config["locktime"]) -> "WithdrawTransaction":
+                          locktime: int = config["locktime"], fee_rate: Optional[float] = None) -> "WithdrawTransaction":
         """
         Build Bitcoin withdraw transaction.
 
@@ -589,6 +657,8 @@ class WithdrawTransaction(Transaction):
         :type transaction_hash: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
+        :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (fee estimator rate or legacy fixed fee).
+        :type fee_rate: float
 
         :returns: WithdrawTransaction -- Bitcoin withdraw transaction instance.
 
@@ -615,8 +685,27 @@ class WithdrawTransaction(Transaction):
             raise ValueError("Invalid transaction hash, there is no pay to script hash (P2SH) address.")
 
         self._amount = self._htlc_utxo["value"]
-        # Calculate the fee
-        self._fee = fee_calculator(1, 1)
+        inputs: list = [TxIn(
+            txid=self._transaction_hash,
+            txout=self._htlc_utxo["position"],
+            script_sig=ScriptSig.empty(),
+            sequence=Sequence.max()
+        )]
+        fee_rate = self._fee_rate(fee_rate=fee_rate)
+        # Calculate the fee from the signed transaction size, or the legacy fixed fee
+        self._fee = fee_calculator(1, 1) if fee_rate is None else estimate_fee(MutableTransaction(
+            version=self._version, ins=inputs, outs=[TxOut(
+                value=self._amount, n=0, script_pubkey=get_address_hash(
+                    address=self._address, script=True
+                )
+            )], locktime=Locktime(locktime)
+        ), fee_rate=fee_rate, script_types=["withdraw"])
+
+        if (self._amount - self._fee) < config["dust"]:
+            raise BalanceError(
+                f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
+                f"HTLC amount is only '{self._amount}' Satoshi."
+            )
 
         outputs: list = [TxOut(
             value=(self._amount - self._fee), n=0, script_pubkey=get_address_hash(
@@ -625,21 +714,14 @@ class WithdrawTransaction(Transaction):
         )]
         # Build mutable transaction
         self._transaction = MutableTransaction(
-            version=self._version,
-            ins=[TxIn(
-                txid=self._transaction_hash,
-                txout=self._htlc_utxo["position"],
-                script_sig=ScriptSig.empty(),
-                sequence=Sequence.max()
-            )],
-            outs=outputs,
-            locktime=Locktime(locktime)
+            version=self._version, ins=inputs, outs=outputs, locktime=Locktime(locktime)
         )
 
         # Set transaction type
         self._type = "bitcoin_withdraw_unsigned"
         return self
 
+    @in_network_context
     def sign(self, solver: WithdrawSolver) -> "WithdrawTransaction":
         """
         Sign Bitcoin withdraw transaction.
@@ -684,10 +766,14 @@ class WithdrawTransaction(Transaction):
         self._type = "bitcoin_withdraw_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    @in_network_context
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Bitcoin withdraw transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Bitcoin withdraw transaction raw.
 
         >>> from swap.providers.bitcoin.transaction import WithdrawTransaction
@@ -703,13 +789,13 @@ class WithdrawTransaction(Transaction):
 
         # Encode withdraw transaction raw
         if self._type == "bitcoin_withdraw_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=dict(
@@ -719,7 +805,7 @@ class WithdrawTransaction(Transaction):
             ),
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class RefundTransaction(Transaction):
@@ -730,6 +816,8 @@ class RefundTransaction(Transaction):
     :type network: str
     :param version: Bitcoin transaction version, defaults to ``2``.
     :type version: int
+    :param fee_estimator: Bitcoin fee rate estimator, defaults to ``None`` (legacy fixed fee).
+    :type fee_estimator: bitcoin.fee.FeeEstimator
 
     :returns: RefundTransaction -- Bitcoin refund transaction instance.
 
@@ -737,16 +825,18 @@ class RefundTransaction(Transaction):
         Do not forget to build transaction after initialize refund transaction.
     """
 
-    def __init__(self, network: str = config["network"], version: int = config["version"]):
-        super().__init__(network=network, version=version)
+    def __init__(self, network: str = config["network"], version: int = config["version"],
+                 fee_estimator: Optional[FeeEstimator] = None):
+        super().__init__(network=network, version=version, fee_estimator=fee_estimator)
 
         self._transaction_hash: Optional[str] = None
         self._transaction_detail: Optional[dict] = None
         self._htlc_utxo: Optional[dict] = None
         self._interest: Optional[int] = None
 
+    @in_network_context
     def build_transaction(self, address: str, transaction_hash: str,
-                          locktime: int = config["locktime"]) -> "RefundTransaction":
+                          locktime: int = config["locktime"], fee_rate: Optional[float] = None) -> "RefundTransaction":
         """
         Build Bitcoin refund transaction.
 
@@ -756,6 +846,8 @@ class RefundTransaction(Transaction):
         :type transaction_hash: str
         :param locktime: Bitcoin transaction lock time, defaults to ``0``.
         :type locktime: int
+        :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None`` (fee estimator rate or legacy fixed fee).
+        :type fee_rate: float
 
         :returns: RefundTransaction -- Bitcoin refund transaction instance.
 
@@ -782,8 +874,27 @@ class RefundTransaction(Transaction):
             raise ValueError("Invalid transaction id, there is no pay to script hash (P2SH) address.")
 
         self._amount = self._htlc_utxo["value"]
-        # Calculate the fee
-        self._fee = fee_calculator(1, 1)
+        inputs: list = [TxIn(
+            txid=self._transaction_hash,
+            txout=self._htlc_utxo["position"],
+            script_sig=ScriptSig.empty(),
+            sequence=Sequence.max()
+        )]
+        fee_rate = self._fee_rate(fee_rate=fee_rate)
+        # Calculate the fee from the signed transaction size, or the legacy fixed fee
+        self._fee = fee_calculator(1, 1) if fee_rate is None else estimate_fee(MutableTransaction(
+            version=self._version, ins=inputs, outs=[TxOut(
+                value=self._amount, n=0, script_pubkey=get_address_hash(
+                    address=self._address, script=True
+                )
+            )], locktime=Locktime(locktime)
+        ), fee_rate=fee_rate, script_types=["refund"])
+
+        if (self._amount - self._fee) < config["dust"]:
+            raise BalanceError(
+                f"You don't have enough amount to pay '{self._fee}' Satoshi fee",
+                f"HTLC amount is only '{self._amount}' Satoshi."
+            )
 
         outputs: list = [TxOut(
             value=(self._amount - self._fee), n=0, script_pubkey=get_address_hash(
@@ -792,21 +903,14 @@ class RefundTransaction(Transaction):
         )]
         # Build mutable transaction
         self._transaction = MutableTransaction(
-            version=self._version,
-            ins=[TxIn(
-                txid=self._transaction_hash,
-                txout=self._htlc_utxo["position"],
-                script_sig=ScriptSig.empty(),
-                sequence=Sequence.max()
-            )],
-            outs=outputs,
-            locktime=Locktime(locktime)
+            version=self._version, ins=inputs, outs=outputs, locktime=Locktime(locktime)
         )
 
         # Set transaction type
         self._type = "bitcoin_refund_unsigned"
         return self
 
+    @in_network_context
     def sign(self, solver: RefundSolver) -> "RefundTransaction":
         """
         Sign Bitcoin refund transaction.
@@ -850,10 +954,14 @@ class RefundTransaction(Transaction):
         self._type = "bitcoin_refund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    @in_network_context
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Bitcoin refund transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Bitcoin refund transaction raw.
 
         >>> from swap.providers.bitcoin.transaction import RefundTransaction
@@ -869,13 +977,13 @@ class RefundTransaction(Transaction):
 
         # Encode refund transaction raw
         if self._type == "bitcoin_refund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 raw=self._transaction.hexlify(),
                 fee=self._fee,
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             raw=self._transaction.hexlify(),
             outputs=dict(
@@ -885,4 +993,4 @@ class RefundTransaction(Transaction):
             ),
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), compact=compact)
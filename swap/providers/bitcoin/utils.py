@@ -7,28 +7,40 @@ from btcpy.structs.transaction import (
     MutableTransaction, Sequence, TxIn, TxOut
 )
 from btcpy.structs.address import Address
-from btcpy.setup import setup as stp
 from btcpy.structs.script import (
     P2pkhScript, P2shScript
 )
-from base64 import b64decode
+from decimal import Decimal
 from typing import (
-    Union, Optional, Tuple
+    Union, Optional, List, Dict, Tuple
 )
 
-import requests
 import cryptos
 import json
+import math
 import datetime
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
     AddressError, NetworkError, APIError, UnitError, TransactionRawError
 )
 from ..config import bitcoin as config
+from ..units import (
+    unit_scales, convert_amount, convert_amounts
+)
+from ..session import session
+from .network import network_context
+
+
+# Serialized sizes (bytes) of a legacy transaction parts
+TRANSACTION_OVERHEAD_SIZE: int = 10  # version, input count, output count and lock time
+P2PKH_INPUT_SIZE: int = 149  # outpoint, script sig length, <signature> <public key> and sequence
+P2PKH_OUTPUT_SIZE: int = 34  # value, script length and pay to public key hash script
 
 
-def fee_calculator(transaction_input: int = 1, transaction_output: int = 1) -> int:
+def fee_calculator(transaction_input: int = 1, transaction_output: int = 1, fee_rate: Optional[float] = None) -> int:
     """
     Bitcoin fee calculator.
 
@@ -36,14 +48,28 @@ def fee_calculator(transaction_input: int = 1, transaction_output: int = 1) -> i
     :type transaction_input: int
     :param transaction_output: transaction output numbers, defaults to ``1``.
     :type transaction_output: int
+    :param fee_rate: Bitcoin fee rate (Satoshi per virtual byte), defaults to ``None``.
+    :type fee_rate: float
 
     :returns: int -- Bitcoin fee (Satoshi amount).
 
+    .. note::
+        Without ``fee_rate`` the legacy fixed fee is returned, with it the fee is computed
+        from the pay to public key hash transaction size.
+
     >>> from swap.providers.bitcoin.utils import fee_calculator
     >>> fee_calculator(transaction_input=2, transaction_output=9)
     1836
+    >>> fee_calculator(transaction_input=2, transaction_output=9, fee_rate=2.5)
+    1535
     """
 
+    if fee_rate is not None:
+        return math.ceil(fee_rate * (
+            TRANSACTION_OVERHEAD_SIZE + (transaction_input * P2PKH_INPUT_SIZE) +
+            (transaction_output * P2PKH_OUTPUT_SIZE)
+        ))
+
     # 444 input 102 output
     transaction_input = ((transaction_input - 1) * 444) + 576
     transaction_output = ((transaction_output - 1) * 102)
@@ -67,7 +93,9 @@ def get_address_type(address: str) -> str:
     if not is_address(address=address):
         raise AddressError(f"Invalid Bitcoin '{address}' address.")
 
-    loaded_address = Address.from_string(address)
+    # Addresses are loaded in their own network context
+    with network_context(network=("mainnet" if is_address(address=address, network="mainnet") else "testnet")):
+        loaded_address = Address.from_string(address)
     address_type = loaded_address.get_type()
     return str(address_type)
 
@@ -155,14 +183,12 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     True
     """
 
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionRaw)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loads_transaction_raw = json.loads(decoded_transaction_raw.decode())
-        return loads_transaction_raw["type"] in [
+        loaded_transaction_raw = parse_transaction_raw(transaction_raw=transaction_raw)
+        return loaded_transaction_raw["type"] in [
             "bitcoin_normal_unsigned", "bitcoin_normal_signed",
             "bitcoin_fund_unsigned", "bitcoin_fund_signed",
             "bitcoin_withdraw_unsigned", "bitcoin_withdraw_signed",
@@ -172,46 +198,39 @@ def is_transaction_raw(transaction_raw: str) -> bool:
         return False
 
 
-def amount_unit_converter(amount: Union[int, float], unit_from: str = "Satoshi2BTC") -> Union[int, float]:
+# Unit conversion scales, BTC2Satoshi, mBTC2Satoshi and Satoshi2mBTC amounts are integers
+UNIT_SCALES: Dict[str, Tuple[int, int, bool]] = unit_scales(
+    units=config["units"], integers=["BTC2Satoshi", "mBTC2Satoshi", "Satoshi2mBTC"]
+)
+
+
+def amount_unit_converter(amount: Union[int, float, Decimal, List[Union[int, float, Decimal]]],
+                          unit_from: str = "Satoshi2BTC") -> Union[int, float, List[Union[int, float]]]:
     """
     Bitcoin amount unit converter
 
     :param amount: Bitcoin any amount.
-    :type amount: Union[int, float]
+    :type amount: int, float, decimal.Decimal, list
     :param unit_from: Bitcoin unit convert from symbol, default to ``Satoshi2BTC``.
     :type unit_from: str
 
-    :returns: int, float -- BTC asset amount.
+    :returns: int, float, list -- BTC asset amount.
 
     >>> from swap.providers.bitcoin.utils import amount_unit_converter
     >>> amount_unit_converter(amount=10_000_000, unit_from="Satoshi2BTC")
     0.1
+    >>> amount_unit_converter(amount=[0.1, 0.29], unit_from="BTC2Satoshi")
+    [10000000, 29000000]
     """
 
-    if unit_from not in ["BTC2mBTC", "BTC2Satoshi", "mBTC2BTC", "mBTC2Satoshi", "Satoshi2BTC", "Satoshi2mBTC"]:
+    if unit_from not in UNIT_SCALES:
         raise UnitError(f"Invalid Bitcoin '{unit_from}' unit from",
                         "choose only 'BTC2mBTC', 'BTC2Satoshi', 'mBTC2BTC', 'mBTC2Satoshi', "
                         "'Satoshi2BTC' or 'Satoshi2mBTC' units.")
 
-    # Constant unit values
-    BTC, mBTC, Satoshi = (
-        config["units"]["BTC"],
-        config["units"]["mBTC"],
-        config["units"]["Satoshi"]
-    )
-
-    if unit_from == "BTC2mBTC":
-        return float((amount * mBTC) / BTC)
-    elif unit_from == "BTC2Satoshi":
-        return int((amount * Satoshi) / BTC)
-    elif unit_from == "mBTC2BTC":
-        return float((amount * BTC) / mBTC)
-    elif unit_from == "mBTC2Satoshi":
-        return int((amount * Satoshi) / mBTC)
-    elif unit_from == "Satoshi2BTC":
-        return float((amount * BTC) / Satoshi)
-    elif unit_from == "Satoshi2mBTC":
-        return int((amount * mBTC) / Satoshi)
+    if isinstance(amount, (int, float, Decimal)):
+        return convert_amount(amount=amount, scale=UNIT_SCALES[unit_from])
+    return convert_amounts(amounts=amount, scale=UNIT_SCALES[unit_from])
 
 
 def decode_transaction_raw(transaction_raw: str, offline: bool = True,
@@ -236,24 +255,20 @@ def decode_transaction_raw(transaction_raw: str, offline: bool = True,
     {'fee': 678, 'type': 'bitcoin_fund_unsigned', 'tx': {'hex': '0200000001888be7ec065097d95664763f276d425552d735fb1d974ae78bf72106dca0f3910100000000ffffffff02102700000000000017a9142bb013c3e4beb08421dedcf815cb65a5c388178b87bcdd0e00000000001976a91464a8390b0b1685fcbf2d4b457118dc8da92d553488ac00000000', 'txid': 'abc70fd3466aec9478ea3115200a84f993204ad1f614fe08e92ecc5997a0d3ba', 'hash': 'abc70fd3466aec9478ea3115200a84f993204ad1f614fe08e92ecc5997a0d3ba', 'size': 117, 'vsize': 117, 'version': 2, 'locktime': 0, 'vin': [{'txid': '91f3a0dc0621f78be74a971dfb35d75255426d273f766456d9975006ece78b88', 'vout': 1, 'scriptSig': {'asm': '', 'hex': ''}, 'sequence': '4294967295'}], 'vout': [{'value': '0.00010000', 'n': 0, 'scriptPubKey': {'asm': 'OP_HASH160 2bb013c3e4beb08421dedcf815cb65a5c388178b OP_EQUAL', 'hex': 'a9142bb013c3e4beb08421dedcf815cb65a5c388178b87', 'type': 'p2sh', 'address': '2MwEDybGC34949zgzWX4M9FHmE3crDSUydP'}}, {'value': '0.00974268', 'n': 1, 'scriptPubKey': {'asm': 'OP_DUP OP_HASH160 64a8390b0b1685fcbf2d4b457118dc8da92d5534 OP_EQUALVERIFY OP_CHECKSIG', 'hex': '76a91464a8390b0b1685fcbf2d4b457118dc8da92d553488ac', 'type': 'p2pkh', 'address': 'mphBPZf15cRFcL5tUq6mCbE84XobZ1vg7Q'}}]}, 'network': 'testnet'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bitcoin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     decoded_transaction: Optional[dict] = None
 
     if offline:
-        stp(loaded_transaction_raw["network"], strict=True, force=True)
-        tx = MutableTransaction.unhexlify(loaded_transaction_raw["raw"])
-        decoded_transaction = tx.to_json()
+        with network_context(network=loaded_transaction_raw["network"]):
+            decoded_transaction = MutableTransaction.unhexlify(loaded_transaction_raw["raw"]).to_json()
     else:
         url = f"{config[loaded_transaction_raw['network']]['blockcypher']['url']}/txs/decode"
         parameter = dict(token=config[loaded_transaction_raw["network"]]["blockcypher"]["token"])
         data = dict(tx=loaded_transaction_raw["raw"])
-        response = requests.post(
+        response = session.post(
             url=url, data=json.dumps(data), params=parameter, headers=headers, timeout=timeout
         )
         decoded_transaction = response.json()
@@ -288,17 +303,14 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
     {'fee': '...', 'type': '...', 'transaction_id': '...', 'network': '...', 'date': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bitcoin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     if endpoint == "smartbit":
         url = f"{config[loaded_transaction_raw['network']]['smartbit']}/pushtx"
         data = dict(hex=loaded_transaction_raw["raw"])
-        response = requests.post(
+        response = session.post(
             url=url, data=json.dumps(data), headers=headers, timeout=timeout
         )
         response_json = response.json()
@@ -317,7 +329,7 @@ def submit_transaction_raw(transaction_raw: str, endpoint: str = "sochain", head
     elif endpoint == "sochain":
         url = str(config[loaded_transaction_raw['network']]['sochain']).format(links="send_tx")
         data = dict(tx_hex=loaded_transaction_raw["raw"])
-        response = requests.post(
+        response = session.post(
             url=url, data=json.dumps(data), headers=headers, timeout=timeout
         )
         response_json = response.json()
@@ -356,7 +368,8 @@ def get_address_hash(address: str, script: bool = False) -> Union[str, P2pkhScri
     if not is_address(address=address):
         raise AddressError(f"Invalid Bitcoin '{address}' address.")
 
-    loaded_address = Address.from_string(address)
+    with network_context(network=("mainnet" if is_address(address=address, network="mainnet") else "testnet")):
+        loaded_address = Address.from_string(address)
     get_type = loaded_address.get_type()
     if not script:
         return loaded_address.hash.hex()
@@ -366,22 +379,10 @@ def get_address_hash(address: str, script: bool = False) -> Union[str, P2pkhScri
         return P2shScript(loaded_address)
 
 
-def _get_previous_transaction_indexes(utxos: list, amount: int, transaction_output: int = 2) -> Tuple[list, int]:
-    temp_amount, max_amount = 0, 0
-    previous_transaction_indexes: list = []
-    for index, utxo in enumerate(utxos):
-        temp_amount += utxo["value"]
-        if temp_amount > (amount + fee_calculator((index + 1), transaction_output)):
-            previous_transaction_indexes.append(index)
-            break
-        previous_transaction_indexes.append(index)
-    for utxo in utxos:
-        max_amount += utxo["value"]
-    return previous_transaction_indexes, max_amount
-
-
 def _build_inputs(utxos: list, previous_transaction_indexes: Optional[list] = None) -> tuple:
     inputs, amount = [], 0
+    if previous_transaction_indexes is not None:
+        previous_transaction_indexes = set(previous_transaction_indexes)
     for index, utxo in enumerate(utxos):
         if previous_transaction_indexes is None or index in previous_transaction_indexes:
             amount += utxo["value"]
@@ -398,6 +399,8 @@ def _build_inputs(utxos: list, previous_transaction_indexes: Optional[list] = No
 
 def _build_outputs(utxos: list, previous_transaction_indexes: Optional[list] = None, only_dict: bool = False) -> list:
     outputs = []
+    if previous_transaction_indexes is not None:
+        previous_transaction_indexes = set(previous_transaction_indexes)
     for index, utxo in enumerate(utxos):
         if previous_transaction_indexes is None or index in previous_transaction_indexes:
             outputs.append(
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Dict, List
+)
+
+from ...exceptions import (
+    AddressError, APIError, NetworkError
+)
+from ..config import (
+    bitcoin as config, watcher as watcher_config
+)
+from ..session import session
+from ..watcher import (
+    Event, FUND, WITHDRAW, REFUND
+)
+from .utils import (
+    is_network, is_address
+)
+from .. import watcher
+
+
+def _script_pushes(script: str) -> List[bytes]:
+    # Data pushed by a scriptSig, small integer opcodes are pushed as their number
+    script_bytes, pushes, index = bytes.fromhex(script), [], 0
+    while index < len(script_bytes):
+        opcode: int = script_bytes[index]
+        index += 1
+        if opcode == 0x00:
+            pushes.append(b"")
+            continue
+        if 0x51 <= opcode <= 0x60:
+            pushes.append(bytes([opcode - 0x50]))
+            continue
+        if opcode <= 0x4b:
+            size: int = opcode
+        elif opcode == 0x4c:
+            size, index = script_bytes[index], index + 1
+        elif opcode == 0x4d:
+            size, index = int.from_bytes(script_bytes[index:index + 2], "little"), index + 2
+        elif opcode == 0x4e:
+            size, index = int.from_bytes(script_bytes[index:index + 4], "little"), index + 4
+        else:
+            raise ValueError(f"Invalid Bitcoin scriptSig, unexpected '{opcode:#04x}' opcode.")
+        pushes.append(script_bytes[index:index + size])
+        index += size
+    return pushes
+
+
+class Watcher(watcher.Watcher):
+    """
+    Bitcoin HTLC watcher, polls Pay to Script Hash (P2SH) addresses in batches.
+
+    :param network: Bitcoin network, defaults to ``mainnet``.
+    :type network: str
+    :param confirmations: Confirmations needed before an event is emitted, defaults to ``0``.
+    :type confirmations: int
+    :param interval: Seconds between polls while events keep coming, defaults to ``5``.
+    :type interval: float
+    :param max_interval: Idle polls back off up to this many seconds, defaults to ``60``.
+    :type max_interval: float
+    :param headers: Request headers, default to ``common-headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: Watcher -- Bitcoin HTLC watcher instance.
+
+    >>> from swap.providers.bitcoin.watcher import Watcher
+    >>> watcher: Watcher = Watcher(network="testnet", confirmations=1)
+    >>> watcher.watch(address="2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK").on(print, kind="withdraw")
+    <swap.providers.bitcoin.watcher.Watcher object at 0x0409DAF0>
+    >>> watcher.poll()
+    [Event(kind='fund', htlc='2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK', transaction_hash='a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31')]
+    """
+
+    def __init__(self, network: str = config["network"], confirmations: int = 0,
+                 interval: float = watcher_config["interval"], max_interval: float = watcher_config["max_interval"],
+                 headers: dict = config["headers"], timeout: int = config["timeout"]):
+        super().__init__(network=network, confirmations=confirmations, interval=interval, max_interval=max_interval)
+
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid Bitcoin '{network}' network",
+                               "choose only 'mainnet' or 'testnet' networks.")
+
+        self._headers: dict = headers
+        self._timeout: int = timeout
+
+    def watch(self, address: str) -> "Watcher":
+        """
+        Watch Bitcoin HTLC.
+
+        :param address: Bitcoin HTLC (P2SH) address.
+        :type address: str
+
+        :returns: Watcher -- Bitcoin HTLC watcher instance.
+
+        >>> from swap.providers.bitcoin.watcher import Watcher
+        >>> watcher: Watcher = Watcher(network="testnet")
+        >>> watcher.watch(address="2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK")
+        <swap.providers.bitcoin.watcher.Watcher object at 0x0409DAF0>
+        """
+
+        if not is_address(address=address, network=self._network, address_type="p2sh"):
+            raise AddressError(f"Invalid Bitcoin HTLC '{address}' {self._network} address.")
+        return self._watch(htlc=address)
+
+    def _events(self, address: str, transaction: dict) -> List[Event]:
+        if transaction.get("confirmations", 0) < self._confirmations:
+            return []
+        events: List[Event] = []
+        block_height = transaction["block_height"] if transaction.get("block_height", -1) >= 0 else None
+        for position, output in enumerate(transaction["outputs"]):
+            if address in (output.get("addresses") or []):
+                events.append(Event(
+                    kind=FUND, htlc=address, transaction_hash=transaction["hash"], network=self._network,
+                    block_height=block_height, data=dict(id=position, value=output["value"], position=position)
+                ))
+        for transaction_input in transaction["inputs"]:
+            if address in (transaction_input.get("addresses") or []):
+                # HTLC branch selector is pushed right before the redeem script, OP_1 withdraw and OP_0 refund
+                branch: bytes = _script_pushes(transaction_input["script"])[-2]
+                events.append(Event(
+                    kind=(WITHDRAW if branch == b"\x01" else REFUND), htlc=address,
+                    transaction_hash=transaction["hash"], network=self._network, block_height=block_height,
+                    data=dict(
+                        id=f"{transaction_input['prev_hash']}:{transaction_input['output_index']}",
+                        value=transaction_input["output_value"], prev_hash=transaction_input["prev_hash"],
+                        output_index=transaction_input["output_index"]
+                    )
+                ))
+        return events
+
+    def _poll(self, watched: Dict[str, dict]) -> List[Event]:
+        addresses, events = list(watched), []
+        for start in range(0, len(addresses), watcher_config["batch_size"]):
+            # BlockCypher batches addresses separated by semicolons
+            url = f"{config[self._network]['blockcypher']['url']}/addrs/" \
+                  f"{';'.join(addresses[start:start + watcher_config['batch_size']])}/full"
+            response = session.get(
+                url=url, params=dict(
+                    limit=watcher_config["limit"], token=config[self._network]["blockcypher"]["token"]
+                ), headers=self._headers, timeout=self._timeout
+            )
+            response_json = response.json()
+            for address_json in (response_json if isinstance(response_json, list) else [response_json]):
+                if "error" in address_json:
+                    raise APIError(address_json["error"], response.status_code)
+                for transaction in address_json.get("txs", []):
+                    events.extend(self._events(address=address_json["address"], transaction=transaction))
+        return events
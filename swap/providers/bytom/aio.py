@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Union, AsyncIterator
+)
+
+import json
+
+from ...exceptions import (
+    APIError, NetworkError, AddressError
+)
+from ..aio import (
+    get_session, run_sync
+)
+from ..cache import (
+    cached, finalized
+)
+from ..config import bytom as config
+from .assets import AssetNamespace
+from .utils import (
+    is_network, is_address
+)
+from . import transaction
+
+
+@cached(policy="balance")
+async def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"],
+                      network: str = config["network"], headers: dict = config["headers"],
+                      timeout: int = config["timeout"]) -> int:
+    """
+    Get Bytom balance.
+
+    :param address: Bytom address.
+    :type address: str
+    :param asset: Bytom asset, default to ``BTM``.
+    :type asset: str, bytom.assets.AssetNamespace
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: int -- Bytom asset balance (NEU amount).
+
+    >>> from swap.providers.bytom.aio import get_balance
+    >>> from swap.providers.bytom.assets import BTM as ASSET
+    >>> await get_balance(address="bm1qk9vj4jaezlcnjdckds4fkm8fwv5kawmq9qrufx", asset=ASSET, network="mainnet")
+    71560900
+    """
+
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bytom '{address}' {network} address.")
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockmeta']}/address/{address}/asset"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    if response_json is None:
+        return 0
+    for _asset in response_json:
+        if (str(asset.ID) if isinstance(asset, AssetNamespace) else asset) == _asset["asset_id"]:
+            return int(_asset["balance"])
+    return 0
+
+
+async def get_utxos(program: str, network: str = config["network"],
+                    asset: Union[str, AssetNamespace] = config["asset"], limit: Optional[int] = 15,
+                    by: str = "amount", order: str = "desc", headers: dict = config["headers"],
+                    timeout: int = config["timeout"]) -> list:
+    """
+    Get Bytom unspent transaction outputs (UTXO's).
+
+    :param program: Bytom control program.
+    :type program: str
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param asset: Bytom asset id, defaults to ``BTM``.
+    :type asset: str, bytom.assets.AssetNamespace
+    :param limit: Bytom utxo's limit, defaults to ``15`` (``None`` to follow every page).
+    :type limit: int
+    :param by: Sort by, defaults to ``amount``.
+    :type by: str
+    :param order: Sort order, defaults to ``desc``.
+    :type order: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: list -- Bytom unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.bytom.aio import get_utxos
+    >>> await get_utxos(program="00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", network="mainnet")
+    [{'hash': '7c1e20e6ff719176a3ed6f5332ec3ff665ab28754d2511950e591267e0e675df', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 71510800}, {'hash': '01b07c3523085b75f1e047be3a73b263635d0b86f9b751457a51b26c5a97a110', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 50000}, {'hash': 'e46cfecc1f1a26413172ce81c78affb19408e613915642fa5fb04d3b0a4ffa65', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 100}]
+    """
+
+    if limit is None:
+        return [utxo async for utxo in iter_utxos(
+            program=program, network=network, asset=asset, by=by, order=order, headers=headers, timeout=timeout
+        )]
+    async for page in iter_utxos(
+        program=program, network=network, asset=asset, limit=limit, by=by, order=order,
+        headers=headers, timeout=timeout, pages=True
+    ):
+        return page
+    return []
+
+
+def iter_utxos(program: str, network: str = config["network"], asset: Union[str, AssetNamespace] = config["asset"],
+               limit: int = config["utxo_limit"], by: str = "amount", order: str = "desc",
+               headers: dict = config["headers"], timeout: int = config["timeout"],
+               pages: bool = False) -> AsyncIterator:
+    """
+    Iterate Bytom unspent transaction outputs (UTXO's), next page is fetched only when needed.
+
+    :param program: Bytom control program.
+    :type program: str
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param asset: Bytom asset id, defaults to ``BTM``.
+    :type asset: str, bytom.assets.AssetNamespace
+    :param limit: Bytom utxo's page size, defaults to ``100``.
+    :type limit: int
+    :param by: Sort by, defaults to ``amount``.
+    :type by: str
+    :param order: Sort order, defaults to ``desc``.
+    :type order: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :param pages: Yield whole pages instead of single UTXO's, defaults to ``False``.
+    :type pages: bool
+
+    :returns: async generator -- Bytom unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.bytom.aio import iter_utxos
+    >>> [utxo async for utxo in iter_utxos(program="00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", network="mainnet")]
+    [{'hash': '7c1e20e6ff719176a3ed6f5332ec3ff665ab28754d2511950e591267e0e675df', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 71510800}, ...]
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockcenter']}/q/utxos"
+    data = dict(filter=dict(
+        script=program, asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
+    ), sort=dict(by=by, order=order))
+    return _iter_utxos(url=url, data=data, limit=limit, headers=headers, timeout=timeout, pages=pages)
+
+
+async def _iter_utxos(url: str, data: dict, limit: int, headers: dict, timeout: int, pages: bool) -> AsyncIterator:
+    start: int = 0
+    while True:
+        params = dict(start=start, limit=limit)
+        response = await get_session().post(
+            url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        page: list = response_json["data"] or []
+        if pages:
+            yield page
+        else:
+            for utxo in page:
+                yield utxo
+        if len(page) < limit:
+            break
+        start += len(page)
+
+
+@cached(policy="transaction", permanent=finalized,
+        cacheable=lambda transaction: isinstance(transaction, dict) and transaction.get("inputs") is not None)
+async def get_transaction(transaction_hash: str, network: str = config["network"],
+                          headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
+    """
+    Get Bytom transaction detail.
+
+    :param transaction_hash: Bytom transaction hash/id.
+    :type transaction_hash: str
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Bytom transaction detail.
+
+    >>> from swap.providers.bytom.aio import get_transaction
+    >>> await get_transaction(transaction_hash="bc935995cb3408b51aa3d05e7e77226840eb68340b229f9c561edae31ebc8b95", network="mainnet")
+    {'id': 'bc935995cb3408b51aa3d05e7e77226840eb68340b229f9c561edae31ebc8b95', 'timestamp': 1524765978, 'block_height': 3487, 'trx_amount': 41249562600, 'trx_fee': 437400, 'status_fail': False, 'coinbase': False, 'size': 332, 'chain_status': 'mainnet', ...}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockmeta']}/transaction/{transaction_hash}"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    if response.status_code == 200 and response.json()["inputs"] is not None:
+        return response.json()
+    raise APIError(f"Not found this '{transaction_hash}' transaction hash.", 500)
+
+
+async def get_current_block_height(plus: int = 0, network: str = config["network"],
+                                   headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
+    """
+    Get Bytom current block height.
+
+    :param plus: Add block number on current block height, default to ``0``.
+    :type plus: int
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: int -- Bytom current block height.
+
+    >>> from swap.providers.bytom.aio import get_current_block_height
+    >>> await get_current_block_height(plus=0)
+    678722
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    return await _get_latest_block_height(network=network, headers=headers, timeout=timeout) + plus
+
+
+@cached(policy="block_height")
+async def _get_latest_block_height(network: str, headers: dict, timeout: int) -> int:
+    url = f"{config[network]['blockmeta']}/latest-block"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    if response.status_code == 200:
+        return int(response.json()["block"]["height"])
+    raise APIError("Can't get current latest Bytom block height.")
+
+
+async def submit_raw(address: str, raw: str, signatures: list, network: str = config["network"],
+                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> str:
+    """
+    Submit original Bytom raw into blockchain.
+
+    :param address: Bytom address.
+    :type address: str
+    :param raw: Bytom transaction raw.
+    :type raw: str
+    :param signatures: Bytom signed massage datas.
+    :type signatures: list
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: str -- Bytom submitted transaction id/hash.
+
+    >>> from swap.providers.bytom.aio import submit_raw
+    >>> await submit_raw(address="bm1qk9vj4jaezlcnjdckds4fkm8fwv5kawmq9qrufx", raw="07010002015e015c88650475abf87eb364f93c608db879ad71643fbc7725ded246e8883e79c75a78ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffd0860300011600142cda4f99ea8112e6fa61cdd26157ed6dc408332a22012091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2015f015da72ea4ad87d7b5a51534c07edc005887345ef38fac8d258987dd17268e8d0336ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff90d68c2201011600142cda4f99ea8112e6fa61cdd26157ed6dc408332a22012091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2020146ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff904e012200204f8f0e88d0a44b3d884b07b6dd4536518ffcbb596a91ca0e6b2f37e96463bbfc00013cffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff909aaf1d011600142cda4f99ea8112e6fa61cdd26157ed6dc408332a00", signatures=[["f8466336a79d166e47fb5d64f1e7ec01b203b59b3ee86686492bd1e4d0bdd642dfe4a575049071a052a441635c336708ab7d869cccd5331bc29f60e0ed9cd80d"], ["ebf33fbda5c2f3d144e90c3b763b1e7e42d501e595216fcd2b310b089918bae2ef4c7b8a2e1f650ee741578aba7960706d2bf9be7dffbf0fe77199075f155909"]], network="mainnet")
+    "2993414225f65390220730d0c1a356c14e91bca76db112d37366df93e364a492"
+    """
+
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Bytom '{address}' {network} address.")
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockcenter']}/merchant/submit-payment"
+    data = dict(raw_transaction=raw, signatures=signatures)
+    params = dict(address=address)
+    response = await get_session().post(
+        url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    if response_json["code"] != 200:
+        raise APIError(response_json["msg"], response_json["code"])
+    return response_json["data"]["tx_hash"]
+
+
+class NormalTransaction(transaction.NormalTransaction):
+    """
+    Bytom asynchronous normal transaction.
+
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: NormalTransaction -- Bytom asynchronous normal transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "NormalTransaction":
+        """
+        Build Bytom normal transaction, takes the same arguments as
+        :meth:`swap.providers.bytom.transaction.NormalTransaction.build_transaction`.
+
+        >>> from swap.providers.bytom.aio import NormalTransaction
+        >>> normal_transaction: NormalTransaction = NormalTransaction(network="mainnet")
+        >>> await normal_transaction.build_transaction(address="bm1q9ndylx02syfwd7npehfxz4lddhzqsve2fu6vc7", recipients={"bm1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07q3yf5q8": 10000000}, asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff")
+        <swap.providers.bytom.aio.NormalTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class FundTransaction(transaction.FundTransaction):
+    """
+    Bytom asynchronous fund transaction.
+
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: FundTransaction -- Bytom asynchronous fund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "FundTransaction":
+        """
+        Build Bytom fund transaction, takes the same arguments as
+        :meth:`swap.providers.bytom.transaction.FundTransaction.build_transaction`.
+
+        >>> from swap.providers.bytom.htlc import HTLC
+        >>> from swap.providers.bytom.aio import FundTransaction
+        >>> htlc: HTLC = HTLC(network="mainnet")
+        >>> htlc.build_htlc(secret_hash="3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb", recipient_public_key="3e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e", sender_public_key="fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212", endblock=679208)
+        >>> fund_transaction: FundTransaction = FundTransaction(network="mainnet")
+        >>> await fund_transaction.build_transaction(address="bm1qk9vj4jaezlcnjdckds4fkm8fwv5kawmq9qrufx", htlc=htlc, amount=0.1, asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff", unit="BTM")
+        <swap.providers.bytom.aio.FundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class WithdrawTransaction(transaction.WithdrawTransaction):
+    """
+    Bytom asynchronous withdraw transaction.
+
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: WithdrawTransaction -- Bytom asynchronous withdraw transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "WithdrawTransaction":
+        """
+        Build Bytom withdraw transaction, takes the same arguments as
+        :meth:`swap.providers.bytom.transaction.WithdrawTransaction.build_transaction`.
+
+        >>> from swap.providers.bytom.aio import WithdrawTransaction
+        >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="mainnet")
+        >>> await withdraw_transaction.build_transaction(address="bm1q3plwvmvy4qhjmp5zffzmk50aagpujt6f5je85p", transaction_hash="59b1e43b57cba1afa5834eb9886e4a9fba031c9880ce7ae29d32c36f6b47496f", asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff")
+        <swap.providers.bytom.aio.WithdrawTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class RefundTransaction(transaction.RefundTransaction):
+    """
+    Bytom asynchronous refund transaction.
+
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: RefundTransaction -- Bytom asynchronous refund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "RefundTransaction":
+        """
+        Build Bytom refund transaction, takes the same arguments as
+        :meth:`swap.providers.bytom.transaction.RefundTransaction.build_transaction`.
+
+        >>> from swap.providers.bytom.aio import RefundTransaction
+        >>> refund_transaction: RefundTransaction = RefundTransaction(network="mainnet")
+        >>> await refund_transaction.build_transaction(address="bm1qk9vj4jaezlcnjdckds4fkm8fwv5kawmq9qrufx", transaction_hash="59b1e43b57cba1afa5834eb9886e4a9fba031c9880ce7ae29d32c36f6b47496f", asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff")
+        <swap.providers.bytom.aio.RefundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
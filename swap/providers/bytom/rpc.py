@@ -1,22 +1,26 @@
 #!/usr/bin/env python3
 
 from typing import (
-    Optional, Union
+    Optional, Union, Iterator
 )
 
-import requests
 import json
 
 from ...exceptions import (
     BalanceError, APIError, NetworkError, AddressError
 )
 from ..config import bytom as config
+from ..session import session
+from ..cache import (
+    cached, finalized
+)
 from .assets import AssetNamespace
 from .utils import (
     is_network, is_address, amount_unit_converter, get_address_type
 )
 
 
+@cached(policy="balance")
 def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"], network: str = config["network"],
                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
     """
@@ -48,7 +52,7 @@ def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/address/{address}/asset"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -61,7 +65,7 @@ def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"
 
 
 def get_utxos(program: str, network: str = config["network"], asset: Union[str, AssetNamespace] = config["asset"],
-              limit: int = 15, by: str = "amount", order: str = "desc",
+              limit: Optional[int] = 15, by: str = "amount", order: str = "desc",
               headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
     """
     Get Bytom unspent transaction outputs (UTXO's).
@@ -72,7 +76,7 @@ def get_utxos(program: str, network: str = config["network"], asset: Union[str,
     :type network: str
     :param asset: Bytom asset id, defaults to ``BTM``.
     :type asset: str, bytom.assets.AssetNamespace
-    :param limit: Bytom utxo's limit, defaults to ``15``.
+    :param limit: Bytom utxo's limit, defaults to ``15`` (``None`` to follow every page).
     :type limit: int
     :param by: Sort by, defaults to ``amount``.
     :type by: str
@@ -90,6 +94,49 @@ def get_utxos(program: str, network: str = config["network"], asset: Union[str,
     [{'hash': '7c1e20e6ff719176a3ed6f5332ec3ff665ab28754d2511950e591267e0e675df', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 71510800}, {'hash': '01b07c3523085b75f1e047be3a73b263635d0b86f9b751457a51b26c5a97a110', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 50000}, {'hash': 'e46cfecc1f1a26413172ce81c78affb19408e613915642fa5fb04d3b0a4ffa65', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 100}]
     """
 
+    if limit is None:
+        return list(iter_utxos(
+            program=program, network=network, asset=asset, by=by, order=order, headers=headers, timeout=timeout
+        ))
+    return next(iter_utxos(
+        program=program, network=network, asset=asset, limit=limit, by=by, order=order,
+        headers=headers, timeout=timeout, pages=True
+    ), [])
+
+
+def iter_utxos(program: str, network: str = config["network"], asset: Union[str, AssetNamespace] = config["asset"],
+               limit: int = config["utxo_limit"], by: str = "amount", order: str = "desc",
+               headers: dict = config["headers"], timeout: int = config["timeout"],
+               pages: bool = False) -> Iterator:
+    """
+    Iterate Bytom unspent transaction outputs (UTXO's), next page is fetched only when needed.
+
+    :param program: Bytom control program.
+    :type program: str
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param asset: Bytom asset id, defaults to ``BTM``.
+    :type asset: str, bytom.assets.AssetNamespace
+    :param limit: Bytom utxo's page size, defaults to ``100``.
+    :type limit: int
+    :param by: Sort by, defaults to ``amount``.
+    :type by: str
+    :param order: Sort order, defaults to ``desc``.
+    :type order: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :param pages: Yield whole pages instead of single UTXO's, defaults to ``False``.
+    :type pages: bool
+
+    :returns: generator -- Bytom unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.bytom.rpc import iter_utxos
+    >>> next(iter_utxos(program="00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", network="mainnet"))
+    {'hash': '7c1e20e6ff719176a3ed6f5332ec3ff665ab28754d2511950e591267e0e675df', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 71510800}
+    """
+
     if not is_network(network=network):
         raise NetworkError(f"Invalid Bytom '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
@@ -98,12 +145,25 @@ def get_utxos(program: str, network: str = config["network"], asset: Union[str,
     data = dict(filter=dict(
         script=program, asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
     ), sort=dict(by=by, order=order))
-    params = dict(limit=limit)
-    response = requests.post(
-        url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
-    )
-    response_json = response.json()
-    return response_json["data"]
+    return _iter_utxos(url=url, data=data, limit=limit, headers=headers, timeout=timeout, pages=pages)
+
+
+def _iter_utxos(url: str, data: dict, limit: int, headers: dict, timeout: int, pages: bool) -> Iterator:
+    start: int = 0
+    while True:
+        params = dict(start=start, limit=limit)
+        response = session.post(
+            url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        page: list = response_json["data"] or []
+        if pages:
+            yield page
+        else:
+            yield from page
+        if len(page) < limit:
+            break
+        start += len(page)
 
 
 def estimate_transaction_fee(address: str, amount: int, asset: Union[str, AssetNamespace] = config["asset"],
@@ -151,7 +211,7 @@ def estimate_transaction_fee(address: str, amount: int, asset: Union[str, AssetN
         confirmations=confirmations
     )
     params = dict(address=address)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -193,7 +253,7 @@ def account_create(xpublic_key: str, label: str = "1st address", account_index:
 
     url = f"{config[network]['blockcenter']}/account/create"
     data = dict(pubkey=xpublic_key, label=label, account_index=account_index)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -232,7 +292,7 @@ def build_transaction(address: str, transaction: dict, network: str = config["ne
 
     url = f"{config[network]['blockcenter']}/merchant/build-advanced-tx"
     params = dict(address=address)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(transaction), params=params, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 300:
@@ -248,6 +308,8 @@ def build_transaction(address: str, transaction: dict, network: str = config["ne
     return response.json()["data"][0]
 
 
+@cached(policy="transaction", permanent=finalized,
+        cacheable=lambda transaction: isinstance(transaction, dict) and transaction.get("inputs") is not None)
 def get_transaction(transaction_hash: str, network: str = config["network"],
                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
     """
@@ -274,7 +336,7 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/transaction/{transaction_hash}"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["inputs"] is not None:
@@ -307,13 +369,17 @@ def get_current_block_height(plus: int = 0, network: str = config["network"],
         raise NetworkError(f"Invalid Bytom '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    return _get_latest_block_height(network=network, headers=headers, timeout=timeout) + plus
+
+
+@cached(policy="block_height")
+def _get_latest_block_height(network: str, headers: dict, timeout: int) -> int:
     url = f"{config[network]['blockmeta']}/latest-block"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200:
-        return int(response.json()["block"]["height"]) \
-            if plus == 0 else int(response.json()["block"]["height"]) + plus
+        return int(response.json()["block"]["height"])
     raise APIError("Can't get current latest Bytom block height.")
 
 
@@ -366,7 +432,7 @@ def decode_raw(raw: str, network: str = config["network"],
 
     url = f"{config[network]['bytom-core']}/decode-raw-transaction"
     data = dict(raw_transaction=raw)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -409,7 +475,7 @@ def submit_raw(address: str, raw: str, signatures: list, network: str = config["
     url = f"{config[network]['blockcenter']}/merchant/submit-payment"
     data = dict(raw_transaction=raw, signatures=signatures)
     params = dict(address=address)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json = response.json()
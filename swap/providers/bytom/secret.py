@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Dict, List
+)
+
+import json
+
+from ...exceptions import (
+    APIError, NetworkError
+)
+from ...utils import sha256
+from ..config import bytom as config
+from ..session import session
+from .rpc import get_transaction
+from .utils import is_network
+
+
+def _witness_secret(witness_arguments: Optional[List[str]]) -> Optional[str]:
+    # Withdraw clause witness is the secret, the signature, 00 clause selector and the HTLC script last
+    if not witness_arguments or len(witness_arguments) < 4 or witness_arguments[-2] not in ["", "00"]:
+        return None
+    try:
+        secret: str = bytes.fromhex(witness_arguments[0]).decode()
+    except (ValueError, UnicodeDecodeError):
+        return None
+    # HTLC script locks the sha256 of the secret
+    if sha256(secret) not in witness_arguments[-1]:
+        return None
+    return secret
+
+
+def extract_secret(transaction_hash: str, network: str = config["network"],
+                   headers: dict = config["headers"], timeout: int = config["timeout"]) -> Optional[str]:
+    """
+    Extract secret key (preimage) from Bytom HTLC withdraw transaction.
+
+    :param transaction_hash: Bytom withdraw transaction hash/id.
+    :type transaction_hash: str
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: str -- Secret key, None if the transaction is not an HTLC withdraw.
+
+    >>> from swap.providers.bytom.secret import extract_secret
+    >>> extract_secret(transaction_hash="eee73b6d97de9b957b8eac5280a8b26a95832f501f5d02a1eae96f25f0ea0c6c", network="mainnet")
+    "Hello Meheret!"
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    transaction: dict = get_transaction(
+        transaction_hash=transaction_hash, network=network, headers=headers, timeout=timeout
+    )
+    for transaction_input in transaction["inputs"]:
+        secret: Optional[str] = _witness_secret(transaction_input.get("witness_arguments"))
+        if secret is not None:
+            return secret
+    return None
+
+
+def scan_secrets(secret_hashes: List[str], start_block: int, end_block: int, network: str = config["network"],
+                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> Dict[str, str]:
+    """
+    Scan Bytom block range once for HTLC withdraw secrets.
+
+    :param secret_hashes: Watched secret sha-256 hashes.
+    :type secret_hashes: list
+    :param start_block: First block height to scan.
+    :type start_block: int
+    :param end_block: Last block height to scan (included).
+    :type end_block: int
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Found secret keys by secret hash, stops early once every hash is found.
+
+    >>> from swap.providers.bytom.secret import scan_secrets
+    >>> scan_secrets(secret_hashes=["3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb"], start_block=680000, end_block=680100, network="mainnet")
+    {'3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb': 'Hello Meheret!'}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Bytom '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    watched: set = {secret_hash.lower() for secret_hash in secret_hashes}
+    secrets: Dict[str, str] = {}
+    url = f"{config[network]['bytom-core']}/get-block"
+    for block_height in range(start_block, end_block + 1):
+        if len(secrets) == len(watched):
+            break
+        # One request returns every transaction (with witness arguments) of the block
+        response = session.post(
+            url=url, data=json.dumps(dict(block_height=block_height)), headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        if response.status_code != 200 or response_json.get("status") != "success":
+            raise APIError(response_json.get("msg", f"Can't get this '{block_height}' Bytom block."),
+                           response_json.get("code", response.status_code))
+        for transaction in response_json["data"]["transactions"]:
+            for transaction_input in transaction["inputs"]:
+                secret: Optional[str] = _witness_secret(transaction_input.get("witness_arguments"))
+                if secret is not None and sha256(secret) in watched:
+                    secrets[sha256(secret)] = secret
+    return secrets
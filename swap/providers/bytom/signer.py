@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+from pybytom.wallet.tools import (
+    get_private_key, path_to_indexes
+)
+from pybytom.signature import sign
+from typing import (
+    Optional, Dict, List, Tuple
+)
+
+import hashlib
+
+from ..cache import Cache
+from ..config import bytom as config
+
+# Derived child private keys, least recently used ones are evicted
+key_cache: Cache = Cache(maxsize=config["key_cache_size"], path=None)
+
+
+def derive_private_key(xprivate_key: str, path: Optional[str] = None, indexes: Optional[List[str]] = None) -> str:
+    """
+    Derive Bytom child private key, each derivation is computed once and kept in the key cache.
+
+    :param xprivate_key: Bytom root xprivate key.
+    :type xprivate_key: str
+    :param path: Bytom derivation path, defaults to ``None``.
+    :type path: str
+    :param indexes: Bytom derivation indexes, defaults to ``None`` (root xprivate key without path).
+    :type indexes: list
+
+    :returns: str -- Bytom child private key.
+
+    >>> from swap.providers.bytom.signer import derive_private_key
+    >>> derive_private_key(xprivate_key="58775359b7b3588dcdc1bcf373489fa1272cacc03909f78469657b0208e66e46daedfdd0fd8f8df14e2084c7e8df4701db3062dded1c713e0aae734ac09c4afd", path="m/44/153/1/0/1")
+    "b0f9552e4fedac7f2e750ae984e36a97cf2b24609f7ec43f35606ed65eec6e46db35f71c405fd5948ecffa2c512adafb35cc621f99a60ecb6ec8aef815a8c6e5"
+    """
+
+    indexes: List[str] = path_to_indexes(path=path) if path else list(indexes or [])
+    # Root xprivate keys are hashed, the cache never holds them
+    key: str = f"{hashlib.sha256(xprivate_key.encode()).hexdigest()}:{''.join(indexes)}"
+    private_key, found = key_cache.get(key=key)
+    if not found:
+        private_key = get_private_key(xprivate_key=xprivate_key, indexes=indexes)
+        key_cache.set(key=key, value=private_key)
+    return private_key
+
+
+def sign_datas(xprivate_key: str, unsigned_datas: List[dict], path: Optional[str] = None,
+               indexes: Optional[List[str]] = None) -> List[List[str]]:
+    """
+    Sign Bytom transaction unsigned datas, grouped by derivation path.
+
+    :param xprivate_key: Bytom root xprivate key.
+    :type xprivate_key: str
+    :param unsigned_datas: Bytom transaction unsigned datas (with path).
+    :type unsigned_datas: list
+    :param path: Bytom derivation path of the unsigned datas without path, defaults to ``None``.
+    :type path: str
+    :param indexes: Bytom derivation indexes of the unsigned datas without path, defaults to ``None``.
+    :type indexes: list
+
+    :returns: list -- Bytom signatures of every unsigned datas, in the same order.
+
+    .. note::
+        Each derivation path is derived once and all its messages are signed in one pass,
+        so multi-input transactions spending from one address derive a single key.
+
+    >>> from swap.providers.bytom.signer import sign_datas
+    >>> sign_datas(xprivate_key="58775359b7b3588dcdc1bcf373489fa1272cacc03909f78469657b0208e66e46daedfdd0fd8f8df14e2084c7e8df4701db3062dded1c713e0aae734ac09c4afd", unsigned_datas=[{"datas": ["f42a2b6e15585b88da8b34237c7a6fd83af12ee6971813d66cf794a63ebcc16f"], "public_key": "fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212", "network": "mainnet", "path": "m/44/153/1/0/1"}])
+    [['b82e97abc4b70f7ffe7f783254c63e61436d6a7ad15da89b1fb791f91d1d6aa0bab7ff86328eabd2959f5475dde443e613ce7dfe70411be5b469b02069164a06']]
+    """
+
+    groups: Dict[Tuple[Optional[str], Tuple[str, ...]], List[int]] = {}
+    for index, unsigned in enumerate(unsigned_datas):
+        # Instruction path first, then the solver path or indexes, else the root xprivate key
+        derivation: Tuple[Optional[str], Tuple[str, ...]] = \
+            (unsigned["path"], ()) if unsigned.get("path") else (path, ()) if path else (None, tuple(indexes or []))
+        groups.setdefault(derivation, []).append(index)
+
+    signatures: List[Optional[List[str]]] = [None] * len(unsigned_datas)
+    for (_path, _indexes), positions in groups.items():
+        private_key: str = derive_private_key(xprivate_key=xprivate_key, path=_path, indexes=list(_indexes))
+        for position in positions:
+            signatures[position] = [
+                sign(private_key=private_key, message=unsigned_data)
+                for unsigned_data in unsigned_datas[position]["datas"]
+            ]
+    return signatures
@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
 
-from base64 import b64decode
 from pybytom.utils import is_address as btm_is_address
-from typing import Optional, Union
+from decimal import Decimal
+from typing import (
+    Optional, Union, List, Dict, Tuple
+)
 
-import requests
 import json
 import datetime
 
 from ...utils import (
-    clean_transaction_raw, get_current_timestamp
+    get_current_timestamp, parse_transaction_raw, TransactionRaw
 )
 from ...exceptions import (
     NetworkError, APIError, TransactionRawError, UnitError, AddressError
 )
 from ..config import bytom as config
+from ..units import (
+    unit_scales, convert_amount, convert_amounts
+)
+from ..session import session
 
 
 def get_address_type(address: str) -> Optional[str]:
@@ -111,13 +116,11 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     True
     """
 
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionRaw)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loaded_transaction_raw = parse_transaction_raw(transaction_raw=transaction_raw)
         return loaded_transaction_raw["type"] in [
             "bytom_normal_unsigned", "bytom_normal_signed",
             "bytom_fund_unsigned", "bytom_fund_signed",
@@ -128,46 +131,39 @@ def is_transaction_raw(transaction_raw: str) -> bool:
         return False
 
 
-def amount_unit_converter(amount: Union[int, float], unit_from: str = "NEU2BTM") -> Union[int, float]:
+# Unit conversion scales, BTM2NEU, mBTM2NEU and NEU2mBTM amounts are integers
+UNIT_SCALES: Dict[str, Tuple[int, int, bool]] = unit_scales(
+    units=config["units"], integers=["BTM2NEU", "mBTM2NEU", "NEU2mBTM"]
+)
+
+
+def amount_unit_converter(amount: Union[int, float, Decimal, List[Union[int, float, Decimal]]],
+                          unit_from: str = "NEU2BTM") -> Union[int, float, List[Union[int, float]]]:
     """
     Bytom amount unit converter
 
     :param amount: Bytom any amount.
-    :type amount: int, float
+    :type amount: int, float, decimal.Decimal, list
     :param unit_from: Bytom unit convert from symbol, default to ``NEU2BTM``.
     :type unit_from: str
 
-    :returns: int, float -- BTM asset amount.
+    :returns: int, float, list -- BTM asset amount.
 
     >>> from swap.providers.bytom.utils import amount_unit_converter
     >>> amount_unit_converter(amount=10_000_000, unit_from="NEU2BTM")
     0.1
+    >>> amount_unit_converter(amount=[0.1, 0.29], unit_from="BTM2NEU")
+    [10000000, 29000000]
     """
 
-    if unit_from not in ["BTM2mBTM", "BTM2NEU", "mBTM2BTM", "mBTM2NEU", "NEU2BTM", "NEU2mBTM"]:
+    if unit_from not in UNIT_SCALES:
         raise UnitError(f"Invalid Bytom '{unit_from}' unit from",
                         "choose only 'BTM2mBTM', 'BTM2NEU', 'mBTM2BTM', 'mBTM2NEU', "
                         "'NEU2BTM' or 'NEU2mBTM' units.")
 
-    # Constant unit values
-    BTM, mBTM, NEU = (
-        config["units"]["BTM"],
-        config["units"]["mBTM"],
-        config["units"]["NEU"]
-    )
-
-    if unit_from == "BTM2mBTM":
-        return float((amount * mBTM) / BTM)
-    elif unit_from == "BTM2NEU":
-        return int((amount * NEU) / BTM)
-    elif unit_from == "mBTM2BTM":
-        return float((amount * BTM) / mBTM)
-    elif unit_from == "mBTM2NEU":
-        return int((amount * NEU) / mBTM)
-    elif unit_from == "NEU2BTM":
-        return float((amount * BTM) / NEU)
-    elif unit_from == "NEU2mBTM":
-        return int((amount * mBTM) / NEU)
+    if isinstance(amount, (int, float, Decimal)):
+        return convert_amount(amount=amount, scale=UNIT_SCALES[unit_from])
+    return convert_amounts(amounts=amount, scale=UNIT_SCALES[unit_from])
 
 
 def estimate_endblock(endtime: int, network: str = config["network"],
@@ -201,7 +197,7 @@ def estimate_endblock(endtime: int, network: str = config["network"],
     endblock: float = (endtime - get_current_timestamp()) / config["to_create_new_block_seconds"]
 
     url = f"{config[network]['blockmeta']}/latest-block"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200:
@@ -229,16 +225,13 @@ def decode_transaction_raw(transaction_raw: str, headers: dict = config["headers
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bytom transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     url = f"{config[loaded_transaction_raw['network']]['bytom-core']}/decode-raw-transaction"
     data = dict(raw_transaction=loaded_transaction_raw["raw"])
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -276,17 +269,14 @@ def submit_transaction_raw(transaction_raw: str, headers: dict = config["headers
     {'fee': ..., 'type': '...', 'transaction_hash': '...', 'network': '...', 'date': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Bytom transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     url = f"{config[loaded_transaction_raw['network']]['blockcenter']}/merchant/submit-payment"
     data = dict(raw_transaction=loaded_transaction_raw["raw"], signatures=loaded_transaction_raw["signatures"])
     params = dict(address=loaded_transaction_raw["address"])
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json = response.json()
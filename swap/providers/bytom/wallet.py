@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
 from pybytom.wallet import Wallet as HDWallet
+from pybytom.wallet.tools import (
+    get_public_key, get_program, get_address
+)
+from functools import partial
 from typing import (
-    Optional, List, Union
+    Optional, List, Union, Tuple
 )
 
 from ...utils import is_mnemonic
@@ -10,6 +14,7 @@ from ...exceptions import (
     NetworkError, UnitError
 )
 from ..config import bytom as config
+from ..pool import map_chunks
 from .assets import AssetNamespace
 from .utils import amount_unit_converter
 from .rpc import (
@@ -20,6 +25,18 @@ from .rpc import (
 DEFAULT_PATH: str = config["path"]
 
 
+def _derive_addresses(network: str, xpublic_key: str, path: str, indexes: List[int]) -> List[Tuple[str, str, str]]:
+    addresses: List[Tuple[str, str, str]] = []
+    for index in indexes:
+        # Only the last index is walked, from the parent child xpublic key
+        public_key: str = get_public_key(xpublic_key=xpublic_key, path=f"m/{index}")
+        addresses.append((
+            get_address(program=get_program(public_key=public_key), network=network, vapor=False),
+            public_key, f"{path}/{index}"
+        ))
+    return addresses
+
+
 class Wallet(HDWallet):
     """
     Bytom Wallet class.
@@ -241,6 +258,53 @@ class Wallet(HDWallet):
         self._hdwallet.clean_derivation()
         return self
 
+    def derive_range(self, account: int = 1, change: bool = False, start: int = 0, count: int = 1,
+                     processes: Optional[int] = None) -> List[Tuple[str, str, str]]:
+        """
+        Derive range of Bytom addresses, the account change node is derived once and every address from it.
+
+        :param account: Bytom derivation account, defaults to ``1``.
+        :type account: int
+        :param change: Bytom derivation change, defaults to ``False``.
+        :type change: bool
+        :param start: First address index, defaults to ``0``.
+        :type start: int
+        :param count: Number of addresses, defaults to ``1``.
+        :type count: int
+        :param processes: Worker processes for large ranges, defaults to ``None`` (runs in this process).
+        :type processes: int
+
+        :returns: list -- Bytom addresses, public keys and derivation paths.
+
+        >>> from swap.providers.bytom.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="mainnet")
+        >>> wallet.from_entropy(entropy="ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.derive_range(account=1, change=False, start=1, count=1)
+        [('bm1qk9vj4jaezlcnjdckds4fkm8fwv5kawmq9qrufx', 'fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212', 'm/44/153/1/0/1')]
+        """
+
+        if start < 0 or count < 0:
+            raise ValueError("Invalid Bytom derivation range, start and count must be positive.")
+
+        indexes: List[str] = self._hdwallet.indexes()
+        path: str = config["bip44_path"].rsplit("/", 1)[0].format(account=account, change=(1 if change else 0))
+        try:
+            self._hdwallet.clean_derivation()
+            self._hdwallet.from_path(path=path)
+            xpublic_key: Optional[str] = self._hdwallet.child_xpublic_key()
+        finally:
+            # Restore the wallet derivation
+            self._hdwallet.clean_derivation()
+            if indexes:
+                self._hdwallet.from_indexes(indexes=indexes)
+        if xpublic_key is None:
+            raise ValueError("Bytom wallet must have root xprivate key to derive addresses.")
+
+        return map_chunks(
+            function=partial(_derive_addresses, self._network, xpublic_key, path),
+            items=list(range(start, start + count)), processes=processes
+        )
+
     def strength(self) -> Optional[int]:
         """
         Get Bytom wallet strength.
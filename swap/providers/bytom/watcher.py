@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Dict, List
+)
+
+from ...exceptions import (
+    AddressError, APIError, NetworkError
+)
+from ..config import (
+    bytom as config, watcher as watcher_config
+)
+from ..session import session
+from ..watcher import (
+    Event, FUND, WITHDRAW, REFUND
+)
+from .rpc import get_current_block_height
+from .utils import (
+    is_network, is_address, get_address_type
+)
+from .. import watcher
+
+
+class Watcher(watcher.Watcher):
+    """
+    Bytom HTLC watcher, polls Pay to Witness Script Hash (P2WSH) addresses.
+
+    :param network: Bytom network, defaults to ``mainnet``.
+    :type network: str
+    :param confirmations: Confirmations needed before an event is emitted, defaults to ``0``.
+    :type confirmations: int
+    :param interval: Seconds between polls while events keep coming, defaults to ``5``.
+    :type interval: float
+    :param max_interval: Idle polls back off up to this many seconds, defaults to ``60``.
+    :type max_interval: float
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: Watcher -- Bytom HTLC watcher instance.
+
+    >>> from swap.providers.bytom.watcher import Watcher
+    >>> watcher: Watcher = Watcher(network="mainnet", confirmations=1)
+    >>> watcher.watch(address="bm1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07q3yf5q8").on(print, kind="withdraw")
+    <swap.providers.bytom.watcher.Watcher object at 0x0409DAF0>
+    >>> watcher.poll()
+    [Event(kind='fund', htlc='bm1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07q3yf5q8', transaction_hash='b6d12407bbd238938941246fd0dd3e5234f1e3c370bef3fcbc1f60ebee022e76')]
+    """
+
+    def __init__(self, network: str = config["network"], confirmations: int = 0,
+                 interval: float = watcher_config["interval"], max_interval: float = watcher_config["max_interval"],
+                 headers: dict = config["headers"], timeout: int = config["timeout"]):
+        super().__init__(network=network, confirmations=confirmations, interval=interval, max_interval=max_interval)
+
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid Bytom '{network}' network",
+                               "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+        self._headers: dict = headers
+        self._timeout: int = timeout
+
+    def watch(self, address: str) -> "Watcher":
+        """
+        Watch Bytom HTLC.
+
+        :param address: Bytom HTLC (P2WSH) address.
+        :type address: str
+
+        :returns: Watcher -- Bytom HTLC watcher instance.
+
+        >>> from swap.providers.bytom.watcher import Watcher
+        >>> watcher: Watcher = Watcher(network="mainnet")
+        >>> watcher.watch(address="bm1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07q3yf5q8")
+        <swap.providers.bytom.watcher.Watcher object at 0x0409DAF0>
+        """
+
+        if not is_address(address=address, network=self._network) or get_address_type(address) != "p2wsh":
+            raise AddressError(f"Invalid Bytom HTLC '{address}' {self._network} address.")
+        return self._watch(htlc=address)
+
+    def _events(self, address: str, transaction: dict, block_height: Optional[int]) -> List[Event]:
+        _block_height: Optional[int] = transaction.get("block_height") or None
+        if self._confirmations and (
+            _block_height is None or block_height - _block_height + 1 < self._confirmations
+        ):
+            return []
+        events: List[Event] = []
+        for output in transaction["outputs"]:
+            if output["address"] == address:
+                events.append(Event(
+                    kind=FUND, htlc=address, transaction_hash=transaction["id"], network=self._network,
+                    block_height=_block_height, data=dict(
+                        id=output["id"], amount=output["amount"], asset_id=output["asset_id"],
+                        position=output["position"]
+                    )
+                ))
+        for transaction_input in transaction["inputs"]:
+            if transaction_input["address"] == address:
+                # HTLC clause selector is the argument right before the witness program, 00 withdraw and 01 refund
+                selector: str = transaction_input["witness_arguments"][-2]
+                events.append(Event(
+                    kind=(WITHDRAW if selector in ["", "00"] else REFUND), htlc=address,
+                    transaction_hash=transaction["id"], network=self._network, block_height=_block_height,
+                    data=dict(
+                        id=transaction_input["spent_output_id"], amount=transaction_input["amount"],
+                        asset_id=transaction_input["asset_id"]
+                    )
+                ))
+        return events
+
+    def _poll(self, watched: Dict[str, dict]) -> List[Event]:
+        block_height: Optional[int] = get_current_block_height(
+            network=self._network, headers=self._headers, timeout=self._timeout
+        ) if self._confirmations else None
+        events: List[Event] = []
+        for address in watched:
+            url = f"{config[self._network]['blockmeta']}/address/{address}/trx"
+            response = session.get(
+                url=url, params=dict(limit=watcher_config["limit"]), headers=self._headers, timeout=self._timeout
+            )
+            if response.status_code != 200:
+                raise APIError(f"Can't get this '{address}' Bytom address transactions.", response.status_code)
+            for transaction in (response.json() or []):
+                events.extend(self._events(address=address, transaction=transaction, block_height=block_height))
+        return events
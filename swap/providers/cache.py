@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+from functools import wraps
+from typing import (
+    Any, Callable, Optional, Tuple
+)
+
+import threading
+import inspect
+import sqlite3
+import copy
+import json
+import time
+
+from .config import cache as config
+
+# Keeps the entry until it is evicted or cleared
+PERMANENT: Optional[float] = None
+
+
+class DiskBackend:
+    """
+    SQLite on-disk cache backend.
+
+    :param path: SQLite database file path.
+    :type path: str
+
+    :returns: DiskBackend -- Disk backend instance.
+
+    .. note::
+        Values are stored as JSON, so only JSON serializable responses can be persisted.
+
+    >>> from swap.providers.cache import DiskBackend
+    >>> disk_backend: DiskBackend = DiskBackend(path="/tmp/swap-cache.sqlite")
+    >>> disk_backend.get(key="bitcoin.get_transaction:...") is None
+    True
+    """
+
+    def __init__(self, path: str):
+
+        self.path: str = path
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        with self._lock:
+            row: Optional[tuple] = self._connection.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= time.time():
+                with self._connection:
+                    self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, expires: Optional[float]) -> None:
+        try:
+            dumped: str = json.dumps(value)
+        except (TypeError, ValueError):
+            return  # Not JSON serializable, keep it in memory only
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)", (key, dumped, expires)
+            )
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        with self._lock, self._connection:
+            if prefix is None:
+                self._connection.execute("DELETE FROM cache")
+            else:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                )
+
+
+class Cache:
+    """
+    In-memory LRU response cache with per entry expiry.
+
+    :param maxsize: Maximum entries kept in memory, defaults to ``1024``.
+    :type maxsize: int
+    :param path: SQLite database file path of the on-disk backend, defaults to ``None`` (memory only).
+    :type path: str
+
+    :returns: Cache -- Cache instance.
+
+    >>> from swap.providers.cache import Cache
+    >>> cache: Cache = Cache(maxsize=256)
+    >>> cache.set(key="bytom.get_current_block_height:...", value=678722, ttl=30)
+    <swap.providers.cache.Cache object at 0x0409DAF0>
+    >>> cache.get(key="bytom.get_current_block_height:...")
+    (678722, True)
+    """
+
+    def __init__(self, maxsize: int = config["maxsize"], path: Optional[str] = config["path"]):
+
+        self.maxsize: int = maxsize
+        self.backend: Optional[DiskBackend] = DiskBackend(path=path) if path else None
+
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _store(self, key: str, value: Any, expires: Optional[float]) -> None:
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Tuple[Any, bool]:
+        """
+        Get cached value.
+
+        :param key: Cache key.
+        :type key: str
+
+        :returns: tuple -- Cached value and whether it was found.
+
+        >>> from swap.providers.cache import Cache
+        >>> cache: Cache = Cache()
+        >>> cache.get(key="bytom.get_current_block_height:...")
+        (None, False)
+        """
+
+        with self._lock:
+            entry: Optional[Tuple[Any, Optional[float]]] = self._entries.get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > time.time():
+                    self._entries.move_to_end(key)
+                    return copy.deepcopy(entry[0]), True
+                del self._entries[key]
+        if self.backend is None:
+            return None, False
+        entry = self.backend.get(key=key)
+        if entry is None:
+            return None, False
+        with self._lock:
+            self._store(key=key, value=copy.deepcopy(entry[0]), expires=entry[1])
+        return entry[0], True
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = PERMANENT) -> "Cache":
+        """
+        Set cached value.
+
+        :param key: Cache key.
+        :type key: str
+        :param value: Value to cache.
+        :type value: any
+        :param ttl: Seconds to keep the value, defaults to ``None`` (permanent).
+        :type ttl: float
+
+        :returns: Cache -- Cache instance.
+
+        >>> from swap.providers.cache import Cache
+        >>> cache: Cache = Cache()
+        >>> cache.set(key="bitcoin.get_transaction:...", value={"confirmations": 5279})
+        <swap.providers.cache.Cache object at 0x0409DAF0>
+        """
+
+        expires: Optional[float] = None if ttl is PERMANENT else (time.time() + ttl)
+        with self._lock:
+            self._store(key=key, value=copy.deepcopy(value), expires=expires)
+        if self.backend is not None:
+            self.backend.set(key=key, value=value, expires=expires)
+        return self
+
+    def clear(self, policy: Optional[str] = None) -> "Cache":
+        """
+        Forget cached values.
+
+        :param policy: Cache policy name, defaults to ``None`` (all policies).
+        :type policy: str
+
+        :returns: Cache -- Cache instance.
+
+        >>> from swap.providers.cache import Cache
+        >>> cache: Cache = Cache()
+        >>> cache.clear(policy="balance")
+        <swap.providers.cache.Cache object at 0x0409DAF0>
+        """
+
+        prefix: Optional[str] = None if policy is None else f"{policy}:"
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    del self._entries[key]
+        if self.backend is not None:
+            self.backend.clear(prefix=prefix)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _dump_argument(value: Any) -> Any:
+    # Namespaces (e.g. Bytom/Vapor assets) are keyed by their content
+    return vars(value) if hasattr(value, "__dict__") else str(value)
+
+
+def cached(policy: str, permanent: Optional[Callable[[Any], bool]] = None,
+           cacheable: Optional[Callable[[Any], bool]] = None,
+           ignore: tuple = ("headers", "timeout", "token")) -> Callable:
+    """
+    Cache rpc function responses by policy.
+
+    :param policy: Cache policy name, TTL (seconds) is read from ``config.cache["policies"]``.
+    :type policy: str
+    :param permanent: Response check to keep it forever (e.g. finalized transaction), defaults to ``None``.
+    :type permanent: callable
+    :param cacheable: Response check to cache it at all (e.g. not an error), defaults to ``None``.
+    :type cacheable: callable
+    :param ignore: Arguments which are not part of the cache key (nor stored), defaults to ``('headers', 'timeout', 'token')``.
+    :type ignore: tuple
+
+    :returns: callable -- Decorator.
+
+    .. note::
+        Policy TTL ``None`` keeps responses forever and ``0`` disables the policy,
+        unknown policies (e.g. submits) are never cached.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        signature: inspect.Signature = inspect.signature(function)
+
+        def _key(*args, **kwargs) -> Optional[str]:
+            if policy not in config["policies"] or config["policies"][policy] == 0:
+                return None
+            bound: inspect.BoundArguments = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return f"{policy}:{function.__module__}.{function.__qualname__}:" + json.dumps({
+                name: value for name, value in bound.arguments.items() if name not in ignore
+            }, sort_keys=True, default=_dump_argument)
+
+        def _set(key: str, value: Any) -> None:
+            if cacheable is None or cacheable(value):
+                cache.set(key=key, value=value, ttl=(
+                    PERMANENT if permanent is not None and permanent(value) else config["policies"][policy]
+                ))
+
+        if inspect.iscoroutinefunction(function):
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                key: Optional[str] = _key(*args, **kwargs)
+                if key is None:
+                    return await function(*args, **kwargs)
+                value, found = cache.get(key=key)
+                if found:
+                    return value
+                value = await function(*args, **kwargs)
+                _set(key=key, value=value)
+                return value
+
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            key: Optional[str] = _key(*args, **kwargs)
+            if key is None:
+                return function(*args, **kwargs)
+            value, found = cache.get(key=key)
+            if found:
+                return value
+            value = function(*args, **kwargs)
+            _set(key=key, value=value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def finalized(transaction: dict) -> bool:
+    """
+    Check transaction response is past the finality depth, its confirmations count keeps changing until then.
+
+    :param transaction: Transaction response with confirmations.
+    :type transaction: dict
+
+    :returns: bool -- Finalized, True if it can be kept forever.
+
+    >>> from swap.providers.cache import finalized
+    >>> finalized(transaction={"confirmations": 5279})
+    True
+    """
+
+    return (transaction.get("confirmations") or 0) >= config["finality"]
+
+
+# Shared response cache, used by every rpc module
+cache: Cache = Cache()
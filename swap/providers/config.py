@@ -33,6 +33,12 @@ bitcoin: dict = {
         "Satoshi": 100_000_000
     },
     "unit": "Satoshi",
+    "coin_selection": "first-fit",
+    "utxo_limit": 200,
+    "fee_priority": "medium",
+    "fee_rate_ttl": 60,
+    "min_fee_rate": 1,
+    "dust": 546,
     "timeout": 60,
     "headers": {
         "user-agent": f"Swap User-Agent {__version__}",
@@ -72,6 +78,8 @@ bytom: dict = {
         "NEU": 100_000_000
     },
     "confirmations": 1,
+    "utxo_limit": 100,
+    "key_cache_size": 128,  # Derived private keys kept by the signer
     "network": "mainnet",
     "forbid_chain_tx": False,
     "headers": {
@@ -149,6 +157,9 @@ ethereum: dict = {
     "network": "mainnet",
     "unit": "Wei",
     "timeout": 60,
+    "pool_size": 10,
+    "batch_size": 100,
+    "solc_version": "0.8.6",
     "headers": {
         "user-agent": f"Swap User-Agent {__version__}",
         "content-type": "application/json; charset=utf-8",
@@ -187,6 +198,8 @@ vapor: dict = {
         "NEU": 100_000_000
     },
     "confirmations": 1,
+    "utxo_limit": 100,
+    "key_cache_size": 128,  # Derived private keys kept by the signer
     "network": "mainnet",
     "forbid_chain_tx": False,
     "headers": {
@@ -233,9 +246,67 @@ xinfin: dict = {
     "network": "mainnet",
     "unit": "Wei",
     "timeout": 60,
+    "batch_size": 100,
+    "solc_version": "0.8.10",
     "headers": {
         "user-agent": f"Swap User-Agent {__version__}",
         "content-type": "application/json; charset=utf-8",
         "accept": "application/json"
     }
 }
+
+# HTTP session config
+session: dict = {
+    "pool_connections": 10,
+    "pool_maxsize": 10,
+    "retries": 3,
+    "backoff_factor": 0.5,
+    "status_forcelist": [429, 500, 502, 503, 504],
+    "circuit_breaker": {
+        "failures": 5,
+        "reset_timeout": 30
+    }
+}
+
+# Asynchronous providers config
+aio: dict = {
+    "limit": 100,
+    "limit_per_host": 10,
+    "workers": 4  # Threads running blocking transaction builds
+}
+
+# HTLC watcher config
+watcher: dict = {
+    "interval": 5,  # Seconds between polls while events keep coming
+    "max_interval": 60,  # Idle polls back off up to this many seconds
+    "batch_size": 20,  # Addresses per batched request
+    "limit": 50,  # Latest transactions fetched per address
+    "block_range": 2000,  # Blocks per log request
+    "reorg_depth": 12  # Latest blocks indexed again on every sync, in case of chain reorganization
+}
+
+# Contract artifacts config
+artifacts: dict = {
+    "maxsize": 256,  # Web3 contract objects kept
+    "path": None  # Directory of the compiled solc outputs, None uses the temporary directory
+}
+
+# Process pool config
+pool: dict = {
+    "chunk_size": 1000  # Items per worker task
+}
+
+# Response cache config
+cache: dict = {
+    "maxsize": 1024,
+    "path": None,  # SQLite file path of the on-disk backend
+    "finality": 6,  # Confirmations after which a transaction response no longer changes
+    # Seconds to keep responses, None keeps them forever and 0 disables the policy
+    "policies": {
+        "transaction": 15,  # Transactions below the finality depth, final ones are kept forever
+        "decoded": None,
+        "decimals": None,
+        "block_height": 30,
+        "balance": 10
+    }
+}
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+from web3 import Web3
+from web3.types import Wei
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from hexbytes.main import HexBytes
+from typing import (
+    Optional, Any
+)
+
+import web3 as _web3
+import json
+
+from ...exceptions import (
+    AddressError, APIError
+)
+from ..aio import (
+    get_session, run_sync
+)
+from ..cache import cached
+from ..config import ethereum as config
+from .nonce import NonceManager
+from .rpc import (
+    get_web3, _hexlify_dict
+)
+from .utils import (
+    is_address, to_checksum_address
+)
+from . import transaction
+
+
+async def _request(method: str, params: list, network: str = config["network"], token: Optional[str] = None) -> Any:
+    web3: Web3 = get_web3(network=network, provider="http", token=token)
+    response = await get_session().post(
+        url=web3.provider.endpoint_uri, data=json.dumps(dict(jsonrpc="2.0", method=method, params=params, id=0)),
+        headers=config["headers"], timeout=config["timeout"]
+    )
+    if response.status_code != 200:
+        raise APIError(response.status_code, response.content)
+    response_json: dict = response.json()
+    if "error" in response_json:
+        raise APIError(response_json["error"].get("message"), response_json["error"].get("code"))
+    if method in PYTHONIC_RESULT_FORMATTERS and response_json["result"] is not None:
+        return PYTHONIC_RESULT_FORMATTERS[method](response_json["result"])
+    return response_json["result"]
+
+
+@cached(policy="balance")
+async def get_balance(address: str, network: str = config["network"], token: Optional[str] = None) -> Wei:
+    """
+    Get Ethereum balance.
+
+    :param address: Ethereum address.
+    :type address: str
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+
+    :returns: Wei -- Ethereum balance (Wei).
+
+    >>> from swap.providers.ethereum.aio import get_balance
+    >>> await get_balance(address="0xbaF2Fc3829B6D25739BeDC18a5A83bF519c6Fe8c", network="testnet")
+    99937915760000000000
+    """
+
+    # Check parameter instances
+    if not is_address(address=address):
+        raise AddressError(f"Invalid Ethereum '{address}' address.")
+
+    balance: int = await _request(
+        "eth_getBalance", [to_checksum_address(address=address), "latest"], network=network, token=token
+    )
+    return Wei(balance)
+
+
+async def get_transaction(transaction_hash: str, network: str = config["network"], token: Optional[str] = None) -> dict:
+    """
+    Get Ethereum transaction detail.
+
+    :param transaction_hash: Ethereum transaction hash/id.
+    :type transaction_hash: str
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+
+    :returns: dict -- Ethereum transaction detail.
+
+    >>> from swap.providers.ethereum.aio import get_transaction
+    >>> await get_transaction(transaction_hash="0xa4d57071427e3310b3e2fb16e7712f8d8aaaafb31ce5fcd6534fc50848905948", network="testnet")
+    {'hash': '0xa4d57071427e3310b3e2fb16e7712f8d8aaaafb31ce5fcd6534fc50848905948', 'nonce': 0, 'blockHash': '0xb33a804ae10713bf549db8ec749f7d650347613ac784db1a8d17e0cb03741bf0', 'blockNumber': 1, ...}
+    """
+
+    transaction_detail: Optional[dict] = await _request(
+        "eth_getTransactionByHash", [HexBytes(transaction_hash).hex()], network=network, token=token
+    )
+    if transaction_detail is None:
+        raise _web3.exceptions.TransactionNotFound(f"Transaction with hash: '{transaction_hash}' not found.")
+    return _hexlify_dict(transaction_detail)
+
+
+async def get_transaction_receipt(transaction_hash: str, network: str = config["network"],
+                                  token: Optional[str] = None) -> Optional[dict]:
+    """
+    Get Ethereum transaction receipt.
+
+    :param transaction_hash: Ethereum transaction hash/id.
+    :type transaction_hash: str
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+
+    :returns: dict -- Ethereum transaction receipt.
+
+    >>> from swap.providers.ethereum.aio import get_transaction_receipt
+    >>> await get_transaction_receipt(transaction_hash="d26220f61ff4207837ee3cf5ab2a551b2476389ae76cf1ccd2005d304bdc308d", network="testnet")
+    {'transactionHash': '0xd26220f61ff4207837ee3cf5ab2a551b2476389ae76cf1ccd2005d304bdc308d', 'transactionIndex': 0, 'blockHash': '0xb325934bfb333b5ca77634081cfeaedfa53598771dcfcb482ed3ace789ec5843', 'blockNumber': 1, ...}
+    """
+
+    return _hexlify_dict(await _request(
+        "eth_getTransactionReceipt", [HexBytes(transaction_hash).hex()], network=network, token=token
+    ))
+
+
+async def submit_raw(raw: str, network: str = config["network"], token: Optional[str] = None,
+                     nonce_manager: Optional[NonceManager] = None) -> str:
+    """
+    Submit original Ethereum raw into blockchain.
+
+    :param raw: Ethereum transaction raw.
+    :type raw: str
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+    :param nonce_manager: Nonce manager to reset when the node rejects the transaction, defaults to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
+
+    :returns: str -- Ethereum submitted transaction hash/id.
+
+    >>> from swap.providers.ethereum.aio import submit_raw
+    >>> await submit_raw(raw="0xf86c02840ee6b280825208943e0a9b2ee8f8341a1aead3e7531d75f1e395f24b8901236efcbcbb340000801ba03084982e4a9dd897d3cc1b2c8cc2d1b106b9d302eb23f6fae7d0e57e53e043f8a0116f13f9ab385f6b53e7821b3335ced924a1ceb88303347cd0af4aa75e6bfb73", network="testnet")
+    "0x04b3bfb804f2b3329555c6f3a17a794b3f099b6435a9cf58c78609ed93853907"
+    """
+
+    try:
+        transaction_hash: HexBytes = await _request(
+            "eth_sendRawTransaction", [HexBytes(raw).hex()], network=network, token=token
+        )
+    except Exception:
+        if nonce_manager:
+            nonce_manager.reset(address=Web3().eth.account.recover_transaction(raw))
+        raise
+    return HexBytes(transaction_hash).hex()
+
+
+class NormalTransaction(transaction.NormalTransaction):
+    """
+    Ethereum asynchronous normal transaction, takes the same arguments as
+    :class:`swap.providers.ethereum.transaction.NormalTransaction`.
+
+    :returns: NormalTransaction -- Ethereum asynchronous normal transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "NormalTransaction":
+        """
+        Build Ethereum normal transaction, takes the same arguments as
+        :meth:`swap.providers.ethereum.transaction.NormalTransaction.build_transaction`.
+
+        >>> from swap.providers.ethereum.aio import NormalTransaction
+        >>> normal_transaction: NormalTransaction = NormalTransaction(network="testnet")
+        >>> await normal_transaction.build_transaction(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", recipient={"0x1954C47a5D75bdDA53578CEe5D549bf84b8c6B94": 100_000_000})
+        <swap.providers.ethereum.aio.NormalTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class FundTransaction(transaction.FundTransaction):
+    """
+    Ethereum asynchronous fund transaction, takes the same arguments as
+    :class:`swap.providers.ethereum.transaction.FundTransaction`.
+
+    :returns: FundTransaction -- Ethereum asynchronous fund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "FundTransaction":
+        """
+        Build Ethereum fund transaction, takes the same arguments as
+        :meth:`swap.providers.ethereum.transaction.FundTransaction.build_transaction`.
+
+        >>> from swap.providers.ethereum.htlc import HTLC
+        >>> from swap.providers.ethereum.aio import FundTransaction
+        >>> from swap.utils import sha256, get_current_timestamp
+        >>> htlc: HTLC = HTLC(network="mainnet", erc20=False)
+        >>> htlc.build_htlc(secret_hash=sha256("Hello Meheret!"), recipient_address="0xd77E0d2Eef905cfB39c3C4b952Ed278d58f96E1f", sender_address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", endtime=get_current_timestamp(plus=3600))
+        >>> fund_transaction: FundTransaction = FundTransaction(network="mainnet")
+        >>> await fund_transaction.build_transaction(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", htlc=htlc, amount=100_000_000)
+        <swap.providers.ethereum.aio.FundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class WithdrawTransaction(transaction.WithdrawTransaction):
+    """
+    Ethereum asynchronous withdraw transaction, takes the same arguments as
+    :class:`swap.providers.ethereum.transaction.WithdrawTransaction`.
+
+    :returns: WithdrawTransaction -- Ethereum asynchronous withdraw transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "WithdrawTransaction":
+        """
+        Build Ethereum withdraw transaction, takes the same arguments as
+        :meth:`swap.providers.ethereum.transaction.WithdrawTransaction.build_transaction`.
+
+        >>> from swap.providers.ethereum.aio import WithdrawTransaction
+        >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="mainnet")
+        >>> await withdraw_transaction.build_transaction(transaction_hash="0xe49ff507739f8d916ae2c9fd51dd63764658ffa42a5288a49d93bc70a933edc4", secret_key="Hello Meheret!", address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", contract_address="0x67324d402ffc103d061dAfA9096ff639f0676378")
+        <swap.providers.ethereum.aio.WithdrawTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class RefundTransaction(transaction.RefundTransaction):
+    """
+    Ethereum asynchronous refund transaction, takes the same arguments as
+    :class:`swap.providers.ethereum.transaction.RefundTransaction`.
+
+    :returns: RefundTransaction -- Ethereum asynchronous refund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "RefundTransaction":
+        """
+        Build Ethereum refund transaction, takes the same arguments as
+        :meth:`swap.providers.ethereum.transaction.RefundTransaction.build_transaction`.
+
+        >>> from swap.providers.ethereum.aio import RefundTransaction
+        >>> refund_transaction: RefundTransaction = RefundTransaction(network="mainnet")
+        >>> await refund_transaction.build_transaction(transaction_hash="0xe49ff507739f8d916ae2c9fd51dd63764658ffa42a5288a49d93bc70a933edc4", address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", contract_address="0x67324d402ffc103d061dAfA9096ff639f0676378")
+        <swap.providers.ethereum.aio.RefundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+
+from web3 import Web3
+from web3.contract import Contract
+from web3._utils.events import get_event_data
+from hexbytes.main import HexBytes
+from typing import (
+    Optional, Dict, List
+)
+
+import threading
+import sqlite3
+
+from ...exceptions import (
+    AddressError, NetworkError
+)
+from ..config import (
+    ethereum as config, watcher as watcher_config
+)
+from ..artifacts import get_contract
+from .htlc import HTLC
+from .rpc import get_web3
+from .utils import (
+    is_network, is_address, to_checksum_address
+)
+from .watcher import _load_events
+
+# Locked contract columns, amount is kept as text because uint256 overflows SQLite integers
+COLUMNS: List[str] = [
+    "locked_contract_id", "contract_address", "token", "secret_hash", "recipient", "sender", "endtime", "amount",
+    "transaction_hash", "block_number", "status", "withdraw_transaction_hash", "refund_transaction_hash", "preimage"
+]
+
+
+class LockedContractIndex:
+    """
+    Ethereum HTLC locked contract index, built incrementally from contract logs and persisted to SQLite.
+
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param contract_address: Ethereum HTLC contract address, defaults to ``None`` (network HTLC contract).
+    :type contract_address: str
+    :param erc20: HTLC ERC20 token, default to ``False``.
+    :type erc20: bool
+    :param provider: Ethereum network provider, defaults to ``http``.
+    :type provider: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+    :param path: SQLite database file path, defaults to ``:memory:``.
+    :type path: str
+    :param from_block: First block to index, defaults to ``None`` (latest block).
+    :type from_block: int
+    :param block_range: Blocks per log request, defaults to ``2000``.
+    :type block_range: int
+    :param reorg_depth: Latest blocks indexed again on every sync, defaults to ``12``.
+    :type reorg_depth: int
+
+    :returns: LockedContractIndex -- Ethereum HTLC locked contract index instance.
+
+    .. note::
+        Every ``sync`` only requests the blocks after the last indexed block, so withdraw and refund
+        builds given an index find the locked contract id locally instead of fetching the fund receipt.
+        The last ``reorg_depth`` blocks are never taken as final, their logs are rolled back and
+        indexed again by the next ``sync``, so logs dropped by a chain reorganization do not stay indexed.
+
+    >>> from swap.providers.ethereum.index import LockedContractIndex
+    >>> index: LockedContractIndex = LockedContractIndex(network="ropsten", path="/tmp/swap-index.sqlite", from_block=11130000)
+    >>> index.sync()
+    12
+    >>> index.find(secret_hash="3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb")
+    [{'locked_contract_id': '0xf2d54ae031cfbb5d4cc037436d8216d7e237cc3722258e4d31c9d232616af618', 'contract_address': '0x0cc7C744f96729B7f60B12B36A4B9504191CD458', 'token': None, 'secret_hash': '3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb', ...}]
+    """
+
+    def __init__(self, network: str = config["network"], contract_address: Optional[str] = None,
+                 erc20: bool = False, provider: str = config["provider"], token: Optional[str] = None,
+                 path: str = ":memory:", from_block: Optional[int] = None,
+                 block_range: int = watcher_config["block_range"], reorg_depth: int = watcher_config["reorg_depth"]):
+
+        # Check parameter instances
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid Ethereum '{network}' network",
+                               "choose only 'mainnet', 'ropsten', 'kovan', 'rinkeby' or 'testnet' networks.")
+
+        contract_address = contract_address or config[network]["contract_addresses"]["htlc_erc20" if erc20 else "htlc"]
+        if not contract_address or not is_address(address=contract_address):
+            raise AddressError(f"Invalid Ethereum HTLC contract '{contract_address}' address.")
+
+        htlc: HTLC = HTLC(
+            contract_address=contract_address, network=network, erc20=erc20, provider=provider, token=token
+        )
+
+        self._network: str = network
+        self._from_block: Optional[int] = from_block
+        self._block_range: int = block_range
+        self._reorg_depth: int = reorg_depth
+        self.web3: Web3 = get_web3(network=network, provider=provider, token=token)
+        self.contract: Contract = get_contract(
+            web3=self.web3, abi=htlc.abi(), address=htlc.contract_address()
+        )
+        self._events_abi: Dict[bytes, dict] = _load_events()
+
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS locked_contracts (network TEXT NOT NULL, locked_contract_id TEXT NOT NULL, "
+                "contract_address TEXT NOT NULL, token TEXT, secret_hash TEXT, recipient TEXT, sender TEXT, "
+                "endtime INTEGER, amount TEXT, transaction_hash TEXT, block_number INTEGER, "
+                "status TEXT NOT NULL DEFAULT 'open', withdraw_transaction_hash TEXT, refund_transaction_hash TEXT, "
+                "preimage TEXT, status_block_number INTEGER, PRIMARY KEY (network, contract_address, locked_contract_id))"
+            )
+            for column in ["secret_hash", "recipient", "sender", "transaction_hash", "status"]:
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS locked_contracts_{column} ON locked_contracts ({column})"
+                )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cursors (network TEXT NOT NULL, contract_address TEXT NOT NULL, "
+                "block_number INTEGER NOT NULL, PRIMARY KEY (network, contract_address))"
+            )
+
+    def contract_address(self) -> str:
+        """
+        Get indexed Ethereum HTLC contract address.
+
+        :returns: str -- Ethereum HTLC contract address.
+        """
+
+        return self.contract.address
+
+    def block_number(self) -> Optional[int]:
+        """
+        Get last indexed block number.
+
+        :returns: int -- Last indexed block number, None before the first sync.
+        """
+
+        with self._lock:
+            row: Optional[sqlite3.Row] = self._connection.execute(
+                "SELECT block_number FROM cursors WHERE network = ? AND contract_address = ?",
+                (self._network, self.contract_address())
+            ).fetchone()
+        return None if row is None else row["block_number"]
+
+    def _apply(self, name: str, args: dict, transaction_hash: str, block_number: int) -> None:
+        locked_contract_id: str = HexBytes(args["locked_contract_id"]).hex()
+        key: tuple = (self._network, self.contract_address(), locked_contract_id)
+        with self._lock, self._connection:
+            if name == "log_fund":
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO locked_contracts (network, contract_address, locked_contract_id, token, "
+                    "secret_hash, recipient, sender, endtime, amount, transaction_hash, block_number) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", key + (
+                        args.get("token"), HexBytes(args["secret_hash"]).hex()[2:],
+                        to_checksum_address(address=args["recipient"]), to_checksum_address(address=args["sender"]),
+                        args["endtime"], str(args["amount"]), HexBytes(transaction_hash).hex(), block_number
+                    )
+                )
+            elif name == "log_withdraw":
+                self._connection.execute(
+                    "UPDATE locked_contracts SET status = 'withdrawn', withdraw_transaction_hash = ?, "
+                    "status_block_number = ? WHERE network = ? AND contract_address = ? AND locked_contract_id = ?",
+                    (HexBytes(transaction_hash).hex(), block_number) + key
+                )
+            elif name == "log_refund":
+                self._connection.execute(
+                    "UPDATE locked_contracts SET status = 'refunded', refund_transaction_hash = ?, "
+                    "status_block_number = ? WHERE network = ? AND contract_address = ? AND locked_contract_id = ?",
+                    (HexBytes(transaction_hash).hex(), block_number) + key
+                )
+
+    def _set_block_number(self, block_number: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cursors (network, contract_address, block_number) VALUES (?, ?, ?)",
+                (self._network, self.contract_address(), block_number)
+            )
+
+    def _rollback(self, block_number: int) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM locked_contracts WHERE network = ? AND contract_address = ? AND block_number >= ?",
+                (self._network, self.contract_address(), block_number)
+            )
+            self._connection.execute(
+                "UPDATE locked_contracts SET status = 'open', withdraw_transaction_hash = NULL, "
+                "refund_transaction_hash = NULL, status_block_number = NULL "
+                "WHERE network = ? AND contract_address = ? AND status_block_number >= ?",
+                (self._network, self.contract_address(), block_number)
+            )
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """
+        Index HTLC contract logs from the last indexed block up to the given block.
+
+        :param to_block: Last block to index, defaults to ``None`` (latest block).
+        :type to_block: int
+
+        :returns: int -- Number of applied HTLC contract logs, including the indexed again ones.
+
+        >>> from swap.providers.ethereum.index import LockedContractIndex
+        >>> index: LockedContractIndex = LockedContractIndex(network="ropsten", from_block=11130000)
+        >>> index.sync(to_block=11140000)
+        12
+        """
+
+        latest_block: int = self.web3.eth.block_number
+        to_block = latest_block if to_block is None else to_block
+        block_number: Optional[int] = self.block_number()
+        if block_number is not None:
+            from_block: int = block_number + 1
+        else:
+            from_block: int = to_block if self._from_block is None else self._from_block
+        # Logs after the cursor may come from reorganized blocks, they are indexed again from scratch
+        self._rollback(block_number=from_block)
+
+        applied: int = 0
+        for start in range(from_block, to_block + 1, self._block_range):
+            end: int = min(start + self._block_range - 1, to_block)
+            for log in self.web3.eth.get_logs({
+                "fromBlock": start, "toBlock": end, "address": self.contract_address()
+            }):
+                event_abi: Optional[dict] = self._events_abi.get(bytes(HexBytes(log["topics"][0]))) \
+                    if log["topics"] and not log.get("removed") else None
+                if event_abi is None:
+                    continue
+                event_data = get_event_data(self.web3.codec, event_abi, log)
+                self._apply(
+                    name=event_abi["name"], args=dict(event_data["args"]),
+                    transaction_hash=event_data["transactionHash"], block_number=event_data["blockNumber"]
+                )
+                applied += 1
+            # Cursor moves per chunk, but stays reorg depth behind the latest block
+            self._set_block_number(block_number=max(from_block - 1, min(end, latest_block - self._reorg_depth)))
+        return applied
+
+    def _rows(self, where: str = "", parameters: tuple = ()) -> List[dict]:
+        with self._lock:
+            rows: List[sqlite3.Row] = self._connection.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM locked_contracts WHERE network = ? AND contract_address = ?"
+                f"{where} ORDER BY block_number", (self._network, self.contract_address()) + parameters
+            ).fetchall()
+        return [dict(row, amount=int(row["amount"])) for row in rows]
+
+    def get(self, locked_contract_id: str) -> Optional[dict]:
+        """
+        Get indexed locked contract.
+
+        :param locked_contract_id: Ethereum HTLC locked contract id.
+        :type locked_contract_id: str
+
+        :returns: dict -- Locked contract, None if not indexed.
+        """
+
+        rows: List[dict] = self._rows(" AND locked_contract_id = ?", (HexBytes(locked_contract_id).hex(),))
+        return rows[0] if rows else None
+
+    def find(self, secret_hash: Optional[str] = None, sender: Optional[str] = None,
+             recipient: Optional[str] = None, transaction_hash: Optional[str] = None,
+             status: Optional[str] = None) -> List[dict]:
+        """
+        Find indexed locked contracts.
+
+        :param secret_hash: Secret sha-256 hash, defaults to ``None``.
+        :type secret_hash: str
+        :param sender: Ethereum sender address, defaults to ``None``.
+        :type sender: str
+        :param recipient: Ethereum recipient address, defaults to ``None``.
+        :type recipient: str
+        :param transaction_hash: Ethereum HTLC funded transaction hash, defaults to ``None``.
+        :type transaction_hash: str
+        :param status: Locked contract status, ``open``, ``withdrawn`` or ``refunded``, defaults to ``None``.
+        :type status: str
+
+        :returns: list -- Matching locked contracts, ordered by fund block.
+
+        >>> from swap.providers.ethereum.index import LockedContractIndex
+        >>> index: LockedContractIndex = LockedContractIndex(network="ropsten", path="/tmp/swap-index.sqlite")
+        >>> index.find(recipient="0xFb330256C6d563E427101107273026A3456867Af", status="open")
+        [{'locked_contract_id': '0xf2d54ae031cfbb5d4cc037436d8216d7e237cc3722258e4d31c9d232616af618', 'contract_address': '0x0cc7C744f96729B7f60B12B36A4B9504191CD458', 'token': None, 'secret_hash': '3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb', ...}]
+        """
+
+        if status not in [None, "open", "withdrawn", "refunded"]:
+            raise ValueError(f"Invalid locked contract '{status}' status, "
+                             f"choose only 'open', 'withdrawn' or 'refunded' statuses.")
+        for address in [sender, recipient]:
+            if address is not None and not is_address(address=address):
+                raise AddressError(f"Invalid Ethereum '{address}' address.")
+
+        where, parameters = "", ()
+        for column, value in [
+            ("secret_hash", None if secret_hash is None else HexBytes(secret_hash).hex()[2:]),
+            ("sender", None if sender is None else to_checksum_address(address=sender)),
+            ("recipient", None if recipient is None else to_checksum_address(address=recipient)),
+            ("transaction_hash", None if transaction_hash is None else HexBytes(transaction_hash).hex()),
+            ("status", status)
+        ]:
+            if value is not None:
+                where, parameters = f"{where} AND {column} = ?", parameters + (value,)
+        return self._rows(where, parameters)
+
+    def open_contracts(self) -> List[dict]:
+        """
+        Get every open (neither withdrawn nor refunded) locked contract.
+
+        :returns: list -- Open locked contracts, ordered by fund block.
+        """
+
+        return self.find(status="open")
+
+    def locked_contract_id(self, transaction_hash: str, sync: bool = True) -> Optional[str]:
+        """
+        Get locked contract id of HTLC funded transaction.
+
+        :param transaction_hash: Ethereum HTLC funded transaction hash.
+        :type transaction_hash: str
+        :param sync: Sync the index once when the transaction is not indexed yet, defaults to ``True``.
+        :type sync: bool
+
+        :returns: str -- Ethereum HTLC locked contract id, None if not found.
+
+        >>> from swap.providers.ethereum.index import LockedContractIndex
+        >>> index: LockedContractIndex = LockedContractIndex(network="ropsten", path="/tmp/swap-index.sqlite")
+        >>> index.locked_contract_id(transaction_hash="0x5f354103a2b828bbec59a517ff534371d9072b7e860ac63f84c81ce8a383ce55")
+        "0xf2d54ae031cfbb5d4cc037436d8216d7e237cc3722258e4d31c9d232616af618"
+        """
+
+        rows: List[dict] = self.find(transaction_hash=transaction_hash)
+        if not rows and sync:
+            self.sync()
+            rows = self.find(transaction_hash=transaction_hash)
+        return rows[0]["locked_contract_id"] if rows else None
+
+    def refresh(self, locked_contract_id: str) -> Optional[dict]:
+        """
+        Refresh indexed locked contract from ``get_locked_contract`` state, also reveals the preimage.
+
+        :param locked_contract_id: Ethereum HTLC locked contract id.
+        :type locked_contract_id: str
+
+        :returns: dict -- Locked contract, None if not indexed.
+        """
+
+        state: list = self.contract.functions.get_locked_contract(
+            bytes(HexBytes(locked_contract_id))
+        ).call()
+        # get_locked_contract returns (..., withdrawn, refunded, preimage) last
+        withdrawn, refunded, preimage = state[-3], state[-2], state[-1]
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE locked_contracts SET status = ?, preimage = ? "
+                "WHERE network = ? AND contract_address = ? AND locked_contract_id = ?", (
+                    "withdrawn" if withdrawn else ("refunded" if refunded else "open"), preimage or None,
+                    self._network, self.contract_address(), HexBytes(locked_contract_id).hex()
+                )
+            )
+        return self.get(locked_contract_id=locked_contract_id)
+
+    def close(self) -> None:
+        """
+        Close SQLite database connection.
+        """
+
+        with self._lock:
+            self._connection.close()
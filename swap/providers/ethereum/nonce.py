@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+from web3 import Web3
+from typing import (
+    Optional, Callable, Dict, List
+)
+
+import functools
+import threading
+
+
+class NonceManager:
+    """
+    Ethereum local nonce manager.
+
+    :param web3: Ethereum or XinFin Web3 instance used to read the sender pending transaction count.
+    :type web3: web3.Web3
+
+    :returns: NonceManager -- Ethereum nonce manager instance.
+
+    .. note::
+        Nonces are handed out locally per sender, the node is only asked for the pending
+        transaction count on first use of a sender, on :meth:`reconcile` and after :meth:`reset`.
+        Nonces of failed builds and rejected submissions are given back with :meth:`release`.
+
+    >>> from swap.providers.ethereum.nonce import NonceManager
+    >>> from swap.providers.ethereum.rpc import get_web3
+    >>> nonce_manager: NonceManager = NonceManager(web3=get_web3(network="testnet"))
+    >>> nonce_manager.allocate(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C")
+    7
+    >>> nonce_manager.allocate(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C")
+    8
+    """
+
+    def __init__(self, web3: Web3):
+
+        self.web3: Web3 = web3
+
+        self._nonces: Dict[str, int] = {}
+        self._released: Dict[str, List[int]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_lock(self, address: str) -> threading.Lock:
+        with self._lock:
+            if address.lower() not in self._locks:
+                self._locks[address.lower()] = threading.Lock()
+            return self._locks[address.lower()]
+
+    def _pending_count(self, address: str) -> int:
+        return self.web3.eth.get_transaction_count(
+            self.web3.toChecksumAddress(address), "pending"
+        )
+
+    def allocate(self, address: str) -> int:
+        """
+        Allocate next nonce for sender.
+
+        :param address: Sender address.
+        :type address: str
+
+        :returns: int -- Allocated nonce.
+
+        >>> from swap.providers.ethereum.nonce import NonceManager
+        >>> from swap.providers.ethereum.rpc import get_web3
+        >>> nonce_manager: NonceManager = NonceManager(web3=get_web3(network="testnet"))
+        >>> nonce_manager.allocate(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C")
+        7
+        """
+
+        with self._get_lock(address):
+            return self._allocate(address=address)
+
+    def _allocate(self, address: str) -> int:
+        key: str = address.lower()
+        if key not in self._nonces:
+            self._nonces[key] = self._pending_count(address=address)
+            self._released[key] = []
+        if self._released[key]:
+            return self._released[key].pop(0)
+        nonce: int = self._nonces[key]
+        self._nonces[key] += 1
+        return nonce
+
+    def allocate_many(self, address: str, count: int) -> List[int]:
+        """
+        Allocate next nonces for sender in one step, released nonces are handed out first.
+
+        :param address: Sender address.
+        :type address: str
+        :param count: Number of nonces.
+        :type count: int
+
+        :returns: list -- Allocated nonces, in ascending order.
+
+        >>> from swap.providers.ethereum.nonce import NonceManager
+        >>> from swap.providers.ethereum.rpc import get_web3
+        >>> nonce_manager: NonceManager = NonceManager(web3=get_web3(network="testnet"))
+        >>> nonce_manager.allocate_many(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", count=3)
+        [7, 8, 9]
+        """
+
+        # One lock for the whole run, concurrent builds can't interleave their nonces
+        with self._get_lock(address):
+            return [self._allocate(address=address) for _ in range(count)]
+
+    def release(self, address: str, nonce: int) -> "NonceManager":
+        """
+        Give back an allocated nonce which was never submitted (e.g. failed build).
+
+        :param address: Sender address.
+        :type address: str
+        :param nonce: Allocated nonce.
+        :type nonce: int
+
+        :returns: NonceManager -- Ethereum nonce manager instance.
+
+        >>> from swap.providers.ethereum.nonce import NonceManager
+        >>> from swap.providers.ethereum.rpc import get_web3
+        >>> nonce_manager: NonceManager = NonceManager(web3=get_web3(network="testnet"))
+        >>> nonce: int = nonce_manager.allocate(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C")
+        >>> nonce_manager.release(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", nonce=nonce)
+        <swap.providers.ethereum.nonce.NonceManager object at 0x0409DAF0>
+        """
+
+        with self._get_lock(address):
+            key: str = address.lower()
+            if key in self._nonces and nonce < self._nonces[key] and nonce not in self._released[key]:
+                self._released[key].append(nonce)
+                self._released[key].sort()
+            return self
+
+    def reconcile(self, address: str) -> int:
+        """
+        Reconcile local nonce with the node pending transaction count.
+
+        :param address: Sender address.
+        :type address: str
+
+        :returns: int -- Next nonce to be allocated.
+
+        >>> from swap.providers.ethereum.nonce import NonceManager
+        >>> from swap.providers.ethereum.rpc import get_web3
+        >>> nonce_manager: NonceManager = NonceManager(web3=get_web3(network="testnet"))
+        >>> nonce_manager.reconcile(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C")
+        7
+        """
+
+        with self._get_lock(address):
+            key: str = address.lower()
+            pending_count: int = self._pending_count(address=address)
+            self._nonces[key] = max(self._nonces.get(key, 0), pending_count)
+            self._released[key] = [
+                nonce for nonce in self._released.get(key, []) if nonce >= pending_count
+            ]
+            return self._released[key][0] if self._released[key] else self._nonces[key]
+
+    def reset(self, address: Optional[str] = None) -> "NonceManager":
+        """
+        Forget local nonces, next allocation re-reads the node pending transaction count.
+
+        :param address: Sender address, defaults to ``None`` (all senders).
+        :type address: str
+
+        :returns: NonceManager -- Ethereum nonce manager instance.
+
+        >>> from swap.providers.ethereum.nonce import NonceManager
+        >>> from swap.providers.ethereum.rpc import get_web3
+        >>> nonce_manager: NonceManager = NonceManager(web3=get_web3(network="testnet"))
+        >>> nonce_manager.reset(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C")
+        <swap.providers.ethereum.nonce.NonceManager object at 0x0409DAF0>
+        """
+
+        if address is None:
+            with self._lock:
+                addresses: list = list(self._locks.keys())
+            for _address in addresses:
+                self.reset(address=_address)
+            return self
+
+        with self._get_lock(address):
+            self._nonces.pop(address.lower(), None)
+            self._released.pop(address.lower(), None)
+            return self
+
+
+def releases_nonce(build_transaction: Callable) -> Callable:
+    """
+    Give back the nonces of a failed build and of the previous unsigned build on the same transaction instance.
+    """
+
+    @functools.wraps(build_transaction)
+    def wrapper(self, *args, **kwargs):
+        # Previous build was never signed, its nonces would be skipped by the node
+        self._release_nonce()
+        try:
+            return build_transaction(self, *args, **kwargs)
+        except Exception:
+            self._release_nonce()
+            raise
+    return wrapper
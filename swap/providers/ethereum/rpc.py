@@ -6,26 +6,49 @@ from web3.providers import (
     HTTPProvider, WebsocketProvider
 )
 from web3.contract import Contract
-from pyxdc.utils import decode_transaction_raw as dtr
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
 from hexbytes.main import HexBytes
 from eth_typing import URI
+from requests.adapters import HTTPAdapter
 from typing import (
-    Optional, Tuple
+    Optional, Tuple, Dict, List, Any, Union
 )
 
 import web3 as _web3
+import requests
+import threading
 import json
-import sys
-import os
 
 from ...exceptions import (
-    AddressError, NetworkError
+    AddressError, NetworkError, APIError
 )
+from ..cache import cached
 from ..config import ethereum as config
+from ..artifacts import (
+    load_artifact, get_contract
+)
+from .nonce import NonceManager
 from .utils import (
     is_network, is_address, to_checksum_address
 )
 
+# Process-wide pooled Web3 instances and shared HTTP session
+_web3_clients: Dict[Tuple[str, str, Optional[str]], Web3] = {}
+_session: Optional[requests.Session] = None
+_lock: threading.Lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=config["pool_size"], pool_maxsize=config["pool_size"]
+        )
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
 
 def get_web3(network: str = config["network"], provider: str = config["provider"],
              token: Optional[str] = None) -> Web3:
@@ -41,6 +64,10 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
 
     :returns: Web3 -- Ethereum Web3 instance.
 
+    .. note::
+        Web3 instances are pooled per process and keyed by network, provider and token,
+        all HTTP providers share one keep-alive session sized by ``pool_size`` config.
+
     >>> from swap.providers.ethereum.rpc import get_web3
     >>> get_web3(network="testnet", provider="http", token="infura endpoint token ...")
     <web3.main.Web3 object at 0x000001DDECCD0640>
@@ -50,36 +77,90 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
     if not is_network(network=network):
         raise NetworkError(f"Invalid Ethereum '{network}' network",
                            "choose only 'mainnet', 'ropsten', 'kovan', 'rinkeby' or 'testnet' networks.")
+    if provider not in ["http", "websocket"]:
+        raise ValueError(f"Invalid Ethereum '{provider}' provider",
+                         "choose only 'http' or 'websocket' providers.")
 
     endpoint: str = "ganache-cli" if network == "testnet" else "infura"
     token: str = token if token else config[network][endpoint]["token"]
 
-    if provider == "http":
-        web3: Web3 = Web3(HTTPProvider(
-                URI(
-                    f"{config[network]['infura']['http']}/{token}"
-                    if token else config[network][endpoint]["http"]
-                ),
-                request_kwargs={
-                    "timeout": config["timeout"]
-                }
+    key: Tuple[str, str, Optional[str]] = (network, provider, token)
+    with _lock:
+        if key in _web3_clients:
+            return _web3_clients[key]
+
+        if provider == "http":
+            web3: Web3 = Web3(HTTPProvider(
+                    URI(
+                        f"{config[network]['infura']['http']}/{token}"
+                        if token else config[network][endpoint]["http"]
+                    ),
+                    request_kwargs={
+                        "timeout": config["timeout"]
+                    },
+                    session=_get_session()
+                )
             )
-        )
-        return web3
-    elif provider == "websocket":
-        web3: Web3 = Web3(WebsocketProvider(
-                URI(
-                    f"{config[network]['infura']['websocket']}/{token}"
-                    if token else config[network][endpoint]["websocket"]
+        else:
+            web3: Web3 = Web3(WebsocketProvider(
+                    URI(
+                        f"{config[network]['infura']['websocket']}/{token}"
+                        if token else config[network][endpoint]["websocket"]
+                    )
                 )
             )
-        )
+        _web3_clients[key] = web3
         return web3
-    else:
-        raise ValueError(f"Invalid Ethereum '{provider}' provider",
-                         "choose only 'http' or 'websocket' providers.")
 
 
+def close_web3(network: Optional[str] = None, provider: Optional[str] = None, token: Optional[str] = None) -> int:
+    """
+    Close pooled Ethereum Web3 instances.
+
+    :param network: Ethereum network, defaults to ``None`` (all networks).
+    :type network: str
+    :param provider: Ethereum network provider, defaults to ``None`` (all providers).
+    :type provider: str
+    :param token: Infura API endpoint token, defaults to ``None`` (all tokens).
+    :type token: str
+
+    :returns: int -- Number of closed Web3 instances.
+
+    >>> from swap.providers.ethereum.rpc import close_web3
+    >>> close_web3(network="testnet")
+    1
+    """
+
+    global _session
+    with _lock:
+        keys: list = [
+            key for key in _web3_clients if (
+                (network is None or key[0] == network) and
+                (provider is None or key[1] == provider) and
+                (token is None or key[2] == token)
+            )
+        ]
+        for key in keys:
+            del _web3_clients[key]
+        # Close shared session when there is no HTTP client left on it
+        if _session is not None and not any(key[1] == "http" for key in _web3_clients):
+            _session.close()
+            _session = None
+        return len(keys)
+
+
+def reset_web3() -> None:
+    """
+    Close all pooled Ethereum Web3 instances and the shared HTTP session.
+
+    >>> from swap.providers.ethereum.rpc import reset_web3
+    >>> reset_web3()
+    """
+
+    close_web3()
+
+
+@cached(policy="balance")
 def get_balance(address: str, network: str = config["network"], provider: str = config["provider"],
                 token: Optional[str] = None) -> Wei:
     """
@@ -141,16 +222,13 @@ def get_erc20_balance(address: str, token_address: str, network: str = config["n
     elif not is_address(address=token_address):
         raise AddressError(f"Invalid Ethereum ERC20 token '{token_address}' address.")
 
-    # Get current working directory path (like linux or unix path).
-    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-    with open(f"{cwd}/contracts/libs/erc20.json", "r") as erc20_json_file:
-        erc20_contract_data: dict = json.loads(erc20_json_file.read())["erc20.sol:ERC20"]
-        erc20_json_file.close()
+    erc20_contract_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/erc20.json", sol_source_with_class_name="erc20.sol:ERC20"
+    )
 
     web3: Web3 = get_web3(network=network, provider=provider, token=token)
-    erc20_token: Contract = web3.eth.contract(
-        address=to_checksum_address(address=token_address),
-        abi=erc20_contract_data["abi"]
+    erc20_token: Contract = get_contract(
+        web3=web3, abi=erc20_contract_data["abi"], address=to_checksum_address(address=token_address)
     )
     try:
         name: str = erc20_token.functions.name().call()
@@ -165,6 +243,7 @@ def get_erc20_balance(address: str, token_address: str, network: str = config["n
         return 0, "", "", 0, ".0"
 
 
+@cached(policy="decimals")
 def get_erc20_decimals(token_address: str, network: str = config["network"],
                        provider: str = config["provider"], token: Optional[str] = None) -> int:
     """
@@ -190,16 +269,13 @@ def get_erc20_decimals(token_address: str, network: str = config["network"],
     if not is_address(address=token_address):
         raise AddressError(f"Invalid Ethereum ERC20 token '{token_address}' address.")
 
-    # Get current working directory path (like linux or unix path).
-    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-    with open(f"{cwd}/contracts/libs/erc20.json", "r") as erc20_json_file:
-        erc20_contract_data: dict = json.loads(erc20_json_file.read())["erc20.sol:ERC20"]
-        erc20_json_file.close()
+    erc20_contract_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/erc20.json", sol_source_with_class_name="erc20.sol:ERC20"
+    )
 
     web3: Web3 = get_web3(network=network, provider=provider, token=token)
-    erc20_token: Contract = web3.eth.contract(
-        address=to_checksum_address(address=token_address),
-        abi=erc20_contract_data["abi"]
+    erc20_token: Contract = get_contract(
+        web3=web3, abi=erc20_contract_data["abi"], address=to_checksum_address(address=token_address)
     )
     decimals: int = erc20_token.functions.decimals().call()
     return decimals
@@ -314,11 +390,13 @@ def decode_raw(raw: str) -> dict:
     {'hash': '0x04b3bfb804f2b3329555c6f3a17a794b3f099b6435a9cf58c78609ed93853907', 'from': '0x3769F63e3b694cD2e973e28af59bdFd751303273', 'to': '0x3e0a9B2Ee8F8341A1aEaD3E7531d75f1e395F24b', 'nonce': 2, 'gas': 21000, 'gas_price': 250000000, 'value': 21000000000000000000, 'data': '0x', 'chain_id': -4, 'r': '0x3084982e4a9dd897d3cc1b2c8cc2d1b106b9d302eb23f6fae7d0e57e53e043f8', 's': '0x116f13f9ab385f6b53e7821b3335ced924a1ceb88303347cd0af4aa75e6bfb73', 'v': 27}
     """
 
+    # Only raw decoding needs pyxdc, it is not imported with the Ethereum provider
+    from pyxdc.utils import decode_transaction_raw as dtr
     return dtr(transaction_raw=raw)
 
 
 def submit_raw(raw: str, network: str = config["network"], provider: str = config["provider"],
-               token: Optional[str] = None) -> str:
+               token: Optional[str] = None, nonce_manager: Optional[NonceManager] = None) -> str:
     """
     Submit original Ethereum raw into blockchain.
 
@@ -330,6 +408,8 @@ def submit_raw(raw: str, network: str = config["network"], provider: str = confi
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param nonce_manager: Nonce manager to give back the nonce of a rejected transaction, defaults to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: str -- Ethereum submitted transaction hash/id.
 
@@ -339,5 +419,226 @@ def submit_raw(raw: str, network: str = config["network"], provider: str = confi
     """
 
     web3: Web3 = get_web3(network=network, provider=provider, token=token)
-    transaction_hash: HexBytes = web3.eth.send_raw_transaction(raw)
+    # Sender and nonce are read before submitting, the submit error is never hidden by decoding
+    transaction: Optional[dict] = decode_raw(raw=raw) if nonce_manager else None
+    try:
+        transaction_hash: HexBytes = web3.eth.send_raw_transaction(raw)
+    except Exception:
+        if nonce_manager:
+            # Only the rejected nonce is given back, the other in-flight nonces of the sender stay allocated
+            nonce_manager.release(address=transaction["from"], nonce=transaction["nonce"])
+        raise
     return transaction_hash.hex()
+
+
+def _batch_request(calls: List[Tuple[str, list]], network: str = config["network"], token: Optional[str] = None,
+                   batch_size: int = config["batch_size"]) -> List[Union[Any, APIError]]:
+    web3: Web3 = get_web3(network=network, provider="http", token=token)
+    results: List[Union[Any, APIError]] = []
+    for start in range(0, len(calls), batch_size):
+        chunk: List[Tuple[str, list]] = calls[start:start + batch_size]
+        data: list = [
+            dict(jsonrpc="2.0", method=method, params=params, id=index)
+            for index, (method, params) in enumerate(chunk)
+        ]
+        response = _get_session().post(
+            url=web3.provider.endpoint_uri, data=json.dumps(data),
+            headers=config["headers"], timeout=config["timeout"]
+        )
+        if response.status_code != 200:
+            raise APIError(response.status_code, response.content)
+        response_json: Union[list, dict] = response.json()
+        if not isinstance(response_json, list):
+            raise APIError(response_json["error"]["message"], response_json["error"]["code"]) \
+                if "error" in response_json else APIError("Invalid Ethereum batch response.")
+        responses: dict = {item["id"]: item for item in response_json if "id" in item}
+        for index, (method, params) in enumerate(chunk):
+            if index not in responses:
+                results.append(APIError(f"No Ethereum '{method}' response for batch item {start + index}."))
+            elif "error" in responses[index]:
+                results.append(APIError(
+                    responses[index]["error"].get("message"), responses[index]["error"].get("code")
+                ))
+            elif method in PYTHONIC_RESULT_FORMATTERS:
+                results.append(PYTHONIC_RESULT_FORMATTERS[method](responses[index]["result"]))
+            else:
+                results.append(responses[index]["result"])
+    return results
+
+
+def _hexlify_dict(dictionary: Optional[dict]) -> Optional[dict]:
+    if dictionary is None:
+        return None
+    dictionary = dict(dictionary)
+    for key, value in dictionary.items():
+        if isinstance(value, HexBytes):
+            dictionary[key] = value.hex()
+    return dictionary
+
+
+def get_balances(addresses: List[str], network: str = config["network"], token: Optional[str] = None,
+                 batch_size: int = config["batch_size"]) -> List[Union[Wei, APIError]]:
+    """
+    Get Ethereum balances in JSON-RPC batches.
+
+    :param addresses: Ethereum addresses.
+    :type addresses: list
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- Ethereum balances (Wei) or APIError per address.
+
+    >>> from swap.providers.ethereum.rpc import get_balances
+    >>> get_balances(addresses=["0xbaF2Fc3829B6D25739BeDC18a5A83bF519c6Fe8c", "0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C"], network="testnet")
+    [99937915760000000000, 0]
+    """
+
+    # Check parameter instances
+    for address in addresses:
+        if not is_address(address=address):
+            raise AddressError(f"Invalid Ethereum '{address}' address.")
+
+    balances: list = _batch_request(calls=[
+        ("eth_getBalance", [to_checksum_address(address=address), "latest"]) for address in addresses
+    ], network=network, token=token, batch_size=batch_size)
+    return [
+        balance if isinstance(balance, APIError) else Wei(balance) for balance in balances
+    ]
+
+
+def get_erc20_balances(addresses: List[str], token_address: str, network: str = config["network"],
+                       token: Optional[str] = None, batch_size: int = config["batch_size"]) \
+        -> List[Union[Tuple[int, str, str, int, str], APIError]]:
+    """
+    Get Ethereum ERC20 token balances in JSON-RPC batches.
+
+    :param addresses: Ethereum addresses.
+    :type addresses: list
+    :param token_address: Ethereum ERC20 token address.
+    :type token_address: str
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- Ethereum ERC20 token balance and decimals or APIError per address.
+
+    >>> from swap.providers.ethereum.rpc import get_erc20_balances
+    >>> get_erc20_balances(addresses=["0xbaF2Fc3829B6D25739BeDC18a5A83bF519c6Fe8c"], token_address="0xDaB6844e863bdfEE6AaFf888D2D34Bf1B7c37861", network="testnet")
+    [(99999999999999999999999999998, 'Ethereum ERC20', 'ERC20', 18, '99999999999.999999999999999998')]
+    """
+
+    # Check parameter instances
+    for address in addresses:
+        if not is_address(address=address):
+            raise AddressError(f"Invalid Ethereum '{address}' address.")
+    if not is_address(address=token_address):
+        raise AddressError(f"Invalid Ethereum ERC20 token '{token_address}' address.")
+
+    erc20_contract_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/erc20.json", sol_source_with_class_name="erc20.sol:ERC20"
+    )
+
+    web3: Web3 = get_web3(network=network, provider="http", token=token)
+    erc20_token: Contract = get_contract(
+        web3=web3, abi=erc20_contract_data["abi"], address=to_checksum_address(address=token_address)
+    )
+
+    def _call(data: str) -> Tuple[str, list]:
+        return "eth_call", [dict(to=erc20_token.address, data=data), "latest"]
+
+    results: list = _batch_request(calls=[
+        _call(erc20_token.encodeABI(fn_name="name")),
+        _call(erc20_token.encodeABI(fn_name="symbol")),
+        _call(erc20_token.encodeABI(fn_name="decimals"))
+    ] + [
+        _call(erc20_token.encodeABI(fn_name="balanceOf", args=[to_checksum_address(address=address)]))
+        for address in addresses
+    ], network=network, token=token, batch_size=batch_size)
+
+    (name, symbol, decimals), balances = results[:3], results[3:]
+    for result in (name, symbol, decimals):
+        if isinstance(result, APIError):
+            return [result for _ in addresses]
+    if not HexBytes(decimals):
+        return [(0, "", "", 0, ".0") for _ in addresses]
+
+    name: str = web3.codec.decode_single("string", HexBytes(name))
+    symbol: str = web3.codec.decode_single("string", HexBytes(symbol))
+    decimals: int = web3.codec.decode_single("uint8", HexBytes(decimals))
+    erc20_balances: list = []
+    for balance in balances:
+        if isinstance(balance, APIError):
+            erc20_balances.append(balance)
+            continue
+        balance: int = web3.codec.decode_single("uint256", HexBytes(balance))
+        balance_str: str = str(balance)[:-decimals] + "." + str(balance)[-decimals:]
+        erc20_balances.append((balance, name, symbol, decimals, balance_str))
+    return erc20_balances
+
+
+def get_transactions(transaction_hashes: List[str], network: str = config["network"], token: Optional[str] = None,
+                     batch_size: int = config["batch_size"]) -> List[Union[Optional[dict], APIError]]:
+    """
+    Get Ethereum transaction details in JSON-RPC batches.
+
+    :param transaction_hashes: Ethereum transaction hashes/ids.
+    :type transaction_hashes: list
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- Ethereum transaction detail, None (not found) or APIError per hash.
+
+    >>> from swap.providers.ethereum.rpc import get_transactions
+    >>> get_transactions(transaction_hashes=["0xa4d57071427e3310b3e2fb16e7712f8d8aaaafb31ce5fcd6534fc50848905948"], network="testnet")
+    [{'hash': '0xa4d57071427e3310b3e2fb16e7712f8d8aaaafb31ce5fcd6534fc50848905948', 'nonce': 0, 'blockHash': '0xb33a804ae10713bf549db8ec749f7d650347613ac784db1a8d17e0cb03741bf0', 'blockNumber': 1, ...}]
+    """
+
+    transactions: list = _batch_request(calls=[
+        ("eth_getTransactionByHash", [HexBytes(transaction_hash).hex()]) for transaction_hash in transaction_hashes
+    ], network=network, token=token, batch_size=batch_size)
+    return [
+        transaction if isinstance(transaction, APIError) else _hexlify_dict(transaction)
+        for transaction in transactions
+    ]
+
+
+def get_transaction_receipts(transaction_hashes: List[str], network: str = config["network"],
+                             token: Optional[str] = None, batch_size: int = config["batch_size"]) \
+        -> List[Union[Optional[dict], APIError]]:
+    """
+    Get Ethereum transaction receipts in JSON-RPC batches.
+
+    :param transaction_hashes: Ethereum transaction hashes/ids.
+    :type transaction_hashes: list
+    :param network: Ethereum network, defaults to ``mainnet``.
+    :type network: str
+    :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
+    :type token: str
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- Ethereum transaction receipt, None (not found) or APIError per hash.
+
+    >>> from swap.providers.ethereum.rpc import get_transaction_receipts
+    >>> get_transaction_receipts(transaction_hashes=["d26220f61ff4207837ee3cf5ab2a551b2476389ae76cf1ccd2005d304bdc308d"], network="testnet")
+    [{'transactionHash': '0xd26220f61ff4207837ee3cf5ab2a551b2476389ae76cf1ccd2005d304bdc308d', 'transactionIndex': 0, 'blockHash': '0xb325934bfb333b5ca77634081cfeaedfa53598771dcfcb482ed3ace789ec5843', 'blockNumber': 1, ...}]
+    """
+
+    transaction_receipts: list = _batch_request(calls=[
+        ("eth_getTransactionReceipt", [HexBytes(transaction_hash).hex()]) for transaction_hash in transaction_hashes
+    ], network=network, token=token, batch_size=batch_size)
+    return [
+        transaction_receipt if isinstance(transaction_receipt, APIError) else _hexlify_dict(transaction_receipt)
+        for transaction_receipt in transaction_receipts
+    ]
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode, b64decode
 from eth_account.datastructures import SignedTransaction
 from web3.types import Wei
 from typing import (
-    Optional, Union
+    Optional, Union, List
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    clean_transaction_raw, dumps_transaction_raw, parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
     TransactionRawError, UnitError
 )
@@ -78,11 +77,11 @@ class Signature(Transaction):
         return self._fee if unit == "Wei" else \
             amount_unit_converter(amount=self._fee, unit_from=f"Wei2{unit}")
 
-    def hash(self) -> Optional[str]:
+    def hash(self) -> Optional[Union[str, List[str]]]:
         """
         Get Ethereum signature has.
 
-        :returns: str -- Ethereum signature hash.
+        :returns: str, list -- Ethereum signature hash, a list for multi-recipient normal signatures.
 
         >>> from swap.providers.ethereum.signature import Signature
         >>> from swap.providers.ethereum.solver import FundSolver
@@ -97,6 +96,8 @@ class Signature(Transaction):
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["hash"] for signature in self._signature]
         return self._signature["hash"] if self._signature else None
 
     def json(self) -> dict:
@@ -120,11 +121,11 @@ class Signature(Transaction):
 
         return self._transaction
 
-    def raw(self) -> Optional[str]:
+    def raw(self) -> Optional[Union[str, List[str]]]:
         """
         Get Ethereum signature raw.
 
-        :returns: str -- Ethereum signature raw.
+        :returns: str, list -- Ethereum signature raw, a list for multi-recipient normal signatures.
 
         >>> from swap.providers.ethereum.signature import Signature
         >>> from swap.providers.ethereum.solver import FundSolver
@@ -139,6 +140,8 @@ class Signature(Transaction):
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["rawTransaction"] for signature in self._signature]
         return self._signature["rawTransaction"] if self._signature else None
 
     def type(self) -> str:
@@ -162,7 +165,7 @@ class Signature(Transaction):
 
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
             Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign Ethereum unsigned transaction raw.
@@ -182,45 +185,43 @@ class Signature(Transaction):
         <swap.providers.ethereum.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "ethereum_normal_unsigned":
             return NormalSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_normal_unsigned":
             return NormalSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_fund_unsigned":
             return FundSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_fund_unsigned":
             return FundSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_withdraw_unsigned":
             return WithdrawSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_withdraw_unsigned":
             return WithdrawSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_refund_unsigned":
             return RefundSignature(network=self._network, erc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "ethereum_erc20_refund_unsigned":
             return RefundSignature(network=self._network, erc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def signature(self) -> dict:
@@ -289,7 +290,7 @@ class NormalSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: NormalSolver) -> "NormalSignature":
         """
         Sign Ethereum unsigned normal transaction raw.
 
@@ -309,13 +310,10 @@ class NormalSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_normal_unsigned", "ethereum_erc20_normal_unsigned"]:
             raise TypeError(f"Invalid Ethereum normal unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using normal signature.")
@@ -331,28 +329,20 @@ class NormalSignature(Signature):
         )
 
         wallet: Wallet = solver.solve()
-        signed_normal_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_normal_transaction["hash"].hex(),
-            rawTransaction=signed_normal_transaction["rawTransaction"].hex(),
-            r=signed_normal_transaction["r"],
-            s=signed_normal_transaction["s"],
-            v=signed_normal_transaction["v"]
+        # Multi-recipient transaction raw holds a transaction list, all are signed at once
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "ethereum_erc20_normal_signed" if self._erc20 else "ethereum_normal_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -381,7 +371,7 @@ class FundSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: FundSolver) -> "FundSignature":
         """
         Sign Ethereum unsigned fund transaction raw.
 
@@ -401,13 +391,10 @@ class FundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_fund_unsigned", "ethereum_erc20_fund_unsigned"]:
             raise TypeError(f"Invalid Ethereum fund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using fund signature.")
@@ -437,14 +424,14 @@ class FundSignature(Signature):
         )
         self._type = "ethereum_erc20_fund_signed" if self._erc20 else "ethereum_fund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -473,7 +460,7 @@ class WithdrawSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign Ethereum unsigned withdraw transaction raw.
 
@@ -493,13 +480,10 @@ class WithdrawSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_withdraw_unsigned", "ethereum_erc20_withdraw_unsigned"]:
             raise TypeError(f"Invalid Ethereum withdraw unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using withdraw signature.")
@@ -529,14 +513,14 @@ class WithdrawSignature(Signature):
         )
         self._type = "ethereum_erc20_withdraw_signed" if self._erc20 else "ethereum_withdraw_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -565,7 +549,7 @@ class RefundSignature(Signature):
             network=network, erc20=erc20, provider=provider, token=token
         )
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: RefundSolver) -> "RefundSignature":
         """
         Sign Ethereum unsigned refund transaction raw.
 
@@ -585,13 +569,10 @@ class RefundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Ethereum unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["ethereum_refund_unsigned", "ethereum_erc20_refund_unsigned"]:
             raise TypeError(f"Invalid Ethereum refund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using refund signature.")
@@ -621,12 +602,12 @@ class RefundSignature(Signature):
         )
         self._type = "ethereum_erc20_refund_signed" if self._erc20 else "ethereum_refund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
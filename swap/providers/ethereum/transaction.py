@@ -2,27 +2,34 @@
 
 from binascii import unhexlify
 from eth_account.datastructures import SignedTransaction
-from web3.datastructures import AttributeDict
 from web3.contract import Contract
 from web3 import Web3
 from web3.types import Wei
+from hexbytes.main import HexBytes
+from eth_utils import event_abi_to_log_topic
 from typing import (
-    Optional, Union
+    Optional, Union, Tuple, List
 )
-from base64 import b64encode
 
-import json
-import sys
-import os
+import web3 as _web3
 
 from ...exceptions import (
-    AddressError, NetworkError, UnitError
+    AddressError, NetworkError, UnitError, APIError
 )
-from ...utils import clean_transaction_raw
+from ...utils import dumps_transaction_raw
 from ..config import ethereum as config
+from ..artifacts import (
+    load_artifact, get_contract
+)
 from .wallet import Wallet
 from .htlc import HTLC
-from .rpc import get_web3
+from .nonce import (
+    NonceManager, releases_nonce
+)
+from .index import LockedContractIndex
+from .rpc import (
+    get_web3, _batch_request
+)
 from .utils import (
     is_network, is_address, to_checksum_address, amount_unit_converter
 )
@@ -30,6 +37,9 @@ from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 
+# Fixed never used recipient of multi-recipient token transfer gas estimates, no key is known for it
+GAS_ESTIMATE_ADDRESS: str = "0xbcd09ea6302c8af97882dc30078dd8f679b0a691"
+
 
 class Transaction:
     """
@@ -43,6 +53,10 @@ class Transaction:
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param batch: Resolve nonce, gas price and chain id in one JSON-RPC batch request, default to ``False``.
+    :type batch: bool
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: Transaction -- Ethereum transaction instance.
 
@@ -51,7 +65,8 @@ class Transaction:
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None):
+                 provider: str = config["provider"], token: Optional[str] = None, batch: bool = False,
+                 nonce_manager: Optional[NonceManager] = None):
 
         # Check parameter instances
         if not is_network(network=network):
@@ -60,6 +75,11 @@ class Transaction:
 
         self._erc20: bool = erc20
         self._network: str = network
+        self._provider: str = provider
+        self._token: Optional[str] = token
+        self._batch: bool = batch
+        self._nonce_manager: Optional[NonceManager] = nonce_manager
+        self._nonce: Optional[Tuple[str, List[int]]] = None
         self.web3: Web3 = get_web3(
             network=network, provider=provider, token=token
         )
@@ -68,6 +88,127 @@ class Transaction:
         self._signature: Optional[dict] = None
         self._type: Optional[str] = None
         self._fee: Optional[Wei] = None
+        self._rpc_calls: dict = dict(calls=0, round_trips=0)
+
+    def _resolve(self, address: str, transaction_hash: Optional[str] = None,
+                 chain_id: bool = True, count: int = 1) -> Tuple[dict, Optional[dict]]:
+        """
+        Resolve nonce, gas price, chain id and optionally the funded transaction receipt once per build.
+        """
+
+        address: str = to_checksum_address(address=address)
+        nonces: Optional[List[int]] = self._nonce_manager.allocate_many(
+            address=address, count=count
+        ) if self._nonce_manager else None
+        nonce: Optional[int] = nonces[0] if nonces else None
+        self._nonce: Optional[Tuple[str, List[int]]] = (address, nonces) if self._nonce_manager else None
+        if self._batch:
+            calls: dict = dict(gasPrice=("eth_gasPrice", []))
+            if nonce is None:
+                calls["nonce"] = ("eth_getTransactionCount", [address, "latest"])
+            if chain_id:
+                calls["chainId"] = ("eth_chainId", [])
+            if transaction_hash:
+                calls["receipt"] = ("eth_getTransactionReceipt", [HexBytes(transaction_hash).hex()])
+            results: dict = dict(zip(calls.keys(), _batch_request(
+                calls=list(calls.values()), network=self._network, token=self._token
+            )))
+            for result in results.values():
+                if isinstance(result, APIError):
+                    raise result
+            self._rpc_calls = dict(calls=len(calls), round_trips=1)
+            if transaction_hash and results["receipt"] is None:
+                raise _web3.exceptions.TransactionNotFound(
+                    f"Transaction with hash: {transaction_hash} not found."
+                )
+        else:
+            results: dict = dict(gasPrice=self.web3.eth.gas_price)
+            if nonce is None:
+                results["nonce"] = self.web3.eth.get_transaction_count(address)
+            if chain_id:
+                results["chainId"] = self.web3.eth.chain_id
+            if transaction_hash:
+                results["receipt"] = self.web3.eth.get_transaction_receipt(transaction_hash)
+            self._rpc_calls = dict(calls=len(results), round_trips=len(results))
+
+        return dict(
+            nonce=(nonce if nonce is not None else results["nonce"]),
+            # Sequential sender nonces, one per transaction of a multi-recipient build
+            nonces=(nonces if nonces is not None else list(range(results["nonce"], results["nonce"] + count))),
+            gasPrice=results["gasPrice"],
+            chainId=results.get("chainId")
+        ), results.get("receipt")
+
+    def _release_nonce(self) -> None:
+        if self._nonce_manager and self._nonce:
+            for nonce in self._nonce[1]:
+                self._nonce_manager.release(address=self._nonce[0], nonce=nonce)
+            self._nonce = None
+
+    def _estimate_gas(self, function, transaction: dict) -> Wei:
+        self._rpc_calls["calls"] += 1
+        self._rpc_calls["round_trips"] += 1
+        return Wei(function(transaction))
+
+    def _sign(self, transaction: Union[dict, List[dict]], private_key: str) -> Union[dict, List[dict]]:
+        # Signed nonces go with the signed transaction raw, a rebuild doesn't give them back
+        self._nonce = None
+        # Multi-recipient builds hold a list of transactions, signed in nonce order
+        if isinstance(transaction, list):
+            return [self._sign(transaction=_transaction, private_key=private_key) for _transaction in transaction]
+        signed_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
+            transaction_dict=transaction, private_key=private_key
+        )
+        return dict(
+            hash=signed_transaction["hash"].hex(),
+            rawTransaction=signed_transaction["rawTransaction"].hex(),
+            r=signed_transaction["r"],
+            s=signed_transaction["s"],
+            v=signed_transaction["v"]
+        )
+
+    def _htlc_contract(self, contract_address: Optional[str] = None) -> Contract:
+        contract_address = contract_address or \
+            config[self._network]["contract_addresses"]["htlc_erc20" if self._erc20 else "htlc"]
+        if not contract_address:
+            raise ValueError(f"HTLC contact address not found. Before build HTLC, initial contract address first.")
+        # Shared HTLC artifact and contract, builds don't construct a new HTLC instance
+        htlc_contract_data: dict = load_artifact(
+            package=__package__, json_source_name="htlc-erc20.json" if self._erc20 else "htlc.json",
+            sol_source_with_class_name="htlc-erc20.sol:HTLC_ERC20" if self._erc20 else "htlc.sol:HTLC"
+        )
+        return get_contract(
+            web3=self.web3, abi=htlc_contract_data["abi"], address=to_checksum_address(address=contract_address)
+        )
+
+    def _locked_contract_id(self, htlc_contract: Contract, transaction_receipt: dict,
+                            transaction_hash: str) -> bytes:
+        # Fund receipt also holds ERC20 transfer/approval logs, so match the HTLC log_fund topic by address
+        log_fund_topic: HexBytes = HexBytes(event_abi_to_log_topic(htlc_contract.events.log_fund.abi))
+        for log in transaction_receipt["logs"]:
+            if to_checksum_address(address=log["address"]) == htlc_contract.address and \
+                    log["topics"] and HexBytes(log["topics"][0]) == log_fund_topic:
+                return htlc_contract.events.log_fund().processLog(log=log)["args"]["locked_contract_id"]
+        raise ValueError(f"Can't find Ethereum HTLC fund log in this '{transaction_hash}' transaction.")
+
+    def rpc_calls(self) -> dict:
+        """
+        Get Ethereum transaction build RPC calls.
+
+        :returns: dict -- Ethereum RPC calls and network round-trips used by the last build.
+
+        >>> from swap.providers.ethereum.transaction import WithdrawTransaction
+        >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="mainnet", batch=True)
+        >>> withdraw_transaction.build_transaction(transaction_hash="0xe49ff507739f8d916ae2c9fd51dd63764658ffa42a5288a49d93bc70a933edc4", secret_key="Hello Meheret!", address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", contract_address="0x67324d402ffc103d061dAfA9096ff639f0676378")
+        >>> withdraw_transaction.rpc_calls()
+        {'calls': 5, 'round_trips': 2}
+        """
+
+        # Check transaction
+        if not self._transaction:
+            raise ValueError("Transaction is none, build transaction first.")
+
+        return self._rpc_calls
 
     def fee(self, unit: str = config["unit"]) -> Union[Wei, int, float]:
         """
@@ -98,11 +239,11 @@ class Transaction:
         return self._fee if unit == "Wei" else \
             amount_unit_converter(amount=self._fee, unit_from=f"Wei2{unit}")
 
-    def hash(self) -> Optional[str]:
+    def hash(self) -> Optional[Union[str, List[str]]]:
         """
         Get Ethereum transaction hash.
 
-        :returns: str -- Ethereum transaction hash.
+        :returns: str, list -- Ethereum transaction hash, a list for multi-recipient normal transactions.
 
         >>> from swap.providers.ethereum.transaction import WithdrawTransaction
         >>> from swap.providers.ethereum.solver import WithdrawSolver
@@ -118,6 +259,8 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["hash"] for signature in self._signature]
         return self._signature["hash"] if self._signature else None
 
     def json(self) -> dict:
@@ -143,11 +286,11 @@ class Transaction:
 
         return self._transaction
 
-    def raw(self) -> Optional[str]:
+    def raw(self) -> Optional[Union[str, List[str]]]:
         """
         Get Ethereum transaction hash.
 
-        :returns: str -- Ethereum transaction hash.
+        :returns: str, list -- Ethereum transaction raw, a list for multi-recipient normal transactions.
 
         >>> from swap.providers.ethereum.transaction import RefundTransaction
         >>> from swap.providers.ethereum.solver import RefundSolver
@@ -163,6 +306,8 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["rawTransaction"] for signature in self._signature]
         return self._signature["rawTransaction"] if self._signature else None
 
     def type(self) -> str:
@@ -207,10 +352,13 @@ class Transaction:
 
         return self._signature
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Ethereum fund transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Ethereum fund transaction raw.
 
         >>> from swap.providers.ethereum.htlc import HTLC
@@ -228,14 +376,14 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             erc20=self._erc20
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class NormalTransaction(Transaction):
@@ -250,6 +398,10 @@ class NormalTransaction(Transaction):
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param batch: Resolve nonce, gas price and chain id in one JSON-RPC batch request, default to ``False``.
+    :type batch: bool
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: NormalTransaction -- Ethereum normal transaction instance.
 
@@ -258,11 +410,14 @@ class NormalTransaction(Transaction):
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None):
+                 provider: str = config["provider"], token: Optional[str] = None, batch: bool = False,
+                 nonce_manager: Optional[NonceManager] = None):
         super().__init__(
-            network=network, erc20=erc20, provider=provider, token=token
+            network=network, erc20=erc20, provider=provider, token=token, batch=batch,
+            nonce_manager=nonce_manager
         )
 
+    @releases_nonce
     def build_transaction(self, address: str, recipient: dict, token_address: Optional[str] = None, unit: str = config["unit"]) -> "NormalTransaction":
         """
         Build Ethereum normal transaction.
@@ -278,10 +433,19 @@ class NormalTransaction(Transaction):
 
         :returns: NormalTransaction -- Ethereum normal transaction instance.
 
+        .. note::
+            Multiple recipients build one transaction per recipient with sequential sender nonces,
+            their transaction raw holds the transaction and signature lists, gas is estimated once
+            and shared, so pay contract recipients with a fallback function in their own build.
+
         >>> from swap.providers.ethereum.transaction import NormalTransaction
         >>> normal_transaction: NormalTransaction = NormalTransaction(network="testnet")
         >>> normal_transaction.build_transaction(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", recipient={"0x1954C47a5D75bdDA53578CEe5D549bf84b8c6B94": 100_000_000})
         <swap.providers.ethereum.transaction.FundTransaction object at 0x0409DAF0>
+        >>> normal_transaction.build_transaction(address="0x69e04fe16c9A6A83076B3c2dc4b4Bc21b5d9A20C", recipient={"0x1954C47a5D75bdDA53578CEe5D549bf84b8c6B94": 100_000_000, "0xd77E0d2Eef905cfB39c3C4b952Ed278d58f96E1f": 200_000_000})
+        <swap.providers.ethereum.transaction.FundTransaction object at 0x0409DAF0>
+        >>> normal_transaction.fee(unit="Wei")
+        42000
         """
 
         # Check parameter instances
@@ -289,61 +453,72 @@ class NormalTransaction(Transaction):
             raise AddressError(f"Invalid Ethereum sender '{address}' address.")
         if unit not in ["Ether", "Gwei", "Wei"]:
             raise UnitError("Invalid Ethereum unit, choose only 'Ether', 'Gwei' or 'Wei' units.")
-        if len(recipient.items()) > 1:
-            raise ValueError("You can't broadcast for multiple addresses on this version, only for one address.")
+        if not recipient:
+            raise ValueError("Recipient is empty, set at least one recipient address and amount.")
 
         # Set address, fee and confirmations
-        recipient_address, amount = list(recipient.items())[0]
-        self._address, self._token_address, self._amount = (
-            address, token_address, Wei(
+        recipients: List[Tuple[str, Wei]] = [
+            (to_checksum_address(address=recipient_address), Wei(
                 amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
-            ) if not self._erc20 else amount
+            ) if not self._erc20 else amount) for recipient_address, amount in recipient.items()
+        ]
+        self._address, self._token_address, self._amount = (
+            address, token_address, recipients[0][1] if len(recipients) == 1 else [
+                amount for _, amount in recipients
+            ]
         )
 
         if self._erc20:
-            # Get current working directory path (like linux or unix path).
-            cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-            with open(f"{cwd}/contracts/libs/erc20.json", "r") as erc20_json_file:
-                erc20_contract_data: dict = json.loads(erc20_json_file.read())["erc20.sol:ERC20"]
-                erc20_json_file.close()
-
-            erc20_contract: Contract = self.web3.eth.contract(
-                address=to_checksum_address(address=token_address), abi=erc20_contract_data["abi"]
+            erc20_contract_data: dict = load_artifact(
+                package=__package__, json_source_name="libs/erc20.json", sol_source_with_class_name="erc20.sol:ERC20"
             )
-            transfer_function = erc20_contract.functions.transfer(
-                to_checksum_address(address=recipient_address), self._amount
+
+            erc20_contract: Contract = get_contract(
+                web3=self.web3, abi=erc20_contract_data["abi"], address=to_checksum_address(address=token_address)
             )
-            self._fee = transfer_function.estimateGas({
+            defaults, _ = self._resolve(address=address, count=len(recipients))
+            # Gas is estimated once per call shape, a multi-recipient build estimates the transfer to the never
+            # used gas estimate address (the most expensive storage path), so every transfer fits in the shared gas
+            transfer_function = erc20_contract.functions.transfer(*(recipients[0] if len(recipients) == 1 else (
+                to_checksum_address(address=GAS_ESTIMATE_ADDRESS), max(amount for _, amount in recipients)
+            )))
+            gas: Wei = self._estimate_gas(transfer_function.estimateGas, {
                 "from": to_checksum_address(address=address),
                 "value": Wei(0),
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address)
-                ),
-                "gasPrice": self.web3.eth.gas_price
+                "nonce": defaults["nonce"],
+                "gasPrice": defaults["gasPrice"]
             })
 
-            self._transaction = transfer_function.buildTransaction({
-                "from": to_checksum_address(address=address),
-                "value": Wei(0),
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address)
-                ),
-                "gas": self._fee,
-                "gasPrice": self.web3.eth.gas_price
-            })
+            transactions: List[dict] = [
+                erc20_contract.functions.transfer(recipient_address, amount).buildTransaction({
+                    "chainId": defaults["chainId"],
+                    "from": to_checksum_address(address=address),
+                    "value": Wei(0),
+                    "nonce": nonce,
+                    "gas": gas,
+                    "gasPrice": defaults["gasPrice"]
+                }) for (recipient_address, amount), nonce in zip(recipients, defaults["nonces"])
+            ]
         else:
-            self._transaction = {
-                "from": to_checksum_address(address=address),
-                "to": to_checksum_address(address=recipient_address),
-                "value": self._amount,
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address)
-                ),
-                "gasPrice": self.web3.eth.gas_price
-            }
-            self._fee = self.web3.eth.estimateGas(self._transaction)
-            self._transaction.setdefault("gas", self._fee)
+            defaults, _ = self._resolve(address=address, chain_id=False, count=len(recipients))
+            transactions: List[dict] = [
+                {
+                    "from": to_checksum_address(address=address),
+                    "to": recipient_address,
+                    "value": amount,
+                    "nonce": nonce,
+                    "gasPrice": defaults["gasPrice"]
+                } for (recipient_address, amount), nonce in zip(recipients, defaults["nonces"])
+            ]
+            # Value transfers share one call shape, the largest one is estimated once
+            gas: Wei = self._estimate_gas(
+                self.web3.eth.estimateGas, max(transactions, key=lambda transaction: transaction["value"])
+            )
+            for transaction in transactions:
+                transaction.setdefault("gas", gas)
 
+        self._transaction = transactions[0] if len(transactions) == 1 else transactions
+        self._fee = Wei(gas * len(transactions))
         self._type = "ethereum_erc20_normal_unsigned" if self._erc20 else "ethereum_normal_unsigned"
         return self
 
@@ -370,17 +545,8 @@ class NormalTransaction(Transaction):
             raise TypeError(f"Solver must be Ethereum NormalSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_normal_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_normal_transaction["hash"].hex(),
-            rawTransaction=signed_normal_transaction["rawTransaction"].hex(),
-            r=signed_normal_transaction["r"],
-            s=signed_normal_transaction["s"],
-            v=signed_normal_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "ethereum_erc20_normal_signed" if self._erc20 else "ethereum_normal_signed"
         return self
@@ -398,6 +564,10 @@ class FundTransaction(Transaction):
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param batch: Resolve nonce, gas price and chain id in one JSON-RPC batch request, default to ``False``.
+    :type batch: bool
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: FundTransaction -- Ethereum fund transaction instance.
 
@@ -406,11 +576,14 @@ class FundTransaction(Transaction):
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None):
+                 provider: str = config["provider"], token: Optional[str] = None, batch: bool = False,
+                 nonce_manager: Optional[NonceManager] = None):
         super().__init__(
-            network=network, erc20=erc20, provider=provider, token=token
+            network=network, erc20=erc20, provider=provider, token=token, batch=batch,
+            nonce_manager=nonce_manager
         )
 
+    @releases_nonce
     def build_transaction(self, address: str, htlc: HTLC, amount: Union[Wei, int],
                           unit: str = config["unit"]) -> "FundTransaction":
         """
@@ -452,8 +625,8 @@ class FundTransaction(Transaction):
             amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
         ) if not self._erc20 else amount
 
-        htlc_contract: Contract = self.web3.eth.contract(
-            address=htlc.contract_address(), abi=htlc.abi()
+        htlc_contract: Contract = get_contract(
+            web3=self.web3, abi=htlc.abi(), address=htlc.contract_address()
         )
 
         if self._erc20:
@@ -473,23 +646,21 @@ class FundTransaction(Transaction):
                 htlc.agreements["endtime"]["timestamp"]  # Locktime Seconds
             )
 
-        self._fee = htlc_fund_function.estimateGas({
+        defaults, _ = self._resolve(address=address)
+        self._fee = self._estimate_gas(htlc_fund_function.estimateGas, {
             "from": to_checksum_address(address=address),
             "value": _amount if not self._erc20 else Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address)
-            ),
-            "gasPrice": self.web3.eth.gas_price
+            "nonce": defaults["nonce"],
+            "gasPrice": defaults["gasPrice"]
         })
 
         self._transaction = htlc_fund_function.buildTransaction({
+            "chainId": defaults["chainId"],
             "from": to_checksum_address(address=address),
             "value": _amount if not self._erc20 else Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address)
-            ),
+            "nonce": defaults["nonce"],
             "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
+            "gasPrice": defaults["gasPrice"]
         })
         self._type = "ethereum_erc20_fund_unsigned" if self._erc20 else "ethereum_fund_unsigned"
         return self
@@ -521,17 +692,8 @@ class FundTransaction(Transaction):
             raise TypeError(f"Solver must be Ethereum FundSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_fund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_fund_transaction["hash"].hex(),
-            rawTransaction=signed_fund_transaction["rawTransaction"].hex(),
-            r=signed_fund_transaction["r"],
-            s=signed_fund_transaction["s"],
-            v=signed_fund_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "ethereum_erc20_fund_signed" if self._erc20 else "ethereum_fund_signed"
         return self
@@ -549,6 +711,12 @@ class WithdrawTransaction(Transaction):
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param batch: Resolve nonce, gas price and chain id in one JSON-RPC batch request, default to ``False``.
+    :type batch: bool
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
+    :param index: Look up locked contract ids locally instead of fetching the fund receipt, default to ``None``.
+    :type index: ethereum.index.LockedContractIndex
 
     :returns: WithdrawTransaction -- Ethereum withdraw transaction instance.
 
@@ -557,11 +725,16 @@ class WithdrawTransaction(Transaction):
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False, provider: str = config["provider"],
-                 token: Optional[str] = None):
+                 token: Optional[str] = None, batch: bool = False,
+                 nonce_manager: Optional[NonceManager] = None, index: Optional[LockedContractIndex] = None):
         super().__init__(
-            network=network, erc20=erc20, provider=provider, token=token
+            network=network, erc20=erc20, provider=provider, token=token, batch=batch,
+            nonce_manager=nonce_manager
         )
 
+        self._index: Optional[LockedContractIndex] = index
+
+    @releases_nonce
     def build_transaction(self, transaction_hash: str, address: str, secret_key: str,
                           contract_address: Optional[str] = None) -> "WithdrawTransaction":
         """
@@ -590,41 +763,36 @@ class WithdrawTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid Ethereum HTLC contract '{contract_address}' address.")
 
-        htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, erc20=self._erc20
-        )
-        htlc_contract: Contract = self.web3.eth.contract(
-            address=htlc.contract_address(), abi=htlc.abi()
-        )
+        htlc_contract: Contract = self._htlc_contract(contract_address=contract_address)
 
-        transaction_receipt: AttributeDict = self.web3.eth.get_transaction_receipt(transaction_hash)
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._erc20 else 0]
+        locked_contract_id: Optional[Union[str, bytes]] = self._index.locked_contract_id(
+            transaction_hash=transaction_hash
+        ) if self._index and self._index.contract_address() == htlc_contract.address else None
+        # Indexed builds skip the funded transaction receipt request
+        defaults, transaction_receipt = self._resolve(
+            address=address, transaction_hash=(None if locked_contract_id else transaction_hash)
         )
-
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+        locked_contract_id = bytes(HexBytes(locked_contract_id)) if locked_contract_id else \
+            self._locked_contract_id(htlc_contract, transaction_receipt, transaction_hash)
         htlc_withdraw_function = htlc_contract.functions.withdraw(
             locked_contract_id,  # Locked Contract ID
             secret_key  # Secret Key
         )
 
-        self._fee = htlc_withdraw_function.estimateGas({
+        self._fee = self._estimate_gas(htlc_withdraw_function.estimateGas, {
             "from": to_checksum_address(address=address),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address)
-            ),
-            "gasPrice": self.web3.eth.gas_price
+            "nonce": defaults["nonce"],
+            "gasPrice": defaults["gasPrice"]
         })
 
         self._transaction = htlc_withdraw_function.buildTransaction({
+            "chainId": defaults["chainId"],
             "from": to_checksum_address(address=address),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address)
-            ),
+            "nonce": defaults["nonce"],
             "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
+            "gasPrice": defaults["gasPrice"]
         })
         self._type = "ethereum_erc20_withdraw_unsigned" if self._erc20 else "ethereum_withdraw_unsigned"
         return self
@@ -652,17 +820,8 @@ class WithdrawTransaction(Transaction):
             raise TypeError(f"Solver must be Ethereum WithdrawSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_withdraw_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_withdraw_transaction["hash"].hex(),
-            rawTransaction=signed_withdraw_transaction["rawTransaction"].hex(),
-            r=signed_withdraw_transaction["r"],
-            s=signed_withdraw_transaction["s"],
-            v=signed_withdraw_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "ethereum_erc20_withdraw_signed" if self._erc20 else "ethereum_withdraw_signed"
         return self
@@ -680,6 +839,12 @@ class RefundTransaction(Transaction):
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param batch: Resolve nonce, gas price and chain id in one JSON-RPC batch request, default to ``False``.
+    :type batch: bool
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
+    :param index: Look up locked contract ids locally instead of fetching the fund receipt, default to ``None``.
+    :type index: ethereum.index.LockedContractIndex
 
     :returns: RefundTransaction -- Ethereum refund transaction instance.
 
@@ -688,11 +853,16 @@ class RefundTransaction(Transaction):
     """
 
     def __init__(self, network: str = config["network"], erc20: bool = False,
-                 provider: str = config["provider"], token: Optional[str] = None):
+                 provider: str = config["provider"], token: Optional[str] = None, batch: bool = False,
+                 nonce_manager: Optional[NonceManager] = None, index: Optional[LockedContractIndex] = None):
         super().__init__(
-            network=network, erc20=erc20, provider=provider, token=token
+            network=network, erc20=erc20, provider=provider, token=token, batch=batch,
+            nonce_manager=nonce_manager
         )
 
+        self._index: Optional[LockedContractIndex] = index
+
+    @releases_nonce
     def build_transaction(self, transaction_hash: str, address: str,
                           contract_address: Optional[str] = None) -> "RefundTransaction":
         """
@@ -719,40 +889,35 @@ class RefundTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid Ethereum HTLC contract '{contract_address}' address.")
 
-        htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, erc20=self._erc20
-        )
-        htlc_contract: Contract = self.web3.eth.contract(
-            address=htlc.contract_address(), abi=htlc.abi()
-        )
+        htlc_contract: Contract = self._htlc_contract(contract_address=contract_address)
 
-        transaction_receipt: AttributeDict = self.web3.eth.get_transaction_receipt(transaction_hash)
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._erc20 else 0]
+        locked_contract_id: Optional[Union[str, bytes]] = self._index.locked_contract_id(
+            transaction_hash=transaction_hash
+        ) if self._index and self._index.contract_address() == htlc_contract.address else None
+        # Indexed builds skip the funded transaction receipt request
+        defaults, transaction_receipt = self._resolve(
+            address=address, transaction_hash=(None if locked_contract_id else transaction_hash)
         )
-
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+        locked_contract_id = bytes(HexBytes(locked_contract_id)) if locked_contract_id else \
+            self._locked_contract_id(htlc_contract, transaction_receipt, transaction_hash)
         htlc_refund_function = htlc_contract.functions.refund(
             locked_contract_id  # Locked Contract ID
         )
 
-        self._fee = htlc_refund_function.estimateGas({
+        self._fee = self._estimate_gas(htlc_refund_function.estimateGas, {
             "from": to_checksum_address(address=address),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address)
-            ),
-            "gasPrice": self.web3.eth.gas_price
+            "nonce": defaults["nonce"],
+            "gasPrice": defaults["gasPrice"]
         })
 
         self._transaction = htlc_refund_function.buildTransaction({
+            "chainId": defaults["chainId"],
             "from": to_checksum_address(address=address),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address)
-            ),
+            "nonce": defaults["nonce"],
             "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
+            "gasPrice": defaults["gasPrice"]
         })
         self._type = "ethereum_erc20_refund_unsigned" if self._erc20 else "ethereum_refund_unsigned"
         return self
@@ -780,17 +945,8 @@ class RefundTransaction(Transaction):
             raise TypeError(f"Solver must be Ethereum RefundSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_refund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_refund_transaction["hash"].hex(),
-            rawTransaction=signed_refund_transaction["rawTransaction"].hex(),
-            r=signed_refund_transaction["r"],
-            s=signed_refund_transaction["s"],
-            v=signed_refund_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "ethereum_erc20_refund_signed" if self._erc20 else "ethereum_refund_signed"
         return self
@@ -1,23 +1,25 @@
 #!/usr/bin/env python3
 
-from base64 import b64decode
 from datetime import datetime
 from web3.types import ChecksumAddress
-from hexbytes.main import HexBytes
 from web3 import Web3
+from decimal import Decimal
 from typing import (
-    Union, Optional
+    Union, Optional, List, Dict, Tuple
 )
 
-import json
-import sys
-import os
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
-    AddressError, UnitError, TransactionRawError
+    AddressError, UnitError, TransactionRawError, APIError
 )
 from ..config import ethereum as config
+from ..units import (
+    unit_scales, convert_amount, convert_amounts
+)
+from ..artifacts import load_artifact
+from .nonce import NonceManager
 
 
 def is_network(network: str) -> bool:
@@ -122,13 +124,11 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     """
 
     # Check parameter instances
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionRaw)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loaded_transaction_raw = parse_transaction_raw(transaction_raw=transaction_raw)
         return loaded_transaction_raw["type"] in [
             "ethereum_normal_unsigned", "ethereum_normal_signed", "ethereum_erc20_normal_unsigned", "ethereum_erc20_normal_signed",
             "ethereum_fund_unsigned", "ethereum_fund_signed", "ethereum_erc20_fund_unsigned", "ethereum_erc20_fund_signed",
@@ -140,11 +140,9 @@ def is_transaction_raw(transaction_raw: str) -> bool:
 
 
 def get_erc20_data(key: str) -> dict:
-    # Get current working directory path (like linux or unix path).
-    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-    with open(f"{cwd}/contracts/libs/erc20.json", "r") as erc20_json_file:
-        erc20_data: dict = json.loads(erc20_json_file.read())["erc20.sol:ERC20"]
-        erc20_json_file.close()
+    erc20_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/erc20.json", sol_source_with_class_name="erc20.sol:ERC20"
+    )
     return erc20_data[key]
 
 
@@ -163,13 +161,10 @@ def decode_transaction_raw(transaction_raw: str) -> dict:
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Ethereum transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     return dict(
         fee=loaded_transaction_raw["fee"],
         transaction=loaded_transaction_raw["transaction"],
@@ -179,8 +174,14 @@ def decode_transaction_raw(transaction_raw: str) -> dict:
     )
 
 
+def _release_nonces(nonce_manager: Optional[NonceManager], transactions: List[dict]) -> None:
+    if nonce_manager:
+        for transaction in transactions:
+            nonce_manager.release(address=transaction["from"], nonce=transaction["nonce"])
+
+
 def submit_transaction_raw(transaction_raw: str, provider: str = config["provider"],
-                           token: Optional[str] = None) -> dict:
+                           token: Optional[str] = None, nonce_manager: Optional[NonceManager] = None) -> dict:
     """
     Submit Ethereum transaction raw.
 
@@ -190,9 +191,16 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     :type provider: str
     :param token: Infura API endpoint token, defaults to ``4414fea5f7454211956b1627621450b4``.
     :type token: str
+    :param nonce_manager: Nonce manager to give back rejected transaction nonces, defaults to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: dict -- Ethereum submitted transaction id, fee, type and date.
 
+    .. note::
+        Multi-recipient normal transaction raw is submitted in one batch request, its transaction
+        hash and errors are lists in nonce order, a rejected transaction has ``None`` hash and its error,
+        an accepted one has its hash and ``None`` error. It raises only when every transaction is rejected.
+
     >>> from swap.providers.ethereum.utils import submit_transaction_raw
     >>> transaction_raw: str = "eyJmZWUiOiAxMDAwMDAwMCwgImFkZHJlc3MiOiAiYm0xcWU5MHFqdDl3NG04cnQzdG51dTBwenAyNGRrZmZlbHlzOHpjd3llIiwgInJhdyI6ICIwNzAxMDAwMjAxNWYwMTVkMzA1YTI4ZDhkMzRiNDBjNjU5MzY4MTBmOWU5YzFmOGJjOWM3OTNlYzJlNzJjNzBmOTIwM2ZiYmViMGE1NmRiOWZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MGFkZTIwNDAxMDExNjAwMTQwZTQzYTkyYTllOGFjYTc4OGViMTU1MWMzMTY0NDhjMmUzZjc4MjE1MDEwMDAxNWYwMTVkMjAyZmQyNTU3YjY3ZjFkZjhiOGFjZWYwNjZmNWQ0NmE4NTAwODE0MzliNDE5MzI1ZDU1ZGJkOTM0MWUxMWFjNGZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MDg0YWY1ZjAxMDExNjAwMTRjOTVlMDkyY2FlYWVjZTM1YzU3M2U3MWUxMTA1NTU2ZDkyOWNmYzkwMjIwMTIwNTk5MDdmZGFkMGZmOTVmZWJhNDNhZWYzN2QyZTU1YzU3YjZlMTg2Y2QzYWQxN2M4M2U2YzgwYzY1ODIxOGI2NTAyMDEzYWZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY5MDRlMDExNjAwMTRjOTVlMDkyY2FlYWVjZTM1YzU3M2U3MWUxMTA1NTU2ZDkyOWNmYzkwMDAwMTNjZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmUwOTQ5MDY0MDExNjAwMTRjOTVlMDkyY2FlYWVjZTM1YzU3M2U3MWUxMTA1NTU2ZDkyOWNmYzkwMDAiLCAiaGFzaCI6ICI3NzlmYzliOWNhNGRiMTVkNDFhYzgwNDNlZDRlNDFkYjg4NDU2ZjA1YzljZmJhMDQ5MzYyZWNlZmQ2MjY3ZmMzIiwgInVuc2lnbmVkX2RhdGFzIjogW3siZGF0YXMiOiBbIjMzZThkYThjZThlZjEzZmI0OTM4YTM3NGFlYTM2NjRlNGNkMmNkMDBmZGQ5ZDI5ODU5M2JkYmQ4NzJkNjZiODgiXSwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJwYXRoIjogbnVsbH0sIHsiZGF0YXMiOiBbIjc1ZTg3Yzc5MzNiNGRjNGE4N2UwNmZlZDMyM2U4NDI1ZTU0YTQ5NGZmODBkYzdmOGM0NTUyY2RiMGE2YmM3NGEiXSwgInB1YmxpY19rZXkiOiAiNTk5MDdmZGFkMGZmOTVmZWJhNDNhZWYzN2QyZTU1YzU3YjZlMTg2Y2QzYWQxN2M4M2U2YzgwYzY1ODIxOGI2NSIsICJuZXR3b3JrIjogIm1haW5uZXQiLCAicGF0aCI6ICJtLzQ0LzE1My8xLzAvMSJ9XSwgInNpZ25hdHVyZXMiOiBbXSwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJ0eXBlIjogImJ5dG9tX2NsYWltX3Vuc2lnbmVkIn0"
     >>> submit_transaction_raw(transaction_raw=transaction_raw)
@@ -200,13 +208,10 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     """
 
     # Check parameter instances
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid Ethereum transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     if not loaded_transaction_raw["type"] in [
         "ethereum_normal_signed", "ethereum_erc20_normal_signed",
         "ethereum_fund_signed", "ethereum_erc20_fund_signed",
@@ -215,59 +220,91 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     ]:
         raise TransactionRawError("Wrong Ethereum transaction raw must be signed, not unsigned transaction raw.")
 
-    from .rpc import get_web3
+    from .rpc import (
+        get_web3, _batch_request
+    )
     web3: Web3 = get_web3(
         network=loaded_transaction_raw["network"], provider=provider, token=token
     )
-    transaction_hash: HexBytes = web3.eth.send_raw_transaction(
-        loaded_transaction_raw["signature"]["rawTransaction"]
-    )
-
+    signatures: List[dict] = loaded_transaction_raw["signature"] \
+        if isinstance(loaded_transaction_raw["signature"], list) else [loaded_transaction_raw["signature"]]
+    transactions: List[dict] = loaded_transaction_raw["transaction"] \
+        if isinstance(loaded_transaction_raw["transaction"], list) else [loaded_transaction_raw["transaction"]]
+    try:
+        if len(signatures) == 1:
+            transaction_hashes: List[str] = [web3.eth.send_raw_transaction(
+                signatures[0]["rawTransaction"]
+            ).hex()]
+        else:
+            # Multi-recipient transactions are sent in nonce order in one JSON-RPC batch request
+            transaction_hashes: List[str] = _batch_request(calls=[
+                ("eth_sendRawTransaction", [signature["rawTransaction"]]) for signature in signatures
+            ], network=loaded_transaction_raw["network"], token=token)
+    except Exception:
+        _release_nonces(nonce_manager=nonce_manager, transactions=transactions)
+        raise
+    errors: List[Optional[str]] = [
+        str(transaction_hash) if isinstance(transaction_hash, APIError) else None
+        for transaction_hash in transaction_hashes
+    ]
+    # Only the rejected transaction nonces are given back, accepted ones stay in flight
+    _release_nonces(nonce_manager=nonce_manager, transactions=[
+        transaction for transaction, error in zip(transactions, errors) if error is not None
+    ])
+    if all(error is not None for error in errors):
+        raise transaction_hashes[0]
+
+    if not isinstance(loaded_transaction_raw["signature"], list):
+        return dict(
+            fee=loaded_transaction_raw["fee"],
+            type=loaded_transaction_raw["type"],
+            transaction_hash=transaction_hashes[0],
+            network=loaded_transaction_raw["network"],
+            date=str(datetime.now())
+        )
     return dict(
         fee=loaded_transaction_raw["fee"],
         type=loaded_transaction_raw["type"],
-        transaction_hash=transaction_hash.hex(),
+        transaction_hash=[
+            None if error is not None else transaction_hash
+            for transaction_hash, error in zip(transaction_hashes, errors)
+        ],
+        errors=errors,
         network=loaded_transaction_raw["network"],
         date=str(datetime.now())
     )
 
 
-def amount_unit_converter(amount: Union[int, float], unit_from: str = "Wei2Ether") -> Union[int, float]:
+# Unit conversion scales, Ether2Wei, Gwei2Wei and Wei2Gwei amounts are integers
+UNIT_SCALES: Dict[str, Tuple[int, int, bool]] = unit_scales(
+    units=config["units"], integers=["Ether2Wei", "Gwei2Wei", "Wei2Gwei"]
+)
+
+
+def amount_unit_converter(amount: Union[int, float, Decimal, List[Union[int, float, Decimal]]],
+                          unit_from: str = "Wei2Ether") -> Union[int, float, List[Union[int, float]]]:
     """
     Ethereum amount unit converter.
 
     :param amount: Ethereum amount.
-    :type amount: int, float
+    :type amount: int, float, decimal.Decimal, list
     :param unit_from: Ethereum unit, default to Wei2Ether
     :type unit_from: str
 
-    :returns: int, float -- Ethereum amount.
+    :returns: int, float, list -- Ethereum amount.
 
     >>> from swap.providers.ethereum.utils import amount_unit_converter
     >>> amount_unit_converter(amount=100_000_000, unit_from="Wei2Ether")
     0.1
+    >>> from decimal import Decimal
+    >>> amount_unit_converter(amount=[0.1, Decimal("1.000000000000000001")], unit_from="Ether2Wei")
+    [100000000000000000, 1000000000000000001]
     """
 
-    if unit_from not in ["Ether2Gwei", "Ether2Wei", "Gwei2Ether", "Gwei2Wei", "Wei2Ether", "Wei2Gwei"]:
+    if unit_from not in UNIT_SCALES:
         raise UnitError(f"Invalid Ethereum '{unit_from}' unit from",
                         "choose only 'Ether2Gwei', 'Ether2Wei', 'Gwei2Ether', 'Gwei2Wei', 'Wei2Ether' or 'Wei2Gwei' units.")
 
-    # Constant values
-    Ether, Gwei, Wei = (
-        config["units"]["Ether"],
-        config["units"]["Gwei"],
-        config["units"]["Wei"]
-    )
-
-    if unit_from == "Ether2Gwei":
-        return float((amount * Gwei) / Ether)
-    elif unit_from == "Ether2Wei":
-        return int((amount * Wei) / Ether)
-    elif unit_from == "Gwei2Ether":
-        return float((amount * Ether) / Gwei)
-    elif unit_from == "Gwei2Wei":
-        return int((amount * Wei) / Gwei)
-    elif unit_from == "Wei2Ether":
-        return float((amount * Ether) / Wei)
-    elif unit_from == "Wei2Gwei":
-        return int((amount * Gwei) / Wei)
+    if isinstance(amount, (int, float, Decimal)):
+        return convert_amount(amount=amount, scale=UNIT_SCALES[unit_from])
+    return convert_amounts(amounts=amount, scale=UNIT_SCALES[unit_from])
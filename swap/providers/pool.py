@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Callable, Optional, List
+)
+
+from .config import pool as config
+
+
+def map_chunks(function: Callable[[list], list], items: list, processes: Optional[int] = None,
+               chunk_size: int = config["chunk_size"]) -> list:
+    """
+    Map chunks of items, in a process pool for large inputs.
+
+    :param function: Picklable (module level) function, takes a chunk of items and returns one result per item.
+    :type function: callable
+    :param items: Items to map.
+    :type items: list
+    :param processes: Worker processes, defaults to ``None`` (runs in this process).
+    :type processes: int
+    :param chunk_size: Items per worker task, defaults to ``1000``.
+    :type chunk_size: int
+
+    :returns: list -- Results of every item, in the same order.
+
+    >>> from swap.providers.pool import map_chunks
+    >>> map_chunks(function=sorted, items=[3, 1, 2])
+    [1, 2, 3]
+    """
+
+    if not processes or processes <= 1 or len(items) <= chunk_size:
+        return function(items)
+    chunks: List[list] = [items[index:index + chunk_size] for index in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as executor:
+        return [result for results in executor.map(function, chunks) for result in results]
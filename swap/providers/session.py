@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
+from typing import (
+    Dict, Optional
+)
+
+import threading
+import requests
+import time
+
+from ..exceptions import APIError
+from .config import session as config
+
+
+class CircuitBreaker:
+    """
+    Per endpoint circuit breaker.
+
+    :param failures: Consecutive failures before opening the circuit, defaults to ``5``.
+    :type failures: int
+    :param reset_timeout: Seconds to keep the circuit open before one trial request, defaults to ``30``.
+    :type reset_timeout: int
+
+    :returns: CircuitBreaker -- Circuit breaker instance.
+
+    >>> from swap.providers.session import CircuitBreaker
+    >>> circuit_breaker: CircuitBreaker = CircuitBreaker(failures=3, reset_timeout=10)
+    >>> circuit_breaker.allow(endpoint="api.blockcypher.com")
+    True
+    """
+
+    def __init__(self, failures: int = config["circuit_breaker"]["failures"],
+                 reset_timeout: int = config["circuit_breaker"]["reset_timeout"]):
+
+        self._failures: int = failures
+        self._reset_timeout: int = reset_timeout
+        self._counts: Dict[str, int] = {}
+        self._opened: Dict[str, float] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Check whether a request to the endpoint is allowed.
+
+        :param endpoint: Endpoint host.
+        :type endpoint: str
+
+        :returns: bool -- Request allowed.
+
+        >>> from swap.providers.session import CircuitBreaker
+        >>> circuit_breaker: CircuitBreaker = CircuitBreaker()
+        >>> circuit_breaker.allow(endpoint="api.blockcypher.com")
+        True
+        """
+
+        with self._lock:
+            opened: Optional[float] = self._opened.get(endpoint)
+            if opened is None:
+                return True
+            if (time.monotonic() - opened) >= self._reset_timeout:
+                # Half open, let one trial request through
+                self._opened[endpoint] = time.monotonic()
+                return True
+            return False
+
+    def success(self, endpoint: str) -> None:
+        with self._lock:
+            self._counts.pop(endpoint, None)
+            self._opened.pop(endpoint, None)
+
+    def failure(self, endpoint: str) -> None:
+        with self._lock:
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+            if self._counts[endpoint] >= self._failures:
+                self._opened[endpoint] = time.monotonic()
+
+    def reset(self) -> "CircuitBreaker":
+        """
+        Close every circuit.
+
+        :returns: CircuitBreaker -- Circuit breaker instance.
+
+        >>> from swap.providers.session import CircuitBreaker
+        >>> circuit_breaker: CircuitBreaker = CircuitBreaker()
+        >>> circuit_breaker.reset()
+        <swap.providers.session.CircuitBreaker object at 0x0409DAF0>
+        """
+
+        with self._lock:
+            self._counts.clear()
+            self._opened.clear()
+            return self
+
+
+class Session(requests.Session):
+    """
+    Pooled HTTP session with retries and circuit breaker.
+
+    :param pool_connections: Number of hosts to keep connection pools for, defaults to ``10``.
+    :type pool_connections: int
+    :param pool_maxsize: Maximum connections kept per host, defaults to ``10``.
+    :type pool_maxsize: int
+    :param retries: Retries on connection errors and retryable status codes, defaults to ``3``.
+    :type retries: int
+    :param backoff_factor: Exponential backoff factor (seconds), defaults to ``0.5``.
+    :type backoff_factor: float
+    :param circuit_breaker: Circuit breaker, defaults to a new one.
+    :type circuit_breaker: CircuitBreaker
+
+    :returns: Session -- Session instance.
+
+    .. note::
+        ``Retry-After`` header of ``429`` and ``503`` responses is honored before the next retry,
+        ``POST`` requests are retried only on connection errors.
+
+    >>> from swap.providers.session import Session
+    >>> session: Session = Session(retries=5)
+    >>> session.get(url="https://api.blockcypher.com/v1/btc/test3", timeout=60).status_code
+    200
+    """
+
+    def __init__(self, pool_connections: int = config["pool_connections"], pool_maxsize: int = config["pool_maxsize"],
+                 retries: int = config["retries"], backoff_factor: float = config["backoff_factor"],
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        super().__init__()
+
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker()
+        # Default idempotent methods only, POST (like raw transaction submit) is retried
+        # on connection errors alone, when the request was never sent
+        max_retries: Retry = Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            backoff_factor=backoff_factor, status_forcelist=config["status_forcelist"],
+            respect_retry_after_header=True, raise_on_status=False
+        )
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        endpoint: str = urlparse(url).netloc
+        if not self.circuit_breaker.allow(endpoint=endpoint):
+            raise APIError(f"Too many failed requests to '{endpoint}' endpoint, circuit is open.")
+        try:
+            response: requests.Response = super().request(method, url, *args, **kwargs)
+        except requests.exceptions.RequestException:
+            self.circuit_breaker.failure(endpoint=endpoint)
+            raise
+        if response.status_code in config["status_forcelist"]:
+            self.circuit_breaker.failure(endpoint=endpoint)
+        else:
+            self.circuit_breaker.success(endpoint=endpoint)
+        return response
+
+
+# Shared session, used by every requests based rpc and utils module
+session: Session = Session()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+from decimal import (
+    Context, Decimal, ROUND_DOWN
+)
+from math import gcd
+from typing import (
+    Dict, Iterable, List, Tuple, Union
+)
+
+# Decimal context wide enough for any 256-bit amount, integer results are truncated
+_context: Context = Context(prec=80, rounding=ROUND_DOWN)
+
+
+def unit_scales(units: Dict[str, int], integers: List[str]) -> Dict[str, Tuple[int, int, bool]]:
+    """
+    Precompute unit conversion scales.
+
+    :param units: Unit values of one coin, like ``{"BTC": 1, "mBTC": 1_000, "Satoshi": 100_000_000}``.
+    :type units: dict
+    :param integers: Unit conversions returning integer amounts, like ``["BTC2Satoshi"]``.
+    :type integers: list
+
+    :returns: dict -- Reduced numerator, denominator and integer result of every ``<from>2<to>`` unit conversion.
+
+    >>> from swap.providers.units import unit_scales
+    >>> unit_scales(units={"BTC": 1, "Satoshi": 100_000_000}, integers=["BTC2Satoshi"])
+    {'BTC2Satoshi': (100000000, 1, True), 'Satoshi2BTC': (1, 100000000, False)}
+    """
+
+    scales: Dict[str, Tuple[int, int, bool]] = {}
+    for unit_from, value_from in units.items():
+        for unit_to, value_to in units.items():
+            if unit_from != unit_to:
+                divisor: int = gcd(value_to, value_from)
+                scales[f"{unit_from}2{unit_to}"] = (
+                    value_to // divisor, value_from // divisor, f"{unit_from}2{unit_to}" in integers
+                )
+    return scales
+
+
+def convert_amount(amount: Union[int, float, Decimal], scale: Tuple[int, int, bool]) -> Union[int, float]:
+    """
+    Convert amount with a unit conversion scale, without float rounding on the way.
+
+    :param amount: Any amount.
+    :type amount: int, float, decimal.Decimal
+    :param scale: Unit conversion scale, from ``unit_scales``.
+    :type scale: tuple
+
+    :returns: int, float -- Converted amount, integer amounts are truncated.
+
+    >>> from swap.providers.units import convert_amount
+    >>> convert_amount(amount=0.29, scale=(100000000, 1, True))
+    29000000
+    """
+
+    numerator, denominator, integer = scale
+    if isinstance(amount, int):
+        value: int = amount * numerator
+        if integer:
+            return value // denominator if value >= 0 else -(-value // denominator)
+        # Integer true division is correctly rounded
+        return value / denominator
+    if isinstance(amount, float):
+        # Shortest repr of the float, 0.29 is 0.29 and not 0.28999999999999998
+        amount = Decimal(repr(amount))
+    elif not isinstance(amount, Decimal):
+        raise TypeError(f"Amount must be int, float or Decimal, not '{type(amount).__name__}' type.")
+    value: Decimal = _context.multiply(amount, numerator)
+    if integer:
+        return int(_context.divide_int(value, denominator))
+    return float(_context.divide(value, denominator))
+
+
+def convert_amounts(amounts: Iterable[Union[int, float, Decimal]], scale: Tuple[int, int, bool]) \
+        -> List[Union[int, float]]:
+    """
+    Convert many amounts with one unit conversion scale.
+
+    :param amounts: Any amounts, list, tuple or any iterable.
+    :type amounts: list
+    :param scale: Unit conversion scale, from ``unit_scales``.
+    :type scale: tuple
+
+    :returns: list -- Converted amounts, in the same order.
+
+    >>> from swap.providers.units import convert_amounts
+    >>> convert_amounts(amounts=[1, 2, 0.5], scale=(100000000, 1, True))
+    [100000000, 200000000, 50000000]
+    """
+
+    numerator, denominator, integer = scale
+    amounts = list(amounts)
+    if integer and all(type(amount) is int and amount >= 0 for amount in amounts):
+        # Non-negative integer amounts, the common accounting case, in one pass
+        return [amount * numerator // denominator for amount in amounts]
+    return [convert_amount(amount=amount, scale=scale) for amount in amounts]
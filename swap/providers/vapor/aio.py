@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Union, AsyncIterator
+)
+
+import json
+
+from ...exceptions import (
+    APIError, NetworkError, AddressError
+)
+from ..aio import (
+    get_session, run_sync
+)
+from ..cache import (
+    cached, finalized
+)
+from ..config import vapor as config
+from .assets import AssetNamespace
+from .utils import (
+    is_network, is_address
+)
+from . import transaction
+
+
+@cached(policy="balance")
+async def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"],
+                      network: str = config["network"], headers: dict = config["headers"],
+                      timeout: int = config["timeout"]) -> int:
+    """
+    Get Vapor balance.
+
+    :param address: Vapor address.
+    :type address: str
+    :param asset: Vapor asset, default to ``BTM``.
+    :type asset: str, vapor.assets.AssetNamespace
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: int -- Vapor asset balance (NEU amount).
+
+    >>> from swap.providers.vapor.aio import get_balance
+    >>> from swap.providers.vapor.assets import BTM as ASSET
+    >>> await get_balance(address="vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag", asset=ASSET, network="mainnet")
+    97000000
+    """
+
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Vapor '{address}' {network} address.")
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Vapor '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockmeta']}/address/{address}"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    if response.json() is None or response.json()["data"] is None:
+        return 0
+    for _asset in response.json()["data"]["address"]:
+        if (str(asset.ID) if isinstance(asset, AssetNamespace) else asset) == _asset["asset_id"]:
+            return int(_asset["balance"])
+    return 0
+
+
+async def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"],
+                    network: str = config["network"], limit: Optional[int] = 15,
+                    by: str = "amount", order: str = "desc", headers: dict = config["headers"],
+                    timeout: int = config["timeout"]) -> list:
+    """
+    Get Vapor unspent transaction outputs (UTXO's).
+
+    :param program: Vapor control program.
+    :type program: str
+    :param asset: Vapor asset id, defaults to ``BTM``.
+    :type asset: str, vapor.assets.AssetNamespace
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param limit: Vapor utxo's limit, defaults to ``15`` (``None`` to follow every page).
+    :type limit: int
+    :param by: Sort by, defaults to ``amount``.
+    :type by: str
+    :param order: Sort order, defaults to ``desc``.
+    :type order: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: list -- Vapor unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.vapor.aio import get_utxos
+    >>> from swap.providers.vapor.assets import BTM as ASSET
+    >>> await get_utxos(program="00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", asset=ASSET, network="mainnet")
+    [{'hash': 'e152f88d33c6659ad823d15c5c65b2ed946d207c42430022cba9bb9b9d70a7a4', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 587639800}, {'hash': '88289fa4c7633574931be7ce4102aeb24def0de20e38e7d69a5ddd6efc116b95', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 8160000}, ...]
+    """
+
+    if limit is None:
+        return [utxo async for utxo in iter_utxos(
+            program=program, asset=asset, network=network, by=by, order=order, headers=headers, timeout=timeout
+        )]
+    async for page in iter_utxos(
+        program=program, asset=asset, network=network, limit=limit, by=by, order=order,
+        headers=headers, timeout=timeout, pages=True
+    ):
+        return page
+    return []
+
+
+def iter_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"], network: str = config["network"],
+               limit: int = config["utxo_limit"], by: str = "amount", order: str = "desc",
+               headers: dict = config["headers"], timeout: int = config["timeout"],
+               pages: bool = False) -> AsyncIterator:
+    """
+    Iterate Vapor unspent transaction outputs (UTXO's), next page is fetched only when needed.
+
+    :param program: Vapor control program.
+    :type program: str
+    :param asset: Vapor asset id, defaults to ``BTM``.
+    :type asset: str, vapor.assets.AssetNamespace
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param limit: Vapor utxo's page size, defaults to ``100``.
+    :type limit: int
+    :param by: Sort by, defaults to ``amount``.
+    :type by: str
+    :param order: Sort order, defaults to ``desc``.
+    :type order: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :param pages: Yield whole pages instead of single UTXO's, defaults to ``False``.
+    :type pages: bool
+
+    :returns: async generator -- Vapor unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.vapor.aio import iter_utxos
+    >>> [utxo async for utxo in iter_utxos(program="00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", network="mainnet")]
+    [{'hash': 'e152f88d33c6659ad823d15c5c65b2ed946d207c42430022cba9bb9b9d70a7a4', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 587639800}, ...]
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Vapor '{network}' network",
+                           "choose only 'mainnet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockcenter']}/q/utxos"
+    data = dict(filter=dict(
+        script=program, asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
+    ), sort=dict(by=by, order=order))
+    return _iter_utxos(url=url, data=data, limit=limit, headers=headers, timeout=timeout, pages=pages)
+
+
+async def _iter_utxos(url: str, data: dict, limit: int, headers: dict, timeout: int, pages: bool) -> AsyncIterator:
+    start: int = 0
+    while True:
+        params = dict(start=start, limit=limit)
+        response = await get_session().post(
+            url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        page: list = response_json["data"] or []
+        if pages:
+            yield page
+        else:
+            for utxo in page:
+                yield utxo
+        if len(page) < limit:
+            break
+        start += len(page)
+
+
+@cached(policy="transaction", permanent=finalized,
+        cacheable=lambda transaction: isinstance(transaction, dict) and transaction.get("inputs") is not None)
+async def get_transaction(transaction_hash: str, network: str = config["network"],
+                          headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
+    """
+    Get Vapor transaction detail.
+
+    :param transaction_hash: Vapor transaction hash/id.
+    :type transaction_hash: str
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- Vapor transaction detail.
+
+    >>> from swap.providers.vapor.aio import get_transaction
+    >>> await get_transaction(transaction_hash="4e91bca76db112d3a356c17366df93e364a4922993414225f65390220730d0c1", network="mainnet")
+    {'tx_id': '961d984b04214dc202fb40f4c48466d10a2813a138a31e1d2877ad3b6af0ef4c', 'timestamp': 1606993457000, 'block_hash': '440e791390f61c615b974c9292ac1d43bad67368076ef6d86a77cab22f1c2119', 'block_height': 85098064, 'trx_amount': 0, 'trx_fee': 10000000, ...}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Vapor '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockmeta']}/tx/hash/{transaction_hash}"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    if response.status_code == 200 and response.json()["code"] == 200:
+        transaction: dict = response.json()["data"]["transaction"]
+        # Blockmeta gives no confirmations for Vapor, they are counted from the latest block like Bytom ones
+        transaction["confirmations"] = max(await _get_latest_block_height(
+            network=network, headers=headers, timeout=timeout
+        ) - transaction["block_height"] + 1, 0) if transaction.get("block_height") else 0
+        return transaction
+    raise APIError(f"Not found this '{transaction_hash}' vapor transaction id.", 500)
+
+
+async def get_current_block_height(plus: int = 0, network: str = config["network"],
+                                   headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
+    """
+    Get Vapor current block height.
+
+    :param plus: Add block number on current block height, default to ``0``.
+    :type plus: int
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: int -- Vapor current block height.
+
+    >>> from swap.providers.vapor.aio import get_current_block_height
+    >>> await get_current_block_height(plus=0)
+    678722
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Vapor '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    return await _get_latest_block_height(network=network, headers=headers, timeout=timeout) + plus
+
+
+@cached(policy="block_height")
+async def _get_latest_block_height(network: str, headers: dict, timeout: int) -> int:
+    url = f"{config[network]['blockmeta']}/block"
+    response = await get_session().get(
+        url=url, headers=headers, timeout=timeout
+    )
+    if response.status_code == 200 and response.json()["code"] == 200:
+        return int(response.json()["data"]["block"]["height"])
+    raise APIError("Can't get current latest Vapor block height.")
+
+
+async def submit_raw(address: str, raw: str, signatures: list, network: str = config["network"],
+                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> str:
+    """
+    Submit original Vapor raw into blockchain.
+
+    :param address: Vapor address.
+    :type address: str
+    :param raw: Vapor transaction raw.
+    :type raw: str
+    :param signatures: Vapor signed massage datas.
+    :type signatures: list
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: str -- Vapor submitted transaction id/hash.
+
+    >>> from swap.providers.vapor.aio import submit_raw
+    >>> await submit_raw(address="vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag", raw="07010001015f015d0c8382b6aadd32748d0a9490259bf9ba5b55f6ac283535f8752cf5d51621801cffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff8095f52a00011600142cda4f99ea8112e6fa61cdd26157ed6dc408332a22012091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e202014a0048ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff80ade204012200204f8f0e88d0a44b3d884b07b6dd4536518ffcbb596a91ca0e6b2f37e96463bbfc00013e003cffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff80bbb021011600142cda4f99ea8112e6fa61cdd26157ed6dc408332a00", signatures=[["31818788bd6cfd255643242212efc1239db8f9dcd91b0e07ef1ddd38d8edf98c420da5578ec195ff7a5ddd72605a1973c040f2345ea630e0e584e28738ad3f03"]], network="mainnet")
+    "2993414225f65390220730d0c1a356c14e91bca76db112d37366df93e364a492"
+    """
+
+    if not is_address(address=address, network=network):
+        raise AddressError(f"Invalid Vapor '{address}' {network} address.")
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid Vapor '{network}' network",
+                           "choose only 'mainnet', 'solonet' or 'testnet' networks.")
+
+    url = f"{config[network]['blockcenter']}/merchant/submit-payment"
+    data = dict(raw_transaction=raw, signatures=signatures)
+    params = dict(address=address)
+    response = await get_session().post(
+        url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+    )
+    response_json = response.json()
+    if response_json["code"] != 200:
+        raise APIError(response_json["msg"], response_json["code"])
+    return response_json["data"]["tx_hash"]
+
+
+class NormalTransaction(transaction.NormalTransaction):
+    """
+    Vapor asynchronous normal transaction.
+
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: NormalTransaction -- Vapor asynchronous normal transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "NormalTransaction":
+        """
+        Build Vapor normal transaction, takes the same arguments as
+        :meth:`swap.providers.vapor.transaction.NormalTransaction.build_transaction`.
+
+        >>> from swap.providers.vapor.aio import NormalTransaction
+        >>> normal_transaction: NormalTransaction = NormalTransaction(network="mainnet")
+        >>> await normal_transaction.build_transaction(address="vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag", recipients={"vp1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07qcyvk37": 10000000}, asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff")
+        <swap.providers.vapor.aio.NormalTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class FundTransaction(transaction.FundTransaction):
+    """
+    Vapor asynchronous fund transaction.
+
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: FundTransaction -- Vapor asynchronous fund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "FundTransaction":
+        """
+        Build Vapor fund transaction, takes the same arguments as
+        :meth:`swap.providers.vapor.transaction.FundTransaction.build_transaction`.
+
+        >>> from swap.providers.vapor.htlc import HTLC
+        >>> from swap.providers.vapor.aio import FundTransaction
+        >>> htlc: HTLC = HTLC(network="mainnet")
+        >>> htlc.build_htlc(secret_hash="3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb", recipient_public_key="3e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e", sender_public_key="fe6b3fd4458291b19605d92837ae1060cc0237e68022b2eb9faf01a118226212", endblock=120723497)
+        >>> fund_transaction: FundTransaction = FundTransaction(network="mainnet")
+        >>> await fund_transaction.build_transaction(address="vp1qk9vj4jaezlcnjdckds4fkm8fwv5kawmqwpnpvs", htlc=htlc, amount=0.1, asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff", unit="BTM")
+        <swap.providers.vapor.aio.FundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class WithdrawTransaction(transaction.WithdrawTransaction):
+    """
+    Vapor asynchronous withdraw transaction.
+
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: WithdrawTransaction -- Vapor asynchronous withdraw transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "WithdrawTransaction":
+        """
+        Build Vapor withdraw transaction, takes the same arguments as
+        :meth:`swap.providers.vapor.transaction.WithdrawTransaction.build_transaction`.
+
+        >>> from swap.providers.vapor.aio import WithdrawTransaction
+        >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="mainnet")
+        >>> await withdraw_transaction.build_transaction(address="vp1q3plwvmvy4qhjmp5zffzmk50aagpujt6flnf63h", transaction_hash="37b36d7be5dfda0cc5dc3c918705464ff901dc5eadb6f4f049db03a679e02bfe", asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff")
+        <swap.providers.vapor.aio.WithdrawTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class RefundTransaction(transaction.RefundTransaction):
+    """
+    Vapor asynchronous refund transaction.
+
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+
+    :returns: RefundTransaction -- Vapor asynchronous refund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "RefundTransaction":
+        """
+        Build Vapor refund transaction, takes the same arguments as
+        :meth:`swap.providers.vapor.transaction.RefundTransaction.build_transaction`.
+
+        >>> from swap.providers.vapor.aio import RefundTransaction
+        >>> refund_transaction: RefundTransaction = RefundTransaction(network="mainnet")
+        >>> await refund_transaction.build_transaction(address="vp1qk9vj4jaezlcnjdckds4fkm8fwv5kawmqwpnpvs", transaction_hash="37b36d7be5dfda0cc5dc3c918705464ff901dc5eadb6f4f049db03a679e02bfe", asset="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff")
+        <swap.providers.vapor.aio.RefundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
@@ -10,7 +10,6 @@ from pybytom.wallet.tools import (
 from pybytom.script.opcode import (
     OP_FALSE, OP_DEPTH, OP_CHECKPREDICATE
 )
-from equity import Equity
 from ctypes import c_int64
 from typing import (
     Optional, List, Union
@@ -51,7 +50,7 @@ class HTLC:
             raise NetworkError(f"Invalid Vapor '{network}' network",
                                "choose only 'mainnet', 'solonet' or 'testnet' networks.")
         self._network: str = network
-        self._script: Optional[Equity, dict] = None
+        self._script: Optional[dict] = None
         self._contract_address: Optional[str] = contract_address
         self.agreements: Optional[dict] = None
 
@@ -104,7 +103,8 @@ class HTLC:
                 sender_public_key,
                 endblock
             ]
-            # Compile HTLC by script
+            # Compile HTLC by script, equity is only needed (and imported) here
+            from equity import Equity
             self._script = Equity(config[self._network]["vapor-core"]) \
                 .compile_source(htlc_script, htlc_agreement)
         else:
@@ -1,22 +1,26 @@
 #!/usr/bin/env python3
 
 from typing import (
-    Optional, Union
+    Optional, Union, Iterator
 )
 
-import requests
 import json
 
 from ...exceptions import (
     BalanceError, APIError, NetworkError, AddressError
 )
 from ..config import vapor as config
+from ..session import session
+from ..cache import (
+    cached, finalized
+)
 from .assets import AssetNamespace
 from .utils import (
     is_network, is_address, amount_unit_converter, get_address_type
 )
 
 
+@cached(policy="balance")
 def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"], network: str = config["network"],
                 headers: dict = config["headers"], timeout: int = config["timeout"]) -> int:
     """
@@ -48,7 +52,7 @@ def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/address/{address}"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.json() is None or response.json()["data"] is None:
@@ -60,7 +64,7 @@ def get_balance(address: str, asset: Union[str, AssetNamespace] = config["asset"
 
 
 def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"], network: str = config["network"],
-              limit: int = 15, by: str = "amount", order: str = "desc",
+              limit: Optional[int] = 15, by: str = "amount", order: str = "desc",
               headers: dict = config["headers"], timeout: int = config["timeout"]) -> list:
     """
     Get Vapor unspent transaction outputs (UTXO's).
@@ -71,7 +75,7 @@ def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"],
     :type asset: str, vapor.assets.AssetNamespace
     :param network: Vapor network, defaults to ``mainnet``.
     :type network: str
-    :param limit: Vapor utxo's limit, defaults to ``15``.
+    :param limit: Vapor utxo's limit, defaults to ``15`` (``None`` to follow every page).
     :type limit: int
     :param by: Sort by, defaults to ``amount``.
     :type by: str
@@ -90,6 +94,50 @@ def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"],
     [{'hash': 'e152f88d33c6659ad823d15c5c65b2ed946d207c42430022cba9bb9b9d70a7a4', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 587639800}, {'hash': '88289fa4c7633574931be7ce4102aeb24def0de20e38e7d69a5ddd6efc116b95', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 8160000}, {'hash': 'f71c68f921b434cc2bcd469d26e7927aa6db7500e4cdeef814884f11c10f5de2', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 10000}, {'hash': 'e46cfecc1f1a26413172ce81c78affb19408e613915642fa5fb04d3b0a4ffa65', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 100}]
     """
 
+    if limit is None:
+        return list(iter_utxos(
+            program=program, asset=asset, network=network, by=by, order=order, headers=headers, timeout=timeout
+        ))
+    return next(iter_utxos(
+        program=program, asset=asset, network=network, limit=limit, by=by, order=order,
+        headers=headers, timeout=timeout, pages=True
+    ), [])
+
+
+def iter_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"], network: str = config["network"],
+               limit: int = config["utxo_limit"], by: str = "amount", order: str = "desc",
+               headers: dict = config["headers"], timeout: int = config["timeout"],
+               pages: bool = False) -> Iterator:
+    """
+    Iterate Vapor unspent transaction outputs (UTXO's), next page is fetched only when needed.
+
+    :param program: Vapor control program.
+    :type program: str
+    :param asset: Vapor asset id, defaults to ``BTM``.
+    :type asset: str, vapor.assets.AssetNamespace
+    :param network: Vapor network, defaults to ``mainnet``.
+    :type network: str
+    :param limit: Vapor utxo's page size, defaults to ``100``.
+    :type limit: int
+    :param by: Sort by, defaults to ``amount``.
+    :type by: str
+    :param order: Sort order, defaults to ``desc``.
+    :type order: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: Request timeout, default to ``60``.
+    :type timeout: int
+    :param pages: Yield whole pages instead of single UTXO's, defaults to ``False``.
+    :type pages: bool
+
+    :returns: generator -- Vapor unspent transaction outputs (UTXO's).
+
+    >>> from swap.providers.vapor.rpc import iter_utxos
+    >>> from swap.providers.vapor.assets import BTM as ASSET
+    >>> next(iter_utxos(program="00142cda4f99ea8112e6fa61cdd26157ed6dc408332a", asset=ASSET, network="mainnet"))
+    {'hash': 'e152f88d33c6659ad823d15c5c65b2ed946d207c42430022cba9bb9b9d70a7a4', 'asset': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 587639800}
+    """
+
     if not is_network(network=network):
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet' or 'testnet' networks.")
@@ -98,12 +146,25 @@ def get_utxos(program: str, asset: Union[str, AssetNamespace] = config["asset"],
     data = dict(filter=dict(
         script=program, asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
     ), sort=dict(by=by, order=order))
-    params = dict(limit=limit)
-    response = requests.post(
-        url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
-    )
-    response_json = response.json()
-    return response_json["data"]
+    return _iter_utxos(url=url, data=data, limit=limit, headers=headers, timeout=timeout, pages=pages)
+
+
+def _iter_utxos(url: str, data: dict, limit: int, headers: dict, timeout: int, pages: bool) -> Iterator:
+    start: int = 0
+    while True:
+        params = dict(start=start, limit=limit)
+        response = session.post(
+            url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+        )
+        response_json = response.json()
+        page: list = response_json["data"] or []
+        if pages:
+            yield page
+        else:
+            yield from page
+        if len(page) < limit:
+            break
+        start += len(page)
 
 
 def estimate_transaction_fee(address: str, amount: int, asset: Union[str, AssetNamespace] = config["asset"],
@@ -151,7 +212,7 @@ def estimate_transaction_fee(address: str, amount: int, asset: Union[str, AssetN
         confirmations=confirmations
     )
     params = dict(address=address)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -191,7 +252,7 @@ def account_create(xpublic_key: str, label: str = "1st address", account_index:
 
     url = f"{config[network]['blockcenter']}/account/create"
     data = dict(pubkey=xpublic_key, label=label, account_index=account_index)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
@@ -230,7 +291,7 @@ def build_transaction(address: str, transaction: dict, network: str = config["ne
 
     url = f"{config[network]['blockcenter']}/merchant/build-advanced-tx"
     params = dict(address=address)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(transaction), params=params, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 300:
@@ -246,6 +307,8 @@ def build_transaction(address: str, transaction: dict, network: str = config["ne
     return response.json()["data"][0]
 
 
+@cached(policy="transaction", permanent=finalized,
+        cacheable=lambda transaction: isinstance(transaction, dict) and transaction.get("inputs") is not None)
 def get_transaction(transaction_hash: str, network: str = config["network"],
                     headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
     """
@@ -264,7 +327,7 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
 
     >>> from swap.providers.vapor.rpc import get_transaction
     >>> get_transaction(transaction_hash="4e91bca76db112d3a356c17366df93e364a4922993414225f65390220730d0c1", network="mainnet")
-    {'tx_id': '961d984b04214dc202fb40f4c48466d10a2813a138a31e1d2877ad3b6af0ef4c', 'timestamp': 1606993457000, 'block_hash': '440e791390f61c615b974c9292ac1d43bad67368076ef6d86a77cab22f1c2119', 'block_height': 85098064, 'trx_amount': 0, 'trx_fee': 10000000, 'status_fail': False, 'is_vote': False, 'is_cross_chain': False, 'coinbase': 0, 'size': 646, 'chain_status': 'mainnet', 'index_id': 18811685, 'mux_id': '97fdbe17d62ae8f8f2024ebc6a231183e8ce7c4e8fde5645b9a3c973f8d0d3ad', 'inputs': [{'type': 'spend', 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 10000, 'control_program': '00204f8f0e88d0a44b3d884b07b6dd4536518ffcbb596a91ca0e6b2f37e96463bbfc', 'address': 'vp1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07qcyvk37', 'spent_output_id': 'c30e26caef4ad3436542700c5b32a91cdf0622c60a6c8a6e11cb1c0b250bc65f', 'input_id': 'c470139ab9f9e81829e51096c57365392195ea2e90d7fb19e9eb2b309df22425', 'witness_arguments': ['db718488496e0823b1cfd9ce64f226ffc4e9debd30eac0b751aa6bd28f694908ae0c0f5d39dd6ed697cae9b0857832ffcb9989487eea81d49d5f2a1228425205', '01', '02e8032091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2203e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e203a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb741f547a6416000000557aa888537a7cae7cac631f000000537acd9f6972ae7cac00c0'], 'decode_program': ['DUP ', 'SHA3 ', 'DATA_32 4f8f0e88d0a44b3d884b07b6dd4536518ffcbb596a91ca0e6b2f37e96463bbfc', 'EQUALVERIFY ', 'DATA_8 ffffffffffffffff', 'SWAP ', 'FALSE ', 'CHECKPREDICATE '], 'decimals': 8, 'unit': 'BTM'}, {'type': 'spend', 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 16990000, 'control_program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': 'vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag', 'spent_output_id': '1a7f2357f2ec272ea2d96413aee511d2077447731a799110cef97de177739181', 'input_id': '4f50c438b5006eafc547cc48128cb94d2e39430ef30f117aa85e6f30ac92ce09', 'witness_arguments': ['e31abbf90f8b20cb41f4daedc2f558dedcbc258fcfb9a36ae1f8c0b4b80f448a78d1d835adb02cc918374c71df8c02c52b425b18d14601ad11e5f0ad8eb00a07', '91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2'], 'decode_program': ['DUP ', 'HASH160 ', 'DATA_20 2cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'EQUALVERIFY ', 'TXSIGHASH ', 'SWAP ', 'CHECKSIG '], 'decimals': 8, 'unit': 'BTM'}], 'outputs': [{'type': 'control', 'id': '20c00b6f9f4fc4f22ccee6c5f8b471a72b1f514f821b1c9c3d1f3243ff011cf1', 'position': 0, 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 10000, 'control_program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': 'vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag', 'decimals': 8, 'decode_program': ['DUP ', 'HASH160 ', 'DATA_20 2cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'EQUALVERIFY ', 'TXSIGHASH ', 'SWAP ', 'CHECKSIG '], 'unit': 'BTM'}, {'type': 'control', 'id': 'f7a36ebce7001e83510eb16c13ff0e5ef311179c25e8cf7bcb599ff8d17e23b2', 'position': 1, 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 6990000, 'control_program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': 'vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag', 'decimals': 8, 'decode_program': ['DUP ', 'HASH160 ', 'DATA_20 2cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'EQUALVERIFY ', 'TXSIGHASH ', 'SWAP ', 'CHECKSIG '], 'unit': 'BTM'}], 'mov_type': ''}
+    {'tx_id': '961d984b04214dc202fb40f4c48466d10a2813a138a31e1d2877ad3b6af0ef4c', 'timestamp': 1606993457000, 'block_hash': '440e791390f61c615b974c9292ac1d43bad67368076ef6d86a77cab22f1c2119', 'block_height': 85098064, 'trx_amount': 0, 'trx_fee': 10000000, 'status_fail': False, 'is_vote': False, 'is_cross_chain': False, 'coinbase': 0, 'size': 646, 'chain_status': 'mainnet', 'index_id': 18811685, 'mux_id': '97fdbe17d62ae8f8f2024ebc6a231183e8ce7c4e8fde5645b9a3c973f8d0d3ad', 'inputs': [{'type': 'spend', 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 10000, 'control_program': '00204f8f0e88d0a44b3d884b07b6dd4536518ffcbb596a91ca0e6b2f37e96463bbfc', 'address': 'vp1qf78sazxs539nmzztq7md63fk2x8lew6ed2gu5rnt9um7jerrh07qcyvk37', 'spent_output_id': 'c30e26caef4ad3436542700c5b32a91cdf0622c60a6c8a6e11cb1c0b250bc65f', 'input_id': 'c470139ab9f9e81829e51096c57365392195ea2e90d7fb19e9eb2b309df22425', 'witness_arguments': ['db718488496e0823b1cfd9ce64f226ffc4e9debd30eac0b751aa6bd28f694908ae0c0f5d39dd6ed697cae9b0857832ffcb9989487eea81d49d5f2a1228425205', '01', '02e8032091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2203e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e203a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb741f547a6416000000557aa888537a7cae7cac631f000000537acd9f6972ae7cac00c0'], 'decode_program': ['DUP ', 'SHA3 ', 'DATA_32 4f8f0e88d0a44b3d884b07b6dd4536518ffcbb596a91ca0e6b2f37e96463bbfc', 'EQUALVERIFY ', 'DATA_8 ffffffffffffffff', 'SWAP ', 'FALSE ', 'CHECKPREDICATE '], 'decimals': 8, 'unit': 'BTM'}, {'type': 'spend', 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 16990000, 'control_program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': 'vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag', 'spent_output_id': '1a7f2357f2ec272ea2d96413aee511d2077447731a799110cef97de177739181', 'input_id': '4f50c438b5006eafc547cc48128cb94d2e39430ef30f117aa85e6f30ac92ce09', 'witness_arguments': ['e31abbf90f8b20cb41f4daedc2f558dedcbc258fcfb9a36ae1f8c0b4b80f448a78d1d835adb02cc918374c71df8c02c52b425b18d14601ad11e5f0ad8eb00a07', '91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2'], 'decode_program': ['DUP ', 'HASH160 ', 'DATA_20 2cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'EQUALVERIFY ', 'TXSIGHASH ', 'SWAP ', 'CHECKSIG '], 'decimals': 8, 'unit': 'BTM'}], 'outputs': [{'type': 'control', 'id': '20c00b6f9f4fc4f22ccee6c5f8b471a72b1f514f821b1c9c3d1f3243ff011cf1', 'position': 0, 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 10000, 'control_program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': 'vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag', 'decimals': 8, 'decode_program': ['DUP ', 'HASH160 ', 'DATA_20 2cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'EQUALVERIFY ', 'TXSIGHASH ', 'SWAP ', 'CHECKSIG '], 'unit': 'BTM'}, {'type': 'control', 'id': 'f7a36ebce7001e83510eb16c13ff0e5ef311179c25e8cf7bcb599ff8d17e23b2', 'position': 1, 'asset_id': 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 'amount': 6990000, 'control_program': '00142cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'address': 'vp1q9ndylx02syfwd7npehfxz4lddhzqsve2za23ag', 'decimals': 8, 'decode_program': ['DUP ', 'HASH160 ', 'DATA_20 2cda4f99ea8112e6fa61cdd26157ed6dc408332a', 'EQUALVERIFY ', 'TXSIGHASH ', 'SWAP ', 'CHECKSIG '], 'unit': 'BTM'}], 'mov_type': '', 'confirmations': 3289}
     """
 
     if not is_network(network=network):
@@ -272,11 +335,16 @@ def get_transaction(transaction_hash: str, network: str = config["network"],
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
     url = f"{config[network]['blockmeta']}/tx/hash/{transaction_hash}"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
-        return response.json()["data"]["transaction"]
+        transaction: dict = response.json()["data"]["transaction"]
+        # Blockmeta gives no confirmations for Vapor, they are counted from the latest block like Bytom ones
+        transaction["confirmations"] = max(_get_latest_block_height(
+            network=network, headers=headers, timeout=timeout
+        ) - transaction["block_height"] + 1, 0) if transaction.get("block_height") else 0
+        return transaction
     raise APIError(f"Not found this '{transaction_hash}' vapor transaction id.", 500)
 
 
@@ -305,13 +373,17 @@ def get_current_block_height(plus: int = 0, network: str = config["network"],
         raise NetworkError(f"Invalid Vapor '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
 
+    return _get_latest_block_height(network=network, headers=headers, timeout=timeout) + plus
+
+
+@cached(policy="block_height")
+def _get_latest_block_height(network: str, headers: dict, timeout: int) -> int:
     url = f"{config[network]['blockmeta']}/block"
-    response = requests.get(
+    response = session.get(
         url=url, headers=headers, timeout=timeout
     )
     if response.status_code == 200 and response.json()["code"] == 200:
-        return int(response.json()["data"]["block"]["height"]) \
-            if plus == 0 else int(response.json()["data"]["block"]["height"]) + plus
+        return int(response.json()["data"]["block"]["height"])
     raise APIError("Can't get current latest Vapor block height.")
 
 
@@ -364,7 +436,7 @@ def decode_raw(raw: str, network: str = config["network"],
 
     url = f"{config[network]['vapor-core']}/decode-raw-transaction"
     data = dict(raw_transaction=raw)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), headers=headers, timeout=timeout
     )
     response_json = response.json()
@@ -407,7 +479,7 @@ def submit_raw(address: str, raw: str, signatures: list, network: str = config["
     url = f"{config[network]['blockcenter']}/merchant/submit-payment"
     data = dict(raw_transaction=raw, signatures=signatures)
     params = dict(address=address)
-    response = requests.post(
+    response = session.post(
         url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json: dict = response.json()
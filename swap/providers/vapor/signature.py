@@ -1,20 +1,18 @@
 #!/usr/bin/env python3
 
-from base64 import (
-    b64encode, b64decode
-)
 from typing import (
     Optional, Union, List
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    clean_transaction_raw, dumps_transaction_raw, parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
     TransactionRawError, NetworkError, UnitError
 )
 from ..config import vapor as config
 from .transaction import Transaction
+from .signer import sign_datas
 from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
@@ -160,7 +158,7 @@ class Signature(Transaction):
             raise ValueError("Type is none, sign unsigned transaction raw first.")
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) \
             -> Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign unsigned transaction raw.
@@ -181,29 +179,27 @@ class Signature(Transaction):
         <swap.providers.vapor.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Vapor unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "vapor_normal_unsigned":
             return NormalSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "vapor_fund_unsigned":
             return FundSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "vapor_withdraw_unsigned":
             return WithdrawSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "vapor_refund_unsigned":
             return RefundSignature(network=self._network).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def unsigned_datas(self) -> List[dict]:
@@ -282,7 +278,7 @@ class NormalSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: NormalSolver) -> "NormalSignature":
         """
         Sign unsigned normal transaction raw.
 
@@ -303,13 +299,11 @@ class NormalSignature(Signature):
         <swap.providers.vapor.signature.NormalSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Vapor unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "vapor_normal_unsigned":
             raise TypeError(f"Invalid Vapor normal unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using normal signature.")
@@ -321,32 +315,20 @@ class NormalSignature(Signature):
         # Set transaction, fee, type and network
         self._fee, self._type, self._network, self._transaction = (
             loaded_transaction_raw["fee"], loaded_transaction_raw["type"],
-            loaded_transaction_raw["network"], loaded_transaction_raw
+            loaded_transaction_raw["network"], loaded_transaction_raw.loads()
         )
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign normal transaction
-        for unsigned in self.unsigned_datas():
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Sign normal transaction, each derivation path is derived once
+        self._signatures.extend(sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ))
 
         # Set transaction type
         self._type = "vapor_normal_signed"
         # Encode normal transaction raw
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -355,7 +337,7 @@ class NormalSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -372,7 +354,7 @@ class FundSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: FundSolver) -> "FundSignature":
         """
         Sign unsigned fund transaction raw.
 
@@ -392,13 +374,11 @@ class FundSignature(Signature):
         <swap.providers.vapor.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Vapor unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "vapor_fund_unsigned":
             raise TypeError(f"Invalid Vapor fund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using fund signature.")
@@ -410,32 +390,20 @@ class FundSignature(Signature):
         # Set transaction, fee, type and network
         self._fee, self._type, self._network, self._transaction = (
             loaded_transaction_raw["fee"], loaded_transaction_raw["type"],
-            loaded_transaction_raw["network"], loaded_transaction_raw
+            loaded_transaction_raw["network"], loaded_transaction_raw.loads()
         )
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign fund transaction
-        for unsigned in self.unsigned_datas():
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Sign fund transaction, each derivation path is derived once
+        self._signatures.extend(sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ))
 
         # Set transaction type
         self._type = "vapor_fund_signed"
         # Encode fund transaction raw
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -444,7 +412,7 @@ class FundSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type,
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -461,7 +429,7 @@ class WithdrawSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign unsigned withdraw transaction raw.
 
@@ -482,13 +450,11 @@ class WithdrawSignature(Signature):
         <swap.providers.vapor.signature.WithdrawSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Vapor unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "vapor_withdraw_unsigned":
             raise TypeError(f"Invalid Vapor withdraw unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using withdraw signature.")
@@ -500,35 +466,25 @@ class WithdrawSignature(Signature):
         # Set transaction, fee, type and network
         self._fee, self._type, self._network, self._transaction = (
             loaded_transaction_raw["fee"], loaded_transaction_raw["type"],
-            loaded_transaction_raw["network"], loaded_transaction_raw
+            loaded_transaction_raw["network"], loaded_transaction_raw.loads()
         )
 
         # Set recipient wallet
         wallet, secret, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas()):
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(bytearray(secret.encode()).hex())
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("00"))
-                signed_data.append(solver.witness(self._network))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        witness: str = solver.witness(self._network)
+        # Sign withdraw transaction, each derivation path is derived once
+        for signed_data in sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append([
+                item for signature in signed_data
+                for item in [bytearray(secret.encode()).hex(), signature, str("00"), witness]
+            ])
 
         # Set transaction type
         self._type = "vapor_withdraw_signed"
         # Encode withdraw transaction raw
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -537,7 +493,7 @@ class WithdrawSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -554,7 +510,7 @@ class RefundSignature(Signature):
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: RefundSolver) -> "RefundSignature":
         """
         Sign unsigned refund transaction raw.
 
@@ -575,13 +531,11 @@ class RefundSignature(Signature):
         <swap.providers.vapor.signature.RefundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Vapor unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if not loaded_transaction_raw["type"] == "vapor_refund_unsigned":
             raise TypeError(f"Invalid Vapor refund unsigned transaction raw type, "
                             f"you can't sign {loaded_transaction_raw['type']} type by using refund signature.")
@@ -593,33 +547,23 @@ class RefundSignature(Signature):
         # Set transaction, fee, type and network
         self._fee, self._type, self._network, self._transaction = (
             loaded_transaction_raw["fee"], loaded_transaction_raw["type"],
-            loaded_transaction_raw["network"], loaded_transaction_raw
+            loaded_transaction_raw["network"], loaded_transaction_raw.loads()
         )
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign refund transaction
-        for index, unsigned in enumerate(self.unsigned_datas()):
-            signed_data = list()
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("01"))
-                signed_data.append(solver.witness(self._network))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        witness: str = solver.witness(self._network)
+        # Sign refund transaction, each derivation path is derived once
+        for signed_data in sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append([
+                item for signature in signed_data for item in [signature, str("01"), witness]
+            ])
 
         # Encode refund transaction raw
         self._type = "vapor_refund_signed"
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._transaction["address"],
             raw=self.raw(),
@@ -628,5 +572,5 @@ class RefundSignature(Signature):
             signatures=self.signatures(),
             network=self._network,
             type=self._type
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
@@ -7,14 +7,11 @@ from pybytom.transaction.actions import (
 from pybytom.wallet.tools import (
     indexes_to_path, get_program, get_address
 )
-from base64 import b64encode
 from typing import (
     Optional, Union, List
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import dumps_transaction_raw
 from ...exceptions import (
     AddressError, BalanceError, NetworkError, UnitError
 )
@@ -24,6 +21,7 @@ from .htlc import HTLC
 from .rpc import (
     get_balance, estimate_transaction_fee, build_transaction, find_p2wsh_utxo, decode_raw, get_transaction
 )
+from .signer import sign_datas
 from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
@@ -365,31 +363,22 @@ class NormalTransaction(Transaction):
 
         # Setting sender wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Signing normal transaction
-        for unsigned in self.unsigned_datas(detail=True):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Signing normal transaction, each derivation path is derived once
+        self._signatures.extend(sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ))
 
         # Set transaction type
         self._type = "vapor_normal_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Vapor normal transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Vapor normal transaction raw.
 
         >>> from swap.providers.vapor.transaction import NormalTransaction
@@ -405,7 +394,7 @@ class NormalTransaction(Transaction):
 
         # Encode normal transaction raw
         if self._type == "vapor_normal_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 fee=self._fee,
                 address=self._address,
                 raw=self.raw(),
@@ -416,8 +405,8 @@ class NormalTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._address,
             raw=self.raw(),
@@ -428,7 +417,7 @@ class NormalTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class FundTransaction(Transaction):
@@ -565,31 +554,22 @@ class FundTransaction(Transaction):
 
         # Setting sender wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Signing fund transaction
-        for unsigned in self.unsigned_datas(detail=True):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        # Signing fund transaction, each derivation path is derived once
+        self._signatures.extend(sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ))
 
         # Set transaction type
         self._type = "vapor_fund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Vapor fund transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Vapor fund transaction raw.
 
         >>> from swap.providers.vapor.htlc import HTLC
@@ -608,7 +588,7 @@ class FundTransaction(Transaction):
 
         # Encode fund transaction raw
         if self._type == "vapor_fund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 fee=self._fee,
                 address=self._address,
                 raw=self.raw(),
@@ -619,8 +599,8 @@ class FundTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type,
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._address,
             raw=self.raw(),
@@ -631,7 +611,7 @@ class FundTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type,
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class WithdrawTransaction(Transaction):
@@ -751,34 +731,27 @@ class WithdrawTransaction(Transaction):
 
         # Set recipient wallet
         wallet, secret, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas(detail=True)):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(bytearray(secret.encode()).hex())
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("00"))
-                signed_data.append(solver.witness(self._network))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        witness: str = solver.witness(self._network)
+        # Sign withdraw transaction, each derivation path is derived once
+        for signed_data in sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append([
+                item for signature in signed_data
+                for item in [bytearray(secret.encode()).hex(), signature, str("00"), witness]
+            ])
 
         # Set transaction type
         self._type = "vapor_withdraw_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Vapor withdraw transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Vapor withdraw transaction raw.
 
         >>> from swap.providers.vapor.transaction import WithdrawTransaction
@@ -794,7 +767,7 @@ class WithdrawTransaction(Transaction):
 
         # Encode withdraw transaction raw
         if self._type == "vapor_withdraw_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 fee=self._fee,
                 address=self._htlc_utxo["address"],
                 raw=self.raw(),
@@ -805,8 +778,8 @@ class WithdrawTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._htlc_utxo["address"],
             raw=self.raw(),
@@ -817,7 +790,7 @@ class WithdrawTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class RefundTransaction(Transaction):
@@ -937,33 +910,26 @@ class RefundTransaction(Transaction):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
-        # Clean derivation indexes/path
-        wallet.clean_derivation()
-        # Sign withdraw transaction
-        for index, unsigned in enumerate(self.unsigned_datas(detail=True)):
-            signed_data = []
-            unsigned_datas = unsigned["datas"]
-            if unsigned["path"]:
-                wallet.from_path(unsigned["path"])
-            elif path:
-                wallet.from_path(path)
-            elif indexes:
-                wallet.from_indexes(indexes)
-            for unsigned_data in unsigned_datas:
-                signed_data.append(wallet.sign(unsigned_data))
-                signed_data.append(str("01"))
-                signed_data.append(solver.witness(self._network))
-            self._signatures.append(signed_data)
-            wallet.clean_derivation()
+        witness: str = solver.witness(self._network)
+        # Sign withdraw transaction, each derivation path is derived once
+        for signed_data in sign_datas(
+            xprivate_key=wallet.xprivate_key(), unsigned_datas=self.unsigned_datas(), path=path, indexes=indexes
+        ):
+            self._signatures.append([
+                item for signature in signed_data for item in [signature, str("01"), witness]
+            ])
 
         # Set transaction type
         self._type = "vapor_refund_signed"
         return self
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get Vapor refund transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- Vapor refund transaction raw.
 
         >>> from swap.providers.vapor.transaction import RefundTransaction
@@ -979,7 +945,7 @@ class RefundTransaction(Transaction):
 
         # Encode refund transaction raw
         if self._type == "vapor_refund_signed":
-            return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            return dumps_transaction_raw(transaction_raw=dict(
                 fee=self._fee,
                 address=self._htlc_utxo["address"],
                 raw=self.raw(),
@@ -990,8 +956,8 @@ class RefundTransaction(Transaction):
                 signatures=self.signatures(),
                 network=self._network,
                 type=self._type
-            ))).encode()).decode())
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+            ), compact=compact)
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             address=self._htlc_utxo["address"],
             hash=self.hash(),
@@ -1002,4 +968,4 @@ class RefundTransaction(Transaction):
             signatures=[],
             network=self._network,
             type=self._type
-        ))).encode()).decode())
+        ), compact=compact)
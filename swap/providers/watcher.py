@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional, Any, Callable, Dict, List, Tuple, AsyncIterator
+)
+
+import threading
+import asyncio
+import copy
+import time
+import abc
+
+from .config import watcher as config
+
+# HTLC event kinds
+FUND: str = "fund"
+WITHDRAW: str = "withdraw"
+REFUND: str = "refund"
+
+
+class Event:
+    """
+    HTLC watcher event.
+
+    :param kind: Event kind, ``fund``, ``withdraw`` or ``refund``.
+    :type kind: str
+    :param htlc: Watched HTLC address (Bitcoin, Bytom and Vapor) or contract address (Ethereum and XinFin).
+    :type htlc: str
+    :param transaction_hash: Transaction hash/id which emitted the event.
+    :type transaction_hash: str
+    :param network: Network of the HTLC.
+    :type network: str
+    :param block_height: Block height of the transaction, defaults to ``None`` (unconfirmed).
+    :type block_height: int
+    :param data: Chain specific event details, defaults to ``None``.
+    :type data: dict
+
+    :returns: Event -- HTLC watcher event instance.
+
+    >>> from swap.providers.watcher import Event
+    >>> Event(kind="fund", htlc="2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK", transaction_hash="a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31", network="testnet")
+    Event(kind='fund', htlc='2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK', transaction_hash='a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31')
+    """
+
+    def __init__(self, kind: str, htlc: str, transaction_hash: str, network: str,
+                 block_height: Optional[int] = None, data: Optional[dict] = None):
+
+        if kind not in [FUND, WITHDRAW, REFUND]:
+            raise ValueError(f"Invalid HTLC '{kind}' event kind, choose only 'fund', 'withdraw' or 'refund' kinds.")
+
+        self.kind: str = kind
+        self.htlc: str = htlc
+        self.transaction_hash: str = transaction_hash
+        self.network: str = network
+        self.block_height: Optional[int] = block_height
+        self.data: dict = data if data else {}
+
+    def key(self) -> Tuple[str, str, str, Any]:
+        # Several events of one transaction are told apart by the locked contract id or output
+        return self.kind, self.htlc, self.transaction_hash, self.data.get("id")
+
+    def json(self) -> dict:
+        return dict(
+            kind=self.kind, htlc=self.htlc, transaction_hash=self.transaction_hash,
+            network=self.network, block_height=self.block_height, data=self.data
+        )
+
+    def __repr__(self) -> str:
+        return f"Event(kind={self.kind!r}, htlc={self.htlc!r}, transaction_hash={self.transaction_hash!r})"
+
+
+class Watcher(abc.ABC):
+    """
+    HTLC watcher base, tracks many HTLCs at once with adaptive batched polling.
+
+    :param network: Network of the watched HTLCs.
+    :type network: str
+    :param confirmations: Confirmations needed before an event is emitted, defaults to ``0``.
+    :type confirmations: int
+    :param interval: Seconds between polls while events keep coming, defaults to ``5``.
+    :type interval: float
+    :param max_interval: Idle polls back off up to this many seconds, defaults to ``60``.
+    :type max_interval: float
+
+    :returns: Watcher -- HTLC watcher instance.
+
+    .. note::
+        Every event is emitted once, to the ``on`` callbacks and to the ``events`` async iterator.
+    """
+
+    def __init__(self, network: str, confirmations: int = 0, interval: float = config["interval"],
+                 max_interval: float = config["max_interval"]):
+
+        if interval <= 0 or max_interval < interval:
+            raise ValueError("Invalid watcher interval, must be positive and not above max interval.")
+
+        self._network: str = network
+        self._confirmations: int = confirmations
+        self._interval: float = interval
+        self._max_interval: float = max_interval
+
+        self._watched: Dict[str, dict] = {}
+        self._callbacks: List[Tuple[Callable[[Event], None], Optional[str]]] = []
+        self._seen: set = set()
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+
+    def _watch(self, htlc: str, **options) -> "Watcher":
+        with self._lock:
+            self._watched.setdefault(htlc, {}).update(options)
+        return self
+
+    def unwatch(self, htlc: str) -> "Watcher":
+        """
+        Stop watching HTLC.
+
+        :param htlc: HTLC address or contract address.
+        :type htlc: str
+
+        :returns: Watcher -- HTLC watcher instance.
+        """
+
+        with self._lock:
+            self._watched.pop(htlc, None)
+            self._seen = {key for key in self._seen if key[1] != htlc}
+        return self
+
+    def watching(self) -> List[str]:
+        """
+        Get watched HTLCs.
+
+        :returns: list -- HTLC addresses or contract addresses.
+        """
+
+        with self._lock:
+            return list(self._watched)
+
+    def on(self, callback: Callable[[Event], None], kind: Optional[str] = None) -> "Watcher":
+        """
+        Register event callback.
+
+        :param callback: Called with every new event.
+        :type callback: callable
+        :param kind: Event kind filter, defaults to ``None`` (all kinds).
+        :type kind: str
+
+        :returns: Watcher -- HTLC watcher instance.
+        """
+
+        self._callbacks.append((callback, kind))
+        return self
+
+    def _watched_copy(self) -> Dict[str, dict]:
+        with self._lock:
+            return copy.deepcopy(self._watched)
+
+    @abc.abstractmethod
+    def _poll(self, watched: Dict[str, dict]) -> List[Event]:
+        """
+        Poll watched HTLCs once, every provider watcher implements it with its batched requests.
+
+        :param watched: Copy of the watched HTLCs and their options.
+        :type watched: dict
+
+        :returns: list -- Events found, seen ones included.
+        """
+
+    def _dispatch(self, events: List[Event]) -> List[Event]:
+        new_events: List[Event] = []
+        with self._lock:
+            for event in events:
+                if event.htlc in self._watched and event.key() not in self._seen:
+                    self._seen.add(event.key())
+                    new_events.append(event)
+        for event in new_events:
+            for callback, kind in self._callbacks:
+                if kind is None or kind == event.kind:
+                    callback(event)
+        return new_events
+
+    def poll(self) -> List[Event]:
+        """
+        Poll every watched HTLC once, in batches.
+
+        :returns: list -- New events.
+        """
+
+        watched: Dict[str, dict] = self._watched_copy()
+        if not watched:
+            return []
+        return self._dispatch(self._poll(watched))
+
+    def _next_interval(self, interval: float, found: bool) -> float:
+        # Poll fast while swaps are moving and back off while idle
+        return self._interval if found else min(interval * 2, self._max_interval)
+
+    def run(self, timeout: Optional[float] = None) -> None:
+        """
+        Poll watched HTLCs until stopped, emitting events to the callbacks.
+
+        :param timeout: Seconds to run, defaults to ``None`` (until stopped).
+        :type timeout: float
+        """
+
+        self._stopped.clear()
+        deadline: Optional[float] = None if timeout is None else time.time() + timeout
+        interval: float = self._interval
+        while not self._stopped.is_set():
+            interval = self._next_interval(interval, bool(self.poll()))
+            if deadline is not None:
+                if time.time() >= deadline:
+                    break
+                interval = min(interval, deadline - time.time())
+            self._stopped.wait(interval)
+
+    def stop(self) -> None:
+        """
+        Stop ``run`` and ``events``.
+        """
+
+        self._stopped.set()
+
+    async def events(self) -> AsyncIterator[Event]:
+        """
+        Iterate new events asynchronously until stopped.
+
+        :returns: async generator -- HTLC watcher events.
+        """
+
+        self._stopped.clear()
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        interval: float = self._interval
+        while not self._stopped.is_set():
+            events: List[Event] = await loop.run_in_executor(None, self.poll)
+            for event in events:
+                yield event
+            interval = self._next_interval(interval, bool(events))
+            await asyncio.sleep(interval)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+
+from web3 import Web3
+from web3.types import Wei
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from hexbytes.main import HexBytes
+from typing import (
+    Optional, Any
+)
+
+import web3 as _web3
+import json
+
+from ...exceptions import (
+    AddressError, NetworkError, APIError
+)
+from ..aio import (
+    get_session, run_sync
+)
+from ..cache import cached
+from ..config import xinfin as config
+from ..ethereum.nonce import NonceManager
+from .utils import (
+    is_network, is_address, to_checksum_address
+)
+from . import transaction
+
+
+async def _request(method: str, params: list, network: str = config["network"],
+                   headers: dict = config["headers"], timeout: int = config["timeout"]) -> Any:
+
+    # Check parameter instances
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid XinFin '{network}' network",
+                           "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+
+    response = await get_session().post(
+        url=config[network]["http"], data=json.dumps(dict(jsonrpc="2.0", method=method, params=params, id=0)),
+        headers=headers, timeout=timeout
+    )
+    if response.status_code != 200:
+        raise APIError(response.status_code, response.content)
+    response_json: dict = response.json()
+    if "error" in response_json:
+        raise APIError(response_json["error"].get("message"), response_json["error"].get("code"))
+    return response_json["result"]
+
+
+@cached(policy="balance")
+async def get_balance(address: str, network: str = config["network"], headers: dict = config["headers"],
+                      timeout: int = config["timeout"]) -> Wei:
+    """
+    Get XinFin balance.
+
+    :param address: XinFin address.
+    :type address: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: Wei -- XinFin balance (Wei).
+
+    >>> from swap.providers.xinfin.aio import get_balance
+    >>> await get_balance("xdc70c1eb09363603a3b6391deb2daa6d2561a62f52", "mainnet")
+    71560900
+    """
+
+    # Check parameter instances
+    if not is_address(address=address):
+        raise AddressError(f"Invalid XinFin '{address}' address.")
+
+    balance: str = await _request(
+        "eth_getBalance", [to_checksum_address(address=address, prefix="0x"), "latest"],
+        network=network, headers=headers, timeout=timeout
+    )
+    return Wei(int(balance, 16))
+
+
+async def get_transaction(transaction_hash: str, network: str = config["network"],
+                          headers: dict = config["headers"], timeout: int = config["timeout"]) -> dict:
+    """
+    Get XinFin transaction detail.
+
+    :param transaction_hash: XinFin transaction hash/id.
+    :type transaction_hash: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- XinFin transaction detail.
+
+    >>> from swap.providers.xinfin.aio import get_transaction
+    >>> await get_transaction(transaction_hash="0xa4d57071427e3310b3e2fb16e7712f8d8aaaafb31ce5fcd6534fc50848905948")
+    {'hash': '0xa4d57071427e3310b3e2fb16e7712f8d8aaaafb31ce5fcd6534fc50848905948', 'nonce': 0, 'blockHash': '0xb33a804ae10713bf549db8ec749f7d650347613ac784db1a8d17e0cb03741bf0', 'blockNumber': 1, ...}
+    """
+
+    transaction_detail: Optional[dict] = await _request(
+        "eth_getTransactionByHash", [HexBytes(transaction_hash).hex()],
+        network=network, headers=headers, timeout=timeout
+    )
+    if transaction_detail is None:
+        raise _web3.exceptions.TransactionNotFound(f"Transaction with hash: '{transaction_hash}' not found.")
+    transaction_detail_dict: dict = dict(PYTHONIC_RESULT_FORMATTERS["eth_getTransactionByHash"](transaction_detail))
+    for key, value in transaction_detail_dict.items():
+        if isinstance(value, HexBytes):
+            transaction_detail_dict[key] = transaction_detail_dict[key].hex()
+    return transaction_detail_dict
+
+
+async def get_transaction_receipt(transaction_hash: str, network: str = config["network"],
+                                  headers: dict = config["headers"], timeout: int = config["timeout"]) -> Optional[dict]:
+    """
+    Get XinFin transaction receipt.
+
+    :param transaction_hash: XinFin transaction hash/id.
+    :type transaction_hash: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+
+    :returns: dict -- XinFin transaction receipt.
+
+    >>> from swap.providers.xinfin.aio import get_transaction_receipt
+    >>> await get_transaction_receipt(transaction_hash="0x5f4b11c11553cf040131b273c2bbc8c93d217269dd9b28393d5d0a3d623c1fcc", network="testnet")
+    {'blockHash': '0x08d711ba038b97d0622d2c08b74dd2d9d2d00492116ead11452c12688618dcbc', 'blockNumber': '0x1e93914', 'contractAddress': None, 'cumulativeGasUsed': '0x5208', ...}
+    """
+
+    return await _request(
+        "eth_getTransactionReceipt", [HexBytes(transaction_hash).hex()],
+        network=network, headers=headers, timeout=timeout
+    )
+
+
+async def submit_raw(raw: str, network: str = config["network"], headers: dict = config["headers"],
+                     timeout: int = config["timeout"], nonce_manager: Optional[NonceManager] = None) -> str:
+    """
+    Submit original XinFin raw into blockchain.
+
+    :param raw: XinFin transaction raw.
+    :type raw: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+    :param nonce_manager: Nonce manager to reset when the node rejects the transaction, defaults to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
+
+    :returns: str -- XinFin submitted transaction hash/id.
+
+    >>> from swap.providers.xinfin.aio import submit_raw
+    >>> await submit_raw(raw="0xf86c02840ee6b280825208943e0a9b2ee8f8341a1aead3e7531d75f1e395f24b8901236efcbcbb340000801ba03084982e4a9dd897d3cc1b2c8cc2d1b106b9d302eb23f6fae7d0e57e53e043f8a0116f13f9ab385f6b53e7821b3335ced924a1ceb88303347cd0af4aa75e6bfb73", network="testnet")
+    "0x04b3bfb804f2b3329555c6f3a17a794b3f099b6435a9cf58c78609ed93853907"
+    """
+
+    try:
+        transaction_hash: str = await _request(
+            "eth_sendRawTransaction", [HexBytes(raw).hex()], network=network, headers=headers, timeout=timeout
+        )
+    except Exception:
+        if nonce_manager:
+            nonce_manager.reset(address=Web3().eth.account.recover_transaction(raw))
+        raise
+    return HexBytes(transaction_hash).hex()
+
+
+class NormalTransaction(transaction.NormalTransaction):
+    """
+    XinFin asynchronous normal transaction, takes the same arguments as
+    :class:`swap.providers.xinfin.transaction.NormalTransaction`.
+
+    :returns: NormalTransaction -- XinFin asynchronous normal transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "NormalTransaction":
+        """
+        Build XinFin normal transaction, takes the same arguments as
+        :meth:`swap.providers.xinfin.transaction.NormalTransaction.build_transaction`.
+
+        >>> from swap.providers.xinfin.aio import NormalTransaction
+        >>> normal_transaction: NormalTransaction = NormalTransaction(network="testnet")
+        >>> await normal_transaction.build_transaction(address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", recipient={"xdcf8D43806260CFc6cC79fB408BA1897054667F81C": 100_000_000})
+        <swap.providers.xinfin.aio.NormalTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class FundTransaction(transaction.FundTransaction):
+    """
+    XinFin asynchronous fund transaction, takes the same arguments as
+    :class:`swap.providers.xinfin.transaction.FundTransaction`.
+
+    :returns: FundTransaction -- XinFin asynchronous fund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "FundTransaction":
+        """
+        Build XinFin fund transaction, takes the same arguments as
+        :meth:`swap.providers.xinfin.transaction.FundTransaction.build_transaction`.
+
+        >>> from swap.providers.xinfin.htlc import HTLC
+        >>> from swap.providers.xinfin.aio import FundTransaction
+        >>> from swap.utils import sha256, get_current_timestamp
+        >>> htlc: HTLC = HTLC(contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7", network="testnet")
+        >>> htlc.build_htlc(secret_hash=sha256("Hello Meheret!"), recipient_address="xdcf8D43806260CFc6cC79fB408BA1897054667F81C", sender_address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", endtime=get_current_timestamp(plus=3600))
+        >>> fund_transaction: FundTransaction = FundTransaction(network="testnet")
+        >>> await fund_transaction.build_transaction(address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", htlc=htlc, amount=3, unit="XDC")
+        <swap.providers.xinfin.aio.FundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class WithdrawTransaction(transaction.WithdrawTransaction):
+    """
+    XinFin asynchronous withdraw transaction, takes the same arguments as
+    :class:`swap.providers.xinfin.transaction.WithdrawTransaction`.
+
+    :returns: WithdrawTransaction -- XinFin asynchronous withdraw transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "WithdrawTransaction":
+        """
+        Build XinFin withdraw transaction, takes the same arguments as
+        :meth:`swap.providers.xinfin.transaction.WithdrawTransaction.build_transaction`.
+
+        >>> from swap.providers.xinfin.aio import WithdrawTransaction
+        >>> withdraw_transaction: WithdrawTransaction = WithdrawTransaction(network="testnet")
+        >>> await withdraw_transaction.build_transaction(transaction_hash="0x0d4c93546aa3e5e476455931a63f1a97a2624e3b516e3fd8e3a582cb20aaeef9", secret_key="Hello Meheret!", address="xdcf8D43806260CFc6cC79fB408BA1897054667F81C", contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7")
+        <swap.providers.xinfin.aio.WithdrawTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
+
+
+class RefundTransaction(transaction.RefundTransaction):
+    """
+    XinFin asynchronous refund transaction, takes the same arguments as
+    :class:`swap.providers.xinfin.transaction.RefundTransaction`.
+
+    :returns: RefundTransaction -- XinFin asynchronous refund transaction instance.
+    """
+
+    async def build_transaction(self, *args, **kwargs) -> "RefundTransaction":
+        """
+        Build XinFin refund transaction, takes the same arguments as
+        :meth:`swap.providers.xinfin.transaction.RefundTransaction.build_transaction`.
+
+        >>> from swap.providers.xinfin.aio import RefundTransaction
+        >>> refund_transaction: RefundTransaction = RefundTransaction(network="testnet")
+        >>> await refund_transaction.build_transaction(transaction_hash="0x0d4c93546aa3e5e476455931a63f1a97a2624e3b516e3fd8e3a582cb20aaeef9", address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7")
+        <swap.providers.xinfin.aio.RefundTransaction object at 0x0409DAF0>
+        """
+
+        return await run_sync(super().build_transaction, *args, **kwargs)
@@ -4,7 +4,6 @@ from eth_account.datastructures import SignedTransaction
 from web3.contract import (
     ContractConstructor, Contract
 )
-from semantic_version.base import Version
 from datetime import datetime
 from typing import (
     Optional, Type, Union, Tuple
@@ -13,14 +12,13 @@ from web3.types import (
     Wei, ChecksumAddress
 )
 
-import json
-import sys
-import os
-
 from ...exceptions import (
     AddressError, NetworkError, TransactionError, UnitError
 )
 from ..config import xinfin as config
+from ..artifacts import (
+    load_artifact, compile_artifact
+)
 from .rpc import (
     get_web3, get_balance, get_xrc20_balance
 )
@@ -78,33 +76,22 @@ class HTLC:
             network=network, provider=provider
         )
 
-        # Get current working directory path (like linux or unix path).
-        cwd: str = os.path.dirname(sys.modules[__package__].__file__)
         sol_source_name: str = "htlc-xrc20.sol" if self._xrc20 else "htlc.sol"
         sol_source_with_class_name: str = "htlc-xrc20.sol:HTLC_XRC20" if self._xrc20 else "htlc.sol:HTLC"
         json_source_name: str = "htlc-xrc20.json" if self._xrc20 else "htlc.json"
 
-        if use_script:
-            solcx = __import__("solcx")
-            compiled_files: dict = solcx.compile_files(
-                source_files=[f"{cwd}/contracts/{sol_source_name}"],
-                output_values=["abi", "bin", "bin-runtime", "opcodes"],
-                solc_version=Version("0.8.10")
-            )
+        # Artifacts are loaded (or compiled) once per process and shared between HTLC instances
+        compiled_file: dict = compile_artifact(
+            package=__package__, sol_source_name=sol_source_name,
+            sol_source_with_class_name=sol_source_with_class_name, solc_version=config["solc_version"]
+        ) if use_script else load_artifact(
+            package=__package__, json_source_name=json_source_name, sol_source_with_class_name=sol_source_with_class_name
+        )
 
-            self._abi: list = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["abi"]
-            self._bytecode: str = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["bin"]
-            self._bytecode_runtime: str = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["bin-runtime"]
-            self._opcodes: str = compiled_files[f"{cwd}/contracts/{sol_source_with_class_name}"]["opcodes"]
-        else:
-            with open(f"{cwd}/contracts/{json_source_name}", "r") as htlc_json_file:
-                compiled_file: dict = json.loads(htlc_json_file.read())[sol_source_with_class_name]
-                htlc_json_file.close()
-
-            self._abi: list = compiled_file["abi"]
-            self._bytecode: str = compiled_file["bin"]
-            self._bytecode_runtime: str = compiled_file["bin-runtime"]
-            self._opcodes: str = compiled_file["opcodes"]
+        self._abi: list = compiled_file["abi"]
+        self._bytecode: str = compiled_file["bin"]
+        self._bytecode_runtime: str = compiled_file["bin-runtime"]
+        self._opcodes: str = compiled_file["opcodes"]
 
         self._fee: Optional[Wei] = None
         self._unsigned_transaction: Optional[dict] = None
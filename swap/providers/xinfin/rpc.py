@@ -11,19 +11,22 @@ from pyxdc.utils import decode_transaction_raw as dtr
 from hexbytes.main import HexBytes
 from eth_typing import URI
 from typing import (
-    Optional, Tuple
+    Optional, Tuple, List, Any, Union
 )
 
 import web3 as _web3
-import requests
 import json
-import sys
-import os
 
 from ...exceptions import (
     AddressError, NetworkError, APIError
 )
+from ..cache import cached
 from ..config import xinfin as config
+from ..artifacts import (
+    load_artifact, get_contract
+)
+from ..session import session
+from ..ethereum.nonce import NonceManager
 from .utils import (
     is_network, is_address, to_checksum_address
 )
@@ -70,6 +73,7 @@ def get_web3(network: str = config["network"], provider: str = config["provider"
                          "choose only 'http' or 'websocket' providers.")
 
 
+@cached(policy="balance")
 def get_balance(address: str, network: str = config["network"], provider: str = config["provider"]) -> Wei:
     """
     Get XinFin balance.
@@ -126,18 +130,15 @@ def get_xrc20_balance(address: str, token_address: str, network: str = config["n
     elif not is_address(address=token_address):
         raise AddressError(f"Invalid XinFin XRC20 token '{token_address}' address.")
 
-    # Get current working directory path (like linux or unix path).
-    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-    with open(f"{cwd}/contracts/libs/xrc20.json", "r") as xrc20_json_file:
-        xrc20_contract_data: dict = json.loads(xrc20_json_file.read())["xrc20.sol:XRC20"]
-        xrc20_json_file.close()
+    xrc20_contract_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
+    )
 
     web3: Web3 = get_web3(network=network, provider=provider)
-    xrc20_token: Contract = web3.eth.contract(
-        address=to_checksum_address(
+    xrc20_token: Contract = get_contract(
+        web3=web3, abi=xrc20_contract_data["abi"], address=to_checksum_address(
             address=token_address, prefix="0x"
-        ),
-        abi=xrc20_contract_data["abi"]
+        )
     )
     try:
         name:   str = xrc20_token.functions.name().call()
@@ -152,6 +153,7 @@ def get_xrc20_balance(address: str, token_address: str, network: str = config["n
         return 0, "", "", 0, ".0"
 
 
+@cached(policy="decimals")
 def get_xrc20_decimals(token_address: str, network: str = config["network"], provider: str = config["provider"]) -> int:
     """
     Get XinFin XRC20 token decimals.
@@ -174,18 +176,15 @@ def get_xrc20_decimals(token_address: str, network: str = config["network"], pro
     if not is_address(address=token_address):
         raise AddressError(f"Invalid XinFin XRC20 token '{token_address}' address.")
 
-    # Get current working directory path (like linux or unix path).
-    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-    with open(f"{cwd}/contracts/libs/xrc20.json", "r") as xrc20_json_file:
-        xrc20_contract_data: dict = json.loads(xrc20_json_file.read())["xrc20.sol:XRC20"]
-        xrc20_json_file.close()
+    xrc20_contract_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
+    )
 
     web3: Web3 = get_web3(network=network, provider=provider)
-    xrc20_token: Contract = web3.eth.contract(
-        address=to_checksum_address(
+    xrc20_token: Contract = get_contract(
+        web3=web3, abi=xrc20_contract_data["abi"], address=to_checksum_address(
             address=token_address, prefix="0x"
-        ),
-        abi=xrc20_contract_data["abi"]
+        )
     )
     decimals: int = xrc20_token.functions.decimals().call()
     return decimals
@@ -246,7 +245,7 @@ def get_transaction_receipt(transaction_hash: str, network: str = config["networ
         data = dict(
             jsonrpc="2.0", method="eth_getTransactionReceipt", params=[transaction_hash], id=1
         )
-        response = requests.post(
+        response = session.post(
             url=url, data=json.dumps(data), headers=headers, timeout=timeout
         )
         if response.status_code == 200:
@@ -317,7 +316,8 @@ def decode_raw(raw: str) -> dict:
     return dtr(transaction_raw=raw)
 
 
-def submit_raw(raw: str, network: str = config["network"], provider: str = config["provider"]) -> str:
+def submit_raw(raw: str, network: str = config["network"], provider: str = config["provider"],
+               nonce_manager: Optional[NonceManager] = None) -> str:
     """
     Submit original XinFin raw into blockchain.
 
@@ -327,6 +327,8 @@ def submit_raw(raw: str, network: str = config["network"], provider: str = confi
     :type network: str
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Nonce manager to give back the nonce of a rejected transaction, defaults to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: str -- XinFin submitted transaction hash/id.
 
@@ -336,5 +338,225 @@ def submit_raw(raw: str, network: str = config["network"], provider: str = confi
     """
 
     web3: Web3 = get_web3(network=network, provider=provider)
-    transaction_hash: HexBytes = web3.eth.send_raw_transaction(raw)
+    # Sender and nonce are read before submitting, the submit error is never hidden by decoding
+    transaction: Optional[dict] = decode_raw(raw=raw) if nonce_manager else None
+    try:
+        transaction_hash: HexBytes = web3.eth.send_raw_transaction(raw)
+    except Exception:
+        if nonce_manager:
+            # Only the rejected nonce is given back, the other in-flight nonces of the sender stay allocated
+            nonce_manager.release(
+                address=to_checksum_address(address=transaction["from"], prefix="0x"), nonce=transaction["nonce"]
+            )
+        raise
     return transaction_hash.hex()
+
+
+def _batch_request(calls: List[Tuple[str, list]], network: str = config["network"],
+                   headers: dict = config["headers"], timeout: int = config["timeout"],
+                   batch_size: int = config["batch_size"]) -> List[Union[Any, APIError]]:
+
+    # Check parameter instances
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid XinFin '{network}' network",
+                           "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+
+    results: List[Union[Any, APIError]] = []
+    for start in range(0, len(calls), batch_size):
+        chunk: List[Tuple[str, list]] = calls[start:start + batch_size]
+        data: list = [
+            dict(jsonrpc="2.0", method=method, params=params, id=index)
+            for index, (method, params) in enumerate(chunk)
+        ]
+        response = session.post(
+            url=config[network]["http"], data=json.dumps(data), headers=headers, timeout=timeout
+        )
+        if response.status_code != 200:
+            raise APIError(response.status_code, response.content)
+        response_json: Union[list, dict] = response.json()
+        if not isinstance(response_json, list):
+            raise APIError(response_json["error"]["message"], response_json["error"]["code"]) \
+                if "error" in response_json else APIError("Invalid XinFin batch response.")
+        responses: dict = {item["id"]: item for item in response_json if "id" in item}
+        for index, (method, params) in enumerate(chunk):
+            if index not in responses:
+                results.append(APIError(f"No XinFin '{method}' response for batch item {start + index}."))
+            elif "error" in responses[index]:
+                results.append(APIError(
+                    responses[index]["error"].get("message"), responses[index]["error"].get("code")
+                ))
+            else:
+                results.append(responses[index]["result"])
+    return results
+
+
+def get_balances(addresses: List[str], network: str = config["network"], headers: dict = config["headers"],
+                 timeout: int = config["timeout"], batch_size: int = config["batch_size"]) -> List[Union[Wei, APIError]]:
+    """
+    Get XinFin balances in JSON-RPC batches.
+
+    :param addresses: XinFin addresses.
+    :type addresses: list
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- XinFin balances (Wei) or APIError per address.
+
+    >>> from swap.providers.xinfin.rpc import get_balances
+    >>> get_balances(addresses=["xdc70c1eb09363603a3b6391deb2daa6d2561a62f52", "xdc2224caa2235df8da3d2016d2ab1137d2d548a232"], network="mainnet")
+    [71560900, 0]
+    """
+
+    # Check parameter instances
+    for address in addresses:
+        if not is_address(address=address):
+            raise AddressError(f"Invalid XinFin '{address}' address.")
+
+    balances: list = _batch_request(calls=[
+        ("eth_getBalance", [to_checksum_address(address=address, prefix="0x"), "latest"]) for address in addresses
+    ], network=network, headers=headers, timeout=timeout, batch_size=batch_size)
+    return [
+        balance if isinstance(balance, APIError) else Wei(int(balance, 16)) for balance in balances
+    ]
+
+
+def get_xrc20_balances(addresses: List[str], token_address: str, network: str = config["network"],
+                       headers: dict = config["headers"], timeout: int = config["timeout"],
+                       batch_size: int = config["batch_size"]) -> List[Union[Tuple[int, str, str, int, str], APIError]]:
+    """
+    Get XinFin XRC20 token balances in JSON-RPC batches.
+
+    :param addresses: XinFin addresses.
+    :type addresses: list
+    :param token_address: XinFin XRC20 token address.
+    :type token_address: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- XinFin XRC20 token balance and decimals or APIError per address.
+
+    >>> from swap.providers.xinfin.rpc import get_xrc20_balances
+    >>> get_xrc20_balances(addresses=["xdc70c1eb09363603a3b6391deb2daa6d2561a62f52"], token_address="xdcDaB6844e863bdfEE6AaFf888D2D34Bf1B7c37861", network="testnet")
+    [(99999999999999999999999999998, 'XinFin XRC20', 'XRC20', 18, '99999999999.999999999999999998')]
+    """
+
+    # Check parameter instances
+    for address in addresses:
+        if not is_address(address=address):
+            raise AddressError(f"Invalid XinFin '{address}' address.")
+    if not is_address(address=token_address):
+        raise AddressError(f"Invalid XinFin XRC20 token '{token_address}' address.")
+
+    xrc20_contract_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
+    )
+
+    web3: Web3 = Web3()
+    xrc20_token: Contract = web3.eth.contract(
+        address=to_checksum_address(
+            address=token_address, prefix="0x"
+        ),
+        abi=xrc20_contract_data["abi"]
+    )
+
+    def _call(data: str) -> Tuple[str, list]:
+        return "eth_call", [dict(to=xrc20_token.address, data=data), "latest"]
+
+    results: list = _batch_request(calls=[
+        _call(xrc20_token.encodeABI(fn_name="name")),
+        _call(xrc20_token.encodeABI(fn_name="symbol")),
+        _call(xrc20_token.encodeABI(fn_name="decimals"))
+    ] + [
+        _call(xrc20_token.encodeABI(fn_name="balanceOf", args=[to_checksum_address(address=address, prefix="0x")]))
+        for address in addresses
+    ], network=network, headers=headers, timeout=timeout, batch_size=batch_size)
+
+    (name, symbol, decimals), balances = results[:3], results[3:]
+    for result in (name, symbol, decimals):
+        if isinstance(result, APIError):
+            return [result for _ in addresses]
+    if not HexBytes(decimals):
+        return [(0, "", "", 0, ".0") for _ in addresses]
+
+    name: str = web3.codec.decode_single("string", HexBytes(name))
+    symbol: str = web3.codec.decode_single("string", HexBytes(symbol))
+    decimals: int = web3.codec.decode_single("uint8", HexBytes(decimals))
+    xrc20_balances: list = []
+    for balance in balances:
+        if isinstance(balance, APIError):
+            xrc20_balances.append(balance)
+            continue
+        balance: int = web3.codec.decode_single("uint256", HexBytes(balance))
+        balance_str: str = str(balance)[:-decimals] + "." + str(balance)[-decimals:]
+        xrc20_balances.append((balance, name, symbol, decimals, balance_str))
+    return xrc20_balances
+
+
+def get_transactions(transaction_hashes: List[str], network: str = config["network"], headers: dict = config["headers"],
+                     timeout: int = config["timeout"], batch_size: int = config["batch_size"]) \
+        -> List[Union[Optional[dict], APIError]]:
+    """
+    Get XinFin transaction details in JSON-RPC batches.
+
+    :param transaction_hashes: XinFin transaction hashes/ids.
+    :type transaction_hashes: list
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- XinFin transaction detail, None (not found) or APIError per hash.
+
+    >>> from swap.providers.xinfin.rpc import get_transactions
+    >>> get_transactions(transaction_hashes=["0x5f4b11c11553cf040131b273c2bbc8c93d217269dd9b28393d5d0a3d623c1fcc"], network="mainnet")
+    [{'blockHash': '0x08d711ba038b97d0622d2c08b74dd2d9d2d00492116ead11452c12688618dcbc', 'blockNumber': '0x1e93914', 'from': 'xdc95e80fc8ef98b92fe71514168c2e4b8f0ce38169', ...}]
+    """
+
+    return _batch_request(calls=[
+        ("eth_getTransactionByHash", [HexBytes(transaction_hash).hex()]) for transaction_hash in transaction_hashes
+    ], network=network, headers=headers, timeout=timeout, batch_size=batch_size)
+
+
+def get_transaction_receipts(transaction_hashes: List[str], network: str = config["network"],
+                             headers: dict = config["headers"], timeout: int = config["timeout"],
+                             batch_size: int = config["batch_size"]) -> List[Union[Optional[dict], APIError]]:
+    """
+    Get XinFin transaction receipts in JSON-RPC batches.
+
+    :param transaction_hashes: XinFin transaction hashes/ids.
+    :type transaction_hashes: list
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+    :param batch_size: Calls per JSON-RPC batch request, defaults to ``100``.
+    :type batch_size: int
+
+    :returns: list -- XinFin transaction receipt, None (not found) or APIError per hash.
+
+    >>> from swap.providers.xinfin.rpc import get_transaction_receipts
+    >>> get_transaction_receipts(transaction_hashes=["0x5f4b11c11553cf040131b273c2bbc8c93d217269dd9b28393d5d0a3d623c1fcc"], network="mainnet")
+    [{'blockHash': '0x08d711ba038b97d0622d2c08b74dd2d9d2d00492116ead11452c12688618dcbc', 'blockNumber': '0x1e93914', 'contractAddress': None, 'cumulativeGasUsed': '0x5208', ...}]
+    """
+
+    return _batch_request(calls=[
+        ("eth_getTransactionReceipt", [HexBytes(transaction_hash).hex()]) for transaction_hash in transaction_hashes
+    ], network=network, headers=headers, timeout=timeout, batch_size=batch_size)
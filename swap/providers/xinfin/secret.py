@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+from web3 import Web3
+from eth_abi import decode_abi
+from eth_abi.exceptions import DecodingError
+from eth_utils import (
+    event_abi_to_log_topic, function_abi_to_4byte_selector
+)
+from hexbytes.main import HexBytes
+from typing import (
+    Optional, Dict, List, Tuple
+)
+
+from ...exceptions import (
+    AddressError, APIError, NetworkError
+)
+from ...utils import sha256
+from ..config import (
+    xinfin as config, watcher as watcher_config
+)
+from ..artifacts import load_artifact
+from .rpc import (
+    get_web3, get_transaction, get_transactions
+)
+from .utils import (
+    is_network, is_address, to_checksum_address
+)
+
+
+def _load_withdraw() -> Tuple[Dict[bytes, dict], List[str]]:
+    functions, topics = {}, []
+    for json_source_name, sol_source_with_class_name in [
+        ("htlc.json", "htlc.sol:HTLC"), ("htlc-xrc20.json", "htlc-xrc20.sol:HTLC_XRC20")
+    ]:
+        abi: list = load_artifact(
+            package=__package__, json_source_name=json_source_name, sol_source_with_class_name=sol_source_with_class_name
+        )["abi"]
+        for _abi in abi:
+            if _abi["type"] == "function" and _abi["name"] == "withdraw":
+                functions[function_abi_to_4byte_selector(_abi)] = _abi
+            elif _abi["type"] == "event" and _abi["name"] == "log_withdraw":
+                topic: str = HexBytes(event_abi_to_log_topic(_abi)).hex()
+                if topic not in topics:
+                    topics.append(topic)
+    return functions, topics
+
+
+# HTLC withdraw function selectors and log_withdraw topics
+WITHDRAW_FUNCTIONS, WITHDRAW_TOPICS = _load_withdraw()
+
+
+def _input_secret(data: Optional[str]) -> Optional[str]:
+    data: bytes = bytes(HexBytes(data or "0x"))
+    function_abi: Optional[dict] = WITHDRAW_FUNCTIONS.get(data[:4])
+    if function_abi is None:
+        return None
+    try:
+        # HTLC withdraw(bytes32 _locked_contract_id, string _preimage) call
+        _, preimage = decode_abi([_input["type"] for _input in function_abi["inputs"]], data[4:])
+    except DecodingError:
+        return None
+    return preimage
+
+
+def extract_secret(transaction_hash: str, network: str = config["network"],
+                   provider: str = config["provider"]) -> Optional[str]:
+    """
+    Extract secret key (preimage) from XinFin HTLC withdraw transaction.
+
+    :param transaction_hash: XinFin withdraw transaction hash/id.
+    :type transaction_hash: str
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: XinFin network provider, defaults to ``http``.
+    :type provider: str
+
+    :returns: str -- Secret key, None if the transaction is not an HTLC withdraw.
+
+    >>> from swap.providers.xinfin.secret import extract_secret
+    >>> extract_secret(transaction_hash="0x3e9256305f1d37249b569ff3ba670e31df962e2da51a5a2c46cbad5cbc8a55d3", network="apothem")
+    "Hello Meheret!"
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid XinFin '{network}' network",
+                           "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+
+    return _input_secret(get_transaction(
+        transaction_hash=transaction_hash, network=network, provider=provider
+    )["input"])
+
+
+def scan_secrets(secret_hashes: List[str], start_block: int, end_block: int,
+                 contract_addresses: Optional[List[str]] = None, network: str = config["network"],
+                 headers: dict = config["headers"], timeout: int = config["timeout"],
+                 block_range: int = watcher_config["block_range"]) -> Dict[str, str]:
+    """
+    Scan XinFin block range once for HTLC withdraw secrets.
+
+    :param secret_hashes: Watched secret sha-256 hashes.
+    :type secret_hashes: list
+    :param start_block: First block number to scan.
+    :type start_block: int
+    :param end_block: Last block number to scan (included).
+    :type end_block: int
+    :param contract_addresses: XinFin HTLC contract addresses, defaults to ``None`` (network HTLC contracts).
+    :type contract_addresses: list
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param headers: Request headers, default to ``common headers``.
+    :type headers: dict
+    :param timeout: request timeout, default to ``60``.
+    :type timeout: int
+    :param block_range: Blocks per log request, defaults to ``2000``.
+    :type block_range: int
+
+    :returns: dict -- Found secret keys by secret hash, stops early once every hash is found.
+
+    >>> from swap.providers.xinfin.secret import scan_secrets
+    >>> scan_secrets(secret_hashes=["3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb"], start_block=31880000, end_block=31890000, network="apothem")
+    {'3a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb': 'Hello Meheret!'}
+    """
+
+    if not is_network(network=network):
+        raise NetworkError(f"Invalid XinFin '{network}' network",
+                           "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+
+    if contract_addresses is None:
+        contract_addresses = [
+            contract_address for contract_address in config[network]["contract_addresses"].values()
+            if contract_address
+        ]
+    for contract_address in contract_addresses:
+        if not is_address(address=contract_address):
+            raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
+    if not contract_addresses:
+        raise AddressError(f"There is no XinFin HTLC contract address on {network} network.")
+
+    web3: Web3 = get_web3(network=network, provider="http")
+    watched: set = {secret_hash.lower() for secret_hash in secret_hashes}
+    secrets: Dict[str, str] = {}
+    for start in range(start_block, end_block + 1, block_range):
+        if len(secrets) == len(watched):
+            break
+        end: int = min(start + block_range - 1, end_block)
+        # Only withdraw logs are fetched, their transactions are then read in one batch
+        logs: list = web3.eth.get_logs({
+            "fromBlock": start, "toBlock": end, "topics": [WITHDRAW_TOPICS], "address": [
+                to_checksum_address(address=contract_address, prefix="0x") for contract_address in contract_addresses
+            ]
+        })
+        transaction_hashes: List[str] = list(dict.fromkeys(
+            HexBytes(log["transactionHash"]).hex() for log in logs if not log.get("removed")
+        ))
+        if not transaction_hashes:
+            continue
+        for transaction in get_transactions(
+            transaction_hashes=transaction_hashes, network=network, headers=headers, timeout=timeout
+        ):
+            if isinstance(transaction, APIError):
+                raise transaction
+            secret: Optional[str] = _input_secret(transaction["input"]) if transaction else None
+            if secret is not None and sha256(secret) in watched:
+                secrets[sha256(secret)] = secret
+    return secrets
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
-from base64 import b64encode, b64decode
 from eth_account.datastructures import SignedTransaction
 from web3.types import Wei
 from typing import (
-    Optional, Union
+    Optional, Union, List
 )
 
-import json
-
-from ...utils import clean_transaction_raw
+from ...utils import (
+    clean_transaction_raw, dumps_transaction_raw, parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
     TransactionRawError, UnitError
 )
@@ -75,11 +74,11 @@ class Signature(Transaction):
         return self._fee if unit == "Wei" else \
             amount_unit_converter(amount=self._fee, unit_from=f"Wei2{unit}")
 
-    def hash(self) -> Optional[str]:
+    def hash(self) -> Optional[Union[str, List[str]]]:
         """
         Get XinFin signature has.
 
-        :returns: str -- XinFin signature hash.
+        :returns: str, list -- XinFin signature hash, a list for multi-recipient normal signatures.
 
         >>> from swap.providers.xinfin.signature import Signature
         >>> from swap.providers.xinfin.solver import RefundSolver
@@ -94,6 +93,8 @@ class Signature(Transaction):
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["hash"] for signature in self._signature]
         return self._signature["hash"] if self._signature else None
 
     def json(self) -> dict:
@@ -117,11 +118,11 @@ class Signature(Transaction):
 
         return self._transaction
 
-    def raw(self) -> Optional[str]:
+    def raw(self) -> Optional[Union[str, List[str]]]:
         """
         Get XinFin signature raw.
 
-        :returns: str -- XinFin signature raw.
+        :returns: str, list -- XinFin signature raw, a list for multi-recipient normal signatures.
 
         >>> from swap.providers.xinfin.signature import Signature
         >>> from swap.providers.xinfin.solver import WithdrawSolver
@@ -136,6 +137,8 @@ class Signature(Transaction):
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["rawTransaction"] for signature in self._signature]
         return self._signature["rawTransaction"] if self._signature else None
 
     def type(self) -> str:
@@ -159,7 +162,7 @@ class Signature(Transaction):
 
         return self._type
 
-    def sign(self, transaction_raw: str, solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: Union[NormalSolver, FundSolver, WithdrawSolver, RefundSolver]) -> \
             Union["NormalSignature", "FundSignature", "WithdrawSignature", "RefundSignature"]:
         """
         Sign XinFin unsigned transaction raw.
@@ -179,45 +182,43 @@ class Signature(Transaction):
         <swap.providers.xinfin.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        # Transaction raw is decoded once, then reused by validation, dispatch and signing
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "xinfin_normal_unsigned":
             return NormalSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_normal_unsigned":
             return NormalSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_fund_unsigned":
             return FundSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_fund_unsigned":
             return FundSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_withdraw_unsigned":
             return WithdrawSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_withdraw_unsigned":
             return WithdrawSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_refund_unsigned":
             return RefundSignature(network=self._network, xrc20=False).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
         elif loaded_transaction_raw["type"] == "xinfin_xrc20_refund_unsigned":
             return RefundSignature(network=self._network, xrc20=True).sign(
-                transaction_raw=transaction_raw, solver=solver
+                transaction_raw=loaded_transaction_raw, solver=solver
             )
 
     def signature(self) -> dict:
@@ -283,7 +284,7 @@ class NormalSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: NormalSolver) -> "NormalSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: NormalSolver) -> "NormalSignature":
         """
         Sign XinFin unsigned normal transaction raw.
 
@@ -303,13 +304,10 @@ class NormalSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_normal_unsigned", "xinfin_xrc20_normal_unsigned"]:
             raise TypeError(f"Invalid XinFin normal unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using normal signature.")
@@ -325,28 +323,20 @@ class NormalSignature(Signature):
         )
 
         wallet: Wallet = solver.solve()
-        signed_normal_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_normal_transaction["hash"].hex(),
-            rawTransaction=signed_normal_transaction["rawTransaction"].hex(),
-            r=signed_normal_transaction["r"],
-            s=signed_normal_transaction["s"],
-            v=signed_normal_transaction["v"]
+        # Multi-recipient transaction raw holds a transaction list, all are signed at once
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "xinfin_xrc20_normal_signed" if self._xrc20 else "xinfin_normal_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -372,7 +362,7 @@ class FundSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: FundSolver) -> "FundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: FundSolver) -> "FundSignature":
         """
         Sign XinFin unsigned fund transaction raw.
 
@@ -392,13 +382,10 @@ class FundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_fund_unsigned", "xinfin_xrc20_fund_unsigned"]:
             raise TypeError(f"Invalid XinFin fund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using fund signature.")
@@ -428,14 +415,14 @@ class FundSignature(Signature):
         )
         self._type = "xinfin_xrc20_fund_signed" if self._xrc20 else "xinfin_fund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -461,7 +448,7 @@ class WithdrawSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: WithdrawSolver) -> "WithdrawSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: WithdrawSolver) -> "WithdrawSignature":
         """
         Sign XinFin unsigned withdraw transaction raw.
 
@@ -481,13 +468,10 @@ class WithdrawSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_withdraw_unsigned", "xinfin_xrc20_withdraw_unsigned"]:
             raise TypeError(f"Invalid XinFin withdraw unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using withdraw signature.")
@@ -517,14 +501,14 @@ class WithdrawSignature(Signature):
         )
         self._type = "xinfin_xrc20_withdraw_signed" if self._xrc20 else "xinfin_withdraw_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
 
 
@@ -550,7 +534,7 @@ class RefundSignature(Signature):
             network=network, xrc20=xrc20, provider=provider
         )
 
-    def sign(self, transaction_raw: str, solver: RefundSolver) -> "RefundSignature":
+    def sign(self, transaction_raw: Union[str, TransactionRaw], solver: RefundSolver) -> "RefundSignature":
         """
         Sign XinFin unsigned refund transaction raw.
 
@@ -570,13 +554,10 @@ class RefundSignature(Signature):
         """
 
         # Check parameter instances
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
             raise TransactionRawError("Invalid XinFin unsigned transaction raw.")
 
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
         if loaded_transaction_raw["type"] not in ["xinfin_refund_unsigned", "xinfin_xrc20_refund_unsigned"]:
             raise TypeError(f"Invalid XinFin refund unsigned transaction raw type, "
                             f"you can't sign '{loaded_transaction_raw['type']}' type by using refund signature.")
@@ -606,12 +587,12 @@ class RefundSignature(Signature):
         )
         self._type = "xinfin_xrc20_refund_signed" if self._xrc20 else "xinfin_refund_signed"
 
-        self._signed_raw = b64encode(str(json.dumps(dict(
+        self._signed_raw = dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode()
+        ), compact=loaded_transaction_raw.compact())
         return self
@@ -6,20 +6,24 @@ from web3.datastructures import AttributeDict
 from web3.contract import Contract
 from web3 import Web3
 from web3.types import Wei
+from hexbytes.main import HexBytes
+from eth_utils import event_abi_to_log_topic
 from typing import (
-    Optional, Union
+    Optional, Union, Tuple, List
 )
-from base64 import b64encode
-
-import json
-import sys
-import os
 
 from ...exceptions import (
     AddressError, NetworkError, UnitError
 )
-from ...utils import clean_transaction_raw
+from ...utils import dumps_transaction_raw
 from ..config import xinfin as config
+from ..artifacts import (
+    load_artifact, get_contract
+)
+from ..ethereum.nonce import (
+    NonceManager, releases_nonce
+)
+from .index import LockedContractIndex
 from .wallet import Wallet
 from .htlc import HTLC
 from .rpc import (
@@ -32,6 +36,9 @@ from .solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
 
+# Fixed never used recipient of multi-recipient token transfer gas estimates, no key is known for it
+GAS_ESTIMATE_ADDRESS: str = "0xbcd09ea6302c8af97882dc30078dd8f679b0a691"
+
 
 class Transaction:
     """
@@ -43,6 +50,8 @@ class Transaction:
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: Transaction -- XinFin transaction instance.
 
@@ -50,7 +59,8 @@ class Transaction:
         XinFin has only three networks, ``mainnet``, ``apothem`` and ``testnet``.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"],
+                 nonce_manager: Optional[NonceManager] = None):
 
         # Check parameter instances
         if not is_network(network=network):
@@ -67,6 +77,80 @@ class Transaction:
         self._signature: Optional[dict] = None
         self._type: Optional[str] = None
         self._fee: Optional[Wei] = None
+        self._nonce_manager: Optional[NonceManager] = nonce_manager
+        self._nonce: Optional[Tuple[str, List[int]]] = None
+
+    def _resolve(self, address: str) -> Tuple[int, Wei]:
+        """
+        Resolve nonce and gas price once per build.
+        """
+
+        nonces, gas_price = self._resolve_nonces(address=address, count=1)
+        return nonces[0], gas_price
+
+    def _resolve_nonces(self, address: str, count: int) -> Tuple[List[int], Wei]:
+        """
+        Resolve sequential nonces and gas price once per multi-recipient build.
+        """
+
+        address: str = to_checksum_address(address=address, prefix="0x")
+        if self._nonce_manager:
+            self._nonce = (address, self._nonce_manager.allocate_many(address=address, count=count))
+            return self._nonce[1], self.web3.eth.gas_price
+        nonce: int = self.web3.eth.get_transaction_count(address)
+        return list(range(nonce, nonce + count)), self.web3.eth.gas_price
+
+    def _release_nonce(self) -> None:
+        if self._nonce_manager and self._nonce:
+            for nonce in self._nonce[1]:
+                self._nonce_manager.release(address=self._nonce[0], nonce=nonce)
+            self._nonce = None
+
+    def _sign(self, transaction: Union[dict, List[dict]], private_key: str) -> Union[dict, List[dict]]:
+        # Signed nonces go with the signed transaction raw, a rebuild doesn't give them back
+        self._nonce = None
+        # Multi-recipient builds hold a list of transactions, signed in nonce order
+        if isinstance(transaction, list):
+            return [self._sign(transaction=_transaction, private_key=private_key) for _transaction in transaction]
+        signed_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
+            transaction_dict=transaction, private_key=private_key
+        )
+        return dict(
+            hash=signed_transaction["hash"].hex(),
+            rawTransaction=signed_transaction["rawTransaction"].hex(),
+            r=signed_transaction["r"],
+            s=signed_transaction["s"],
+            v=signed_transaction["v"]
+        )
+
+    def _estimate_gas(self, function, transaction: dict) -> Wei:
+        return Wei(function(transaction))
+
+    def _htlc_contract(self, contract_address: Optional[str] = None) -> Contract:
+        contract_address = contract_address or \
+            config[self._network]["contract_addresses"]["htlc_xrc20" if self._xrc20 else "htlc"]
+        if not contract_address:
+            raise ValueError(f"HTLC contact address not found. Before build HTLC, initial contract address first.")
+        # Shared HTLC artifact and contract, builds don't construct a new HTLC instance
+        htlc_contract_data: dict = load_artifact(
+            package=__package__, json_source_name="htlc-xrc20.json" if self._xrc20 else "htlc.json",
+            sol_source_with_class_name="htlc-xrc20.sol:HTLC_XRC20" if self._xrc20 else "htlc.sol:HTLC"
+        )
+        return get_contract(
+            web3=self.web3, abi=htlc_contract_data["abi"], address=to_checksum_address(address=contract_address, prefix="0x")
+        )
+
+    def _locked_contract_id(self, htlc_contract: Contract, transaction_hash: str) -> bytes:
+        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
+            transaction_hash=transaction_hash, network=self._network
+        )).__attribute_dict__()
+        # Fund receipt also holds XRC20 transfer/approval logs, so match the HTLC log_fund topic by address
+        log_fund_topic: HexBytes = HexBytes(event_abi_to_log_topic(htlc_contract.events.log_fund.abi))
+        for log in transaction_receipt["logs"]:
+            if to_checksum_address(address=log["address"], prefix="0x") == htlc_contract.address and \
+                    log["topics"] and HexBytes(log["topics"][0]) == log_fund_topic:
+                return htlc_contract.events.log_fund().processLog(log=log)["args"]["locked_contract_id"]
+        raise ValueError(f"Can't find XinFin HTLC fund log in this '{transaction_hash}' transaction.")
 
     def fee(self, unit: str = config["unit"]) -> Union[Wei, int, float]:
         """
@@ -97,11 +181,11 @@ class Transaction:
         return self._fee if unit == "Wei" else \
             amount_unit_converter(amount=self._fee, unit_from=f"Wei2{unit}")
 
-    def hash(self) -> Optional[str]:
+    def hash(self) -> Optional[Union[str, List[str]]]:
         """
         Get XinFin transaction hash.
 
-        :returns: str -- XinFin transaction hash.
+        :returns: str, list -- XinFin transaction hash, a list for multi-recipient normal transactions.
 
         >>> from swap.providers.xinfin.transaction import WithdrawTransaction
         >>> from swap.providers.xinfin.solver import WithdrawSolver
@@ -117,6 +201,8 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["hash"] for signature in self._signature]
         return self._signature["hash"] if self._signature else None
 
     def json(self) -> dict:
@@ -142,11 +228,11 @@ class Transaction:
 
         return self._transaction
 
-    def raw(self) -> Optional[str]:
+    def raw(self) -> Optional[Union[str, List[str]]]:
         """
         Get XinFin transaction hash.
 
-        :returns: str -- XinFin transaction hash.
+        :returns: str, list -- XinFin transaction raw, a list for multi-recipient normal transactions.
 
         >>> from swap.providers.xinfin.transaction import RefundTransaction
         >>> from swap.providers.xinfin.solver import RefundSolver
@@ -162,6 +248,8 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
+        if isinstance(self._signature, list):
+            return [signature["rawTransaction"] for signature in self._signature]
         return self._signature["rawTransaction"] if self._signature else None
 
     def type(self) -> str:
@@ -206,10 +294,13 @@ class Transaction:
 
         return self._signature
 
-    def transaction_raw(self) -> str:
+    def transaction_raw(self, compact: bool = False) -> str:
         """
         Get XinFin fund transaction raw.
 
+        :param compact: Encode compact binary transaction raw, defaults to ``False``.
+        :type compact: bool
+
         :returns: str -- XinFin fund transaction raw.
 
         >>> from swap.providers.xinfin.htlc import HTLC
@@ -227,14 +318,14 @@ class Transaction:
         if not self._transaction:
             raise ValueError("Transaction is none, build transaction first.")
 
-        return clean_transaction_raw(b64encode(str(json.dumps(dict(
+        return dumps_transaction_raw(transaction_raw=dict(
             fee=self._fee,
             type=self._type,
             transaction=self._transaction,
             signature=self._signature,
             network=self._network,
             xrc20=self._xrc20
-        ))).encode()).decode())
+        ), compact=compact)
 
 
 class NormalTransaction(Transaction):
@@ -247,6 +338,8 @@ class NormalTransaction(Transaction):
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: NormalTransaction -- XinFin normal transaction instance.
 
@@ -254,11 +347,13 @@ class NormalTransaction(Transaction):
         Do not forget to build transaction after initialize fund transaction.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"],
+                 nonce_manager: Optional[NonceManager] = None):
         super().__init__(
-            network=network, xrc20=xrc20, provider=provider
+            network=network, xrc20=xrc20, provider=provider, nonce_manager=nonce_manager
         )
 
+    @releases_nonce
     def build_transaction(self, address: str, recipient: dict, token_address: Optional[str] = None, unit: str = config["unit"]) -> "NormalTransaction":
         """
         Build XinFin normal transaction.
@@ -274,10 +369,19 @@ class NormalTransaction(Transaction):
 
         :returns: NormalTransaction -- XinFin normal transaction instance.
 
+        .. note::
+            Multiple recipients build one transaction per recipient with sequential sender nonces,
+            their transaction raw holds the transaction and signature lists, gas is estimated once
+            and shared, so pay contract recipients with a fallback function in their own build.
+
         >>> from swap.providers.xinfin.transaction import NormalTransaction
         >>> normal_transaction: NormalTransaction = NormalTransaction(network="testnet")
         >>> normal_transaction.build_transaction(address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", recipient={"xdcf8D43806260CFc6cC79fB408BA1897054667F81C": 100_000_000})
         <swap.providers.xinfin.transaction.FundTransaction object at 0x0409DAF0>
+        >>> normal_transaction.build_transaction(address="xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232", recipient={"xdcf8D43806260CFc6cC79fB408BA1897054667F81C": 100_000_000, "xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7": 200_000_000})
+        <swap.providers.xinfin.transaction.FundTransaction object at 0x0409DAF0>
+        >>> normal_transaction.fee(unit="Wei")
+        42000
         """
 
         # Check parameter instances
@@ -285,61 +389,71 @@ class NormalTransaction(Transaction):
             raise AddressError(f"Invalid XinFin sender '{address}' address.")
         if unit not in ["XDC", "Gwei", "Wei"]:
             raise UnitError("Invalid XinFin unit, choose only 'XDC', 'Gwei' or 'Wei' units.")
-        if len(recipient.items()) > 1:
-            raise ValueError("You can't broadcast for multiple addresses on this version, only for one address.")
+        if not recipient:
+            raise ValueError("Recipient is empty, set at least one recipient address and amount.")
 
         # Set address, fee and confirmations
-        recipient_address, amount = list(recipient.items())[0]
-        self._address, self._token_address, self._amount = (
-            address, token_address, Wei(
+        recipients: List[Tuple[str, Wei]] = [
+            (to_checksum_address(address=recipient_address, prefix="0x"), Wei(
                 amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
-            ) if not self._xrc20 else amount
+            ) if not self._xrc20 else amount) for recipient_address, amount in recipient.items()
+        ]
+        self._address, self._token_address, self._amount = (
+            address, token_address, recipients[0][1] if len(recipients) == 1 else [
+                amount for _, amount in recipients
+            ]
         )
 
+        nonces, gas_price = self._resolve_nonces(address=address, count=len(recipients))
         if self._xrc20:
-            # Get current working directory path (like linux or unix path).
-            cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-            with open(f"{cwd}/contracts/libs/xrc20.json", "r") as xrc20_json_file:
-                xrc20_contract_data: dict = json.loads(xrc20_json_file.read())["xrc20.sol:XRC20"]
-                xrc20_json_file.close()
-
-            xrc20_contract: Contract = self.web3.eth.contract(
-                address=to_checksum_address(address=token_address, prefix="0x"), abi=xrc20_contract_data["abi"]
+            xrc20_contract_data: dict = load_artifact(
+                package=__package__, json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
             )
-            transfer_function = xrc20_contract.functions.transfer(
-                to_checksum_address(address=recipient_address, prefix="0x"), self._amount
+
+            xrc20_contract: Contract = get_contract(
+                web3=self.web3, abi=xrc20_contract_data["abi"], address=to_checksum_address(address=token_address, prefix="0x")
             )
-            self._fee = transfer_function.estimateGas({
+            # Gas is estimated once per call shape, a multi-recipient build estimates the transfer to the never
+            # used gas estimate address (the most expensive storage path), so every transfer fits in the shared gas
+            transfer_function = xrc20_contract.functions.transfer(*(recipients[0] if len(recipients) == 1 else (
+                to_checksum_address(address=GAS_ESTIMATE_ADDRESS, prefix="0x"),
+                max(amount for _, amount in recipients)
+            )))
+            gas: Wei = self._estimate_gas(transfer_function.estimateGas, {
                 "from": to_checksum_address(address=address, prefix="0x"),
                 "value": Wei(0),
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address, prefix="0x")
-                ),
-                "gasPrice": self.web3.eth.gas_price
+                "nonce": nonces[0],
+                "gasPrice": gas_price
             })
 
-            self._transaction = transfer_function.buildTransaction({
-                "from": to_checksum_address(address=address, prefix="0x"),
-                "value": Wei(0),
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address, prefix="0x")
-                ),
-                "gas": self._fee,
-                "gasPrice": self.web3.eth.gas_price
-            })
+            transactions: List[dict] = [
+                xrc20_contract.functions.transfer(recipient_address, amount).buildTransaction({
+                    "from": to_checksum_address(address=address, prefix="0x"),
+                    "value": Wei(0),
+                    "nonce": nonce,
+                    "gas": gas,
+                    "gasPrice": gas_price
+                }) for (recipient_address, amount), nonce in zip(recipients, nonces)
+            ]
         else:
-            self._transaction = {
-                "from": to_checksum_address(address=address, prefix="0x"),
-                "to": to_checksum_address(address=recipient_address, prefix="0x"),
-                "value": self._amount,
-                "nonce": self.web3.eth.get_transaction_count(
-                    to_checksum_address(address=address, prefix="0x")
-                ),
-                "gasPrice": self.web3.eth.gas_price
-            }
-            self._fee = self.web3.eth.estimateGas(self._transaction)
-            self._transaction.setdefault("gas", self._fee)
+            transactions: List[dict] = [
+                {
+                    "from": to_checksum_address(address=address, prefix="0x"),
+                    "to": recipient_address,
+                    "value": amount,
+                    "nonce": nonce,
+                    "gasPrice": gas_price
+                } for (recipient_address, amount), nonce in zip(recipients, nonces)
+            ]
+            # Value transfers share one call shape, the largest one is estimated once
+            gas: Wei = self._estimate_gas(
+                self.web3.eth.estimateGas, max(transactions, key=lambda transaction: transaction["value"])
+            )
+            for transaction in transactions:
+                transaction.setdefault("gas", gas)
 
+        self._transaction = transactions[0] if len(transactions) == 1 else transactions
+        self._fee = Wei(gas * len(transactions))
         self._type = "xinfin_xrc20_normal_unsigned" if self._xrc20 else "xinfin_normal_unsigned"
         return self
 
@@ -366,17 +480,8 @@ class NormalTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin NormalSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_normal_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_normal_transaction["hash"].hex(),
-            rawTransaction=signed_normal_transaction["rawTransaction"].hex(),
-            r=signed_normal_transaction["r"],
-            s=signed_normal_transaction["s"],
-            v=signed_normal_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "xinfin_xrc20_normal_signed" if self._xrc20 else "xinfin_normal_signed"
         return self
@@ -392,6 +497,8 @@ class FundTransaction(Transaction):
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: FundTransaction -- XinFin fund transaction instance.
 
@@ -399,11 +506,13 @@ class FundTransaction(Transaction):
         Do not forget to build transaction after initialize fund transaction.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"],
+                 nonce_manager: Optional[NonceManager] = None):
         super().__init__(
-            network=network, xrc20=xrc20, provider=provider
+            network=network, xrc20=xrc20, provider=provider, nonce_manager=nonce_manager
         )
 
+    @releases_nonce
     def build_transaction(self, address: str, htlc: HTLC, amount: Union[Wei, int, float],
                           unit: str = config["unit"]) -> "FundTransaction":
         """
@@ -445,8 +554,8 @@ class FundTransaction(Transaction):
             amount if unit == "Wei" else amount_unit_converter(amount=amount, unit_from=f"{unit}2Wei")
         ) if not self._xrc20 else amount
 
-        htlc_contract: Contract = self.web3.eth.contract(
-            address=htlc.contract_address(prefix="0x"), abi=htlc.abi()
+        htlc_contract: Contract = get_contract(
+            web3=self.web3, abi=htlc.abi(), address=htlc.contract_address(prefix="0x")
         )
 
         if self._xrc20:
@@ -466,23 +575,20 @@ class FundTransaction(Transaction):
                 htlc.agreements["endtime"]["timestamp"]  # Locktime Seconds
             )
 
-        self._fee = htlc_fund_function.estimateGas({
+        nonce, gas_price = self._resolve(address=address)
+        self._fee = self._estimate_gas(htlc_fund_function.estimateGas, {
             "from": to_checksum_address(address=address, prefix="0x"),
             "value": _amount if not self._xrc20 else Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gasPrice": self.web3.eth.gas_price
+            "nonce": nonce,
+            "gasPrice": gas_price
         })
 
         self._transaction = htlc_fund_function.buildTransaction({
             "from": to_checksum_address(address=address, prefix="0x"),
             "value": _amount if not self._xrc20 else Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
+            "nonce": nonce,
             "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
+            "gasPrice": gas_price
         })
         self._type = "xinfin_xrc20_fund_unsigned" if self._xrc20 else "xinfin_fund_unsigned"
         return self
@@ -514,17 +620,8 @@ class FundTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin FundSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_fund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_fund_transaction["hash"].hex(),
-            rawTransaction=signed_fund_transaction["rawTransaction"].hex(),
-            r=signed_fund_transaction["r"],
-            s=signed_fund_transaction["s"],
-            v=signed_fund_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "xinfin_xrc20_fund_signed" if self._xrc20 else "xinfin_fund_signed"
         return self
@@ -540,6 +637,10 @@ class WithdrawTransaction(Transaction):
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
+    :param index: Look up locked contract ids locally instead of fetching the fund receipt, default to ``None``.
+    :type index: xinfin.index.LockedContractIndex
 
     :returns: WithdrawTransaction -- XinFin withdraw transaction instance.
 
@@ -547,11 +648,15 @@ class WithdrawTransaction(Transaction):
         Do not forget to build transaction after initialize withdraw transaction.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"],
+                 nonce_manager: Optional[NonceManager] = None, index: Optional[LockedContractIndex] = None):
         super().__init__(
-            network=network, xrc20=xrc20, provider=provider
+            network=network, xrc20=xrc20, provider=provider, nonce_manager=nonce_manager
         )
 
+        self._index: Optional[LockedContractIndex] = index
+
+    @releases_nonce
     def build_transaction(self, transaction_hash: str, address: str, secret_key: str,
                           contract_address: Optional[str] = None) -> "WithdrawTransaction":
         """
@@ -580,43 +685,34 @@ class WithdrawTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
 
-        htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, xrc20=self._xrc20
-        )
-        htlc_contract: Contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(htlc.contract_address(prefix="0x")), abi=htlc.abi()
-        )
+        htlc_contract: Contract = self._htlc_contract(contract_address=contract_address)
 
-        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
-            transaction_hash=transaction_hash, network=self._network
-        )).__attribute_dict__()
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._xrc20 else 0]
-        )
-
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+        # Indexed builds skip the funded transaction receipt request
+        locked_contract_id: Optional[Union[str, bytes]] = self._index.locked_contract_id(
+            transaction_hash=transaction_hash
+        ) if self._index and \
+            self._index.contract_address() == to_checksum_address(address=htlc_contract.address) else None
+        locked_contract_id = bytes(HexBytes(locked_contract_id)) if locked_contract_id else \
+            self._locked_contract_id(htlc_contract, transaction_hash)
         htlc_fund_function = htlc_contract.functions.withdraw(
             locked_contract_id,  # Locked Contract ID
             secret_key  # Secret Key
         )
 
-        self._fee = htlc_fund_function.estimateGas({
+        nonce, gas_price = self._resolve(address=address)
+        self._fee = self._estimate_gas(htlc_fund_function.estimateGas, {
             "from": to_checksum_address(address=address, prefix="0x"),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gasPrice": self.web3.eth.gas_price
+            "nonce": nonce,
+            "gasPrice": gas_price
         })
 
         self._transaction = htlc_fund_function.buildTransaction({
             "from": to_checksum_address(address=address, prefix="0x"),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
+            "nonce": nonce,
             "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
+            "gasPrice": gas_price
         })
         self._type = "xinfin_xrc20_withdraw_unsigned" if self._xrc20 else "xinfin_withdraw_unsigned"
         return self
@@ -644,17 +740,8 @@ class WithdrawTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin WithdrawSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_withdraw_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_withdraw_transaction["hash"].hex(),
-            rawTransaction=signed_withdraw_transaction["rawTransaction"].hex(),
-            r=signed_withdraw_transaction["r"],
-            s=signed_withdraw_transaction["s"],
-            v=signed_withdraw_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "xinfin_xrc20_withdraw_signed" if self._xrc20 else "xinfin_withdraw_signed"
         return self
@@ -670,6 +757,10 @@ class RefundTransaction(Transaction):
     :type xrc20: bool
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Allocate sender nonces locally, default to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
+    :param index: Look up locked contract ids locally instead of fetching the fund receipt, default to ``None``.
+    :type index: xinfin.index.LockedContractIndex
 
     :returns: RefundTransaction -- XinFin refund transaction instance.
 
@@ -677,11 +768,15 @@ class RefundTransaction(Transaction):
         Do not forget to build transaction after initialize refund transaction.
     """
 
-    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"]):
+    def __init__(self, network: str = config["network"], xrc20: bool = False, provider: str = config["provider"],
+                 nonce_manager: Optional[NonceManager] = None, index: Optional[LockedContractIndex] = None):
         super().__init__(
-            network=network, xrc20=xrc20, provider=provider
+            network=network, xrc20=xrc20, provider=provider, nonce_manager=nonce_manager
         )
 
+        self._index: Optional[LockedContractIndex] = index
+
+    @releases_nonce
     def build_transaction(self, transaction_hash: str, address: str,
                           contract_address: Optional[str] = None) -> "RefundTransaction":
         """
@@ -708,42 +803,33 @@ class RefundTransaction(Transaction):
         if contract_address and not is_address(address=contract_address):
             raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
 
-        htlc: HTLC = HTLC(
-            contract_address=contract_address, network=self._network, xrc20=self._xrc20
-        )
-        htlc_contract: Contract = self.web3.eth.contract(
-            address=self.web3.toChecksumAddress(htlc.contract_address(prefix="0x")), abi=htlc.abi()
-        )
-
-        transaction_receipt: AttributeDict = _AttributeDict(get_transaction_receipt(
-            transaction_hash=transaction_hash, network=self._network
-        )).__attribute_dict__()
-        log_fund: AttributeDict = htlc_contract.events.log_fund().processLog(
-            log=transaction_receipt["logs"][2 if self._xrc20 else 0]
-        )
+        htlc_contract: Contract = self._htlc_contract(contract_address=contract_address)
 
-        locked_contract_id: str = log_fund["args"]["locked_contract_id"]
+        # Indexed builds skip the funded transaction receipt request
+        locked_contract_id: Optional[Union[str, bytes]] = self._index.locked_contract_id(
+            transaction_hash=transaction_hash
+        ) if self._index and \
+            self._index.contract_address() == to_checksum_address(address=htlc_contract.address) else None
+        locked_contract_id = bytes(HexBytes(locked_contract_id)) if locked_contract_id else \
+            self._locked_contract_id(htlc_contract, transaction_hash)
         htlc_refund_function = htlc_contract.functions.refund(
             locked_contract_id  # Locked Contract ID
         )
 
-        self._fee = htlc_refund_function.estimateGas({
+        nonce, gas_price = self._resolve(address=address)
+        self._fee = self._estimate_gas(htlc_refund_function.estimateGas, {
             "from": to_checksum_address(address=address, prefix="0x"),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
-            "gasPrice": self.web3.eth.gas_price
+            "nonce": nonce,
+            "gasPrice": gas_price
         })
 
         self._transaction = htlc_refund_function.buildTransaction({
             "from": to_checksum_address(address=address, prefix="0x"),
             "value": Wei(0),
-            "nonce": self.web3.eth.get_transaction_count(
-                to_checksum_address(address=address, prefix="0x")
-            ),
+            "nonce": nonce,
             "gas": self._fee,
-            "gasPrice": self.web3.eth.gas_price
+            "gasPrice": gas_price
         })
         self._type = "xinfin_xrc20_refund_unsigned" if self._xrc20 else "xinfin_refund_unsigned"
         return self
@@ -771,17 +857,8 @@ class RefundTransaction(Transaction):
             raise TypeError(f"Solver must be XinFin RefundSolver, not {type(solver).__name__} type.")
 
         wallet: Wallet = solver.solve()
-        signed_refund_transaction: SignedTransaction = self.web3.eth.account.sign_transaction(
-            transaction_dict=self._transaction,
-            private_key=wallet.private_key()
-        )
-
-        self._signature = dict(
-            hash=signed_refund_transaction["hash"].hex(),
-            rawTransaction=signed_refund_transaction["rawTransaction"].hex(),
-            r=signed_refund_transaction["r"],
-            s=signed_refund_transaction["s"],
-            v=signed_refund_transaction["v"]
+        self._signature = self._sign(
+            transaction=self._transaction, private_key=wallet.private_key()
         )
         self._type = "xinfin_xrc20_refund_signed" if self._xrc20 else "xinfin_refund_signed"
         return self
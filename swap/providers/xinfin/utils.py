@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from base64 import b64decode
 from datetime import datetime
 from pyxdc.utils import (
     is_address as _is_address,
@@ -11,17 +10,23 @@ from web3.types import ChecksumAddress
 from web3.datastructures import AttributeDict
 from hexbytes.main import HexBytes
 from web3 import Web3
-from typing import Union
-
-import json
-import sys
-import os
+from decimal import Decimal
+from typing import (
+    Union, Optional, List, Dict, Tuple
+)
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    parse_transaction_raw, TransactionRaw
+)
 from ...exceptions import (
-    AddressError, UnitError, TransactionRawError
+    AddressError, UnitError, TransactionRawError, APIError
 )
 from ..config import xinfin as config
+from ..units import (
+    unit_scales, convert_amount, convert_amounts
+)
+from ..artifacts import load_artifact
+from ..ethereum.nonce import NonceManager
 
 
 def is_network(network: str) -> bool:
@@ -129,13 +134,11 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     """
 
     # Check parameter instances
-    if not isinstance(transaction_raw, str):
+    if not isinstance(transaction_raw, (str, TransactionRaw)):
         raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
 
     try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
+        loaded_transaction_raw = parse_transaction_raw(transaction_raw=transaction_raw)
         return loaded_transaction_raw["type"] in [
             "xinfin_normal_unsigned", "xinfin_normal_signed", "xinfin_xrc20_normal_unsigned", "xinfin_xrc20_normal_signed",
             "xinfin_fund_unsigned", "xinfin_fund_signed", "xinfin_xrc20_fund_unsigned", "xinfin_xrc20_fund_signed",
@@ -147,11 +150,9 @@ def is_transaction_raw(transaction_raw: str) -> bool:
 
 
 def get_xrc20_data(key: str) -> dict:
-    # Get current working directory path (like linux or unix path).
-    cwd: str = os.path.dirname(sys.modules[__package__].__file__)
-    with open(f"{cwd}/contracts/libs/xrc20.json", "r") as xrc20_json_file:
-        xrc20_data: dict = json.loads(xrc20_json_file.read())["xrc20.sol:XRC20"]
-        xrc20_json_file.close()
+    xrc20_data: dict = load_artifact(
+        package=__package__, json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
+    )
     return xrc20_data[key]
 
 
@@ -170,13 +171,10 @@ def decode_transaction_raw(transaction_raw: str) -> dict:
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid XinFin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     return dict(
         fee=loaded_transaction_raw["fee"],
         transaction=loaded_transaction_raw["transaction"],
@@ -186,7 +184,14 @@ def decode_transaction_raw(transaction_raw: str) -> dict:
     )
 
 
-def submit_transaction_raw(transaction_raw: str, provider: str = config["provider"]) -> dict:
+def _release_nonces(nonce_manager: Optional[NonceManager], transactions: List[dict]) -> None:
+    if nonce_manager:
+        for transaction in transactions:
+            nonce_manager.release(address=transaction["from"], nonce=transaction["nonce"])
+
+
+def submit_transaction_raw(transaction_raw: str, provider: str = config["provider"],
+                           nonce_manager: Optional[NonceManager] = None) -> dict:
     """
     Submit XinFin transaction raw.
 
@@ -194,9 +199,16 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     :type transaction_raw: str
     :param provider: XinFin network provider, defaults to ``http``.
     :type provider: str
+    :param nonce_manager: Nonce manager to give back rejected transaction nonces, defaults to ``None``.
+    :type nonce_manager: ethereum.nonce.NonceManager
 
     :returns: dict -- XinFin submitted transaction id, fee, type and date.
 
+    .. note::
+        Multi-recipient normal transaction raw is submitted in one batch request, its transaction
+        hash and errors are lists in nonce order, a rejected transaction has ``None`` hash and its error,
+        an accepted one has its hash and ``None`` error. It raises only when every transaction is rejected.
+
     >>> from swap.providers.xinfin.utils import submit_transaction_raw
     >>> transaction_raw: str = "eyJmZWUiOiAxMDAwMDAwMCwgImFkZHJlc3MiOiAiYm0xcWU5MHFqdDl3NG04cnQzdG51dTBwenAyNGRrZmZlbHlzOHpjd3llIiwgInJhdyI6ICIwNzAxMDAwMjAxNWYwMTVkMzA1YTI4ZDhkMzRiNDBjNjU5MzY4MTBmOWU5YzFmOGJjOWM3OTNlYzJlNzJjNzBmOTIwM2ZiYmViMGE1NmRiOWZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MGFkZTIwNDAxMDExNjAwMTQwZTQzYTkyYTllOGFjYTc4OGViMTU1MWMzMTY0NDhjMmUzZjc4MjE1MDEwMDAxNWYwMTVkMjAyZmQyNTU3YjY3ZjFkZjhiOGFjZWYwNjZmNWQ0NmE4NTAwODE0MzliNDE5MzI1ZDU1ZGJkOTM0MWUxMWFjNGZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MDg0YWY1ZjAxMDExNjAwMTRjOTVlMDkyY2FlYWVjZTM1YzU3M2U3MWUxMTA1NTU2ZDkyOWNmYzkwMjIwMTIwNTk5MDdmZGFkMGZmOTVmZWJhNDNhZWYzN2QyZTU1YzU3YjZlMTg2Y2QzYWQxN2M4M2U2YzgwYzY1ODIxOGI2NTAyMDEzYWZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY5MDRlMDExNjAwMTRjOTVlMDkyY2FlYWVjZTM1YzU3M2U3MWUxMTA1NTU2ZDkyOWNmYzkwMDAwMTNjZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmUwOTQ5MDY0MDExNjAwMTRjOTVlMDkyY2FlYWVjZTM1YzU3M2U3MWUxMTA1NTU2ZDkyOWNmYzkwMDAiLCAiaGFzaCI6ICI3NzlmYzliOWNhNGRiMTVkNDFhYzgwNDNlZDRlNDFkYjg4NDU2ZjA1YzljZmJhMDQ5MzYyZWNlZmQ2MjY3ZmMzIiwgInVuc2lnbmVkX2RhdGFzIjogW3siZGF0YXMiOiBbIjMzZThkYThjZThlZjEzZmI0OTM4YTM3NGFlYTM2NjRlNGNkMmNkMDBmZGQ5ZDI5ODU5M2JkYmQ4NzJkNjZiODgiXSwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJwYXRoIjogbnVsbH0sIHsiZGF0YXMiOiBbIjc1ZTg3Yzc5MzNiNGRjNGE4N2UwNmZlZDMyM2U4NDI1ZTU0YTQ5NGZmODBkYzdmOGM0NTUyY2RiMGE2YmM3NGEiXSwgInB1YmxpY19rZXkiOiAiNTk5MDdmZGFkMGZmOTVmZWJhNDNhZWYzN2QyZTU1YzU3YjZlMTg2Y2QzYWQxN2M4M2U2YzgwYzY1ODIxOGI2NSIsICJuZXR3b3JrIjogIm1haW5uZXQiLCAicGF0aCI6ICJtLzQ0LzE1My8xLzAvMSJ9XSwgInNpZ25hdHVyZXMiOiBbXSwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJ0eXBlIjogImJ5dG9tX2NsYWltX3Vuc2lnbmVkIn0"
     >>> submit_transaction_raw(transaction_raw=transaction_raw)
@@ -204,13 +216,10 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     """
 
     # Check parameter instances
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+    if not is_transaction_raw(transaction_raw=loaded_transaction_raw):
         raise TransactionRawError("Invalid XinFin transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
     if not loaded_transaction_raw["type"] in [
         "xinfin_normal_signed", "xinfin_xrc20_normal_signed",
         "xinfin_fund_signed", "xinfin_xrc20_fund_signed",
@@ -219,62 +228,94 @@ def submit_transaction_raw(transaction_raw: str, provider: str = config["provide
     ]:
         raise TransactionRawError("Wrong XinFin transaction raw must be signed, not unsigned transaction raw.")
 
-    from .rpc import get_web3
+    from .rpc import (
+        get_web3, _batch_request
+    )
     web3: Web3 = get_web3(
         network=loaded_transaction_raw["network"], provider=provider
     )
-    transaction_hash: HexBytes = web3.eth.send_raw_transaction(
-        loaded_transaction_raw["signature"]["rawTransaction"]
-    )
-
+    signatures: List[dict] = loaded_transaction_raw["signature"] \
+        if isinstance(loaded_transaction_raw["signature"], list) else [loaded_transaction_raw["signature"]]
+    transactions: List[dict] = loaded_transaction_raw["transaction"] \
+        if isinstance(loaded_transaction_raw["transaction"], list) else [loaded_transaction_raw["transaction"]]
+    try:
+        if len(signatures) == 1:
+            transaction_hashes: List[str] = [web3.eth.send_raw_transaction(
+                signatures[0]["rawTransaction"]
+            ).hex()]
+        else:
+            # Multi-recipient transactions are sent in nonce order in one JSON-RPC batch request
+            transaction_hashes: List[str] = _batch_request(calls=[
+                ("eth_sendRawTransaction", [signature["rawTransaction"]]) for signature in signatures
+            ], network=loaded_transaction_raw["network"])
+    except Exception:
+        _release_nonces(nonce_manager=nonce_manager, transactions=transactions)
+        raise
+    errors: List[Optional[str]] = [
+        str(transaction_hash) if isinstance(transaction_hash, APIError) else None
+        for transaction_hash in transaction_hashes
+    ]
+    # Only the rejected transaction nonces are given back, accepted ones stay in flight
+    _release_nonces(nonce_manager=nonce_manager, transactions=[
+        transaction for transaction, error in zip(transactions, errors) if error is not None
+    ])
+    if all(error is not None for error in errors):
+        raise transaction_hashes[0]
+
+    if not isinstance(loaded_transaction_raw["signature"], list):
+        return dict(
+            fee=loaded_transaction_raw["fee"],
+            type=loaded_transaction_raw["type"],
+            transaction_hash=transaction_hashes[0],
+            network=loaded_transaction_raw["network"],
+            date=str(datetime.now())
+        )
     return dict(
         fee=loaded_transaction_raw["fee"],
         type=loaded_transaction_raw["type"],
-        transaction_hash=transaction_hash.hex(),
+        transaction_hash=[
+            None if error is not None else transaction_hash
+            for transaction_hash, error in zip(transaction_hashes, errors)
+        ],
+        errors=errors,
         network=loaded_transaction_raw["network"],
         date=str(datetime.now())
     )
 
 
-def amount_unit_converter(amount: Union[int, float], unit_from: str = "Wei2XDC") -> Union[int, float]:
+# Unit conversion scales, XDC2Wei, Gwei2Wei and Wei2Gwei amounts are integers
+UNIT_SCALES: Dict[str, Tuple[int, int, bool]] = unit_scales(
+    units=config["units"], integers=["XDC2Wei", "Gwei2Wei", "Wei2Gwei"]
+)
+
+
+def amount_unit_converter(amount: Union[int, float, Decimal, List[Union[int, float, Decimal]]],
+                          unit_from: str = "Wei2XDC") -> Union[int, float, List[Union[int, float]]]:
     """
     XinFin amount unit converter.
 
     :param amount: XinFIn amount.
-    :type amount: int, float
+    :type amount: int, float, decimal.Decimal, list
     :param unit_from: XinFIn unit from, default to ``Wei2XDC``
     :type unit_from: str
 
-    :returns: int, float -- XinFin amount.
+    :returns: int, float, list -- XinFin amount.
 
     >>> from swap.providers.xinfin.utils import amount_unit_converter
     >>> amount_unit_converter(amount=100_000_000, unit_from="Wei2XDC")
     0.1
+    >>> from decimal import Decimal
+    >>> amount_unit_converter(amount=[0.1, Decimal("1.000000000000000001")], unit_from="XDC2Wei")
+    [100000000000000000, 1000000000000000001]
     """
 
-    if unit_from not in ["XDC2Gwei", "XDC2Wei", "Gwei2XDC", "Gwei2Wei", "Wei2XDC", "Wei2Gwei"]:
+    if unit_from not in UNIT_SCALES:
         raise UnitError(f"Invalid XinFin '{unit_from}' unit from",
                         "choose only 'XDC2Gwei', 'XDC2Wei', 'Gwei2XDC', 'Gwei2Wei', 'Wei2XDC' or 'Wei2Gwei' units.")
 
-    # Constant values
-    XDC, Gwei, Wei = (
-        config["units"]["XDC"],
-        config["units"]["Gwei"],
-        config["units"]["Wei"]
-    )
-
-    if unit_from == "XDC2Gwei":
-        return float((amount * Gwei) / XDC)
-    elif unit_from == "XDC2Wei":
-        return int((amount * Wei) / XDC)
-    elif unit_from == "Gwei2XDC":
-        return float((amount * XDC) / Gwei)
-    elif unit_from == "Gwei2Wei":
-        return int((amount * Wei) / Gwei)
-    elif unit_from == "Wei2XDC":
-        return float((amount * XDC) / Wei)
-    elif unit_from == "Wei2Gwei":
-        return int((amount * Gwei) / Wei)
+    if isinstance(amount, (int, float, Decimal)):
+        return convert_amount(amount=amount, scale=UNIT_SCALES[unit_from])
+    return convert_amounts(amounts=amount, scale=UNIT_SCALES[unit_from])
 
 
 class _AttributeDict:
@@ -3,8 +3,9 @@
 from hdwallet import HDWallet
 from hdwallet.cryptocurrencies import XinFinMainnet
 from web3.types import Wei
+from functools import partial
 from typing import (
-    Optional, Union, Tuple
+    Optional, Union, Tuple, List
 )
 
 from ...utils import is_mnemonic
@@ -12,6 +13,7 @@ from ...exceptions import (
     NetworkError, UnitError
 )
 from ..config import xinfin as config
+from ..pool import map_chunks
 from .utils import (
     is_network, amount_unit_converter
 )
@@ -23,6 +25,23 @@ from .rpc import (
 DEFAULT_PATH: str = config["path"]
 
 
+def _derive_addresses(network: str, xkey: str, private: bool, path: str,
+                      indexes: List[int]) -> List[Tuple[str, str, str]]:
+    hdwallet: HDWallet = HDWallet(
+        cryptocurrency=XinFinMainnet, use_default_path=False
+    )
+    addresses: List[Tuple[str, str, str]] = []
+    for index in indexes:
+        # Only the last index is walked, from the parent xprivate (or slower xpublic) key
+        if private:
+            hdwallet.from_xprivate_key(xprivate_key=xkey, strict=False)
+        else:
+            hdwallet.from_xpublic_key(xpublic_key=xkey, strict=False)
+        hdwallet.from_index(index=index)
+        addresses.append((hdwallet.p2pkh_address(), hdwallet.public_key(), f"{path}/{index}"))
+    return addresses
+
+
 class Wallet(HDWallet):
     """
     XinFin Wallet class.
@@ -259,6 +278,56 @@ class Wallet(HDWallet):
         self._hdwallet.clean_derivation()
         return self
 
+    def derive_range(self, account: int = 0, change: bool = False, start: int = 0, count: int = 1,
+                     processes: Optional[int] = None) -> List[Tuple[str, str, str]]:
+        """
+        Derive range of XinFin addresses, the account change node is derived once and every address from it.
+
+        :param account: XinFin derivation account, defaults to ``0``.
+        :type account: int
+        :param change: XinFin derivation change, defaults to ``False``.
+        :type change: bool
+        :param start: First address index, defaults to ``0``.
+        :type start: int
+        :param count: Number of addresses, defaults to ``1``.
+        :type count: int
+        :param processes: Worker processes for large ranges, defaults to ``None`` (runs in this process).
+        :type processes: int
+
+        :returns: list -- XinFin addresses, public keys and derivation paths.
+
+        >>> from swap.providers.xinfin.wallet import Wallet
+        >>> wallet: Wallet = Wallet(network="mainnet")
+        >>> wallet.from_entropy(entropy="ed0802d701a033776811601dd6c5c4a9")
+        >>> wallet.derive_range(account=0, change=False, start=0, count=1)
+        [('xdc2224caA2235DF8Da3D2016d2AB1137D2d548A232', '0333fbc2f498d145a1827ee894a2ed5f14928523712047ad9fffc59cdda7d314e6', "m/44'/550'/0'/0/0")]
+        """
+
+        if start < 0 or count < 0:
+            raise ValueError("Invalid XinFin derivation range, start and count must be positive.")
+
+        path: Optional[str] = self._hdwallet.path()
+        parent_path: str = config["bip44_path"].rsplit("/", 1)[0].format(
+            account=account, change=(1 if change else 0)
+        )
+        try:
+            self._hdwallet.clean_derivation()
+            self._hdwallet.from_path(path=parent_path)
+            xprivate_key: Optional[str] = self._hdwallet.xprivate_key()
+            xpublic_key: Optional[str] = self._hdwallet.xpublic_key()
+        finally:
+            # Restore the wallet derivation
+            self._hdwallet.clean_derivation()
+            if path:
+                self._hdwallet.from_path(path=path)
+
+        return map_chunks(
+            function=partial(
+                _derive_addresses, self._network, xprivate_key or xpublic_key, xprivate_key is not None, parent_path
+            ),
+            items=list(range(start, start + count)), processes=processes
+        )
+
     def strength(self) -> Optional[int]:
         """
         Get XinFin wallet strength.
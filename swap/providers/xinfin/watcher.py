@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+from web3 import Web3
+from web3._utils.events import get_event_data
+from web3._utils.method_formatters import log_entry_formatter
+from eth_utils import event_abi_to_log_topic
+from hexbytes.main import HexBytes
+from typing import (
+    Optional, Dict, List, AsyncIterator
+)
+
+import websockets
+import asyncio
+import json
+
+from ...exceptions import (
+    AddressError, APIError, NetworkError
+)
+from ..config import (
+    xinfin as config, watcher as watcher_config
+)
+from ..artifacts import load_artifact
+from ..watcher import (
+    Event, FUND, WITHDRAW, REFUND
+)
+from .rpc import get_web3
+from .utils import (
+    is_network, is_address, to_checksum_address
+)
+from .. import watcher
+
+# HTLC contract event kinds
+KINDS: Dict[str, str] = {
+    "log_fund": FUND, "log_withdraw": WITHDRAW, "log_refund": REFUND
+}
+
+
+def _load_events() -> Dict[bytes, dict]:
+    events: Dict[bytes, dict] = {}
+    for json_source_name, sol_source_with_class_name in [
+        ("htlc.json", "htlc.sol:HTLC"), ("htlc-xrc20.json", "htlc-xrc20.sol:HTLC_XRC20")
+    ]:
+        abi: list = load_artifact(
+            package=__package__, json_source_name=json_source_name, sol_source_with_class_name=sol_source_with_class_name
+        )["abi"]
+        for event_abi in abi:
+            if event_abi["type"] == "event" and event_abi["name"] in KINDS:
+                events[event_abi_to_log_topic(event_abi)] = event_abi
+    return events
+
+
+class Watcher(watcher.Watcher):
+    """
+    XinFin HTLC watcher, follows ``log_fund``, ``log_withdraw`` and ``log_refund`` contract events.
+
+    :param network: XinFin network, defaults to ``mainnet``.
+    :type network: str
+    :param provider: XinFin network provider, defaults to ``http``.
+    :type provider: str
+    :param confirmations: Confirmations needed before an event is emitted, defaults to ``0``.
+    :type confirmations: int
+    :param from_block: First block to scan, defaults to ``None`` (latest block).
+    :type from_block: int
+    :param interval: Seconds between polls while events keep coming, defaults to ``5``.
+    :type interval: float
+    :param max_interval: Idle polls back off up to this many seconds, defaults to ``60``.
+    :type max_interval: float
+
+    :returns: Watcher -- XinFin HTLC watcher instance.
+
+    .. note::
+        With ``websocket`` provider, ``events`` and ``run`` subscribe to contract logs
+        (or to new blocks when confirmations are needed) instead of polling on a timer.
+
+    >>> from swap.providers.xinfin.watcher import Watcher
+    >>> watcher: Watcher = Watcher(network="testnet", from_block=1)
+    >>> watcher.watch(contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7").on(print, kind="withdraw")
+    <swap.providers.xinfin.watcher.Watcher object at 0x0409DAF0>
+    >>> watcher.poll()
+    [Event(kind='fund', htlc='xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7', transaction_hash='0x0d4c93546aa3e5e476455931a63f1a97a2624e3b516e3fd8e3a582cb20aaeef9')]
+    """
+
+    def __init__(self, network: str = config["network"], provider: str = config["provider"],
+                 confirmations: int = 0, from_block: Optional[int] = None,
+                 interval: float = watcher_config["interval"], max_interval: float = watcher_config["max_interval"]):
+        super().__init__(network=network, confirmations=confirmations, interval=interval, max_interval=max_interval)
+
+        if not is_network(network=network):
+            raise NetworkError(f"Invalid XinFin '{network}' network",
+                               "choose only 'mainnet', 'apothem' or 'testnet' networks.")
+
+        self._provider: str = provider
+        self._from_block: Optional[int] = from_block
+        # Logs are always read over HTTP, websocket is used for subscriptions only
+        self.web3: Web3 = get_web3(network=network, provider="http")
+        self._events_abi: Dict[bytes, dict] = _load_events()
+
+    def watch(self, contract_address: Optional[str] = None, locked_contract_id: Optional[str] = None,
+              xrc20: bool = False) -> "Watcher":
+        """
+        Watch XinFin HTLC contract.
+
+        :param contract_address: XinFin HTLC contract address, defaults to ``None`` (network HTLC contract).
+        :type contract_address: str
+        :param locked_contract_id: XinFin HTLC locked contract id, defaults to ``None`` (every locked contract).
+        :type locked_contract_id: str
+        :param xrc20: HTLC XRC20 token, default to ``False``.
+        :type xrc20: bool
+
+        :returns: Watcher -- XinFin HTLC watcher instance.
+
+        >>> from swap.providers.xinfin.watcher import Watcher
+        >>> watcher: Watcher = Watcher(network="testnet")
+        >>> watcher.watch(contract_address="xdcdE06b10c67765c8C0b9F64E0eF423b45Eb86b8e7")
+        <swap.providers.xinfin.watcher.Watcher object at 0x0409DAF0>
+        """
+
+        contract_address = contract_address or \
+            config[self._network]["contract_addresses"]["htlc_xrc20" if xrc20 else "htlc"]
+        if not contract_address or not is_address(address=contract_address):
+            raise AddressError(f"Invalid XinFin HTLC contract '{contract_address}' address.")
+
+        contract_address = to_checksum_address(address=contract_address, prefix="xdc")
+        with self._lock:
+            if contract_address not in self._watched:
+                self._watched[contract_address] = dict(locked_contract_ids=set())
+            locked_contract_ids: Optional[set] = self._watched[contract_address]["locked_contract_ids"]
+            if locked_contract_id is None:
+                # Watching the whole contract covers every locked contract
+                self._watched[contract_address]["locked_contract_ids"] = None
+            elif locked_contract_ids is not None:
+                locked_contract_ids.add(HexBytes(locked_contract_id).hex())
+        return self
+
+    def _decode(self, logs: List[dict], watched: Dict[str, dict]) -> List[Event]:
+        events: List[Event] = []
+        for log in logs:
+            contract_address: str = to_checksum_address(address=log["address"], prefix="xdc")
+            if contract_address not in watched or not log["topics"] or log.get("removed"):
+                continue
+            event_abi: Optional[dict] = self._events_abi.get(bytes(HexBytes(log["topics"][0])))
+            if event_abi is None:
+                continue
+            event_data = get_event_data(self.web3.codec, event_abi, log)
+            locked_contract_id: str = HexBytes(event_data["args"]["locked_contract_id"]).hex()
+            locked_contract_ids: Optional[set] = watched[contract_address]["locked_contract_ids"]
+            if locked_contract_ids is not None and locked_contract_id not in locked_contract_ids:
+                continue
+            events.append(Event(
+                kind=KINDS[event_abi["name"]], htlc=contract_address,
+                transaction_hash=event_data["transactionHash"].hex(), network=self._network,
+                block_height=event_data["blockNumber"], data=dict(id=locked_contract_id, **{
+                    key: (HexBytes(value).hex() if isinstance(value, bytes) else value)
+                    for key, value in event_data["args"].items() if key != "locked_contract_id"
+                })
+            ))
+        return events
+
+    def _poll(self, watched: Dict[str, dict]) -> List[Event]:
+        to_block: int = self.web3.eth.block_number - max(self._confirmations - 1, 0)
+        from_block: int = to_block if self._from_block is None else self._from_block
+        events: List[Event] = []
+        for start in range(from_block, to_block + 1, watcher_config["block_range"]):
+            end: int = min(start + watcher_config["block_range"] - 1, to_block)
+            # One request covers every watched contract in the block range
+            events.extend(self._decode(logs=self.web3.eth.get_logs({
+                "fromBlock": start, "toBlock": end, "address": [
+                    to_checksum_address(address=contract_address, prefix="0x") for contract_address in watched
+                ]
+            }), watched=watched))
+            self._from_block = end + 1
+        return events
+
+    async def _subscribe(self) -> AsyncIterator[Event]:
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        endpoint: str = get_web3(network=self._network, provider="websocket").provider.endpoint_uri
+        while not self._stopped.is_set():
+            watched: Dict[str, dict] = self._watched_copy()
+            if not watched:
+                await asyncio.sleep(self._interval)
+                continue
+            async with websockets.connect(endpoint) as websocket:
+                # Logs are final only after confirmations, so blocks trigger the batched polls instead
+                await websocket.send(json.dumps(dict(
+                    jsonrpc="2.0", id=0, method="eth_subscribe",
+                    params=(["newHeads"] if self._confirmations else ["logs", dict(address=[
+                        to_checksum_address(address=contract_address, prefix="0x") for contract_address in watched
+                    ])])
+                )))
+                response_json: dict = json.loads(await websocket.recv())
+                if "error" in response_json:
+                    raise APIError(response_json["error"].get("message"), response_json["error"].get("code"))
+                # Catch up with the events emitted before the subscription
+                for event in await loop.run_in_executor(None, self.poll):
+                    yield event
+                while not self._stopped.is_set() and self._watched_copy() == watched:
+                    try:
+                        message: dict = json.loads(await asyncio.wait_for(websocket.recv(), timeout=self._interval))
+                    except asyncio.TimeoutError:
+                        continue
+                    if self._confirmations:
+                        events: List[Event] = await loop.run_in_executor(None, self.poll)
+                    else:
+                        events: List[Event] = self._dispatch(self._decode(
+                            logs=[log_entry_formatter(message["params"]["result"])], watched=watched
+                        ))
+                    for event in events:
+                        yield event
+
+    async def events(self) -> AsyncIterator[Event]:
+        """
+        Iterate new events asynchronously until stopped, subscribes with ``websocket`` provider.
+
+        :returns: async generator -- XinFin HTLC watcher events.
+        """
+
+        if self._provider != "websocket":
+            async for event in super().events():
+                yield event
+            return
+        self._stopped.clear()
+        async for event in self._subscribe():
+            yield event
+
+    def run(self, timeout: Optional[float] = None) -> None:
+        """
+        Follow watched HTLC contracts until stopped, emitting events to the callbacks.
+
+        :param timeout: Seconds to run, defaults to ``None`` (until stopped).
+        :type timeout: float
+        """
+
+        if self._provider != "websocket":
+            return super().run(timeout=timeout)
+
+        async def drain() -> None:
+            async for _ in self.events():
+                pass
+
+        loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(asyncio.wait_for(drain(), timeout=timeout))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.close()
@@ -7,13 +7,20 @@ from binascii import (
     hexlify, unhexlify
 )
 from random import choice
+from base64 import (
+    b64encode, b64decode
+)
+from functools import lru_cache
 from typing import (
-    Optional, Union
+    Any, Optional, Union, List, Dict, FrozenSet, Set, Tuple
 )
 
 import unicodedata
 import string
+import struct
+import json
 import os
+import re
 import hashlib
 
 # Alphabet and digits.
@@ -100,6 +107,70 @@ def generate_mnemonic(language: str = "english", strength: int = 128) -> str:
     return Mnemonic(language=language).generate(strength=strength)
 
 
+# Mnemonic languages, in language detection order
+MNEMONIC_LANGUAGES: List[str] = [
+    "english", "french", "italian", "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"
+]
+
+
+@lru_cache(maxsize=None)
+def _word_indexes(language: str) -> Dict[str, int]:
+    # Each wordlist file is read once, on first use of its language
+    return {word: index for index, word in enumerate(Mnemonic(language=language).wordlist)}
+
+
+@lru_cache(maxsize=None)
+def _word_languages() -> Dict[str, FrozenSet[str]]:
+    word_languages: Dict[str, Set[str]] = {}
+    for language in MNEMONIC_LANGUAGES:
+        for word in _word_indexes(language=language):
+            word_languages.setdefault(word, set()).add(language)
+    return {word: frozenset(languages) for word, languages in word_languages.items()}
+
+
+def _check_mnemonic(mnemonic: str, language: Optional[str] = None) -> Optional[Tuple[str, bytes]]:
+    """
+    Check mnemonic words checksum in one pass over the words.
+
+    :param mnemonic: Mnemonic words.
+    :type mnemonic: str
+    :param language: Mnemonic language, default to None (detected).
+    :type language: str
+
+    :returns: tuple -- Mnemonic language and entropy, None for invalid mnemonic words.
+    """
+
+    words: List[str] = unicodedata.normalize("NFKD", mnemonic).split(" ")
+    if len(words) not in [12, 15, 18, 21, 24]:
+        return None
+    if language:
+        languages: List[str] = [language]
+    else:
+        # Only languages having every word are checked, words of one language only resolve it at once
+        word_languages: Dict[str, FrozenSet[str]] = _word_languages()
+        candidates: FrozenSet[str] = frozenset(MNEMONIC_LANGUAGES)
+        for word in words:
+            candidates = candidates & word_languages.get(word, frozenset())
+            if not candidates:
+                return None
+        languages: List[str] = [_language for _language in MNEMONIC_LANGUAGES if _language in candidates]
+
+    checksum_length: int = len(words) // 3
+    for _language in languages:
+        word_indexes: Dict[str, int] = _word_indexes(language=_language)
+        bits: int = 0
+        for word in words:
+            index: Optional[int] = word_indexes.get(word)
+            if index is None:
+                break
+            bits = (bits << 11) | index
+        else:
+            entropy: bytes = (bits >> checksum_length).to_bytes(checksum_length * 4, byteorder="big")
+            if hashlib.sha256(entropy).digest()[0] >> (8 - checksum_length) == bits & ((1 << checksum_length) - 1):
+                return _language, entropy
+    return None
+
+
 def get_current_timestamp(plus: int = 0) -> int:
     """
     Get current timestamp.
@@ -156,17 +227,7 @@ def is_mnemonic(mnemonic: str, language: Optional[str] = None) -> bool:
         raise ValueError("invalid language, use only this options english, french, "
                          "italian, spanish, chinese_simplified, chinese_traditional, japanese or korean languages.")
     try:
-        mnemonic = unicodedata.normalize("NFKD", mnemonic)
-        if language is None:
-            for _language in ["english", "french", "italian",
-                              "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"]:
-                valid = False
-                if Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
-                    valid = True
-                    break
-            return valid
-        else:
-            return Mnemonic(language=language).check(mnemonic=mnemonic)
+        return _check_mnemonic(mnemonic=mnemonic, language=language) is not None
     except:
         return False
 
@@ -247,17 +308,11 @@ def get_mnemonic_language(mnemonic: str) -> str:
     "french"
     """
 
-    if not is_mnemonic(mnemonic=mnemonic):
+    checked: Optional[Tuple[str, bytes]] = \
+        _check_mnemonic(mnemonic=mnemonic) if isinstance(mnemonic, str) else None
+    if checked is None:
         raise ValueError("Invalid mnemonic words.")
-
-    language = None
-    mnemonic = unicodedata.normalize("NFKD", mnemonic)
-    for _language in ["english", "french", "italian",
-                      "chinese_simplified", "chinese_traditional", "japanese", "korean", "spanish"]:
-        if Mnemonic(language=_language).check(mnemonic=mnemonic) is True:
-            language = _language
-            break
-    return language
+    return checked[0]
 
 
 def entropy_to_mnemonic(entropy: str, language: str = "english") -> str:
@@ -303,12 +358,14 @@ def mnemonic_to_entropy(mnemonic: str, language: Optional[str] = None) -> str:
     "ee535b143b0d9d1f87546f9df0d06b1a"
     """
 
-    if not is_mnemonic(mnemonic=mnemonic, language=language):
+    if language and language not in MNEMONIC_LANGUAGES:
+        raise ValueError("invalid language, use only this options english, french, "
+                         "italian, spanish, chinese_simplified, chinese_traditional, japanese or korean languages.")
+    checked: Optional[Tuple[str, bytes]] = \
+        _check_mnemonic(mnemonic=mnemonic, language=language) if isinstance(mnemonic, str) else None
+    if checked is None:
         raise ValueError("Invalid mnemonic words.")
-
-    mnemonic = unicodedata.normalize("NFKD", mnemonic)
-    language = language if language else get_mnemonic_language(mnemonic=mnemonic)
-    return Mnemonic(language=language).to_entropy(mnemonic).hex()
+    return checked[1].hex()
 
 
 def sha256(data: Union[str, bytes]) -> str:
@@ -357,3 +414,306 @@ def clean_transaction_raw(transaction_raw: str) -> str:
     "eyJmZWUiOiAxMDAwMDAwMCwgImFkZHJlc3MiOiAiYm0xcTluZHlseDAyc3lmd2Q3bnBlaGZ4ejRsZGRoenFzdmUyZnU2dmM3IiwgInJhdyI6ICIwNzAxMDAwMjAxNWYwMTVkODJlNjVmOTY0ZDNjMzUzMjU0OGRmZGU5Mzg0NjJmNTY2Yzk1ZDNjOTBlNmEzYTE4MmEwYjNiZGFlNDZhYTc5MGZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MDg2ZjIwMzAxMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMjIwMTIwOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMjAxNWYwMTVkMDcwZDBlYjIyZDMyYjgyZDNkMmYzZmM0YmFmYjdhODVmNTIyOWY3ZmQ4OTA0MmQyZmYzMjU3Mzc1ZTQzZDNlYmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmOGY1Zjc0ZjAxMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMjIwMTIwOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMjAyMDE0NmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY5MDRlMDEyMjAwMjA0ZjhmMGU4OGQwYTQ0YjNkODg0YjA3YjZkZDQ1MzY1MThmZmNiYjU5NmE5MWNhMGU2YjJmMzdlOTY0NjNiYmZjMDAwMTNjZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmQ4YjhmODUyMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMDAiLCAiaGFzaCI6ICI1MGIzMzZhYjZlMDU1ZDlkNGQ2NWE5ZjIyOTViNTMyNzBhYmQzODE2YzIzYmE0Yzk1NDg0MWYzOTlhYTc3MmQ1IiwgInVuc2lnbmVkX2RhdGFzIjogW3siZGF0YXMiOiBbImY3ZDNhYTE4YjI5NWNkYTZmMmIxMTMyYzQyMzE5MzNjYzkyZjNiYWNhNzA1OTc0YzVkZTM3OGY5YjY5NWYwZTIiXSwgInB1YmxpY19rZXkiOiAiOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMiIsICJuZXR3b3JrIjogIm1haW5uZXQiLCAicGF0aCI6ICJtLzQ0LzE1My8xLzAvMSJ9LCB7ImRhdGFzIjogWyJjYTYxNWJhMmM3MjllNDYzZmJmNzlhMTE0MTkxNzYyNjFiMWJmNmJlNDQ4MTMzMzVkMmIyNTZlOGE3YmJjZWVlIl0sICJwdWJsaWNfa2V5IjogIjkxZmY3ZjUyNWZmNDA4NzRjNGY0N2YwY2FiNDJlNDZlM2JmNTNhZGFkNTlhZGVmOTU1OGFkMWI2NDQ4ZjIyZTIiLCAibmV0d29yayI6ICJtYWlubmV0IiwgInBhdGgiOiAibS80NC8xNTMvMS8wLzEifV0sICJzaWduYXR1cmVzIjogW10sICJuZXR3b3JrIjogIm1haW5uZXQiLCAidHlwZSI6ICJieXRvbV9mdW5kX3Vuc2lnbmVkIn0="
     """
     return str(transaction_raw + "=" * (-len(transaction_raw) % 4))
+
+
+# Compact transaction raw magic byte and format version, JSON transaction raws always start with "{"
+COMPACT_MAGIC: bytes = b"\xa7"
+COMPACT_VERSION: int = 1
+# Compact format version 1 value tags
+_NONE, _FALSE, _TRUE, _INTEGER, _NEGATIVE, _FLOAT, _STRING, _HEX, _PREFIXED_HEX, _LIST, _DICT, _TABLE = range(12)
+# Compact format version 1 string table (keys, networks and types), append only, never reorder
+_TABLE_STRINGS: List[str] = [
+    "fee", "type", "raw", "outputs", "amount", "n", "script", "network", "address", "hash",
+    "unsigned_datas", "datas", "public_key", "path", "signatures", "transaction", "signature",
+    "rawTransaction", "r", "s", "v", "erc20", "xrc20", "from", "to", "value", "nonce", "gas",
+    "gasPrice", "chainId", "data", "mainnet", "testnet", "solonet", "ropsten", "kovan", "rinkeby",
+    "apothem"
+] + [
+    f"{chain}_{kind}_{state}" for chain in [
+        "bitcoin", "bytom", "vapor", "ethereum", "ethereum_erc20", "xinfin", "xinfin_xrc20"
+    ] for kind in ["normal", "fund", "withdraw", "refund"] for state in ["unsigned", "signed"]
+]
+_TABLE_INDEXES: Dict[str, int] = {string: index for index, string in enumerate(_TABLE_STRINGS)}
+_HEX_PATTERN = re.compile(r"(?:[0-9a-f]{2})+")
+
+
+def _dump_varint(number: int, buffer: bytearray) -> None:
+    while number > 0x7f:
+        buffer.append((number & 0x7f) | 0x80)
+        number >>= 7
+    buffer.append(number)
+
+
+def _load_varint(data: bytes, position: int) -> tuple:
+    number, shift = 0, 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated compact transaction raw.")
+        byte: int = data[position]
+        number |= (byte & 0x7f) << shift
+        position, shift = position + 1, shift + 7
+        if not byte & 0x80:
+            return number, position
+
+
+def _dump_value(value: Any, buffer: bytearray) -> None:
+    if value is None:
+        buffer.append(_NONE)
+    elif isinstance(value, bool):
+        buffer.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        buffer.append(_INTEGER if value >= 0 else _NEGATIVE)
+        _dump_varint(abs(value), buffer)
+    elif isinstance(value, float):
+        buffer.append(_FLOAT)
+        buffer.extend(struct.pack(">d", value))
+    elif isinstance(value, str):
+        if value in _TABLE_INDEXES:
+            buffer.append(_TABLE)
+            _dump_varint(_TABLE_INDEXES[value], buffer)
+        elif _HEX_PATTERN.fullmatch(value):
+            # Lowercase hex strings (raws, scripts, hashes) are kept as raw bytes
+            buffer.append(_HEX)
+            _dump_varint(len(value) // 2, buffer)
+            buffer.extend(bytes.fromhex(value))
+        elif value[:2] == "0x" and _HEX_PATTERN.fullmatch(value, 2):
+            buffer.append(_PREFIXED_HEX)
+            _dump_varint(len(value) // 2 - 1, buffer)
+            buffer.extend(bytes.fromhex(value[2:]))
+        else:
+            encoded: bytes = value.encode()
+            buffer.append(_STRING)
+            _dump_varint(len(encoded), buffer)
+            buffer.extend(encoded)
+    elif isinstance(value, (list, tuple)):
+        buffer.append(_LIST)
+        _dump_varint(len(value), buffer)
+        for item in value:
+            _dump_value(item, buffer)
+    elif isinstance(value, dict):
+        buffer.append(_DICT)
+        _dump_varint(len(value), buffer)
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Transaction raw keys must be str, not '{type(key).__name__}' type.")
+            _dump_value(key, buffer)
+            _dump_value(item, buffer)
+    else:
+        raise TypeError(f"Object of type '{type(value).__name__}' is not transaction raw serializable.")
+
+
+def _load_value(data: bytes, position: int) -> tuple:
+    if position >= len(data):
+        raise ValueError("Truncated compact transaction raw.")
+    tag: int = data[position]
+    position += 1
+    if tag in (_NONE, _FALSE, _TRUE):
+        return (None, False, True)[tag], position
+    elif tag in (_INTEGER, _NEGATIVE):
+        number, position = _load_varint(data, position)
+        return (number if tag == _INTEGER else -number), position
+    elif tag == _FLOAT:
+        if position + 8 > len(data):
+            raise ValueError("Truncated compact transaction raw.")
+        return struct.unpack(">d", data[position:position + 8])[0], position + 8
+    elif tag == _TABLE:
+        index, position = _load_varint(data, position)
+        return _TABLE_STRINGS[index], position
+    elif tag in (_STRING, _HEX, _PREFIXED_HEX):
+        length, position = _load_varint(data, position)
+        value: bytes = data[position:position + length]
+        if len(value) != length:
+            raise ValueError("Truncated compact transaction raw.")
+        return (
+            value.decode() if tag == _STRING else value.hex() if tag == _HEX else f"0x{value.hex()}"
+        ), position + length
+    elif tag == _LIST:
+        count, position = _load_varint(data, position)
+        items: list = []
+        for _ in range(count):
+            item, position = _load_value(data, position)
+            items.append(item)
+        return items, position
+    elif tag == _DICT:
+        count, position = _load_varint(data, position)
+        items: dict = {}
+        for _ in range(count):
+            key, position = _load_value(data, position)
+            items[key], position = _load_value(data, position)
+        return items, position
+    raise ValueError(f"Invalid compact transaction raw value tag '{tag}'.")
+
+
+def dumps_transaction_raw(transaction_raw: dict, compact: bool = False) -> str:
+    """
+    Encode transaction raw.
+
+    :param transaction_raw: Transaction raw fields.
+    :type transaction_raw: dict
+    :param compact: Encode compact binary transaction raw, defaults to ``False`` (base64 JSON).
+    :type compact: bool
+
+    :returns: str -- Encoded transaction raw.
+
+    .. note::
+        Compact transaction raw is a versioned, type-tagged and length-prefixed binary layout,
+        lowercase hex strings are kept as raw bytes and common keys, networks and types as one byte.
+
+    >>> from swap.utils import dumps_transaction_raw
+    >>> dumps_transaction_raw(transaction_raw={"fee": 10000000, "network": "mainnet", "type": "bytom_fund_unsigned"})
+    "eyJmZWUiOiAxMDAwMDAwMCwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJ0eXBlIjogImJ5dG9tX2Z1bmRfdW5zaWduZWQifQ=="
+    >>> dumps_transaction_raw(transaction_raw={"fee": 10000000, "network": "mainnet", "type": "bytom_fund_unsigned"}, compact=True)
+    "pwEKAwsAA4Ct4gQLBwsfCwELMA=="
+    """
+
+    if not compact:
+        return b64encode(json.dumps(transaction_raw).encode()).decode()
+    buffer: bytearray = bytearray(COMPACT_MAGIC)
+    buffer.append(COMPACT_VERSION)
+    _dump_value(transaction_raw, buffer)
+    return b64encode(bytes(buffer)).decode()
+
+
+def loads_transaction_raw(transaction_raw: str) -> dict:
+    """
+    Decode transaction raw, compact binary and base64 JSON transaction raws are detected.
+
+    :param transaction_raw: Any transaction raw.
+    :type transaction_raw: str
+
+    :returns: dict -- Transaction raw fields.
+
+    >>> from swap.utils import loads_transaction_raw
+    >>> loads_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA")
+    {'fee': 10000000, 'network': 'mainnet', 'type': 'bytom_fund_unsigned'}
+    """
+
+    data: bytes = b64decode(clean_transaction_raw(transaction_raw).encode())
+    if data[:1] != COMPACT_MAGIC:
+        return json.loads(data.decode())
+    if data[1:2] != bytes([COMPACT_VERSION]):
+        raise ValueError(f"Unsupported compact transaction raw version '{data[1:2].hex()}'.")
+    loaded_transaction_raw, position = _load_value(data, 2)
+    if position != len(data) or not isinstance(loaded_transaction_raw, dict):
+        raise ValueError("Invalid compact transaction raw.")
+    return loaded_transaction_raw
+
+
+def is_compact_transaction_raw(transaction_raw: str) -> bool:
+    """
+    Check compact binary transaction raw.
+
+    :param transaction_raw: Any transaction raw.
+    :type transaction_raw: str
+
+    :returns: bool -- Compact/base64 JSON transaction raw.
+
+    >>> from swap.utils import is_compact_transaction_raw
+    >>> is_compact_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA")
+    True
+    """
+
+    try:
+        # Only the first base64 quantum is decoded, it holds the magic byte
+        return b64decode(transaction_raw[:4].encode())[:1] == COMPACT_MAGIC
+    except ValueError:
+        return False
+
+
+class TransactionRaw:
+    """
+    Parsed transaction raw envelope, it is decoded once on first field access.
+
+    :param transaction_raw: Any transaction raw.
+    :type transaction_raw: str
+
+    :returns: TransactionRaw -- Transaction raw envelope instance.
+
+    .. note::
+        Envelopes are shared by every ``parse_transaction_raw`` caller, their fields must not be mutated.
+
+    >>> from swap.utils import TransactionRaw
+    >>> transaction_raw: TransactionRaw = TransactionRaw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA")
+    >>> transaction_raw["type"]
+    "bytom_fund_unsigned"
+    """
+
+    def __init__(self, transaction_raw: str):
+        self._transaction_raw: str = clean_transaction_raw(transaction_raw)
+        self._loaded_transaction_raw: Optional[dict] = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self.loads()[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.loads()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.loads().get(key, default)
+
+    def loads(self) -> dict:
+        """
+        Get transaction raw fields.
+
+        :returns: dict -- Transaction raw fields.
+
+        >>> from swap.utils import TransactionRaw
+        >>> TransactionRaw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA").loads()
+        {'fee': 10000000, 'network': 'mainnet', 'type': 'bytom_fund_unsigned'}
+        """
+
+        if self._loaded_transaction_raw is None:
+            self._loaded_transaction_raw = loads_transaction_raw(transaction_raw=self._transaction_raw)
+        return self._loaded_transaction_raw
+
+    def compact(self) -> bool:
+        """
+        Check compact binary transaction raw.
+
+        :returns: bool -- Compact/base64 JSON transaction raw.
+
+        >>> from swap.utils import TransactionRaw
+        >>> TransactionRaw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA").compact()
+        True
+        """
+
+        return is_compact_transaction_raw(transaction_raw=self._transaction_raw)
+
+    def transaction_raw(self) -> str:
+        """
+        Get cleaned transaction raw.
+
+        :returns: str -- Cleaned transaction raw.
+
+        >>> from swap.utils import TransactionRaw
+        >>> TransactionRaw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA").transaction_raw()
+        "pwEKAwsAA4Ct4gQLBwsfCwELMA=="
+        """
+
+        return self._transaction_raw
+
+
+@lru_cache(maxsize=1024)
+def _parse_transaction_raw(transaction_raw: str) -> TransactionRaw:
+    return TransactionRaw(transaction_raw=transaction_raw)
+
+
+def parse_transaction_raw(transaction_raw: Union[str, TransactionRaw]) -> TransactionRaw:
+    """
+    Parse transaction raw envelope, envelopes are memoized by transaction raw.
+
+    :param transaction_raw: Any transaction raw or envelope.
+    :type transaction_raw: str, TransactionRaw
+
+    :returns: TransactionRaw -- Transaction raw envelope.
+
+    >>> from swap.utils import parse_transaction_raw
+    >>> parse_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA") is parse_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA")
+    True
+    """
+
+    if isinstance(transaction_raw, TransactionRaw):
+        return transaction_raw
+    if not isinstance(transaction_raw, str):
+        raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
+    return _parse_transaction_raw(clean_transaction_raw(transaction_raw))
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # coding=utf-8
 
+import subprocess
+import sys
 
 from swap.cli.__main__ import main as cli_main
 from swap import __version__
@@ -19,3 +21,48 @@ def test_swap_cli(cli_tester):
     version = cli_tester.invoke(cli_main, ["--version"])
     assert version.exit_code == 0
     assert version.output == "v%s\n" % __version__
+
+
+def test_swap_cli_lazy_providers():
+
+    assert cli_main.list_commands(None) == ["batch", "bitcoin", "bytom", "ethereum", "serve", "vapor", "xinfin"]
+    assert cli_main.get_command(None, "bit").name == "bitcoin"
+    assert cli_main.get_command(None, "bitcoin").list_commands(None) == [
+        "decode", "fund", "htlc", "refund", "sign", "submit", "withdraw"
+    ]
+
+    # Provider packages are imported only when their commands are invoked
+    modules = subprocess.run([sys.executable, "-c", (
+        "import sys; from swap.cli.__main__ import main; "
+        "main.get_command(None, 'bytom').get_command(None, 'decode'); "
+        "print(' '.join(sorted(sys.modules)))"
+    )], check=True, capture_output=True, text=True).stdout.split()
+    assert "swap.cli.providers.bytom.decode" in modules
+    assert "swap.cli.providers.bytom.htlc" not in modules
+    assert "swap.cli.providers.ethereum" not in modules
+    assert "equity" not in modules
+    assert "web3" not in modules
+    assert "solcx" not in modules
+
+
+def test_swap_cli_lazy_help():
+
+    # Help lists the static short help of every command, without importing any provider
+    for args in [["--help"], ["bitcoin", "--help"], ["ethereum", "--help"], ["bytom", "--help"]]:
+        help_output = subprocess.run([sys.executable, "-c", (
+            "import sys; from swap.cli.__main__ import main; "
+            f"main({args!r}, standalone_mode=False); "
+            "print(' '.join(sorted(sys.modules)), file=sys.stderr)"
+        )], check=True, capture_output=True, text=True)
+        assert "Commands:" in help_output.stdout
+        modules = help_output.stderr.split()
+        assert "web3" not in modules
+        assert "btcpy" not in modules
+        assert "pybytom" not in modules
+        assert "swap.providers" not in modules
+
+    help_output = subprocess.run([
+        sys.executable, "-c", "from swap.cli.__main__ import main; main(['bitcoin', '--help'])"
+    ], capture_output=True, text=True).stdout
+    assert "Select Bitcoin Transaction raw signer." in help_output
+    assert "Select Bitcoin Fund transaction builder." in help_output
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import subprocess
+import tempfile
+import socket
+import json
+import time
+import sys
+import os
+
+from swap.cli.__main__ import main as cli_main
+from swap import __version__
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_swap_cli_batch(cli_tester):
+
+    batch = cli_tester.invoke(
+        cli_main, ["batch"], input="\n".join([
+            json.dumps({"id": 1, "args": [
+                "bitcoin", "decode", "--transaction-raw", _["bitcoin"]["fund"]["unsigned"]["transaction_raw"]
+            ]}),
+            json.dumps({"id": 2, "args": ["--version"]}),
+            json.dumps({"id": 3, "args": ["bitcoin", "unknown"]}),
+            "",
+            json.dumps({"id": 4, "args": ["batch"]}),
+            "unknown",
+            json.dumps({"id": 5, "args": ["ba"]}),
+            json.dumps({"id": 6, "args": ["se", "--socket", "swap.sock"]})
+        ])
+    )
+
+    assert batch.exit_code == 0
+    results = [json.loads(line) for line in batch.output.splitlines()]
+    assert [result["id"] for result in results] == [1, 2, 3, 4, None, 5, 6]
+    assert results[0]["error"] is None
+    assert results[0]["result"]["fee"] == _["bitcoin"]["fund"]["unsigned"]["fee"]
+    assert results[0]["result"]["network"] == _["bitcoin"]["network"]
+    assert results[1] == {"id": 2, "result": f"v{__version__}", "error": None}
+    assert results[2]["result"] is None and results[2]["error"] == "No such command 'unknown'."
+    assert results[3]["error"] == "Command 'batch' can't be run in batch mode."
+    assert results[4]["error"]
+    # Aliases resolve to the nested commands and are refused too
+    assert results[5]["error"] == "Command 'batch' can't be run in batch mode."
+    assert results[6]["error"] == "Command 'serve' can't be run in batch mode."
+
+
+def test_swap_cli_serve(cli_tester):
+
+    socket_path: str = os.path.join(tempfile.mkdtemp(), "swap.sock")
+    server = subprocess.Popen([
+        sys.executable, "-c", "from swap.cli.__main__ import main; main()", "serve", "--socket", socket_path
+    ])
+    try:
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.1)
+        client = socket.socket(socket.AF_UNIX)
+        client.connect(socket_path)
+        stream = client.makefile("rwb")
+        for index in range(3):
+            stream.write(json.dumps({"id": index, "args": ["--version"]}).encode() + b"\n")
+            stream.flush()
+            assert json.loads(stream.readline()) == {"id": index, "result": f"v{__version__}", "error": None}
+        # Non UTF-8 line gets an error line, the connection keeps serving
+        stream.write(b"\xff\n")
+        stream.write(json.dumps({"id": 3, "args": ["--version"]}).encode() + b"\n")
+        stream.flush()
+        assert json.loads(stream.readline()) == {
+            "id": None, "result": None, "error": "Invalid command, it is not UTF-8 encoded."
+        }
+        assert json.loads(stream.readline())["id"] == 3
+        client.close()
+
+        # Live socket of another server is not taken over
+        serve = cli_tester.invoke(cli_main, ["serve", "--socket", socket_path])
+        assert serve.exit_code == 2
+        assert "is already served by another server" in serve.output
+        assert os.path.exists(socket_path)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    assert not os.path.exists(socket_path)
+
+
+def test_swap_cli_serve_socket_path(cli_tester):
+
+    file_path: str = os.path.join(tempfile.mkdtemp(), "swap.sock")
+    with open(file_path, "w") as file:
+        file.write("not a socket")
+    serve = cli_tester.invoke(cli_main, ["serve", "--socket", file_path])
+    assert serve.exit_code == 2
+    assert "already exists and it is not a Unix socket" in serve.output
+    with open(file_path, "r") as file:
+        assert file.read() == "not a socket"
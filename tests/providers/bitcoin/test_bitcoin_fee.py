@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import pytest
+import json
+import os
+
+from btcpy.structs.script import ScriptSig
+from btcpy.structs.transaction import (
+    MutableTransaction, TxIn, TxOut, Sequence, Locktime
+)
+from btcpy.setup import setup
+
+from swap.providers.bitcoin.fee import (
+    FeeEstimator, script_sig_size, estimate_size, estimate_fee
+)
+from swap.providers.bitcoin.utils import (
+    get_address_hash, fee_calculator
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_bitcoin_fee():
+
+    assert script_sig_size(script_type="p2pkh") == 108
+    assert script_sig_size(script_type="withdraw", secret_size=14) == 222
+    assert script_sig_size(script_type="refund") == 207
+    with pytest.raises(ValueError, match="Invalid Bitcoin 'unknown' script type"):
+        script_sig_size(script_type="unknown")
+
+    setup(_["bitcoin"]["network"], strict=True, force=True)
+    unsigned_transaction = MutableTransaction(
+        version=2, ins=[TxIn(
+            txid=_["bitcoin"]["transaction_hash"], txout=0,
+            script_sig=ScriptSig.empty(), sequence=Sequence.max()
+        )], outs=[TxOut(
+            value=10_000, n=0, script_pubkey=get_address_hash(
+                address=_["bitcoin"]["wallet"]["recipient"]["address"], script=True
+            )
+        ), TxOut(
+            value=10_000, n=1, script_pubkey=get_address_hash(
+                address=_["bitcoin"]["wallet"]["sender"]["address"], script=True
+            )
+        )], locktime=Locktime(0)
+    )
+    assert estimate_size(transaction=unsigned_transaction) == 227
+    assert estimate_fee(transaction=unsigned_transaction, fee_rate=2.5) == 568
+    assert estimate_fee(transaction=unsigned_transaction, fee_rate=2.5) == fee_calculator(1, 2, fee_rate=2.5)
+    assert estimate_size(transaction=unsigned_transaction, script_types=["refund"]) == 227 - 108 + 207
+
+    calls = []
+
+    def source(network: str) -> float:
+        calls.append(network)
+        if len(calls) > 2:
+            raise ConnectionError("Fee rate source is down.")
+        return 0.5 * len(calls)
+
+    fee_estimator = FeeEstimator(source=source, ttl=60, min_fee_rate=1)
+    assert fee_estimator.fee_rate(network="testnet") == 1
+    assert fee_estimator.fee_rate(network="testnet") == 1
+    assert calls == ["testnet"]
+    assert fee_estimator.fee_rate(network="mainnet") == 1
+    assert isinstance(fee_estimator.clear(), FeeEstimator)
+    with pytest.raises(ConnectionError):
+        fee_estimator.fee_rate(network="testnet")
+
+    stale_fee_estimator = FeeEstimator(source=source, ttl=0)
+    calls.clear()
+    assert stale_fee_estimator.fee_rate(network="testnet") == 1
+    assert stale_fee_estimator.fee_rate(network="testnet") == 1
+    assert stale_fee_estimator.fee_rate(network="testnet") == 1
+    assert len(calls) == 3
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ThreadPoolExecutor
+
+import btcpy.setup
+import pytest
+import json
+import os
+
+from swap.exceptions import NetworkError
+from swap.providers.bitcoin.network import network_context
+from swap.providers.bitcoin.utils import (
+    get_address_type, decode_transaction_raw
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_bitcoin_network_context():
+
+    with network_context(network="mainnet"):
+        assert btcpy.setup.is_mainnet() and btcpy.setup.net_name() == "mainnet"
+        with network_context(network="testnet"):
+            assert not btcpy.setup.is_mainnet() and btcpy.setup.net_name() == "testnet"
+        assert btcpy.setup.is_mainnet() and btcpy.setup.net_name() == "mainnet"
+
+    with pytest.raises(NetworkError, match=r"Invalid Bitcoin 'solonet' network"):
+        with network_context(network="solonet"):
+            pass
+
+
+def test_bitcoin_network_context_threads():
+
+    transaction_raw: str = _["bitcoin"]["fund"]["unsigned"]["transaction_raw"]
+    addresses: list = [
+        "1MsHWS1BnwMc3tLE8G35UXsS58fKipzB7a", "mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC"
+    ] * 50
+
+    # Mainnet and testnet addresses are loaded concurrently, each one in its own network
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(lambda address: get_address_type(address=address), addresses)) == \
+            ["p2pkh"] * len(addresses)
+        assert all(
+            decoded == decode_transaction_raw(transaction_raw=transaction_raw) for decoded in
+            executor.map(lambda __: decode_transaction_raw(transaction_raw=transaction_raw), range(20))
+        )
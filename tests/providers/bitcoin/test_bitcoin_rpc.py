@@ -5,9 +5,12 @@ import requests
 import json
 import os
 
-from swap.exceptions import APIError
+from swap.exceptions import (
+    APIError, AddressError
+)
+from swap.providers.bitcoin import rpc
 from swap.providers.bitcoin.rpc import (
-    decode_raw, submit_raw
+    decode_raw, submit_raw, iter_utxos
 )
 
 # Test Values
@@ -25,3 +28,44 @@ def test_bitcoin_rpc():
     # (REQ_ERROR) 16: mandatory-script-verify-flag-failed (Operation not valid with the current stack size)
     with pytest.raises((APIError, requests.exceptions.ConnectionError)):
         submit_raw(raw=_["bitcoin"]["fund"]["unsigned"]["raw"], network=_["bitcoin"]["network"])
+
+    with pytest.raises(AddressError, match="Invalid Bitcoin 'unknown' testnet address."):
+        iter_utxos(address="unknown", network="testnet")
+
+
+def test_bitcoin_rpc_iter_utxos_pages(monkeypatch):
+
+    # Block 101 outputs are split across the first and second page edge
+    txrefs: list = [
+        {"tx_hash": "c3", "tx_output_n": 0, "block_height": 102, "value": 3000},
+        {"tx_hash": "b2", "tx_output_n": 0, "block_height": 101, "value": 2000},
+        {"tx_hash": "b2", "tx_output_n": 1, "block_height": 101, "value": 2100},
+        {"tx_hash": "a1", "tx_output_n": 0, "block_height": 100, "value": 1000}
+    ]
+    requests_parameters: list = []
+
+    class Response:
+        def __init__(self, response_json: dict):
+            self._response_json = response_json
+
+        def json(self) -> dict:
+            return self._response_json
+
+    def get(url: str, params: dict, headers: dict, timeout: int) -> Response:
+        requests_parameters.append(dict(params))
+        page: list = [
+            txref for txref in txrefs if "before" not in params or txref["block_height"] < params["before"]
+        ]
+        return Response(dict(txrefs=page[:params["limit"]], hasMore=(len(page) > params["limit"])))
+
+    monkeypatch.setattr(rpc.session, "get", get)
+
+    utxos: list = list(iter_utxos(address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", network="testnet", limit=2))
+    assert [(utxo["tx_hash"], utxo["tx_output_n"]) for utxo in utxos] == [
+        ("c3", 0), ("b2", 0), ("b2", 1), ("a1", 0)
+    ]
+    assert [parameter.get("before") for parameter in requests_parameters] == [None, 102, 101]
+
+    assert list(iter_utxos(
+        address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", network="testnet", limit=2, pages=True
+    )) == [txrefs[:2], txrefs[2:3], txrefs[3:]]
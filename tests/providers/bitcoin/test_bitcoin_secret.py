@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import pytest
+import json
+import os
+
+from swap.providers.bitcoin import secret
+from swap.providers.bitcoin.secret import (
+    extract_secret, scan_secrets, _script_secret
+)
+from swap.exceptions import (
+    APIError, NetworkError
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_bitcoin_secret():
+
+    assert _script_secret(
+        _["bitcoin"]["withdraw"]["signed"]["json"]["vin"][0]["scriptSig"]["hex"]
+    ) == _["bitcoin"]["htlc"]["secret"]["key"]
+    assert _script_secret(_["bitcoin"]["refund"]["signed"]["json"]["vin"][0]["scriptSig"]["hex"]) is None
+    assert _script_secret("") is None
+
+    with pytest.raises(NetworkError, match=r"Invalid Bitcoin 'solonet' network"):
+        extract_secret(transaction_hash=_["bitcoin"]["withdraw"]["signed"]["hash"], network="solonet")
+    with pytest.raises(NetworkError, match=r"Invalid Bitcoin 'solonet' network"):
+        scan_secrets(secret_hashes=[_["bitcoin"]["htlc"]["secret"]["hash"]], start_block=0, end_block=1, network="solonet")
+    assert scan_secrets(secret_hashes=[], start_block=0, end_block=1, network=_["bitcoin"]["network"]) == {}
+
+
+def test_bitcoin_scan_secrets(monkeypatch):
+
+    # Block 100 has the refund, block 101 the withdraw and block 102 is never fetched
+    blocks: dict = {
+        100: [_["bitcoin"]["refund"]["signed"]["json"]["vin"][0]["scriptSig"]["hex"]],
+        101: [None, _["bitcoin"]["withdraw"]["signed"]["json"]["vin"][0]["scriptSig"]["hex"]],
+        102: []
+    }
+    block_heights: list = []
+
+    class Response:
+        def __init__(self, status_code: int, response_json: dict):
+            self.status_code = status_code
+            self._response_json = response_json
+
+        def json(self) -> dict:
+            return self._response_json
+
+    def get(url: str, params: dict, headers: dict, timeout: int) -> Response:
+        block_height: int = int(url.rsplit("/", 1)[-1])
+        block_heights.append(block_height)
+        if block_height not in blocks:
+            return Response(404, dict(error="Block not found"))
+        return Response(200, dict(blocks=[dict(tx=[
+            dict(inputs=[dict(script=script)]) for script in blocks[block_height]
+        ])]))
+
+    monkeypatch.setattr(secret.session, "get", get)
+
+    assert scan_secrets(
+        secret_hashes=[_["bitcoin"]["htlc"]["secret"]["hash"].upper()], start_block=100, end_block=102,
+        network=_["bitcoin"]["network"]
+    ) == {_["bitcoin"]["htlc"]["secret"]["hash"]: _["bitcoin"]["htlc"]["secret"]["key"]}
+    assert block_heights == [100, 101]
+
+    with pytest.raises(APIError, match=r"Can't get this '99' Bitcoin block."):
+        scan_secrets(
+            secret_hashes=[_["bitcoin"]["htlc"]["secret"]["hash"]], start_block=99, end_block=100,
+            network=_["bitcoin"]["network"]
+        )
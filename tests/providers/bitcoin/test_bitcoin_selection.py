@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from swap.providers.bitcoin.selection import (
+    select_utxos, first_fit, largest_first, smallest_first, branch_and_bound, knapsack
+)
+from swap.providers.bitcoin.utils import fee_calculator
+
+utxos = [{"value": 5000}, {"value": 20000}, {"value": 8000}, {"value": 300}]
+
+
+def test_bitcoin_selection():
+
+    assert first_fit(utxos=utxos, amount=10000) == [0, 1]
+    assert largest_first(utxos=utxos, amount=10000) == [1]
+    assert smallest_first(utxos=utxos, amount=10000) == [0, 2]
+    assert knapsack(utxos=utxos, amount=10000) == [0, 2]
+    assert knapsack(utxos=utxos, amount=15000) == [1]
+
+    indexes = branch_and_bound(utxos=[
+        {"value": 5000}, {"value": 20000}, {"value": 6100}
+    ], amount=10000, transaction_output=1)
+    assert indexes == [0, 2]
+    assert 0 <= (11100 - (10000 + fee_calculator(len(indexes), 1))) <= \
+        (fee_calculator(len(indexes), 2) - fee_calculator(len(indexes), 1))
+    assert branch_and_bound(utxos=utxos, amount=10000, transaction_output=1) is None
+
+    assert first_fit(utxos=utxos, amount=50000) is None
+    assert largest_first(utxos=utxos, amount=50000) is None
+    assert knapsack(utxos=utxos, amount=50000) is None
+
+    assert select_utxos(utxos=utxos, amount=10000) == ([0, 1], 33300)
+    assert select_utxos(utxos=utxos, amount=10000, strategy="largest-first") == ([1], 33300)
+    assert select_utxos(utxos=utxos, amount=10000, transaction_output=1, strategy="branch-and-bound") == ([0, 2], 33300)
+    assert select_utxos(utxos=utxos, amount=50000, strategy="knapsack") == ([0, 1, 2, 3], 33300)
+
+    with pytest.raises(ValueError, match="Invalid Bitcoin 'unknown' coin selection strategy"):
+        select_utxos(utxos=utxos, amount=10000, strategy="unknown")
@@ -185,3 +185,39 @@ def test_bitcoin_refund_signature():
     assert refund_signature.transaction_raw() == clean_transaction_raw(
         transaction_raw=_["bitcoin"]["refund"]["signed"]["transaction_raw"]
     )
+
+
+def test_bitcoin_signature_sign_many():
+
+    unsigned_withdraw_transaction_raw = _["bitcoin"]["withdraw"]["unsigned"]["transaction_raw"]
+    unsigned_refund_transaction_raw = _["bitcoin"]["refund"]["unsigned"]["transaction_raw"]
+
+    withdraw_solver = WithdrawSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["recipient"]["root_xprivate_key"],
+        secret_key=_["bitcoin"]["htlc"]["secret"]["key"],
+        bytecode=_["bitcoin"]["htlc"]["bytecode"],
+        path=_["bitcoin"]["wallet"]["recipient"]["derivation"]["path"]
+    )
+    refund_solver = RefundSolver(
+        xprivate_key=_["bitcoin"]["wallet"]["sender"]["root_xprivate_key"],
+        bytecode=_["bitcoin"]["htlc"]["bytecode"],
+        endtime=_["bitcoin"]["htlc"]["endtime"],
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    signed_withdraw_transaction_raw = clean_transaction_raw(
+        transaction_raw=_["bitcoin"]["withdraw"]["signed"]["transaction_raw"]
+    )
+    # Signed in this process and in a process pool, in the same order
+    assert list(WithdrawSignature(network=_["bitcoin"]["network"]).sign_many(
+        transaction_raws=[unsigned_withdraw_transaction_raw] * 3, solver=withdraw_solver, processes=1
+    )) == [signed_withdraw_transaction_raw] * 3
+    assert list(Signature(network=_["bitcoin"]["network"]).sign_many(
+        transaction_raws=[unsigned_withdraw_transaction_raw] * 10, solver=withdraw_solver, processes=2
+    )) == [signed_withdraw_transaction_raw] * 10
+    assert list(RefundSignature(network=_["bitcoin"]["network"]).sign_many(
+        transaction_raws=[unsigned_refund_transaction_raw] * 4, solver=refund_solver, processes=2
+    )) == [clean_transaction_raw(transaction_raw=_["bitcoin"]["refund"]["signed"]["transaction_raw"])] * 4
+    assert list(Signature(network=_["bitcoin"]["network"]).sign_many(
+        transaction_raws=[], solver=withdraw_solver
+    )) == []
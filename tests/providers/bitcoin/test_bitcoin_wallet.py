@@ -191,3 +191,33 @@ def test_bitcoin_wallet_from_private_key():
 
     # assert isinstance(wallet.balance(), int)
     # assert isinstance(wallet.utxos(), list)
+
+
+def test_bitcoin_wallet_derive_range():
+
+    wallet = Wallet(network=_["bitcoin"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["bitcoin"]["wallet"]["sender"]["entropy"],
+        language=_["bitcoin"]["wallet"]["sender"]["language"],
+        passphrase=_["bitcoin"]["wallet"]["sender"]["passphrase"]
+    )
+
+    wallet.from_path(
+        path=_["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    addresses = wallet.derive_range(
+        account=_["bitcoin"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["bitcoin"]["wallet"]["sender"]["derivation"]["change"],
+        start=0, count=3
+    )
+
+    assert wallet.path() == _["bitcoin"]["wallet"]["sender"]["derivation"]["path"]
+    assert len(addresses) == 3
+    assert wallet.derive_range(account=0, start=0 + 1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=0, start=0, count=0) == []
+    for address, public_key, path in addresses:
+        wallet.clean_derivation()
+        wallet.from_path(path=path)
+        assert (address, public_key) == (wallet.address(), wallet.public_key())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import pytest
+import json
+import os
+
+from swap.providers.bitcoin.watcher import (
+    Watcher, _script_pushes
+)
+from swap.exceptions import AddressError
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_bitcoin_watcher():
+
+    withdraw_script: str = _["bitcoin"]["withdraw"]["signed"]["json"]["vin"][0]["scriptSig"]["hex"]
+    refund_script: str = _["bitcoin"]["refund"]["signed"]["json"]["vin"][0]["scriptSig"]["hex"]
+    assert _script_pushes(withdraw_script)[-3] == _["bitcoin"]["htlc"]["secret"]["key"].encode()
+    assert _script_pushes(withdraw_script)[-2] == b"\x01"
+    assert _script_pushes(refund_script)[-2] == b""
+    assert _script_pushes(refund_script)[-1].hex() == _["bitcoin"]["htlc"]["bytecode"]
+
+    watcher: Watcher = Watcher(network=_["bitcoin"]["network"], confirmations=1)
+    with pytest.raises(AddressError, match=r"Invalid Bitcoin HTLC"):
+        watcher.watch(address=_["bitcoin"]["wallet"]["sender"]["address"])
+    assert watcher.watch(address=_["bitcoin"]["htlc"]["contract_address"]).watching() == [
+        _["bitcoin"]["htlc"]["contract_address"]
+    ]
+
+    fund_transaction: dict = {
+        "hash": _["bitcoin"]["fund"]["signed"]["hash"], "block_height": 1938000, "confirmations": 3,
+        "inputs": [{
+            "prev_hash": _["bitcoin"]["transaction_hash"], "output_index": 1, "output_value": 1193208,
+            "script": "", "addresses": [_["bitcoin"]["wallet"]["sender"]["address"]]
+        }],
+        "outputs": [
+            {"value": 1000000, "addresses": [_["bitcoin"]["htlc"]["contract_address"]]},
+            {"value": 182632, "addresses": [_["bitcoin"]["wallet"]["sender"]["address"]]}
+        ]
+    }
+    events = watcher._events(address=_["bitcoin"]["htlc"]["contract_address"], transaction=fund_transaction)
+    assert [(event.kind, event.transaction_hash, event.block_height, event.data["value"]) for event in events] == [
+        ("fund", _["bitcoin"]["fund"]["signed"]["hash"], 1938000, 1000000)
+    ]
+
+    for kind, script in [("withdraw", withdraw_script), ("refund", refund_script)]:
+        spend_transaction: dict = {
+            "hash": _["bitcoin"][kind]["signed"]["hash"], "block_height": -1, "confirmations": 0,
+            "inputs": [{
+                "prev_hash": _["bitcoin"]["fund"]["signed"]["hash"], "output_index": 0, "output_value": 1000000,
+                "script": script, "addresses": [_["bitcoin"]["htlc"]["contract_address"]]
+            }],
+            "outputs": [{"value": 999424, "addresses": [_["bitcoin"]["wallet"]["recipient"]["address"]]}]
+        }
+        assert watcher._events(address=_["bitcoin"]["htlc"]["contract_address"], transaction=spend_transaction) == []
+        spend_transaction.update(block_height=1938001, confirmations=1)
+        events = watcher._events(address=_["bitcoin"]["htlc"]["contract_address"], transaction=spend_transaction)
+        assert [(event.kind, event.transaction_hash, event.data["id"]) for event in events] == [
+            (kind, _["bitcoin"][kind]["signed"]["hash"], f"{_['bitcoin']['fund']['signed']['hash']}:0")
+        ]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import pytest
+import json
+import os
+
+from swap.providers.bytom import secret
+from swap.providers.bytom.secret import (
+    extract_secret, scan_secrets, _witness_secret
+)
+from swap.exceptions import (
+    APIError, NetworkError
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_bytom_secret():
+
+    assert _witness_secret(
+        _["bytom"]["withdraw"]["signed"]["signatures"][0]
+    ) == _["bytom"]["htlc"]["secret"]["key"]
+    assert _witness_secret(_["bytom"]["refund"]["signed"]["signatures"][0]) is None
+    assert _witness_secret(None) is None
+
+    with pytest.raises(NetworkError, match=r"Invalid Bytom 'unknown' network"):
+        extract_secret(transaction_hash=_["bytom"]["withdraw"]["signed"]["hash"], network="unknown")
+    with pytest.raises(NetworkError, match=r"Invalid Bytom 'unknown' network"):
+        scan_secrets(secret_hashes=[_["bytom"]["htlc"]["secret"]["hash"]], start_block=0, end_block=1, network="unknown")
+    assert scan_secrets(secret_hashes=[], start_block=0, end_block=1, network=_["bytom"]["network"]) == {}
+
+
+def test_bytom_scan_secrets(monkeypatch):
+
+    # Block 100 has the refund, block 101 the withdraw and block 102 is never fetched
+    blocks: dict = {
+        100: [_["bytom"]["refund"]["signed"]["signatures"][0]],
+        101: [None, _["bytom"]["withdraw"]["signed"]["signatures"][0]],
+        102: []
+    }
+    block_heights: list = []
+
+    class Response:
+        def __init__(self, status_code: int, response_json: dict):
+            self.status_code = status_code
+            self._response_json = response_json
+
+        def json(self) -> dict:
+            return self._response_json
+
+    def post(url: str, data: str, headers: dict, timeout: int) -> Response:
+        block_height: int = json.loads(data)["block_height"]
+        block_heights.append(block_height)
+        if block_height not in blocks:
+            return Response(400, dict(status="fail", code="BTM761", msg="Block not found"))
+        return Response(200, dict(status="success", data=dict(transactions=[
+            dict(inputs=[dict(witness_arguments=witness_arguments)]) for witness_arguments in blocks[block_height]
+        ])))
+
+    monkeypatch.setattr(secret.session, "post", post)
+
+    assert scan_secrets(
+        secret_hashes=[_["bytom"]["htlc"]["secret"]["hash"].upper()], start_block=100, end_block=102,
+        network=_["bytom"]["network"]
+    ) == {_["bytom"]["htlc"]["secret"]["hash"]: _["bytom"]["htlc"]["secret"]["key"]}
+    assert block_heights == [100, 101]
+
+    with pytest.raises(APIError, match=r"Block not found"):
+        scan_secrets(
+            secret_hashes=[_["bytom"]["htlc"]["secret"]["hash"]], start_block=99, end_block=100,
+            network=_["bytom"]["network"]
+        )
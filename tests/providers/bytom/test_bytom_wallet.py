@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
@@ -181,3 +182,59 @@ def test_bytom_wallet_from_private_key():
 
     # assert isinstance(wallet.balance(), int)
     # assert isinstance(wallet.utxos(), list)
+
+
+def test_bytom_wallet_derive_range():
+
+    wallet = Wallet(network=_["bytom"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["bytom"]["wallet"]["sender"]["entropy"],
+        language=_["bytom"]["wallet"]["sender"]["language"],
+        passphrase=_["bytom"]["wallet"]["sender"]["passphrase"]
+    )
+
+    wallet.from_path(
+        path=_["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    addresses = wallet.derive_range(
+        account=_["bytom"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["bytom"]["wallet"]["sender"]["derivation"]["change"],
+        start=1, count=3
+    )
+
+    assert wallet.path() == _["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    assert len(addresses) == 3
+    assert wallet.derive_range(account=1, start=1 + 1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=1, start=1, count=0) == []
+    assert addresses[0] == (
+        _["bytom"]["wallet"]["sender"]["address"],
+        _["bytom"]["wallet"]["sender"]["public_key"],
+        _["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    )
+    for address, public_key, path in addresses:
+        wallet.clean_derivation()
+        wallet.from_path(path=path)
+        assert (address, public_key) == (wallet.address(), wallet.public_key())
+
+
+def test_bytom_wallet_derive_range_restore(monkeypatch):
+
+    wallet = Wallet(network=_["bytom"]["network"])
+    wallet.from_entropy(
+        entropy=_["bytom"]["wallet"]["sender"]["entropy"],
+        language=_["bytom"]["wallet"]["sender"]["language"],
+        passphrase=_["bytom"]["wallet"]["sender"]["passphrase"]
+    )
+    wallet.from_path(path=_["bytom"]["wallet"]["sender"]["derivation"]["path"])
+
+    def child_xpublic_key():
+        raise ValueError("Derivation failed.")
+
+    # Wallet stays on its own path when the range derivation fails halfway
+    monkeypatch.setattr(wallet._hdwallet, "child_xpublic_key", child_xpublic_key)
+    with pytest.raises(ValueError, match="Derivation failed."):
+        wallet.derive_range(account=1, start=1, count=3)
+    assert wallet.path() == _["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    assert wallet.address() == _["bytom"]["wallet"]["sender"]["address"]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+import json
+import os
+
+from swap.providers.ethereum.index import LockedContractIndex
+from swap.exceptions import (
+    AddressError, NetworkError
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_ethereum_index(tmp_path):
+
+    with pytest.raises(NetworkError, match=r"Invalid Ethereum 'unknown' network"):
+        LockedContractIndex(network="unknown")
+    with pytest.raises(AddressError, match=r"Invalid Ethereum HTLC contract"):
+        LockedContractIndex(network="testnet")
+
+    path: str = str(tmp_path / "index.sqlite")
+    index: LockedContractIndex = LockedContractIndex(
+        network=_["ethereum"]["network"], contract_address=_["ethereum"]["htlc"]["contract_address"], path=path
+    )
+    assert index.contract_address() == _["ethereum"]["htlc"]["contract_address"]
+    assert index.block_number() is None
+
+    locked_contract_id: str = "0x" + _["ethereum"]["withdraw"]["signed"]["json"]["data"][10:74]
+    index._apply(name="log_fund", args=dict(
+        locked_contract_id=bytes.fromhex(locked_contract_id[2:]),
+        secret_hash=bytes.fromhex(_["ethereum"]["htlc"]["agreements"]["secret_hash"]),
+        recipient=_["ethereum"]["htlc"]["agreements"]["recipient_address"],
+        sender=_["ethereum"]["htlc"]["agreements"]["sender_address"],
+        endtime=_["ethereum"]["htlc"]["agreements"]["endtime"]["timestamp"], amount=10 ** 30
+    ), transaction_hash=_["ethereum"]["fund"]["signed"]["hash"], block_number=100)
+    index._set_block_number(block_number=100)
+
+    assert index.locked_contract_id(transaction_hash=_["ethereum"]["fund"]["signed"]["hash"]) == locked_contract_id
+    assert index.find(secret_hash=_["ethereum"]["htlc"]["agreements"]["secret_hash"])[0]["amount"] == 10 ** 30
+    assert index.find(recipient=_["ethereum"]["htlc"]["agreements"]["recipient_address"].lower())[0]["sender"] == \
+        _["ethereum"]["htlc"]["agreements"]["sender_address"]
+    assert [row["locked_contract_id"] for row in index.open_contracts()] == [locked_contract_id]
+
+    index._apply(
+        name="log_withdraw", args=dict(locked_contract_id=bytes.fromhex(locked_contract_id[2:])),
+        transaction_hash=_["ethereum"]["withdraw"]["signed"]["hash"], block_number=101
+    )
+    assert index.open_contracts() == []
+    assert index.get(locked_contract_id=locked_contract_id)["status"] == "withdrawn"
+    assert index.get(locked_contract_id=locked_contract_id)["withdraw_transaction_hash"] == \
+        _["ethereum"]["withdraw"]["signed"]["hash"]
+    with pytest.raises(ValueError, match=r"Invalid locked contract 'closed' status"):
+        index.find(status="closed")
+    index.close()
+
+    # Index is persisted, a new instance resumes after the last indexed block
+    index = LockedContractIndex(
+        network=_["ethereum"]["network"], contract_address=_["ethereum"]["htlc"]["contract_address"], path=path
+    )
+    assert index.block_number() == 100
+    assert index.find(status="withdrawn")[0]["locked_contract_id"] == locked_contract_id
+    index.close()
+
+
+def test_ethereum_index_sync_reorg(monkeypatch):
+
+    index: LockedContractIndex = LockedContractIndex(
+        network=_["ethereum"]["network"], contract_address=_["ethereum"]["htlc"]["contract_address"],
+        from_block=100, reorg_depth=2
+    )
+    topics: dict = {event_abi["name"]: topic for topic, event_abi in index._events_abi.items()}
+    agreements: dict = _["ethereum"]["htlc"]["agreements"]
+
+    def log(name: str, locked_contract_id: str, transaction_hash: str, block_number: int, removed: bool = False) -> dict:
+        args: dict = dict(locked_contract_id=bytes.fromhex(locked_contract_id))
+        if name == "log_fund":
+            args.update(
+                secret_hash=bytes.fromhex(agreements["secret_hash"]), recipient=agreements["recipient_address"],
+                sender=agreements["sender_address"], endtime=agreements["endtime"]["timestamp"], amount=1000
+            )
+        return dict(topics=[topics[name]], removed=removed, blockNumber=block_number, event_data=dict(
+            args=args, transactionHash=bytes.fromhex(transaction_hash), blockNumber=block_number
+        ))
+
+    chain: dict = dict(block_number=110, logs=[
+        log("log_fund", "aa" * 32, "01" * 32, 105), log("log_fund", "bb" * 32, "02" * 32, 109),
+        log("log_withdraw", "aa" * 32, "03" * 32, 110)
+    ])
+
+    class Eth:
+
+        @property
+        def block_number(self) -> int:
+            return chain["block_number"]
+
+        @staticmethod
+        def get_logs(filter_params: dict) -> list:
+            return [
+                item for item in chain["logs"]
+                if filter_params["fromBlock"] <= item["blockNumber"] <= filter_params["toBlock"]
+            ]
+
+    index.web3 = SimpleNamespace(codec=None, eth=Eth())
+    monkeypatch.setattr("swap.providers.ethereum.index.get_event_data", lambda codec, event_abi, log: log["event_data"])
+
+    assert index.sync() == 3
+    # Cursor stays reorg depth behind the latest block
+    assert index.block_number() == 108
+    assert index.get(locked_contract_id="0x" + "aa" * 32)["status"] == "withdrawn"
+    assert index.locked_contract_id(transaction_hash="0x" + "02" * 32, sync=False) == "0x" + "bb" * 32
+
+    # Blocks 109 and 110 are reorganized, the fund and withdraw in them are dropped
+    chain.update(block_number=111, logs=[
+        log("log_fund", "aa" * 32, "01" * 32, 105), log("log_withdraw", "aa" * 32, "03" * 32, 110, removed=True)
+    ])
+    assert index.sync() == 0
+    assert index.block_number() == 109
+    assert index.get(locked_contract_id="0x" + "aa" * 32)["status"] == "open"
+    assert index.get(locked_contract_id="0x" + "aa" * 32)["withdraw_transaction_hash"] is None
+    assert index.locked_contract_id(transaction_hash="0x" + "02" * 32, sync=False) is None
+    index.close()
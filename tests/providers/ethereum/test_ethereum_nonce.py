@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+from swap.providers.ethereum.nonce import NonceManager
+from swap.providers.ethereum.rpc import get_web3
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_ethereum_nonce():
+
+    web3 = get_web3(network=_["ethereum"]["network"])
+    address = _["ethereum"]["wallet"]["sender"]["address"]
+    nonce_manager = NonceManager(web3=web3)
+
+    nonce = nonce_manager.allocate(address=address)
+    assert nonce == web3.eth.get_transaction_count(address, "pending")
+    assert nonce_manager.allocate(address=address.lower()) == nonce + 1
+    assert nonce_manager.allocate(address=address) == nonce + 2
+
+    assert isinstance(nonce_manager.release(address=address, nonce=nonce + 1), NonceManager)
+    assert nonce_manager.allocate(address=address) == nonce + 1
+    assert nonce_manager.allocate(address=address) == nonce + 3
+
+    assert nonce_manager.reconcile(address=address) == nonce + 4
+
+    assert nonce_manager.release(address=address, nonce=nonce + 2).allocate_many(address=address, count=3) == [
+        nonce + 2, nonce + 4, nonce + 5
+    ]
+    assert nonce_manager.allocate_many(address=address, count=0) == []
+
+    assert isinstance(nonce_manager.reset(address=address), NonceManager)
+    assert nonce_manager.allocate(address=address) == nonce
+    assert isinstance(nonce_manager.reset(), NonceManager)
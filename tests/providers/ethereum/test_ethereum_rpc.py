@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
+from types import SimpleNamespace
+
 import pytest
 import json
 import os
 
+from swap.exceptions import (
+    AddressError, APIError
+)
+from swap.providers.ethereum.nonce import NonceManager
 from swap.providers.ethereum.rpc import (
-    decode_raw, submit_raw
+    get_web3, close_web3, reset_web3, decode_raw, submit_raw, get_balances, get_transaction_receipts, _batch_request
 )
 
 # Test Values
@@ -18,6 +24,15 @@ values.close()
 
 def test_ethereum_rpc():
 
+    assert get_web3(network="testnet") is get_web3(network="testnet")
+    assert get_web3(network="testnet") is not get_web3(network="testnet", provider="websocket")
+    assert close_web3(network="testnet", provider="websocket") == 1
+    web3 = get_web3(network="testnet")
+    reset_web3()
+    assert get_web3(network="testnet") is not web3
+    with pytest.raises(ValueError, match=r"Invalid Ethereum 'ipc' provider"):
+        get_web3(network="testnet", provider="ipc")
+
     assert decode_raw(
         raw=_["ethereum"]["fund"]["signed"]["raw"],
     )
@@ -28,3 +43,76 @@ def test_ethereum_rpc():
             raw=_["xinfin"]["fund"]["signed"]["raw"],
             network=_["ethereum"]["network"]
         )
+
+    assert get_balances(addresses=[], network=_["ethereum"]["network"]) == []
+    assert get_transaction_receipts(transaction_hashes=[], network=_["ethereum"]["network"]) == []
+    with pytest.raises(AddressError, match=r"Invalid Ethereum '0xinvalid' address"):
+        get_balances(addresses=["0xinvalid"], network=_["ethereum"]["network"])
+
+
+def test_ethereum_rpc_batch_request(monkeypatch):
+
+    batches: list = []
+
+    def post(url: str, data: str, headers: dict, timeout: int) -> SimpleNamespace:
+        batch: list = json.loads(data)
+        batches.append(batch)
+        responses: list = []
+        for item in batch:
+            address: str = item["params"][0]
+            if address.endswith("3"):
+                responses.append(dict(
+                    jsonrpc="2.0", id=item["id"], error=dict(code=-32000, message="header not found")
+                ))
+            elif not address.endswith("4"):
+                responses.append(dict(jsonrpc="2.0", id=item["id"], result=hex(int(address[-1]) * 1000)))
+        # Batch responses may come in any order, they are matched back by id
+        return SimpleNamespace(status_code=200, json=lambda: responses[::-1])
+
+    monkeypatch.setattr("swap.providers.ethereum.rpc._get_session", lambda: SimpleNamespace(post=post))
+    addresses: list = [f"0x{'0' * 39}{index}" for index in range(6)]
+    results: list = _batch_request(calls=[
+        ("eth_getBalance", [address, "latest"]) for address in addresses
+    ], network=_["ethereum"]["network"], batch_size=4)
+
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert [item["id"] for batch in batches for item in batch] == [0, 1, 2, 3, 0, 1]
+    assert results[:3] + results[5:] == [0, 1000, 2000, 5000]
+    assert isinstance(results[3], APIError) and "header not found" in str(results[3])
+    assert isinstance(results[4], APIError) and \
+        "No Ethereum 'eth_getBalance' response for batch item 4" in str(results[4])
+
+    monkeypatch.setattr("swap.providers.ethereum.rpc._get_session", lambda: SimpleNamespace(
+        post=lambda **kwargs: SimpleNamespace(status_code=200, json=lambda: dict(
+            jsonrpc="2.0", id=None, error=dict(code=-32600, message="batch too large")
+        ))
+    ))
+    with pytest.raises(APIError, match=r"batch too large"):
+        _batch_request(calls=[("eth_getBalance", [addresses[0], "latest"])], network=_["ethereum"]["network"])
+
+
+def test_ethereum_rpc_submit_raw_nonce(monkeypatch):
+
+    transaction: dict = decode_raw(raw=_["ethereum"]["fund"]["signed"]["raw"])
+    address: str = transaction["from"]
+    nonce_manager: NonceManager = NonceManager(web3=SimpleNamespace(
+        toChecksumAddress=lambda address: address,
+        eth=SimpleNamespace(get_transaction_count=lambda address, block_identifier: transaction["nonce"])
+    ))
+    assert nonce_manager.allocate_many(address=address, count=3) == [
+        transaction["nonce"], transaction["nonce"] + 1, transaction["nonce"] + 2
+    ]
+
+    def send_raw_transaction(raw: str):
+        raise ValueError("replacement transaction underpriced")
+
+    monkeypatch.setattr("swap.providers.ethereum.rpc.get_web3", lambda **kwargs: SimpleNamespace(
+        eth=SimpleNamespace(send_raw_transaction=send_raw_transaction)
+    ))
+    with pytest.raises(ValueError, match=r"replacement transaction underpriced"):
+        submit_raw(
+            raw=_["ethereum"]["fund"]["signed"]["raw"], network=_["ethereum"]["network"], nonce_manager=nonce_manager
+        )
+    # Only the rejected nonce is given back, the other in-flight nonces are not handed out again
+    assert nonce_manager.allocate(address=address) == transaction["nonce"]
+    assert nonce_manager.allocate(address=address) == transaction["nonce"] + 3
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from base64 import b64encode
+
 import json
 import os
 
@@ -9,6 +11,7 @@ from swap.providers.ethereum.signature import (
 from swap.providers.ethereum.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from swap.providers.ethereum.utils import decode_transaction_raw
 from swap.utils import clean_transaction_raw
 
 # Test Values
@@ -60,6 +63,43 @@ def test_ethereum_normal_signature():
     )
 
 
+def test_ethereum_normal_signature_multiple_recipients():
+
+    unsigned_normal_transaction: dict = _["ethereum"]["normal"]["unsigned"]["json"]
+    unsigned_normal_transaction_raw = b64encode(json.dumps(dict(
+        fee=_["ethereum"]["normal"]["unsigned"]["fee"] * 2,
+        type=_["ethereum"]["normal"]["unsigned"]["type"],
+        transaction=[
+            unsigned_normal_transaction, dict(unsigned_normal_transaction, nonce=unsigned_normal_transaction["nonce"] + 1)
+        ],
+        signature=None,
+        network=_["ethereum"]["network"],
+        erc20=False
+    )).encode()).decode()
+
+    normal_signature = Signature(network=_["ethereum"]["network"]).sign(
+        transaction_raw=unsigned_normal_transaction_raw,
+        solver=NormalSolver(
+            xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["ethereum"]["wallet"]["sender"]["derivation"]["path"],
+            account=_["ethereum"]["wallet"]["sender"]["derivation"]["account"],
+            change=_["ethereum"]["wallet"]["sender"]["derivation"]["change"],
+            address=_["ethereum"]["wallet"]["sender"]["derivation"]["address"]
+        )
+    )
+
+    assert normal_signature.type() == _["ethereum"]["normal"]["signed"]["type"]
+    assert normal_signature.fee() == _["ethereum"]["normal"]["signed"]["fee"] * 2
+    assert len(normal_signature.hash()) == 2
+    assert normal_signature.hash()[0] == _["ethereum"]["normal"]["signed"]["hash"]
+    assert normal_signature.raw()[0] == _["ethereum"]["normal"]["signed"]["raw"]
+    assert normal_signature.raw()[1] != _["ethereum"]["normal"]["signed"]["raw"]
+    assert normal_signature.signature()[0] == _["ethereum"]["normal"]["signed"]["signature"]
+    assert [signature["hash"] for signature in decode_transaction_raw(
+        transaction_raw=normal_signature.transaction_raw()
+    )["signatures"]] == normal_signature.hash()
+
+
 def test_ethereum_fund_signature():
 
     unsigned_fund_transaction_raw = _["ethereum"]["fund"]["unsigned"]["transaction_raw"]
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
+from swap.providers.ethereum.nonce import NonceManager
 from swap.providers.ethereum.htlc import HTLC
 from swap.providers.ethereum.transaction import (
     NormalTransaction, FundTransaction, WithdrawTransaction, RefundTransaction
 )
+from swap.providers.ethereum.rpc import get_web3
 from swap.providers.ethereum.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
@@ -39,6 +42,7 @@ def test_ethereum_normal_transaction():
     assert isinstance(unsigned_normal_transaction.json(), dict)
     assert unsigned_normal_transaction.signature() == _["ethereum"]["normal"]["unsigned"]["signature"]
     assert isinstance(unsigned_normal_transaction.transaction_raw(), str)
+    assert unsigned_normal_transaction.rpc_calls() == {"calls": 3, "round_trips": 3}
 
     signed_normal_transaction = unsigned_normal_transaction.sign(
         solver=NormalSolver(
@@ -59,6 +63,45 @@ def test_ethereum_normal_transaction():
     assert isinstance(signed_normal_transaction.transaction_raw(), str)
 
 
+def test_ethereum_normal_transaction_multiple_recipients():
+
+    unsigned_normal_transaction = NormalTransaction(network=_["ethereum"]["network"])
+
+    unsigned_normal_transaction.build_transaction(
+        address=_["ethereum"]["wallet"]["sender"]["address"],
+        recipient={
+            _["ethereum"]["wallet"]["recipient"]["address"]: _["ethereum"]["amount"],
+            _["ethereum"]["wallet"]["sender"]["address"]: _["ethereum"]["amount"]
+        },
+        unit=_["ethereum"]["unit"]
+    )
+
+    assert unsigned_normal_transaction.type() == _["ethereum"]["normal"]["unsigned"]["type"]
+    assert unsigned_normal_transaction.fee() == _["ethereum"]["normal"]["unsigned"]["fee"] * 2
+    assert unsigned_normal_transaction.hash() is None
+    assert [transaction["nonce"] for transaction in unsigned_normal_transaction.json()] == [
+        unsigned_normal_transaction.json()[0]["nonce"], unsigned_normal_transaction.json()[0]["nonce"] + 1
+    ]
+    assert unsigned_normal_transaction.json()[0]["gas"] == unsigned_normal_transaction.json()[1]["gas"]
+    assert unsigned_normal_transaction.rpc_calls() == {"calls": 3, "round_trips": 3}
+
+    signed_normal_transaction = unsigned_normal_transaction.sign(
+        solver=NormalSolver(
+            xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["ethereum"]["wallet"]["sender"]["derivation"]["path"],
+            account=_["ethereum"]["wallet"]["sender"]["derivation"]["account"],
+            change=_["ethereum"]["wallet"]["sender"]["derivation"]["change"],
+            address=_["ethereum"]["wallet"]["sender"]["derivation"]["address"]
+        )
+    )
+
+    assert signed_normal_transaction.type() == _["ethereum"]["normal"]["signed"]["type"]
+    assert len(signed_normal_transaction.hash()) == 2
+    assert len(signed_normal_transaction.raw()) == 2
+    assert isinstance(signed_normal_transaction.signature(), list)
+    assert isinstance(signed_normal_transaction.transaction_raw(), str)
+
+
 def test_ethereum_fund_transaction():
 
     htlc = HTLC(
@@ -123,6 +166,18 @@ def test_ethereum_withdraw_transaction():
     assert unsigned_withdraw_transaction.raw() == _["ethereum"]["withdraw"]["unsigned"]["raw"]
     assert isinstance(unsigned_withdraw_transaction.json(), dict)
     assert unsigned_withdraw_transaction.signature() == _["ethereum"]["withdraw"]["unsigned"]["signature"]
+    assert unsigned_withdraw_transaction.rpc_calls() == {"calls": 5, "round_trips": 5}
+
+    batched_withdraw_transaction = WithdrawTransaction(network=_["ethereum"]["network"], batch=True)
+
+    batched_withdraw_transaction.build_transaction(
+        address=_["ethereum"]["wallet"]["recipient"]["address"],
+        transaction_hash=_["ethereum"]["transaction_hash"],
+        secret_key=_["ethereum"]["htlc"]["secret"]["key"]
+    )
+
+    assert batched_withdraw_transaction.json() == unsigned_withdraw_transaction.json()
+    assert batched_withdraw_transaction.rpc_calls() == {"calls": 5, "round_trips": 2}
     assert isinstance(unsigned_withdraw_transaction.transaction_raw(), str)
 
     signed_withdraw_transaction = unsigned_withdraw_transaction.sign(
@@ -178,3 +233,88 @@ def test_ethereum_refund_transaction():
     assert isinstance(signed_refund_transaction.json(), dict)
     assert isinstance(signed_refund_transaction.signature(), dict)
     assert isinstance(signed_refund_transaction.transaction_raw(), str)
+
+
+def test_ethereum_transaction_nonce(monkeypatch):
+
+    nonce_manager = NonceManager(web3=get_web3(network=_["ethereum"]["network"]))
+    address: str = _["ethereum"]["wallet"]["sender"]["address"]
+    nonce: int = nonce_manager.reconcile(address=address)
+    normal_transaction = NormalTransaction(network=_["ethereum"]["network"], nonce_manager=nonce_manager)
+    build_transaction: dict = dict(
+        address=_["ethereum"]["wallet"]["sender"]["address"],
+        recipient={
+            _["ethereum"]["wallet"]["recipient"]["address"]: _["ethereum"]["amount"]
+        },
+        unit=_["ethereum"]["unit"]
+    )
+
+    # Rebuild gives back the nonce of the previous unsigned build
+    assert normal_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce
+    assert normal_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce
+
+    # Failed build gives back its nonce
+    def estimate_gas(function, transaction: dict):
+        raise ValueError("gas required exceeds allowance")
+
+    monkeypatch.setattr(normal_transaction, "_estimate_gas", estimate_gas)
+    with pytest.raises(ValueError, match="gas required exceeds allowance"):
+        normal_transaction.build_transaction(**build_transaction)
+    monkeypatch.undo()
+    assert nonce_manager.allocate(address=address) == nonce
+
+    # Signed build keeps its nonce
+    normal_transaction.build_transaction(**build_transaction).sign(
+        solver=NormalSolver(
+            xprivate_key=_["ethereum"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["ethereum"]["wallet"]["sender"]["derivation"]["path"],
+            account=_["ethereum"]["wallet"]["sender"]["derivation"]["account"],
+            change=_["ethereum"]["wallet"]["sender"]["derivation"]["change"],
+            address=_["ethereum"]["wallet"]["sender"]["derivation"]["address"]
+        )
+    )
+    assert normal_transaction.json()["nonce"] == nonce + 1
+    assert normal_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce + 2
+
+
+def test_ethereum_htlc_transaction_nonce():
+
+    nonce_manager = NonceManager(web3=get_web3(network=_["ethereum"]["network"]))
+    htlc = HTLC(
+        contract_address=_["ethereum"]["htlc"]["contract_address"],
+        network=_["ethereum"]["network"]
+    ).build_htlc(
+        secret_hash=_["ethereum"]["htlc"]["secret"]["hash"],
+        recipient_address=_["ethereum"]["wallet"]["recipient"]["address"],
+        sender_address=_["ethereum"]["wallet"]["sender"]["address"],
+        endtime=get_current_timestamp(plus=3600)
+    )
+
+    for transaction, solver, wallet, build_transaction in [
+        (FundTransaction, FundSolver, "sender", dict(
+            address=_["ethereum"]["wallet"]["sender"]["address"], htlc=htlc,
+            amount=_["ethereum"]["amount"], unit=_["ethereum"]["unit"]
+        )),
+        (WithdrawTransaction, WithdrawSolver, "recipient", dict(
+            address=_["ethereum"]["wallet"]["recipient"]["address"],
+            transaction_hash=_["ethereum"]["transaction_hash"], secret_key=_["ethereum"]["htlc"]["secret"]["key"]
+        )),
+        (RefundTransaction, RefundSolver, "sender", dict(
+            address=_["ethereum"]["wallet"]["sender"]["address"], transaction_hash=_["ethereum"]["transaction_hash"]
+        ))
+    ]:
+        htlc_transaction = transaction(network=_["ethereum"]["network"], nonce_manager=nonce_manager)
+        nonce: int = htlc_transaction.build_transaction(**build_transaction).json()["nonce"]
+
+        # Signed build keeps its nonce, a rebuild of the same instance takes the next one
+        htlc_transaction.sign(
+            solver=solver(
+                xprivate_key=_["ethereum"]["wallet"][wallet]["root_xprivate_key"],
+                path=_["ethereum"]["wallet"][wallet]["derivation"]["path"],
+                account=_["ethereum"]["wallet"][wallet]["derivation"]["account"],
+                change=_["ethereum"]["wallet"][wallet]["derivation"]["change"],
+                address=_["ethereum"]["wallet"][wallet]["derivation"]["address"]
+            )
+        )
+        assert htlc_transaction.json()["nonce"] == nonce
+        assert htlc_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce + 1
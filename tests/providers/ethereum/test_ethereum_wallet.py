@@ -186,3 +186,38 @@ def test_ethereum_wallet_from_private_key():
     assert wallet.address() == _["ethereum"]["wallet"]["sender"]["address"]
 
     # assert isinstance(wallet.balance(), int)
+
+
+def test_ethereum_wallet_derive_range():
+
+    wallet = Wallet(network=_["ethereum"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["ethereum"]["wallet"]["sender"]["entropy"],
+        language=_["ethereum"]["wallet"]["sender"]["language"],
+        passphrase=_["ethereum"]["wallet"]["sender"]["passphrase"]
+    )
+
+    wallet.from_path(
+        path=_["ethereum"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    addresses = wallet.derive_range(
+        account=_["ethereum"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["ethereum"]["wallet"]["sender"]["derivation"]["change"],
+        start=0, count=3
+    )
+
+    assert wallet.path() == _["ethereum"]["wallet"]["sender"]["derivation"]["path"]
+    assert len(addresses) == 3
+    assert wallet.derive_range(account=0, start=0 + 1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=0, start=0, count=0) == []
+    assert addresses[0] == (
+        _["ethereum"]["wallet"]["sender"]["address"],
+        _["ethereum"]["wallet"]["sender"]["public_key"],
+        _["ethereum"]["wallet"]["sender"]["derivation"]["path"]
+    )
+    for address, public_key, path in addresses:
+        wallet.clean_derivation()
+        wallet.from_path(path=path)
+        assert (address, public_key) == (wallet.address(), wallet.public_key())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from hexbytes.main import HexBytes
+
+import asyncio
+import pytest
+import json
+import os
+
+from swap.providers.ethereum.watcher import Watcher
+from swap.exceptions import (
+    AddressError, APIError, NetworkError
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+LOCKED_CONTRACT_ID: str = "0x" + _["ethereum"]["withdraw"]["signed"]["json"]["data"][10:74]
+
+
+class Eth:
+
+    def __init__(self, block_number: int, logs: list):
+        self.block_number: int = block_number
+        self.logs: list = logs
+        self.filters: list = []
+
+    def get_logs(self, filter_params: dict) -> list:
+        self.filters.append(filter_params)
+        return [
+            log for log in self.logs
+            if filter_params["fromBlock"] <= int(log["blockNumber"]) <= filter_params["toBlock"]
+        ]
+
+
+class WebSocket:
+
+    def __init__(self, messages: list):
+        self.messages: list = messages
+        self.sent: list = []
+
+    async def __aenter__(self) -> "WebSocket":
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        return False
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def recv(self) -> str:
+        if not self.messages:
+            # Nothing more on the subscription, the watcher times out and waits again
+            await asyncio.sleep(3600)
+        return json.dumps(self.messages.pop(0))
+
+
+def log(name: str, transaction_hash: str, block_number: int, removed: bool = False) -> dict:
+    return dict(
+        address=_["ethereum"]["htlc"]["contract_address"].lower(), topics=[name], data="0x",
+        blockNumber=block_number, transactionHash=transaction_hash, removed=removed
+    )
+
+
+def set_topics(htlc_watcher: Watcher, logs: list) -> list:
+    topics: dict = {event_abi["name"]: topic for topic, event_abi in htlc_watcher._events_abi.items()}
+    for item in logs:
+        item["topics"] = ["0x" + topics[topic].hex() if topic in topics else topic for topic in item["topics"]]
+    return logs
+
+
+def watcher(monkeypatch, eth: Eth, **kwargs) -> Watcher:
+    monkeypatch.setattr("swap.providers.ethereum.watcher.get_web3", lambda **kwargs: SimpleNamespace(
+        codec=None, eth=eth, provider=SimpleNamespace(endpoint_uri="wss://ropsten.infura.io/ws/v3/token")
+    ))
+    htlc_watcher: Watcher = Watcher(network=_["ethereum"]["network"], **kwargs)
+    set_topics(htlc_watcher=htlc_watcher, logs=eth.logs)
+
+    def get_event_data(codec, event_abi: dict, event_log: dict) -> dict:
+        return dict(
+            args=dict(locked_contract_id=bytes(HexBytes(LOCKED_CONTRACT_ID)), amount=1000),
+            transactionHash=HexBytes(event_log["transactionHash"]), blockNumber=int(event_log["blockNumber"])
+        )
+
+    monkeypatch.setattr("swap.providers.ethereum.watcher.get_event_data", get_event_data)
+    return htlc_watcher
+
+
+def test_ethereum_watcher(monkeypatch):
+
+    with pytest.raises(NetworkError, match=r"Invalid Ethereum 'unknown' network"):
+        Watcher(network="unknown")
+
+    eth: Eth = Eth(block_number=110, logs=[
+        log("log_fund", _["ethereum"]["fund"]["signed"]["hash"], 105),
+        log("log_withdraw", _["ethereum"]["withdraw"]["signed"]["hash"], 108, removed=True),
+        log("log_withdraw", _["ethereum"]["withdraw"]["signed"]["hash"], 109),
+        log("0x" + "11" * 32, _["ethereum"]["refund"]["signed"]["hash"], 110)
+    ])
+    htlc_watcher: Watcher = watcher(monkeypatch, eth, from_block=100, confirmations=2)
+    with pytest.raises(AddressError, match=r"Invalid Ethereum HTLC contract"):
+        htlc_watcher.watch(contract_address="0x0")
+    assert htlc_watcher.watch(
+        contract_address=_["ethereum"]["htlc"]["contract_address"], locked_contract_id=LOCKED_CONTRACT_ID
+    ).watching() == [_["ethereum"]["htlc"]["contract_address"]]
+
+    withdraws: list = []
+    htlc_watcher.on(withdraws.append, kind="withdraw")
+    # Blocks after 109 wait for their second confirmation, removed logs are skipped
+    assert [(event.kind, event.transaction_hash, event.block_height, event.data) for event in htlc_watcher.poll()] == [
+        ("fund", HexBytes(_["ethereum"]["fund"]["signed"]["hash"]).hex(), 105,
+         dict(id=LOCKED_CONTRACT_ID, amount=1000)),
+        ("withdraw", HexBytes(_["ethereum"]["withdraw"]["signed"]["hash"]).hex(), 109,
+         dict(id=LOCKED_CONTRACT_ID, amount=1000))
+    ]
+    assert eth.filters == [dict(fromBlock=100, toBlock=109, address=[_["ethereum"]["htlc"]["contract_address"]])]
+    assert [event.kind for event in withdraws] == ["withdraw"]
+
+    # Next poll starts after the last scanned block, seen events are not emitted again
+    eth.block_number = 111
+    assert htlc_watcher.poll() == []
+    assert eth.filters[-1]["fromBlock"] == 110 and eth.filters[-1]["toBlock"] == 110
+
+
+def test_ethereum_watcher_subscribe(monkeypatch):
+
+    eth: Eth = Eth(block_number=110, logs=[])
+    htlc_watcher: Watcher = watcher(monkeypatch, eth, provider="websocket", interval=1)
+    htlc_watcher.watch(contract_address=_["ethereum"]["htlc"]["contract_address"])
+    web_socket: WebSocket = WebSocket(messages=[
+        dict(jsonrpc="2.0", id=0, result="0x9cef478923ff08bf67fde6c64013158d"),
+        dict(jsonrpc="2.0", method="eth_subscription", params=dict(
+            subscription="0x9cef478923ff08bf67fde6c64013158d", result=set_topics(htlc_watcher=htlc_watcher, logs=[dict(
+                log("log_fund", _["ethereum"]["fund"]["signed"]["hash"], 0), blockNumber=hex(111),
+                blockHash="0x" + "00" * 32, logIndex="0x0", transactionIndex="0x0"
+            )])[0]
+        ))
+    ])
+    monkeypatch.setattr("swap.providers.ethereum.watcher.websockets", SimpleNamespace(
+        connect=lambda endpoint: web_socket
+    ))
+
+    async def first_event():
+        events = htlc_watcher.events()
+        event = await events.__anext__()
+        await events.aclose()
+        return event
+
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        event = loop.run_until_complete(first_event())
+    finally:
+        loop.close()
+
+    assert web_socket.sent == [dict(
+        jsonrpc="2.0", id=0, method="eth_subscribe",
+        params=["logs", dict(address=[_["ethereum"]["htlc"]["contract_address"]])]
+    )]
+    # Catch up poll ran once before the subscribed log
+    assert eth.filters == [dict(fromBlock=110, toBlock=110, address=[_["ethereum"]["htlc"]["contract_address"]])]
+    assert (event.kind, event.htlc, event.transaction_hash, event.block_height) == (
+        "fund", _["ethereum"]["htlc"]["contract_address"], HexBytes(_["ethereum"]["fund"]["signed"]["hash"]).hex(), 111
+    )
+
+
+def test_ethereum_watcher_subscribe_error(monkeypatch):
+
+    web_socket: WebSocket = WebSocket(messages=[
+        dict(jsonrpc="2.0", id=0, error=dict(code=-32601, message="The method eth_subscribe does not exist"))
+    ])
+    monkeypatch.setattr("swap.providers.ethereum.watcher.websockets", SimpleNamespace(
+        connect=lambda endpoint: web_socket
+    ))
+    htlc_watcher: Watcher = watcher(monkeypatch, Eth(block_number=110, logs=[]), provider="websocket", confirmations=1)
+    htlc_watcher.watch(contract_address=_["ethereum"]["htlc"]["contract_address"])
+
+    async def first_event():
+        async for event in htlc_watcher.events():
+            return event
+
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(APIError, match=r"The method eth_subscribe does not exist"):
+            loop.run_until_complete(first_event())
+    finally:
+        loop.close()
+    # Logs are final only after confirmations, so new blocks are subscribed instead
+    assert web_socket.sent[0]["params"] == ["newHeads"]
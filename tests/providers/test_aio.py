@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import threading
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from swap.exceptions import APIError
+from swap.providers.aio import (
+    AsyncSession, get_session, close_session, run_sync
+)
+from swap.providers.cache import (
+    cached, cache
+)
+from swap.providers.session import CircuitBreaker
+
+
+def test_aio():
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    assert loop.run_until_complete(run_sync(sum, [1, 2, 3])) == 6
+    assert loop.run_until_complete(
+        run_sync(lambda: threading.current_thread().name)
+    ).startswith("swap-aio")
+
+    calls: list = []
+
+    @cached(policy="balance")
+    async def get_balance(address: str, headers: dict = None) -> int:
+        calls.append(address)
+        return 100_000
+
+    cache.clear()
+    assert loop.run_until_complete(get_balance(address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC")) == 100_000
+    assert loop.run_until_complete(get_balance(
+        address="mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC", headers={"user-agent": "Swap"}
+    )) == 100_000
+    assert calls == ["mkFWGt4hT11XS8dJKzzRFsTrqjjAwZfQAC"]
+    cache.clear()
+
+    async def sessions() -> tuple:
+        return get_session(), get_session()
+
+    first_session, second_session = loop.run_until_complete(sessions())
+    assert isinstance(first_session, AsyncSession)
+    assert first_session is second_session
+
+    closed_session = AsyncSession(retries=0, circuit_breaker=CircuitBreaker(failures=1, reset_timeout=60))
+    with pytest.raises(aiohttp.ClientError):
+        loop.run_until_complete(closed_session.get(url="http://localhost:1/", timeout=1))
+    with pytest.raises(APIError, match="circuit is open"):
+        loop.run_until_complete(closed_session.get(url="http://localhost:1/", timeout=1))
+
+    loop.run_until_complete(closed_session.close())
+    loop.run_until_complete(close_session())
+    loop.close()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+from swap.providers.artifacts import (
+    load_artifact, source_hash, compile_artifact, get_contract
+)
+from swap.providers.config import artifacts as config
+
+
+class Eth:
+
+    def __init__(self):
+        self.contracts = 0
+
+    def contract(self, address, abi):
+        self.contracts += 1
+        return dict(address=address, abi=abi)
+
+
+class Web3:
+
+    def __init__(self):
+        self.eth = Eth()
+
+
+def test_load_artifact():
+
+    htlc_artifact: dict = load_artifact(
+        package="swap.providers.ethereum", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC"
+    )
+    assert list(htlc_artifact) == ["abi", "bin", "bin-runtime", "opcodes"]
+    assert htlc_artifact is load_artifact(
+        package="swap.providers.ethereum", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC"
+    )
+    assert htlc_artifact is not load_artifact(
+        package="swap.providers.xinfin", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC"
+    )
+    assert load_artifact(
+        package="swap.providers.xinfin", json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
+    )["abi"] is load_artifact(
+        package="swap.providers.xinfin", json_source_name="libs/xrc20.json", sol_source_with_class_name="xrc20.sol:XRC20"
+    )["abi"]
+
+
+def test_compile_artifact(tmp_path):
+
+    assert source_hash(package="swap.providers.ethereum", solc_version="0.8.6") == \
+        "8eeb970b47630795fe64bb310146579fbd1771c7a9bcffbd66cfe952391798b7"
+    assert source_hash(package="swap.providers.ethereum", solc_version="0.8.10") != \
+        source_hash(package="swap.providers.ethereum", solc_version="0.8.6")
+    assert source_hash(package="swap.providers.xinfin", solc_version="0.8.10") != \
+        source_hash(package="swap.providers.ethereum", solc_version="0.8.10")
+
+    # Compiled outputs on disk are used without running solc
+    htlc_artifact: dict = load_artifact(
+        package="swap.providers.ethereum", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC"
+    )
+    key: str = f"{source_hash(package='swap.providers.ethereum', solc_version='0.8.6')}-htlc.sol"
+    with open(os.path.join(str(tmp_path), f"{key}.json"), "w") as json_file:
+        json_file.write(json.dumps({"htlc.sol:HTLC": htlc_artifact}))
+    assert compile_artifact(
+        package="swap.providers.ethereum", sol_source_name="htlc.sol",
+        sol_source_with_class_name="htlc.sol:HTLC", solc_version="0.8.6", path=str(tmp_path)
+    ) == htlc_artifact
+
+
+def test_get_contract():
+
+    abi: list = load_artifact(
+        package="swap.providers.ethereum", json_source_name="htlc.json", sol_source_with_class_name="htlc.sol:HTLC"
+    )["abi"]
+    web3, _web3 = Web3(), Web3()
+    contract = get_contract(web3=web3, abi=abi, address="0xeaEaC81da5E386E8Ca4De1e64d40a10E468A5b40")
+    assert contract == dict(address="0xeaEaC81da5E386E8Ca4De1e64d40a10E468A5b40", abi=abi)
+    assert get_contract(web3=web3, abi=abi, address="0xeaEaC81da5E386E8Ca4De1e64d40a10E468A5b40") is contract
+    assert web3.eth.contracts == 1
+    get_contract(web3=web3, abi=abi, address="0x67324d402ffc103d061dAfA9096ff639f0676378")
+    get_contract(web3=_web3, abi=abi, address="0xeaEaC81da5E386E8Ca4De1e64d40a10E468A5b40")
+    assert web3.eth.contracts == 2
+    assert _web3.eth.contracts == 1
+    assert config["maxsize"] == 256
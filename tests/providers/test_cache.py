@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import time
+
+from swap.providers.cache import (
+    Cache, DiskBackend, cached, cache, finalized
+)
+from swap.providers.config import cache as config
+
+
+def test_cache():
+
+    memory_cache = Cache(maxsize=2)
+    assert memory_cache.get(key="a") == (None, False)
+    memory_cache.set(key="a", value={"confirmations": 1})
+    memory_cache.set(key="b", value=2, ttl=0.1)
+    assert memory_cache.get(key="a") == ({"confirmations": 1}, True)
+    memory_cache.get(key="a")[0]["confirmations"] = 0
+    assert memory_cache.get(key="a") == ({"confirmations": 1}, True)
+    memory_cache.set(key="c", value=3)
+    assert memory_cache.get(key="b") == (None, False)
+    assert len(memory_cache) == 2
+    time.sleep(0.1)
+    memory_cache.set(key="d", value=4, ttl=0.1)
+    time.sleep(0.1)
+    assert memory_cache.get(key="d") == (None, False)
+    assert isinstance(memory_cache.clear(), Cache)
+    assert len(memory_cache) == 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.sqlite")
+        disk_cache = Cache(maxsize=1, path=path)
+        assert isinstance(disk_cache.backend, DiskBackend)
+        disk_cache.set(key="transaction:a", value={"confirmations": 1})
+        disk_cache.set(key="block_height:b", value=678722, ttl=60)
+        assert disk_cache.get(key="transaction:a") == ({"confirmations": 1}, True)
+        assert Cache(path=path).get(key="block_height:b") == (678722, True)
+        disk_cache.clear(policy="block_height")
+        assert Cache(path=path).get(key="block_height:b") == (None, False)
+        assert Cache(path=path).get(key="transaction:a") == ({"confirmations": 1}, True)
+
+    calls = []
+
+    @cached(policy="transaction", permanent=lambda transaction: transaction["confirmations"] > 0,
+            cacheable=lambda transaction: "error" not in transaction)
+    def get_transaction(transaction_hash, network="mainnet", timeout=60):
+        calls.append(transaction_hash)
+        if transaction_hash == "missing":
+            return {"error": "Transaction not found."}
+        return {"hash": transaction_hash, "confirmations": len(calls) - 1}
+
+    @cached(policy="submit")
+    def submit_raw(raw):
+        calls.append(raw)
+        return raw
+
+    cache.clear()
+    assert get_transaction("a") == {"hash": "a", "confirmations": 0}
+    assert get_transaction(transaction_hash="a", network="mainnet", timeout=5)["confirmations"] == 0
+    assert len(calls) == 1
+    assert get_transaction("a", network="testnet")["confirmations"] == 1
+    cache.clear(policy="transaction")
+    assert get_transaction("a")["confirmations"] == 2
+    assert get_transaction("a")["confirmations"] == 2
+    assert len(calls) == 3
+    get_transaction("missing"), get_transaction("missing")
+    assert len(calls) == 5
+    submit_raw("raw"), submit_raw("raw")
+    assert len(calls) == 7
+
+    config["policies"]["transaction"], ttl = 0, config["policies"]["transaction"]
+    try:
+        get_transaction("b"), get_transaction("b")
+        assert len(calls) == 9
+    finally:
+        config["policies"]["transaction"] = ttl
+    cache.clear()
+
+
+def test_cache_finalized():
+
+    assert not finalized(transaction={"confirmations": 0})
+    assert not finalized(transaction={"confirmations": config["finality"] - 1})
+    assert finalized(transaction={"confirmations": config["finality"]})
+    assert not finalized(transaction={"confirmations": None})
+
+    confirmations = []
+
+    @cached(policy="transaction", permanent=finalized)
+    def get_transaction(transaction_hash, network="mainnet", token=None):
+        confirmations.append(len(confirmations))
+        return {"hash": transaction_hash, "confirmations": confirmations[-1] * config["finality"]}
+
+    cache.clear()
+    assert get_transaction("a", token="secret")["confirmations"] == 0
+    # Token is not part of the cache key and it is never stored
+    assert get_transaction("a", token="other")["confirmations"] == 0
+    assert all("secret" not in key for key in cache._entries)
+    # Confirmations below the finality depth expire with the policy TTL
+    assert cache._entries[next(iter(cache._entries))][1] is not None
+    cache.clear(policy="transaction")
+    assert get_transaction("a")["confirmations"] == config["finality"]
+    assert cache._entries[next(iter(cache._entries))][1] is None
+    assert get_transaction("a")["confirmations"] == config["finality"]
+    assert len(confirmations) == 2
+    cache.clear()
@@ -2,7 +2,7 @@
 
 from swap import __version__
 from swap.providers.config import (
-    bitcoin, bytom, ethereum, vapor, xinfin
+    bitcoin, bytom, ethereum, vapor, xinfin, session, aio, watcher, artifacts, cache, pool
 )
 
 
@@ -26,6 +26,12 @@ def test_config():
     assert bitcoin["units"]["mBTC"] == 1_000
     assert bitcoin["units"]["Satoshi"] == 100_000_000
     assert bitcoin["unit"] == "Satoshi"
+    assert bitcoin["coin_selection"] == "first-fit"
+    assert bitcoin["utxo_limit"] == 200
+    assert bitcoin["fee_priority"] == "medium"
+    assert bitcoin["fee_rate_ttl"] == 60
+    assert bitcoin["min_fee_rate"] == 1
+    assert bitcoin["dust"] == 546
     assert bitcoin["timeout"] == 60
     assert bitcoin["headers"]["user-agent"] == f"Swap User-Agent {__version__}"
     assert bitcoin["headers"]["content-type"] == "application/json; charset=utf-8"
@@ -53,6 +59,8 @@ def test_config():
     assert bytom["units"]["mBTM"] == 1_000
     assert bytom["units"]["NEU"] == 100_000_000
     assert bytom["confirmations"] == 1
+    assert bytom["utxo_limit"] == 100
+    assert bytom["key_cache_size"] == 128
     assert bytom["network"] == "mainnet"
     assert bytom["forbid_chain_tx"] is False
     assert bytom["headers"]["user-agent"] == f"Swap User-Agent {__version__}"
@@ -94,6 +102,9 @@ def test_config():
     assert ethereum["network"] == "mainnet"
     assert ethereum["unit"] == "Wei"
     assert ethereum["timeout"] == 60
+    assert ethereum["pool_size"] == 10
+    assert ethereum["batch_size"] == 100
+    assert ethereum["solc_version"] == "0.8.6"
     assert ethereum["headers"]["user-agent"] == f"Swap User-Agent {__version__}"
     assert ethereum["headers"]["content-type"] == "application/json; charset=utf-8"
     assert ethereum["headers"]["accept"] == "application/json"
@@ -120,6 +131,8 @@ def test_config():
     assert vapor["units"]["mBTM"] == 1_000
     assert vapor["units"]["NEU"] == 100_000_000
     assert vapor["confirmations"] == 1
+    assert vapor["utxo_limit"] == 100
+    assert vapor["key_cache_size"] == 128
     assert vapor["network"] == "mainnet"
     assert vapor["forbid_chain_tx"] is False
     assert vapor["headers"]["user-agent"] == f"Swap User-Agent {__version__}"
@@ -148,6 +161,47 @@ def test_config():
     assert xinfin["network"] == "mainnet"
     assert xinfin["unit"] == "Wei"
     assert xinfin["timeout"] == 60
+    assert xinfin["batch_size"] == 100
+    assert xinfin["solc_version"] == "0.8.10"
     assert xinfin["headers"]["user-agent"] == f"Swap User-Agent {__version__}"
     assert xinfin["headers"]["content-type"] == "application/json; charset=utf-8"
     assert xinfin["headers"]["accept"] == "application/json"
+
+    assert isinstance(session, dict)
+    assert session["pool_connections"] == 10
+    assert session["pool_maxsize"] == 10
+    assert session["retries"] == 3
+    assert session["backoff_factor"] == 0.5
+    assert session["status_forcelist"] == [429, 500, 502, 503, 504]
+    assert session["circuit_breaker"]["failures"] == 5
+    assert session["circuit_breaker"]["reset_timeout"] == 30
+
+    assert isinstance(aio, dict)
+    assert aio["limit"] == 100
+    assert aio["limit_per_host"] == 10
+    assert aio["workers"] == 4
+
+    assert isinstance(watcher, dict)
+    assert watcher["interval"] == 5
+    assert watcher["max_interval"] == 60
+    assert watcher["batch_size"] == 20
+    assert watcher["limit"] == 50
+    assert watcher["block_range"] == 2000
+    assert watcher["reorg_depth"] == 12
+
+    assert isinstance(artifacts, dict)
+    assert artifacts["maxsize"] == 256
+    assert artifacts["path"] is None
+
+    assert isinstance(pool, dict)
+    assert pool["chunk_size"] == 1000
+
+    assert isinstance(cache, dict)
+    assert cache["maxsize"] == 1024
+    assert cache["path"] is None
+    assert cache["finality"] == 6
+    assert cache["policies"]["transaction"] == 15
+    assert cache["policies"]["decoded"] is None
+    assert cache["policies"]["decimals"] is None
+    assert cache["policies"]["block_height"] == 30
+    assert cache["policies"]["balance"] == 10
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+import os
+
+from swap.providers.pool import map_chunks
+
+
+def _process_ids(items):
+    return [(item, os.getpid()) for item in items]
+
+
+def test_map_chunks():
+
+    assert map_chunks(function=_process_ids, items=[]) == []
+    assert map_chunks(function=_process_ids, items=[1, 2, 3]) == [(1, os.getpid()), (2, os.getpid()), (3, os.getpid())]
+
+    results = map_chunks(function=_process_ids, items=list(range(10)), processes=2, chunk_size=3)
+    assert [item for item, process_id in results] == list(range(10))
+    assert os.getpid() not in [process_id for item, process_id in results]
+    # Small inputs are never sent to a pool
+    assert map_chunks(function=_process_ids, items=[1, 2], processes=2, chunk_size=3) == \
+        [(1, os.getpid()), (2, os.getpid())]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import pytest
+import requests
+import time
+
+from swap.exceptions import APIError
+from swap.providers.session import (
+    CircuitBreaker, Session, session
+)
+
+
+def test_session():
+
+    circuit_breaker = CircuitBreaker(failures=2, reset_timeout=0.2)
+    assert circuit_breaker.allow(endpoint="localhost:1")
+    circuit_breaker.failure(endpoint="localhost:1")
+    assert circuit_breaker.allow(endpoint="localhost:1")
+    circuit_breaker.failure(endpoint="localhost:1")
+    assert not circuit_breaker.allow(endpoint="localhost:1")
+    assert circuit_breaker.allow(endpoint="localhost:2")
+    time.sleep(0.2)
+    assert circuit_breaker.allow(endpoint="localhost:1")
+    assert not circuit_breaker.allow(endpoint="localhost:1")
+    circuit_breaker.success(endpoint="localhost:1")
+    assert circuit_breaker.allow(endpoint="localhost:1")
+    circuit_breaker.failure(endpoint="localhost:1")
+    circuit_breaker.failure(endpoint="localhost:1")
+    assert isinstance(circuit_breaker.reset(), CircuitBreaker)
+    assert circuit_breaker.allow(endpoint="localhost:1")
+
+    assert isinstance(session, Session)
+    assert session.get_adapter("https://api.blockcypher.com") is session.get_adapter("http://localhost:9888")
+    # Submit requests are not replayed on read errors or retryable status codes
+    max_retries = session.get_adapter("https://api.blockcypher.com").max_retries
+    assert max_retries.is_retry(method="GET", status_code=503)
+    assert not max_retries.is_retry(method="POST", status_code=503)
+
+    closed_session = Session(retries=0, circuit_breaker=CircuitBreaker(failures=1, reset_timeout=60))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        closed_session.get(url="http://localhost:1/", timeout=1)
+    with pytest.raises(APIError, match="circuit is open"):
+        closed_session.get(url="http://localhost:1/", timeout=1)
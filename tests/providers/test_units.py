@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from decimal import Decimal
+
+import pytest
+
+from swap.exceptions import UnitError
+from swap.providers.units import (
+    unit_scales, convert_amount, convert_amounts
+)
+from swap.providers.config import ethereum as config
+from swap.providers.bitcoin.utils import amount_unit_converter
+
+
+def test_unit_scales():
+
+    scales = unit_scales(units=config["units"], integers=["Ether2Wei", "Gwei2Wei", "Wei2Gwei"])
+    assert scales == {
+        "Ether2Gwei": (1_000_000_000, 1, False), "Ether2Wei": (1_000_000_000_000_000_000, 1, True),
+        "Gwei2Ether": (1, 1_000_000_000, False), "Gwei2Wei": (1_000_000_000, 1, True),
+        "Wei2Ether": (1, 1_000_000_000_000_000_000, False), "Wei2Gwei": (1, 1_000_000_000, True)
+    }
+
+    # Integer amounts are exact, large Wei amounts included
+    assert convert_amount(amount=123_456_789_123_456_789_123_456_789, scale=scales["Wei2Gwei"]) == \
+        123_456_789_123_456_789
+    assert convert_amount(amount=Decimal("123456789.123456789123456789"), scale=scales["Ether2Wei"]) == \
+        123_456_789_123_456_789_123_456_789
+    assert convert_amount(amount=0.29, scale=scales["Ether2Gwei"]) == 290_000_000.0
+    assert convert_amount(amount=0.29, scale=scales["Ether2Wei"]) == 290_000_000_000_000_000
+    assert convert_amount(amount=-1_999_999_999, scale=scales["Wei2Gwei"]) == -1
+    assert convert_amount(amount=100_000_000, scale=scales["Wei2Ether"]) == 1e-10
+
+    assert convert_amounts(amounts=range(5), scale=scales["Gwei2Wei"]) == [
+        0, 1_000_000_000, 2_000_000_000, 3_000_000_000, 4_000_000_000
+    ]
+    assert convert_amounts(amounts=(1, 0.5, Decimal("0.25")), scale=scales["Ether2Gwei"]) == [
+        1_000_000_000.0, 500_000_000.0, 250_000_000.0
+    ]
+    assert convert_amounts(amounts=[], scale=scales["Ether2Wei"]) == []
+
+    with pytest.raises(TypeError, match="Amount must be int, float or Decimal, not 'str' type."):
+        convert_amount(amount="1", scale=scales["Ether2Wei"])
+
+
+def test_amount_unit_converter():
+
+    assert amount_unit_converter(amount=10_000_000, unit_from="Satoshi2BTC") == 0.1
+    assert amount_unit_converter(amount=0.29, unit_from="BTC2Satoshi") == 29_000_000
+    assert amount_unit_converter(amount=123_456, unit_from="Satoshi2mBTC") == 1
+    assert amount_unit_converter(amount=[0.1, 0.29, 1], unit_from="BTC2Satoshi") == [
+        10_000_000, 29_000_000, 100_000_000
+    ]
+    assert amount_unit_converter(amount=[10_000_000, 1], unit_from="Satoshi2BTC") == [0.1, 1e-08]
+
+    with pytest.raises(UnitError, match=r"Invalid Bitcoin 'BTC2Wei' unit from"):
+        amount_unit_converter(amount=1, unit_from="BTC2Wei")
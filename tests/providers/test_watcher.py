@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import asyncio
+import pytest
+
+from swap.providers.watcher import (
+    Event, Watcher, FUND, WITHDRAW, REFUND
+)
+
+
+class ListWatcher(Watcher):
+
+    def __init__(self, events: list, **kwargs):
+        super().__init__(network="testnet", **kwargs)
+        self.polls: int = 0
+        self._events: list = events
+
+    def watch(self, htlc: str) -> "ListWatcher":
+        return self._watch(htlc=htlc)
+
+    def _poll(self, watched: dict) -> list:
+        self.polls += 1
+        return list(self._events)
+
+
+def test_watcher():
+
+    event = Event(kind=FUND, htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F", network="testnet",
+                  transaction_hash="7b22ae1ab32410c1da36428f42af3c30e0c419a8553fe315419939752b02f639")
+    assert event.json() == dict(
+        kind="fund", htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F",
+        transaction_hash="7b22ae1ab32410c1da36428f42af3c30e0c419a8553fe315419939752b02f639",
+        network="testnet", block_height=None, data={}
+    )
+    with pytest.raises(ValueError, match="Invalid HTLC 'spend' event kind"):
+        Event(kind="spend", htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F", transaction_hash="", network="testnet")
+    with pytest.raises(ValueError, match="Invalid watcher interval"):
+        ListWatcher(events=[], interval=10, max_interval=5)
+    # Watchers without _poll fail on instantiation, not while polling
+    with pytest.raises(TypeError, match="abstract"):
+        Watcher(network="testnet")
+
+    withdraw = Event(kind=WITHDRAW, htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F", network="testnet",
+                     transaction_hash="f85cd877d7d9e7a9aab7b1cde336cbcd423545355a9aa2d424422dff96d953a9")
+    other = Event(kind=REFUND, htlc="2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK", network="testnet",
+                  transaction_hash="a211d21110756b266925fee2fbf2dc81529beef5e410311b38578dc3a076fb31")
+    watcher = ListWatcher(events=[event, withdraw, other], interval=0.01, max_interval=0.04)
+    assert watcher.poll() == [] and watcher.polls == 0
+
+    withdraws: list = []
+    watcher.on(withdraws.append, kind=WITHDRAW)
+    assert watcher.watch(htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F").watching() == ["2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F"]
+    assert watcher.poll() == [event, withdraw]
+    assert withdraws == [withdraw]
+    assert watcher.poll() == []
+    assert withdraws == [withdraw]
+
+    assert watcher._next_interval(0.01, found=False) == 0.02
+    assert watcher._next_interval(0.04, found=False) == 0.04
+    assert watcher._next_interval(0.04, found=True) == 0.01
+
+    assert watcher.unwatch(htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F").watching() == []
+    watcher.watch(htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F")
+    watcher.run(timeout=0.05)
+    assert withdraws == [withdraw, withdraw]
+
+    async def first_event() -> Event:
+        watcher.unwatch(htlc="2MwiKt6rGsT1mbTUdFdcRpNNMkfUmA2JJ4F").watch(htlc="2N729UBGZB3xjsGFRgKivy4bSjkaJGN3kUK")
+        async for _event in watcher.events():
+            watcher.stop()
+            return _event
+
+    loop = asyncio.new_event_loop()
+    assert loop.run_until_complete(first_event()) is other
+    loop.close()
@@ -6,9 +6,13 @@ import json
 import os
 
 from swap.exceptions import APIError
+from swap.providers.cache import (
+    cache, config as cache_config
+)
 from swap.providers.vapor.rpc import (
-    decode_raw, submit_raw
+    decode_raw, submit_raw, get_transaction
 )
+from swap.providers.vapor import rpc
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -34,3 +38,35 @@ def test_vapor_rpc():
             signatures=_["vapor"]["fund"]["unsigned"]["signatures"],
             network=_["vapor"]["network"]
         )
+
+
+def test_vapor_rpc_get_transaction(monkeypatch):
+
+    class Response:
+        status_code: int = 200
+
+        def __init__(self, response_json: dict):
+            self._response_json = response_json
+
+        def json(self) -> dict:
+            return self._response_json
+
+    def get(url: str, headers: dict, timeout: int) -> Response:
+        if url.endswith("/block"):
+            return Response(dict(code=200, data=dict(block=dict(height=1000))))
+        transaction_hash: str = url.split("/")[-1]
+        return Response(dict(code=200, data=dict(transaction=dict(
+            tx_id=transaction_hash, block_height=dict(a1=999, b2=990, c3=0)[transaction_hash], inputs=[], outputs=[]
+        ))))
+
+    monkeypatch.setattr(rpc.session, "get", get)
+    cache.clear()
+
+    # Confirmations are counted from the latest block, only past the finality depth is cached forever
+    assert get_transaction(transaction_hash="a1", network="mainnet")["confirmations"] == 2
+    assert get_transaction(transaction_hash="b2", network="mainnet")["confirmations"] == 11 >= cache_config["finality"]
+    assert get_transaction(transaction_hash="c3", network="mainnet")["confirmations"] == 0
+    assert sorted(
+        expires is None for key, (value, expires) in cache._entries.items() if "get_transaction" in key
+    ) == [False, False, True]
+    cache.clear()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+from swap.providers.vapor.signer import (
+    derive_private_key, sign_datas, key_cache
+)
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_vapor_signer():
+
+    assert derive_private_key(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+        path=_["vapor"]["wallet"]["sender"]["derivation"]["path"]
+    ) == _["vapor"]["wallet"]["sender"]["private_key"]
+    assert derive_private_key(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+        indexes=_["vapor"]["wallet"]["sender"]["derivation"]["indexes"]
+    ) == _["vapor"]["wallet"]["sender"]["private_key"]
+    assert derive_private_key(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"]
+    ) == _["vapor"]["wallet"]["sender"]["xprivate_key"]
+
+    assert sign_datas(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+        unsigned_datas=_["vapor"]["normal"]["unsigned"]["unsigned_datas"]
+    ) == _["vapor"]["normal"]["signed"]["signatures"]
+
+    # Multi-input transactions from one path derive a single key
+    key_cache.clear()
+    assert sign_datas(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+        unsigned_datas=(_["vapor"]["normal"]["unsigned"]["unsigned_datas"] * 50)
+    ) == (_["vapor"]["normal"]["signed"]["signatures"] * 50)
+    assert len(key_cache) == 1
+
+    # Unsigned datas without path use the solver path
+    assert sign_datas(
+        xprivate_key=_["vapor"]["wallet"]["recipient"]["xprivate_key"],
+        unsigned_datas=_["vapor"]["withdraw"]["unsigned"]["unsigned_datas"],
+        path=_["vapor"]["wallet"]["recipient"]["derivation"]["path"]
+    ) == [[_["vapor"]["withdraw"]["signed"]["signatures"][0][1]]]
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
@@ -181,3 +182,59 @@ def test_vapor_wallet_from_private_key():
 
     # assert isinstance(wallet.balance(), int)
     # assert isinstance(wallet.utxos(), list)
+
+
+def test_vapor_wallet_derive_range():
+
+    wallet = Wallet(network=_["vapor"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["vapor"]["wallet"]["sender"]["entropy"],
+        language=_["vapor"]["wallet"]["sender"]["language"],
+        passphrase=_["vapor"]["wallet"]["sender"]["passphrase"]
+    )
+
+    wallet.from_path(
+        path=_["vapor"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    addresses = wallet.derive_range(
+        account=_["vapor"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["vapor"]["wallet"]["sender"]["derivation"]["change"],
+        start=1, count=3
+    )
+
+    assert wallet.path() == _["vapor"]["wallet"]["sender"]["derivation"]["path"]
+    assert len(addresses) == 3
+    assert wallet.derive_range(account=1, start=1 + 1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=1, start=1, count=0) == []
+    assert addresses[0] == (
+        _["vapor"]["wallet"]["sender"]["address"],
+        _["vapor"]["wallet"]["sender"]["public_key"],
+        _["vapor"]["wallet"]["sender"]["derivation"]["path"]
+    )
+    for address, public_key, path in addresses:
+        wallet.clean_derivation()
+        wallet.from_path(path=path)
+        assert (address, public_key) == (wallet.address(), wallet.public_key())
+
+
+def test_vapor_wallet_derive_range_restore(monkeypatch):
+
+    wallet = Wallet(network=_["vapor"]["network"])
+    wallet.from_entropy(
+        entropy=_["vapor"]["wallet"]["sender"]["entropy"],
+        language=_["vapor"]["wallet"]["sender"]["language"],
+        passphrase=_["vapor"]["wallet"]["sender"]["passphrase"]
+    )
+    wallet.from_path(path=_["vapor"]["wallet"]["sender"]["derivation"]["path"])
+
+    def child_xpublic_key():
+        raise ValueError("Derivation failed.")
+
+    # Wallet stays on its own path when the range derivation fails halfway
+    monkeypatch.setattr(wallet._hdwallet, "child_xpublic_key", child_xpublic_key)
+    with pytest.raises(ValueError, match="Derivation failed."):
+        wallet.derive_range(account=1, start=1, count=3)
+    assert wallet.path() == _["vapor"]["wallet"]["sender"]["derivation"]["path"]
+    assert wallet.address() == _["vapor"]["wallet"]["sender"]["address"]
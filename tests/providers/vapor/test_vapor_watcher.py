@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import pytest
+import json
+import os
+
+from swap.providers.vapor.watcher import Watcher
+from swap.providers.vapor.utils import amount_unit_converter
+from swap.exceptions import AddressError
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_vapor_watcher():
+
+    htlc_address: str = _["vapor"]["htlc"]["contract_address"]
+    watcher: Watcher = Watcher(network=_["vapor"]["network"])
+    with pytest.raises(AddressError, match=r"Invalid Vapor HTLC"):
+        watcher.watch(address=_["vapor"]["wallet"]["sender"]["address"])
+    assert watcher.watch(address=htlc_address).watching() == [htlc_address]
+
+    fund_transaction: dict = dict(
+        tx_id=_["vapor"]["fund"]["signed"]["hash"], block_height=1000,
+        inputs=_["vapor"]["fund"]["signed"]["json"]["inputs"], outputs=_["vapor"]["fund"]["signed"]["json"]["outputs"]
+    )
+    events = watcher._events(address=htlc_address, transaction=fund_transaction, block_height=None)
+    assert [(event.kind, event.transaction_hash, event.block_height, event.data["amount"]) for event in events] == [
+        ("fund", _["vapor"]["fund"]["signed"]["hash"], 1000,
+         amount_unit_converter(amount=_["vapor"]["amount"], unit_from=f"{_['vapor']['unit']}2NEU"))
+    ]
+
+    for kind in ["withdraw", "refund"]:
+        spend_transaction: dict = dict(
+            tx_id=_["vapor"][kind]["signed"]["hash"], block_height=1001,
+            inputs=[dict(
+                address=htlc_address, amount=events[0].data["amount"], asset_id=_["vapor"]["asset"],
+                spent_output_id=events[0].data["id"], witness_arguments=_["vapor"][kind]["signed"]["signatures"][0]
+            )], outputs=[]
+        )
+        spend_events = watcher._events(address=htlc_address, transaction=spend_transaction, block_height=None)
+        assert [(event.kind, event.transaction_hash, event.data["id"]) for event in spend_events] == [
+            (kind, _["vapor"][kind]["signed"]["hash"], events[0].data["id"])
+        ]
+
+    watcher = Watcher(network=_["vapor"]["network"], confirmations=2).watch(address=htlc_address)
+    assert watcher._events(address=htlc_address, transaction=fund_transaction, block_height=1000) == []
+    assert len(watcher._events(address=htlc_address, transaction=fund_transaction, block_height=1001)) == 1
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 
+from types import SimpleNamespace
+
 import pytest
 import json
 import os
 
+from swap.exceptions import AddressError
+from swap.providers.ethereum.nonce import NonceManager
+from swap.providers.xinfin.utils import to_checksum_address
 from swap.providers.xinfin.rpc import (
-    decode_raw, submit_raw
+    decode_raw, submit_raw, get_balances, get_transaction_receipts
 )
 
 # Test Values
@@ -28,3 +33,35 @@ def test_xinfin_rpc():
             raw=_["ethereum"]["fund"]["signed"]["raw"],
             network=_["xinfin"]["network"]
         )
+
+    assert get_balances(addresses=[], network=_["xinfin"]["network"]) == []
+    assert get_transaction_receipts(transaction_hashes=[], network=_["xinfin"]["network"]) == []
+    with pytest.raises(AddressError, match=r"Invalid XinFin 'xdcinvalid' address"):
+        get_balances(addresses=["xdcinvalid"], network=_["xinfin"]["network"])
+
+
+def test_xinfin_rpc_submit_raw_nonce(monkeypatch):
+
+    transaction: dict = decode_raw(raw=_["xinfin"]["fund"]["signed"]["raw"])
+    address: str = to_checksum_address(address=transaction["from"], prefix="0x")
+    nonce_manager: NonceManager = NonceManager(web3=SimpleNamespace(
+        toChecksumAddress=lambda address: address,
+        eth=SimpleNamespace(get_transaction_count=lambda address, block_identifier: transaction["nonce"])
+    ))
+    assert nonce_manager.allocate_many(address=address, count=3) == [
+        transaction["nonce"], transaction["nonce"] + 1, transaction["nonce"] + 2
+    ]
+
+    def send_raw_transaction(raw: str):
+        raise ValueError("replacement transaction underpriced")
+
+    monkeypatch.setattr("swap.providers.xinfin.rpc.get_web3", lambda **kwargs: SimpleNamespace(
+        eth=SimpleNamespace(send_raw_transaction=send_raw_transaction)
+    ))
+    with pytest.raises(ValueError, match=r"replacement transaction underpriced"):
+        submit_raw(
+            raw=_["xinfin"]["fund"]["signed"]["raw"], network=_["xinfin"]["network"], nonce_manager=nonce_manager
+        )
+    # Only the rejected nonce is given back, the other in-flight nonces are not handed out again
+    assert nonce_manager.allocate(address=address) == transaction["nonce"]
+    assert nonce_manager.allocate(address=address) == transaction["nonce"] + 3
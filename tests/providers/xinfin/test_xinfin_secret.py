@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+from hexbytes.main import HexBytes
+
+import pytest
+import json
+import os
+
+from swap.providers.xinfin.secret import (
+    extract_secret, scan_secrets, _input_secret
+)
+from swap.exceptions import NetworkError
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_xinfin_secret():
+
+    assert _input_secret(
+        _["xinfin"]["withdraw"]["signed"]["json"]["data"]
+    ) == _["xinfin"]["htlc"]["secret"]["key"]
+    assert _input_secret(_["xinfin"]["fund"]["signed"]["json"]["data"]) is None
+    assert _input_secret(_["xinfin"]["refund"]["signed"]["json"]["data"]) is None
+    assert _input_secret(None) is None
+
+    with pytest.raises(NetworkError, match=r"Invalid XinFin 'unknown' network"):
+        extract_secret(transaction_hash=_["xinfin"]["withdraw"]["signed"]["hash"], network="unknown")
+    with pytest.raises(NetworkError, match=r"Invalid XinFin 'unknown' network"):
+        scan_secrets(secret_hashes=[_["xinfin"]["htlc"]["secret"]["hash"]], start_block=0, end_block=1, network="unknown")
+
+
+def test_xinfin_scan_secrets(monkeypatch):
+
+    # Blocks 100-109 have the refund, blocks 110-119 the withdraw and blocks 120-125 are never fetched
+    logs: list = [
+        dict(transactionHash=_["xinfin"]["refund"]["signed"]["hash"], blockNumber=105),
+        dict(transactionHash=_["xinfin"]["withdraw"]["signed"]["hash"], blockNumber=112, removed=True),
+        dict(transactionHash=_["xinfin"]["withdraw"]["signed"]["hash"], blockNumber=113)
+    ]
+    transactions: dict = {
+        HexBytes(_["xinfin"]["refund"]["signed"]["hash"]).hex(): dict(input=_["xinfin"]["refund"]["signed"]["json"]["data"]),
+        HexBytes(_["xinfin"]["withdraw"]["signed"]["hash"]).hex(): dict(input=_["xinfin"]["withdraw"]["signed"]["json"]["data"])
+    }
+    filters: list = []
+
+    def get_logs(filter_params: dict) -> list:
+        filters.append((filter_params["fromBlock"], filter_params["toBlock"]))
+        return [
+            log for log in logs if filter_params["fromBlock"] <= log["blockNumber"] <= filter_params["toBlock"]
+        ]
+
+    monkeypatch.setattr("swap.providers.xinfin.secret.get_web3", lambda **kwargs: SimpleNamespace(
+        eth=SimpleNamespace(get_logs=get_logs)
+    ))
+    monkeypatch.setattr("swap.providers.xinfin.secret.get_transactions", lambda transaction_hashes, **kwargs: [
+        transactions[transaction_hash] for transaction_hash in transaction_hashes
+    ])
+
+    assert scan_secrets(
+        secret_hashes=[_["xinfin"]["htlc"]["secret"]["hash"].upper()], start_block=100, end_block=125,
+        contract_addresses=[_["xinfin"]["htlc"]["contract_address"]], network=_["xinfin"]["network"], block_range=10
+    ) == {_["xinfin"]["htlc"]["secret"]["hash"]: _["xinfin"]["htlc"]["secret"]["key"]}
+    assert filters == [(100, 109), (110, 119)]
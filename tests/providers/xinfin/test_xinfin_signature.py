@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from base64 import b64encode
+
 import json
 import os
 
@@ -9,6 +11,7 @@ from swap.providers.xinfin.signature import (
 from swap.providers.xinfin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from swap.providers.xinfin.utils import decode_transaction_raw
 from swap.utils import clean_transaction_raw
 
 # Test Values
@@ -60,6 +63,43 @@ def test_xinfin_normal_signature():
     )
 
 
+def test_xinfin_normal_signature_multiple_recipients():
+
+    unsigned_normal_transaction: dict = _["xinfin"]["normal"]["unsigned"]["json"]
+    unsigned_normal_transaction_raw = b64encode(json.dumps(dict(
+        fee=_["xinfin"]["normal"]["unsigned"]["fee"] * 2,
+        type=_["xinfin"]["normal"]["unsigned"]["type"],
+        transaction=[
+            unsigned_normal_transaction, dict(unsigned_normal_transaction, nonce=unsigned_normal_transaction["nonce"] + 1)
+        ],
+        signature=None,
+        network=_["xinfin"]["network"],
+        xrc20=False
+    )).encode()).decode()
+
+    normal_signature = Signature(network=_["xinfin"]["network"]).sign(
+        transaction_raw=unsigned_normal_transaction_raw,
+        solver=NormalSolver(
+            xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"],
+            account=_["xinfin"]["wallet"]["sender"]["derivation"]["account"],
+            change=_["xinfin"]["wallet"]["sender"]["derivation"]["change"],
+            address=_["xinfin"]["wallet"]["sender"]["derivation"]["address"]
+        )
+    )
+
+    assert normal_signature.type() == _["xinfin"]["normal"]["signed"]["type"]
+    assert normal_signature.fee() == _["xinfin"]["normal"]["signed"]["fee"] * 2
+    assert len(normal_signature.hash()) == 2
+    assert normal_signature.hash()[0] == _["xinfin"]["normal"]["signed"]["hash"]
+    assert normal_signature.raw()[0] == _["xinfin"]["normal"]["signed"]["raw"]
+    assert normal_signature.raw()[1] != _["xinfin"]["normal"]["signed"]["raw"]
+    assert normal_signature.signature()[0] == _["xinfin"]["normal"]["signed"]["signature"]
+    assert [signature["hash"] for signature in decode_transaction_raw(
+        transaction_raw=normal_signature.transaction_raw()
+    )["signatures"]] == normal_signature.hash()
+
+
 def test_xinfin_fund_signature():
 
     unsigned_fund_transaction_raw = _["xinfin"]["fund"]["unsigned"]["transaction_raw"]
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
+from swap.providers.ethereum.nonce import NonceManager
 from swap.providers.xinfin.htlc import HTLC
 from swap.providers.xinfin.transaction import (
     NormalTransaction, FundTransaction, WithdrawTransaction, RefundTransaction
 )
+from swap.providers.xinfin.rpc import get_web3
 from swap.providers.xinfin.solver import (
     NormalSolver, FundSolver, WithdrawSolver, RefundSolver
 )
+from swap.providers.xinfin.utils import to_checksum_address
 from swap.utils import get_current_timestamp
 
 # Test Values
@@ -59,6 +63,44 @@ def test_xinfin_normal_transaction():
     assert isinstance(signed_normal_transaction.transaction_raw(), str)
 
 
+def test_xinfin_normal_transaction_multiple_recipients():
+
+    unsigned_normal_transaction = NormalTransaction(network=_["xinfin"]["network"])
+
+    unsigned_normal_transaction.build_transaction(
+        address=_["xinfin"]["wallet"]["sender"]["address"],
+        recipient={
+            _["xinfin"]["wallet"]["recipient"]["address"]: _["xinfin"]["amount"],
+            _["xinfin"]["wallet"]["sender"]["address"]: _["xinfin"]["amount"]
+        },
+        unit=_["xinfin"]["unit"]
+    )
+
+    assert unsigned_normal_transaction.type() == _["xinfin"]["normal"]["unsigned"]["type"]
+    assert unsigned_normal_transaction.fee() == _["xinfin"]["normal"]["unsigned"]["fee"] * 2
+    assert unsigned_normal_transaction.hash() is None
+    assert [transaction["nonce"] for transaction in unsigned_normal_transaction.json()] == [
+        unsigned_normal_transaction.json()[0]["nonce"], unsigned_normal_transaction.json()[0]["nonce"] + 1
+    ]
+    assert unsigned_normal_transaction.json()[0]["gas"] == unsigned_normal_transaction.json()[1]["gas"]
+
+    signed_normal_transaction = unsigned_normal_transaction.sign(
+        solver=NormalSolver(
+            xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"],
+            account=_["xinfin"]["wallet"]["sender"]["derivation"]["account"],
+            change=_["xinfin"]["wallet"]["sender"]["derivation"]["change"],
+            address=_["xinfin"]["wallet"]["sender"]["derivation"]["address"]
+        )
+    )
+
+    assert signed_normal_transaction.type() == _["xinfin"]["normal"]["signed"]["type"]
+    assert len(signed_normal_transaction.hash()) == 2
+    assert len(signed_normal_transaction.raw()) == 2
+    assert isinstance(signed_normal_transaction.signature(), list)
+    assert isinstance(signed_normal_transaction.transaction_raw(), str)
+
+
 def test_xinfin_fund_transaction():
 
     htlc = HTLC(
@@ -178,3 +220,88 @@ def test_xinfin_refund_transaction():
     assert isinstance(signed_refund_transaction.json(), dict)
     assert isinstance(signed_refund_transaction.signature(), dict)
     assert isinstance(signed_refund_transaction.transaction_raw(), str)
+
+
+def test_xinfin_transaction_nonce(monkeypatch):
+
+    nonce_manager = NonceManager(web3=get_web3(network=_["xinfin"]["network"]))
+    address: str = to_checksum_address(address=_["xinfin"]["wallet"]["sender"]["address"], prefix="0x")
+    nonce: int = nonce_manager.reconcile(address=address)
+    normal_transaction = NormalTransaction(network=_["xinfin"]["network"], nonce_manager=nonce_manager)
+    build_transaction: dict = dict(
+        address=_["xinfin"]["wallet"]["sender"]["address"],
+        recipient={
+            _["xinfin"]["wallet"]["recipient"]["address"]: _["xinfin"]["amount"]
+        },
+        unit=_["xinfin"]["unit"]
+    )
+
+    # Rebuild gives back the nonce of the previous unsigned build
+    assert normal_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce
+    assert normal_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce
+
+    # Failed build gives back its nonce
+    def estimate_gas(function, transaction: dict):
+        raise ValueError("gas required exceeds allowance")
+
+    monkeypatch.setattr(normal_transaction, "_estimate_gas", estimate_gas)
+    with pytest.raises(ValueError, match="gas required exceeds allowance"):
+        normal_transaction.build_transaction(**build_transaction)
+    monkeypatch.undo()
+    assert nonce_manager.allocate(address=address) == nonce
+
+    # Signed build keeps its nonce
+    normal_transaction.build_transaction(**build_transaction).sign(
+        solver=NormalSolver(
+            xprivate_key=_["xinfin"]["wallet"]["sender"]["root_xprivate_key"],
+            path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"],
+            account=_["xinfin"]["wallet"]["sender"]["derivation"]["account"],
+            change=_["xinfin"]["wallet"]["sender"]["derivation"]["change"],
+            address=_["xinfin"]["wallet"]["sender"]["derivation"]["address"]
+        )
+    )
+    assert normal_transaction.json()["nonce"] == nonce + 1
+    assert normal_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce + 2
+
+
+def test_xinfin_htlc_transaction_nonce():
+
+    nonce_manager = NonceManager(web3=get_web3(network=_["xinfin"]["network"]))
+    htlc = HTLC(
+        contract_address=_["xinfin"]["htlc"]["contract_address"],
+        network=_["xinfin"]["network"]
+    ).build_htlc(
+        secret_hash=_["xinfin"]["htlc"]["secret"]["hash"],
+        recipient_address=_["xinfin"]["wallet"]["recipient"]["address"],
+        sender_address=_["xinfin"]["wallet"]["sender"]["address"],
+        endtime=get_current_timestamp(plus=3600)
+    )
+
+    for transaction, solver, wallet, build_transaction in [
+        (FundTransaction, FundSolver, "sender", dict(
+            address=_["xinfin"]["wallet"]["sender"]["address"], htlc=htlc,
+            amount=_["xinfin"]["amount"], unit=_["xinfin"]["unit"]
+        )),
+        (WithdrawTransaction, WithdrawSolver, "recipient", dict(
+            address=_["xinfin"]["wallet"]["recipient"]["address"],
+            transaction_hash=_["xinfin"]["transaction_hash"], secret_key=_["xinfin"]["htlc"]["secret"]["key"]
+        )),
+        (RefundTransaction, RefundSolver, "sender", dict(
+            address=_["xinfin"]["wallet"]["sender"]["address"], transaction_hash=_["xinfin"]["transaction_hash"]
+        ))
+    ]:
+        htlc_transaction = transaction(network=_["xinfin"]["network"], nonce_manager=nonce_manager)
+        nonce: int = htlc_transaction.build_transaction(**build_transaction).json()["nonce"]
+
+        # Signed build keeps its nonce, a rebuild of the same instance takes the next one
+        htlc_transaction.sign(
+            solver=solver(
+                xprivate_key=_["xinfin"]["wallet"][wallet]["root_xprivate_key"],
+                path=_["xinfin"]["wallet"][wallet]["derivation"]["path"],
+                account=_["xinfin"]["wallet"][wallet]["derivation"]["account"],
+                change=_["xinfin"]["wallet"][wallet]["derivation"]["change"],
+                address=_["xinfin"]["wallet"][wallet]["derivation"]["address"]
+            )
+        )
+        assert htlc_transaction.json()["nonce"] == nonce
+        assert htlc_transaction.build_transaction(**build_transaction).json()["nonce"] == nonce + 1
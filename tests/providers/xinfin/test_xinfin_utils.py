@@ -4,7 +4,14 @@ import pytest
 import json
 import os
 
-from swap.exceptions import TransactionRawError
+from swap.exceptions import (
+    APIError, TransactionRawError
+)
+from swap.providers.ethereum.nonce import NonceManager
+from swap.providers.xinfin import rpc
+from swap.utils import (
+    dumps_transaction_raw, loads_transaction_raw
+)
 from swap.providers.xinfin.utils import (
     is_network, is_address, is_transaction_raw, get_xrc20_data,
     decode_transaction_raw, submit_transaction_raw
@@ -46,3 +53,63 @@ def test_xinfin_utils():
     # Wrong Ethereum transaction raw must be signed, not unsigned transaction raw.
     with pytest.raises(TransactionRawError):
         submit_transaction_raw(transaction_raw=_["xinfin"]["fund"]["unsigned"]["transaction_raw"])
+
+
+def test_xinfin_utils_submit_transaction_raw_nonce(monkeypatch):
+
+    transaction_raw: str = _["xinfin"]["normal"]["signed"]["transaction_raw"]
+    transaction: dict = decode_transaction_raw(transaction_raw=transaction_raw)["transaction"]
+    web3 = rpc.get_web3(network=_["xinfin"]["network"])
+
+    def send_raw_transaction(raw_transaction):
+        raise ValueError({"code": -32000, "message": "insufficient funds for gas * price + value"})
+
+    monkeypatch.setattr(web3.eth, "send_raw_transaction", send_raw_transaction)
+    monkeypatch.setattr(rpc, "get_web3", lambda *args, **kwargs: web3)
+    nonce_manager = NonceManager(web3=web3)
+    monkeypatch.setattr(nonce_manager, "_pending_count", lambda address: transaction["nonce"])
+
+    assert nonce_manager.allocate_many(address=transaction["from"], count=2) == [
+        transaction["nonce"], transaction["nonce"] + 1
+    ]
+    with pytest.raises(ValueError, match="insufficient funds"):
+        submit_transaction_raw(transaction_raw=transaction_raw, nonce_manager=nonce_manager)
+    # Only the rejected nonce is given back, the other in-flight nonce stays allocated
+    assert nonce_manager.allocate_many(address=transaction["from"], count=2) == [
+        transaction["nonce"], transaction["nonce"] + 2
+    ]
+
+
+def test_xinfin_utils_submit_transaction_raw_batch(monkeypatch):
+
+    transaction_raw: dict = loads_transaction_raw(transaction_raw=_["xinfin"]["normal"]["signed"]["transaction_raw"])
+    transaction: dict = transaction_raw["transaction"]
+    transaction_raw.update(
+        transaction=[transaction, dict(transaction, nonce=(transaction["nonce"] + 1))],
+        signature=[transaction_raw["signature"], transaction_raw["signature"]]
+    )
+
+    def _batch_request(calls: list, network: str, **kwargs) -> list:
+        assert [method for method, _ in calls] == ["eth_sendRawTransaction", "eth_sendRawTransaction"]
+        return [transaction_raw["signature"][0]["hash"], APIError("nonce too low", -32000)]
+
+    monkeypatch.setattr(rpc, "_batch_request", _batch_request)
+    nonce_manager = NonceManager(web3=rpc.get_web3(network=_["xinfin"]["network"]))
+    monkeypatch.setattr(nonce_manager, "_pending_count", lambda address: transaction["nonce"])
+    assert nonce_manager.allocate_many(address=transaction["from"], count=2) == [
+        transaction["nonce"], transaction["nonce"] + 1
+    ]
+
+    # Accepted hashes are kept next to the rejected transaction errors
+    submitted: dict = submit_transaction_raw(
+        transaction_raw=dumps_transaction_raw(transaction_raw=transaction_raw), nonce_manager=nonce_manager
+    )
+    assert submitted["transaction_hash"] == [transaction_raw["signature"][0]["hash"], None]
+    assert submitted["errors"] == [None, "(-32000), nonce too low"]
+    assert nonce_manager.allocate(address=transaction["from"]) == transaction["nonce"] + 1
+
+    monkeypatch.setattr(rpc, "_batch_request", lambda calls, network, **kwargs: [
+        APIError("nonce too low", -32000), APIError("nonce too low", -32000)
+    ])
+    with pytest.raises(APIError, match="nonce too low"):
+        submit_transaction_raw(transaction_raw=dumps_transaction_raw(transaction_raw=transaction_raw))
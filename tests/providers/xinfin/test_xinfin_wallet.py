@@ -186,3 +186,38 @@ def test_xinfin_wallet_from_private_key():
     assert wallet.address() == _["xinfin"]["wallet"]["sender"]["address"]
 
     # assert isinstance(wallet.balance(), int)
+
+
+def test_xinfin_wallet_derive_range():
+
+    wallet = Wallet(network=_["xinfin"]["network"])
+
+    wallet.from_entropy(
+        entropy=_["xinfin"]["wallet"]["sender"]["entropy"],
+        language=_["xinfin"]["wallet"]["sender"]["language"],
+        passphrase=_["xinfin"]["wallet"]["sender"]["passphrase"]
+    )
+
+    wallet.from_path(
+        path=_["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    addresses = wallet.derive_range(
+        account=_["xinfin"]["wallet"]["sender"]["derivation"]["account"],
+        change=_["xinfin"]["wallet"]["sender"]["derivation"]["change"],
+        start=0, count=3
+    )
+
+    assert wallet.path() == _["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    assert len(addresses) == 3
+    assert wallet.derive_range(account=0, start=0 + 1, count=2) == addresses[1:]
+    assert wallet.derive_range(account=0, start=0, count=0) == []
+    assert addresses[0] == (
+        _["xinfin"]["wallet"]["sender"]["address"],
+        _["xinfin"]["wallet"]["sender"]["public_key"],
+        _["xinfin"]["wallet"]["sender"]["derivation"]["path"]
+    )
+    for address, public_key, path in addresses:
+        wallet.clean_derivation()
+        wallet.from_path(path=path)
+        assert (address, public_key) == (wallet.address(), wallet.public_key())
@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
 
 from swap.utils import (
-    generate_passphrase, generate_entropy, generate_mnemonic,
-    is_mnemonic, get_mnemonic_language, sha256, double_sha256
+    generate_passphrase, generate_entropy, generate_mnemonic, is_mnemonic, get_mnemonic_language,
+    entropy_to_mnemonic, mnemonic_to_entropy,
+    sha256, double_sha256, dumps_transaction_raw, loads_transaction_raw, is_compact_transaction_raw,
+    parse_transaction_raw, TransactionRaw
+)
+
+from base64 import (
+    b64decode, b64encode
 )
 
 import pytest
+import json
+import os
 
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
 
 MNEMONIC: str = "병아리 실컷 여인 축제 극히 저녁 경찰 설사 할인 해물 시각 자가용"
 
@@ -55,3 +69,103 @@ def test_swap_utils():
 
     assert double_sha256("meherett".encode()) == \
         "2803bf9ed1e5874825350b1b0753a96c00a99236b686bde337404453b11d3288"
+
+
+
+def _transaction_raws(value):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in ["transaction_raw", "unsigned_raw", "signed_raw"] and isinstance(item, str):
+                yield item
+            else:
+                yield from _transaction_raws(item)
+
+
+def test_swap_utils_transaction_raw():
+
+    transaction_raws: list = list(_transaction_raws(_))
+    assert transaction_raws
+
+    for transaction_raw in transaction_raws:
+        loaded_transaction_raw: dict = loads_transaction_raw(transaction_raw=transaction_raw)
+        assert not is_compact_transaction_raw(transaction_raw=transaction_raw)
+        assert dumps_transaction_raw(transaction_raw=loaded_transaction_raw).rstrip("=") == transaction_raw.rstrip("=")
+
+        compact_transaction_raw: str = dumps_transaction_raw(transaction_raw=loaded_transaction_raw, compact=True)
+        assert is_compact_transaction_raw(transaction_raw=compact_transaction_raw)
+        assert len(compact_transaction_raw) < len(transaction_raw)
+        assert loads_transaction_raw(transaction_raw=compact_transaction_raw) == loaded_transaction_raw
+        assert list(loads_transaction_raw(transaction_raw=compact_transaction_raw)) == list(loaded_transaction_raw)
+
+    assert dumps_transaction_raw(transaction_raw={
+        "fee": 10000000, "network": "mainnet", "type": "bytom_fund_unsigned"
+    }, compact=True) == "pwEKAwsAA4Ct4gQLBwsfCwELMA=="
+    assert loads_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA") == {
+        "fee": 10000000, "network": "mainnet", "type": "bytom_fund_unsigned"
+    }
+    assert loads_transaction_raw(transaction_raw=dumps_transaction_raw(transaction_raw={
+        "value": -1, "gas": 0.5, "data": "0xa9059cbb", "to": None, "erc20": True, "nonce": [0, 1], "hash": "ABC"
+    }, compact=True)) == {
+        "value": -1, "gas": 0.5, "data": "0xa9059cbb", "to": None, "erc20": True, "nonce": [0, 1], "hash": "ABC"
+    }
+
+    with pytest.raises(ValueError, match="Unsupported compact transaction raw version '02'."):
+        loads_transaction_raw(transaction_raw="pwIKAwsAA4Ct4gQLBwsfCwELMA")
+    with pytest.raises(ValueError, match="Invalid compact transaction raw."):
+        loads_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMAA")
+    compact_transaction_raw: bytes = b64decode(dumps_transaction_raw(transaction_raw={
+        "fee": 10000000, "gas": 0.5
+    }, compact=True).encode())
+    for length in range(3, len(compact_transaction_raw)):
+        with pytest.raises(ValueError, match="Truncated compact transaction raw."):
+            loads_transaction_raw(transaction_raw=b64encode(compact_transaction_raw[:length]).decode())
+
+
+def test_swap_utils_parse_transaction_raw():
+
+    for transaction_raw in _transaction_raws(_):
+        parsed_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw=transaction_raw)
+        assert parse_transaction_raw(transaction_raw=transaction_raw) is parsed_transaction_raw
+        assert parse_transaction_raw(transaction_raw=parsed_transaction_raw) is parsed_transaction_raw
+        assert parsed_transaction_raw.loads() == loads_transaction_raw(transaction_raw=transaction_raw)
+        assert parsed_transaction_raw["type"] == parsed_transaction_raw.get("type")
+        assert not parsed_transaction_raw.compact()
+
+    parsed_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA")
+    assert parsed_transaction_raw is parse_transaction_raw(transaction_raw="pwEKAwsAA4Ct4gQLBwsfCwELMA==")
+    assert parsed_transaction_raw.transaction_raw() == "pwEKAwsAA4Ct4gQLBwsfCwELMA=="
+    assert parsed_transaction_raw.compact()
+    assert parsed_transaction_raw["fee"] == 10000000
+    assert "address" not in parsed_transaction_raw
+
+    # Invalid transaction raws are only decoded on first field access
+    invalid_transaction_raw: TransactionRaw = parse_transaction_raw(transaction_raw="pwIKAwsAA4Ct4gQLBwsfCwELMA")
+    with pytest.raises(ValueError, match="Unsupported compact transaction raw version '02'."):
+        invalid_transaction_raw.loads()
+    with pytest.raises(TypeError, match="Transaction raw must be str"):
+        parse_transaction_raw(transaction_raw=1)
+
+
+def test_swap_utils_mnemonic():
+
+    for language in ["english", "french", "italian", "chinese_simplified",
+                     "chinese_traditional", "japanese", "korean", "spanish"]:
+        mnemonic: str = entropy_to_mnemonic(entropy="ee535b143b0d9d1f87546f9df0d06b1a", language=language)
+        assert is_mnemonic(mnemonic=mnemonic, language=language)
+        assert mnemonic_to_entropy(mnemonic=mnemonic) == "ee535b143b0d9d1f87546f9df0d06b1a"
+        assert mnemonic_to_entropy(mnemonic=mnemonic, language=language) == "ee535b143b0d9d1f87546f9df0d06b1a"
+
+    assert get_mnemonic_language(mnemonic=MNEMONIC) == "korean"
+    # Words of both Chinese wordlists resolve to the first detected language
+    assert get_mnemonic_language(mnemonic=entropy_to_mnemonic(
+        entropy="00000000000000000000000000000000", language="chinese_traditional"
+    )) == "chinese_simplified"
+    # Known words with a wrong checksum
+    assert not is_mnemonic(mnemonic=" ".join(MNEMONIC.split(" ")[:-1] + [MNEMONIC.split(" ")[0]]))
+    assert not is_mnemonic(mnemonic=MNEMONIC, language="english")
+    assert not is_mnemonic(mnemonic=" ".join(MNEMONIC.split(" ")[:11]))
+
+    with pytest.raises(ValueError, match="Invalid mnemonic words."):
+        mnemonic_to_entropy(mnemonic=MNEMONIC, language="english")
+    with pytest.raises(ValueError, match=r"invalid language, .*"):
+        mnemonic_to_entropy(mnemonic=MNEMONIC, language="amharic")